@@ -2,8 +2,10 @@
 FastAPI Application Factory and Configuration
 """
 
+from typing import Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.utils import get_openapi
 from api.routers import (
     auth_router, users_router, machines_router, 
@@ -14,15 +16,79 @@ from api.routers.health import router as health_router
 from api.routers.inventory import router as inventory_router
 from api.routers.pm import router as pm_router
 from api.routers.reports import router as reports_router
+from api.routers.sync import router as sync_router
+from api.routers.batch import router as batch_router
+from api.caching import ResponseCacheMiddleware
+from api.serialization import ORJSONResponse
+from config.app_config import API_THREADPOOL_SIZE, API_RESPONSE_CACHE, API_GZIP_MINIMUM_SIZE
+from database.query_profiler import profile_call
+from services.context_service import bind_app_context, unbind_app_context
+from utils.cache import CacheBackend
+import anyio.to_thread
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def create_app() -> FastAPI:
+def configure_threadpool(size: int = API_THREADPOOL_SIZE) -> None:
+    """
+    Size the threadpool that runs the sync route handlers.
+
+    Route handlers that touch the database are plain ``def`` functions, so
+    FastAPI runs them in anyio's worker threads instead of on the event loop.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = size
+    logger.info(f"API threadpool size: {size}")
+
+
+class RequestContextMiddleware:
+    """Scope the app context bound by get_current_user to one request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        token = bind_app_context(None)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            unbind_app_context(token)
+
+
+class QueryProfilingMiddleware:
+    """Attribute the statements of a request to its route (see database.query_profiler)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        with profile_call(f"api {scope['method']} {scope['path']}") as call:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                # Named after the route template once routing resolved it (not per id)
+                route = scope.get("route")
+                if call is not None and route is not None:
+                    call.name = f"api {scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+def create_app(
+    threadpool_size: Optional[int] = None,
+    response_cache: Optional[CacheBackend] = None,
+) -> FastAPI:
     """
     Create and configure FastAPI application
     
+    Args:
+        threadpool_size: Threads for the sync route handlers (default: API_THREADPOOL_SIZE)
+        response_cache: Backend for the ETag response cache (default: Redis if
+            REDIS_URL is set, otherwise in-memory)
+    
     Returns:
         Configured FastAPI app instance
     """
@@ -32,9 +98,18 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/api/docs",
         redoc_url="/api/redoc",
-        openapi_url="/api/openapi.json"
+        openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse,
     )
     
+    # ETag / conditional GET cache (inside CORS, so 304s get the CORS headers too)
+    if API_RESPONSE_CACHE or response_cache is not None:
+        app.add_middleware(ResponseCacheMiddleware, backend=response_cache)
+    
+    # Compress larger bodies (outside the response cache, which keeps plain bodies)
+    if API_GZIP_MINIMUM_SIZE > 0:
+        app.add_middleware(GZipMiddleware, minimum_size=API_GZIP_MINIMUM_SIZE)
+    
     # CORS Middleware
     app.add_middleware(
         CORSMiddleware,
@@ -50,6 +125,13 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    app.add_middleware(RequestContextMiddleware)
+    app.add_middleware(QueryProfilingMiddleware)
+    
+    @app.on_event("startup")
+    async def _configure_threadpool():
+        configure_threadpool(threadpool_size or API_THREADPOOL_SIZE)
+    
     # Include routers
     app.include_router(health_router, prefix="/api")
     app.include_router(auth_router, prefix="/api")
@@ -62,6 +144,8 @@ def create_app() -> FastAPI:
     app.include_router(inventory_router, prefix="/api")
     app.include_router(pm_router, prefix="/api")
     app.include_router(reports_router, prefix="/api")
+    app.include_router(sync_router, prefix="/api")
+    app.include_router(batch_router, prefix="/api")
     
     # Root endpoint
     @app.get("/")
@@ -0,0 +1,167 @@
+"""
+API Response Caching
+ETag / conditional GET middleware for read-heavy endpoints.
+
+The ETag of a cacheable GET is derived from the request (path, query,
+language) and the data versions of the tables the endpoint reads. Table
+versions are bumped on commit by the ORM hooks in database.change_tracking,
+so an `If-None-Match` revalidation is answered with 304 without touching the
+database, and serialized bodies are kept in a pluggable cache backend.
+
+Writes made by other processes (the desktop app, other workers with the
+in-memory backend) are not seen by the counters; the ETag also rolls over every
+`ttl` seconds, which bounds how long such a change can stay hidden.
+"""
+
+import hashlib
+import time
+import uuid
+from typing import Dict, Optional, Set, Tuple
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+
+from api.security import verify_token
+from config.app_config import CACHE_DEFAULT_TTL
+from database.change_tracking import add_table_change_listener, get_table_versions
+from utils.cache import CacheBackend, get_cache_backend
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Cacheable GET paths (without trailing slash) -> tables the response is built from
+# (including tables embedded through ?expand=)
+CACHEABLE_ROUTES: Dict[str, Tuple[str, ...]] = {
+    "/api/machines": ("machines", "production_lines"),
+    "/api/permissions/config": ("roles",),
+    "/api/permissions/menu-items": (),
+    "/api/permissions/roles": (),
+}
+
+CACHE_CONTROL = "private, no-cache"
+
+
+class ResponseCacheMiddleware:
+    """Pure ASGI middleware: ETag, 304 on If-None-Match, cached response bodies"""
+
+    def __init__(
+        self,
+        app,
+        backend: Optional[CacheBackend] = None,
+        routes: Optional[Dict[str, Tuple[str, ...]]] = None,
+        ttl: int = CACHE_DEFAULT_TTL,
+    ):
+        self.app = app
+        self.backend = backend or get_cache_backend()
+        self.routes = CACHEABLE_ROUTES if routes is None else routes
+        self.ttl = ttl
+        # In-memory counters restart from zero with the process
+        self._salt = "" if self.backend.shared else uuid.uuid4().hex
+        if self.backend.shared:
+            add_table_change_listener(self._publish_table_changes)
+
+    def _publish_table_changes(self, table_names: Set[str]):
+        self.backend.incr_counters(f"table_version:{name}" for name in table_names)
+
+    async def _backend_call(self, func, *args):
+        if self.backend.shared:
+            return await anyio.to_thread.run_sync(func, *args)
+        return func(*args)
+
+    async def _table_versions(self, tables: Tuple[str, ...]) -> Dict[str, int]:
+        if not self.backend.shared:
+            return get_table_versions(tables)
+        counters = await self._backend_call(
+            self.backend.get_counters, [f"table_version:{name}" for name in tables]
+        )
+        return {name: counters[f"table_version:{name}"] for name in tables}
+
+    def _etag(self, scope, headers: Headers, versions: Dict[str, int]) -> str:
+        parts = [
+            self._salt,
+            scope["path"],
+            scope.get("query_string", b"").decode("latin-1"),
+            headers.get("accept-language", ""),
+            str(int(time.time() // self.ttl)),
+            ",".join(f"{name}={version}" for name, version in sorted(versions.items())),
+        ]
+        return '"' + hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest() + '"'
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+        tables = self.routes.get(scope["path"].rstrip("/"))
+        if tables is None:
+            return await self.app(scope, receive, send)
+
+        headers = Headers(scope=scope)
+        authorization = headers.get("authorization", "")
+        if not authorization.lower().startswith("bearer ") or verify_token(authorization[7:]) is None:
+            # Let the route reject the request
+            return await self.app(scope, receive, send)
+
+        try:
+            etag = self._etag(scope, headers, await self._table_versions(tables))
+        except Exception as e:
+            logger.warning(f"Response cache unavailable: {e}")
+            return await self.app(scope, receive, send)
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            await _send_response(send, 304, [], b"", etag)
+            return
+
+        cache_key = f"response:{etag}"
+        try:
+            cached = await self._backend_call(self.backend.get, cache_key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed: {e}")
+            cached = None
+        if cached is not None:
+            content_type, _, body = cached.partition(b"\n")
+            await _send_response(send, 200, [(b"content-type", content_type)], body, etag)
+            return
+
+        await self._call_and_store(scope, receive, send, etag, cache_key)
+
+    async def _call_and_store(self, scope, receive, send, etag: str, cache_key: str):
+        state = {"status": None, "content_type": b"", "body": []}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                if message["status"] == 200:
+                    response_headers = MutableHeaders(scope=message)
+                    response_headers["ETag"] = etag
+                    response_headers["Cache-Control"] = CACHE_CONTROL
+                    state["content_type"] = response_headers.get("content-type", "").encode("latin-1")
+            elif message["type"] == "http.response.body" and state["status"] == 200:
+                state["body"].append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    value = state["content_type"] + b"\n" + b"".join(state["body"])
+                    try:
+                        await self._backend_call(self.backend.set, cache_key, value, self.ttl)
+                    except Exception as e:
+                        logger.warning(f"Response cache write failed: {e}")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(
+        (candidate[2:] if candidate.startswith("W/") else candidate) == etag
+        for candidate in candidates
+    )
+
+
+async def _send_response(send, status_code: int, headers, body: bytes, etag: str):
+    raw_headers = list(headers) + [
+        (b"etag", etag.encode("latin-1")),
+        (b"cache-control", CACHE_CONTROL.encode("latin-1")),
+    ]
+    if status_code != 304:
+        raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    await send({"type": "http.response.start", "status": status_code, "headers": raw_headers})
+    await send({"type": "http.response.body", "body": body})
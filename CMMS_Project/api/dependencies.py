@@ -9,6 +9,7 @@ from api.security import verify_token, TokenData
 from sqlalchemy.orm import Session
 from database.connection import get_db as get_db_connection
 from database.models import User
+from services.context_service import AppContext, bind_app_context
 
 # Try to get SessionLocal from connection
 try:
@@ -35,7 +36,9 @@ def get_localized_error(key: str, lang_code: str = "en") -> str:
     }
     return error_messages.get(key, key)
 
-security = HTTPBearer()
+# Missing credentials are answered with 401 in get_current_user (HTTPBearer's
+# own auto_error would send 403)
+security = HTTPBearer(auto_error=False)
 
 
 def get_db() -> Session:
@@ -58,7 +61,7 @@ def get_db() -> Session:
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
 ) -> TokenData:
     """
     Get current authenticated user from JWT token
@@ -70,10 +73,10 @@ async def get_current_user(
         TokenData with user information
         
     Raises:
-        HTTPException: If token is invalid or expired
+        HTTPException: If the token is missing, invalid or expired
     """
-    token = credentials.credentials
-    token_data = verify_token(token)
+    token = credentials.credentials if credentials is not None else None
+    token_data = verify_token(token) if token else None
     
     if token_data is None:
         lang_code = "en"  # Default language for API errors
@@ -83,6 +86,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Services read the acting user from the app context; bind a fresh one for
+    # this request only (the sync endpoint threadpool inherits it)
+    bind_app_context(AppContext(
+        user_id=token_data.user_id,
+        username=token_data.username,
+        role=token_data.role_name,
+        token=token,
+    ))
     return token_data
 
 
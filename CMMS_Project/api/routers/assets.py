@@ -12,6 +12,7 @@ from api.schemas import (
 )
 from api.dependencies import get_db, get_current_user, require_role
 from api.security import TokenData
+from api.projection import ProjectionError, is_projection_requested, projected_page_response
 from database.models import Part
 from services.inventory_service import create_part as service_create_part
 import logging
@@ -25,11 +26,13 @@ logger = logging.getLogger(__name__)
     response_model=AssetListResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def list_assets(
+def list_assets(
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    status_filter: Optional[str] = Query(None, alias="status")
+    status_filter: Optional[str] = Query(None, alias="status"),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return, e.g. id,sku,name"),
+    expand: Optional[str] = Query(None, description="Comma-separated relations to embed: supplier, inventory_level")
 ):
     """
     List parts/assets with pagination and filtering
@@ -38,25 +41,28 @@ async def list_assets(
     - `skip`: Number of records to skip
     - `limit`: Number of records to return (max: 100)
     - `status`: Filter by status
+    - `fields`: Only these columns (sparse fieldset; `id` is always included)
+    - `expand`: Embed related objects (`supplier`, `inventory_level`)
     """
     try:
-        stmt = select(Part).offset(skip).limit(limit)
-        
+        criteria = []
         if status_filter:
-            stmt = stmt.where(Part.status == status_filter)
-        
-        assets = db.execute(stmt).scalars().all()
+            criteria.append(Part.status == status_filter)
         
         # Get total count
-        count_stmt = select(func.count()).select_from(Part)
-        if status_filter:
-            count_stmt = count_stmt.where(Part.status == status_filter)
-        total = db.execute(count_stmt).scalar()
+        total = db.execute(select(func.count()).select_from(Part).where(*criteria)).scalar()
+        
+        if is_projection_requested(fields, expand):
+            return projected_page_response(db, Part, criteria, skip, limit, total, fields, expand)
+        
+        assets = db.execute(select(Part).where(*criteria).offset(skip).limit(limit)).scalars().all()
         
         return AssetListResponse(
             total=total,
             items=[AssetResponse.from_orm(a) for a in assets]
         )
+    except ProjectionError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing assets: {str(e)}")
         raise HTTPException(
@@ -70,7 +76,7 @@ async def list_assets(
     response_model=AssetResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def get_asset(asset_id: int, db: Session = Depends(get_db)):
+def get_asset(asset_id: int, db: Session = Depends(get_db)):
     """
     Get asset/part by ID
     """
@@ -101,7 +107,7 @@ async def get_asset(asset_id: int, db: Session = Depends(get_db)):
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(get_current_user)]
 )
-async def create_asset(
+def create_asset(
     asset_data: AssetCreate,
     current_user: TokenData = Depends(require_role("admin", "manager")),
     db: Session = Depends(get_db)
@@ -146,7 +152,7 @@ async def create_asset(
     "/{asset_id}",
     response_model=AssetResponse
 )
-async def update_asset(
+def update_asset(
     asset_id: int,
     asset_data: AssetUpdate,
     current_user: TokenData = Depends(get_current_user),
@@ -200,7 +206,7 @@ async def update_asset(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(get_current_user)]
 )
-async def delete_asset(asset_id: int, db: Session = Depends(get_db)):
+def delete_asset(asset_id: int, db: Session = Depends(get_db)):
     """
     Delete asset/part
     """
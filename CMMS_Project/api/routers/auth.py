@@ -24,7 +24,7 @@ logger = logging.getLogger(__name__)
         422: {"model": ErrorResponse, "description": "Validation error"}
     }
 )
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+def login(request: LoginRequest, db: Session = Depends(get_db)):
     """
     User login endpoint
     
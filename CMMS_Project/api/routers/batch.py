@@ -0,0 +1,56 @@
+"""
+Batch Router
+Several write operations in one round-trip (and one transaction)
+"""
+
+from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy.orm import Session
+from typing import Dict, List
+from api.schemas import BatchRequest, BatchResponse
+from api.dependencies import get_db, get_current_user
+from api.security import TokenData
+from services.batch_service import execute_batch, BatchServiceError
+import logging
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+logger = logging.getLogger(__name__)
+
+
+def run_batch(operations: List[Dict], atomic: bool, current_user: TokenData, db: Session) -> Dict:
+    """Shared by /batch and the bulk routes"""
+    try:
+        return execute_batch(
+            operations, user_id=current_user.user_id, atomic=atomic, session=db, role_name=current_user.role_name
+        )
+    except BatchServiceError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error executing batch: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to execute batch"
+        )
+
+
+@router.post(
+    "",
+    response_model=BatchResponse
+)
+def batch(
+    request: BatchRequest,
+    current_user: TokenData = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Execute an ordered list of operations
+    
+    **Operations:** `worksheet.create`, `worksheet.update`, `worksheet.add_part`, `pm.complete`
+    
+    An operation with `ref` can be referenced by later operations as `"$<ref>"`
+    (e.g. add parts to a worksheet created in the same batch). With `atomic`
+    (default) the batch is one transaction: if an operation fails, the
+    batch is rolled back and `committed` is false; every operation gets a
+    result entry (`ok`, `error`, `skipped`, `rolled_back`).
+    """
+    operations = [operation.model_dump() for operation in request.operations]
+    return run_batch(operations, request.atomic, current_user, db)
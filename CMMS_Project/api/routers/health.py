@@ -3,9 +3,12 @@ Health Check Router
 API health and status endpoints
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from datetime import datetime
 from pydantic import BaseModel
+from api.dependencies import require_role
+from database.connection import get_engine_pool_status
+from database.query_profiler import get_query_profile
 import logging
 
 router = APIRouter(prefix="/health", tags=["Health"])
@@ -61,6 +64,27 @@ async def readiness_check():
     """
     Readiness check endpoint
     
-    Returns 200 if API is ready to handle requests.
+    Returns 200 if API is ready to handle requests, with the database
+    connection pool metrics (checkouts, wait time, overflow, invalidations).
     """
-    return {"ready": True}
+    return {"ready": True, "database_pool": get_engine_pool_status()}
+
+
+@router.get(
+    "/metrics",
+    dependencies=[Depends(require_role("admin"))]
+)
+async def metrics(limit: int = Query(10, ge=1, le=100)):
+    """
+    Performance metrics endpoint (admin only)
+    
+    Returns the service calls with the most database time and statements
+    over the recent call window, suspected N+1 patterns (see
+    database.query_profiler) and the connection pool metrics. SQL text and
+    caller names are internals, so the endpoint requires an admin token.
+    """
+    return {
+        "timestamp": datetime.utcnow(),
+        "queries": get_query_profile(limit),
+        "database_pool": get_engine_pool_status(),
+    }
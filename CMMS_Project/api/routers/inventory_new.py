@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/", response_model=InventoryListResponse)
-async def list_inventory(
+def list_inventory(
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100)
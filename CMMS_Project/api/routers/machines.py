@@ -12,6 +12,8 @@ from api.schemas import (
 )
 from api.dependencies import get_db, get_current_user, require_role, get_user_language
 from api.security import TokenData
+from api.serialization import list_page_response, schema_columns
+from api.projection import ProjectionError, is_projection_requested, projected_page_response
 from database.models import Machine
 from services.asset_service import create_machine as service_create_machine
 from utils.localization_helper import get_localized_error
@@ -26,11 +28,13 @@ logger = logging.getLogger(__name__)
     response_model=MachineListResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def list_machines(
+def list_machines(
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    status_filter: Optional[str] = Query(None, alias="status")
+    status_filter: Optional[str] = Query(None, alias="status"),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return, e.g. id,name,status"),
+    expand: Optional[str] = Query(None, description="Comma-separated relations to embed: production_line")
 ):
     """
     List all machines with pagination and filtering
@@ -39,31 +43,34 @@ async def list_machines(
     - `skip`: Number of records to skip (default: 0)
     - `limit`: Number of records to return (default: 10, max: 100)
     - `status`: Filter by status (operational, maintenance, offline)
+    - `fields`: Only these columns (sparse fieldset; `id` is always included)
+    - `expand`: Embed related objects (`production_line`)
     
     **Example:**
     ```bash
     curl -X GET "http://localhost:8000/api/machines?skip=0&limit=20&status=operational" \\
       -H "Authorization: Bearer <token>"
+    curl -X GET "http://localhost:8000/api/machines?fields=name,status&expand=production_line" \\
+      -H "Authorization: Bearer <token>"
     ```
     """
     try:
-        stmt = select(Machine).offset(skip).limit(limit)
-        
+        criteria = []
         if status_filter:
-            stmt = stmt.where(Machine.status == status_filter)
-        
-        machines = db.execute(stmt).scalars().all()
+            criteria.append(Machine.status == status_filter)
         
         # Get total count
-        count_stmt = select(func.count()).select_from(Machine)
-        if status_filter:
-            count_stmt = count_stmt.where(Machine.status == status_filter)
-        total = db.execute(count_stmt).scalar()
+        total = db.execute(select(func.count()).select_from(Machine).where(*criteria)).scalar()
         
-        return MachineListResponse(
-            total=total,
-            items=[MachineResponse.from_orm(m) for m in machines]
-        )
+        if is_projection_requested(fields, expand):
+            return projected_page_response(db, Machine, criteria, skip, limit, total, fields, expand)
+        
+        stmt = select(*schema_columns(Machine, MachineResponse)).where(*criteria).offset(skip).limit(limit)
+        rows = db.execute(stmt).all()
+        
+        return list_page_response(MachineResponse, rows, total)
+    except ProjectionError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing machines: {str(e)}")
         raise HTTPException(
@@ -77,7 +84,7 @@ async def list_machines(
     response_model=MachineResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def get_machine(machine_id: int, db: Session = Depends(get_db)):
+def get_machine(machine_id: int, db: Session = Depends(get_db)):
     """
     Get machine by ID
     
@@ -115,7 +122,7 @@ async def get_machine(machine_id: int, db: Session = Depends(get_db)):
     responses={400: {"model": ErrorResponse}},
     dependencies=[Depends(get_current_user)]
 )
-async def create_machine(
+def create_machine(
     machine_data: MachineCreate,
     current_user: TokenData = Depends(require_role("admin", "manager")),
     db: Session = Depends(get_db)
@@ -176,7 +183,7 @@ async def create_machine(
     response_model=MachineResponse,
     responses={404: {"model": ErrorResponse}}
 )
-async def update_machine(
+def update_machine(
     machine_id: int,
     machine_data: MachineUpdate,
     current_user: TokenData = Depends(get_current_user),
@@ -232,7 +239,7 @@ async def update_machine(
     responses={404: {"model": ErrorResponse}},
     dependencies=[Depends(get_current_user)]
 )
-async def delete_machine(
+def delete_machine(
     machine_id: int, 
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -35,7 +35,7 @@ logger = logging.getLogger(__name__)
     response_model=List[RoleHierarchyResponse],
     dependencies=[Depends(get_current_user)]
 )
-async def get_roles(
+def get_roles(
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
@@ -71,7 +71,7 @@ async def get_roles(
     response_model=List[MenuItemResponse],
     dependencies=[Depends(get_current_user)]
 )
-async def get_menu_items(
+def get_menu_items(
     current_user: TokenData = Depends(get_current_user)
 ):
     """
@@ -102,7 +102,7 @@ async def get_menu_items(
     response_model=PermissionConfigResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def get_config(
+def get_config(
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
@@ -133,7 +133,7 @@ async def get_config(
         422: {"model": ErrorResponse, "description": "Validation error"}
     }
 )
-async def update_config(
+def update_config(
     config_update: PermissionConfigUpdate,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -226,7 +226,7 @@ async def update_config(
     response_model=dict,
     dependencies=[Depends(get_current_user)]
 )
-async def get_manage_permission_level(
+def get_manage_permission_level(
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
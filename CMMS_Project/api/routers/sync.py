@@ -0,0 +1,61 @@
+"""
+Sync Router
+Delta-sync change feed for offline (Android) clients
+"""
+
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from api.dependencies import get_db, get_current_user
+from services.sync_service import (
+    get_changes,
+    DEFAULT_BATCH_SIZE,
+    MAX_BATCH_SIZE,
+    UnknownSyncEntityError,
+    InvalidSyncCursorError,
+)
+import logging
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+logger = logging.getLogger(__name__)
+
+
+@router.get(
+    "/{entity}",
+    dependencies=[Depends(get_current_user)]
+)
+def sync_entity(
+    entity: str,
+    db: Session = Depends(get_db),
+    since: Optional[str] = Query(None, description="Cursor returned by the previous pull"),
+    limit: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=MAX_BATCH_SIZE),
+):
+    """
+    Rows of an entity changed or deleted since a cursor
+    
+    **Entities:** `machines`, `worksheets`, `assets`, `inventory`
+    
+    **Query Parameters:**
+    - `since`: Cursor from the previous response (omit for a full sync)
+    - `limit`: Batch size (default: 500, max: 2000)
+    
+    Keep pulling with the returned `cursor` while `has_more` is true.
+    
+    **Example:**
+    ```bash
+    curl -X GET "http://localhost:8000/api/sync/machines?since=<cursor>" \\
+      -H "Authorization: Bearer <token>"
+    ```
+    """
+    try:
+        return get_changes(entity, cursor=since, limit=limit, session=db)
+    except UnknownSyncEntityError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidSyncCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error syncing {entity}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error syncing entity"
+        )
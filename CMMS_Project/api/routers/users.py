@@ -12,6 +12,7 @@ from api.schemas import (
 )
 from api.dependencies import get_db, get_current_user, require_role, get_user_language
 from api.security import TokenData, hash_password
+from api.serialization import list_page_response
 from database.models import User, Role
 from services.user_service import (
     create_user as service_create_user,
@@ -32,7 +33,7 @@ logger = logging.getLogger(__name__)
     response_model=UserListResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def list_users(
+def list_users(
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
@@ -70,10 +71,7 @@ async def list_users(
             count_stmt = count_stmt.join(Role).where(Role.name == role_name)
         total = db.execute(select(func.count()).select_from(User)).scalar()
         
-        return UserListResponse(
-            total=total,
-            items=[UserResponse.from_orm(user) for user in users]
-        )
+        return list_page_response(UserResponse, users, total)
     except Exception as e:
         logger.error(f"Error listing users: {str(e)}")
         lang_code = "en"  # Default for API errors
@@ -88,7 +86,7 @@ async def list_users(
     response_model=UserResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def get_user(
+def get_user(
     user_id: int, 
     db: Session = Depends(get_db),
     lang_code: str = Depends(get_user_language)
@@ -135,7 +133,7 @@ async def get_user(
         409: {"model": ErrorResponse}
     }
 )
-async def create_user(
+def create_user(
     user_data: UserCreate,
     current_user: TokenData = Depends(require_role("admin", "manager")),
     db: Session = Depends(get_db),
@@ -217,7 +215,7 @@ async def create_user(
         409: {"model": ErrorResponse}
     }
 )
-async def update_user(
+def update_user(
     user_id: int,
     user_data: UserUpdate,
     current_user: TokenData = Depends(require_role("admin", "manager")),
@@ -313,7 +311,7 @@ async def update_user(
         403: {"model": ErrorResponse}
     }
 )
-async def delete_user(
+def delete_user(
     user_id: int,
     current_user: TokenData = Depends(require_role("admin")),
     db: Session = Depends(get_db),
@@ -369,7 +367,7 @@ async def delete_user(
     response_model=UserResponse,
     responses={404: {"model": ErrorResponse}}
 )
-async def reset_password(
+def reset_password(
     user_id: int,
     current_user: TokenData = Depends(require_role("admin", "manager")),
     db: Session = Depends(get_db),
@@ -8,11 +8,17 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select, func
 from typing import Optional
 from api.schemas import (
-    WorksheetCreate, WorksheetUpdate, WorksheetResponse, WorksheetListResponse, ErrorResponse
+    WorksheetCreate, WorksheetUpdate, WorksheetResponse, WorksheetListResponse, ErrorResponse,
+    BatchResponse, WorksheetBulkCreateRequest, WorksheetBulkUpdateRequest, WorksheetPartBulkRequest
 )
 from api.dependencies import get_db, get_current_user
 from api.security import TokenData
+from api.serialization import list_page_response, schema_columns
+from api.projection import ProjectionError, is_projection_requested, projected_page_response
+from api.routers.batch import run_batch
+from api.streaming import stream_rows_response
 from database.models import Worksheet
+from services.streaming_export_service import WORKSHEET_COLUMNS, iter_worksheet_rows
 import logging
 
 router = APIRouter(prefix="/worksheets", tags=["Worksheets"])
@@ -24,12 +30,14 @@ logger = logging.getLogger(__name__)
     response_model=WorksheetListResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def list_worksheets(
+def list_worksheets(
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     status_filter: Optional[str] = Query(None, alias="status"),
-    machine_id: Optional[int] = Query(None)
+    machine_id: Optional[int] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return, e.g. id,title,status"),
+    expand: Optional[str] = Query(None, description="Comma-separated relations to embed: machine, assigned_user")
 ):
     """
     List worksheets with pagination and filtering
@@ -39,29 +47,28 @@ async def list_worksheets(
     - `limit`: Number of records to return (default: 10, max: 100)
     - `status`: Filter by status (pending, in_progress, completed)
     - `machine_id`: Filter by machine ID
+    - `fields`: Only these columns (sparse fieldset; `id` is always included)
+    - `expand`: Embed related objects (`machine`, `assigned_user`)
     """
     try:
-        stmt = select(Worksheet).offset(skip).limit(limit)
-        
+        criteria = []
         if status_filter:
-            stmt = stmt.where(Worksheet.status == status_filter)
+            criteria.append(Worksheet.status == status_filter)
         if machine_id:
-            stmt = stmt.where(Worksheet.machine_id == machine_id)
-        
-        worksheets = db.execute(stmt).scalars().all()
+            criteria.append(Worksheet.machine_id == machine_id)
         
         # Get total count
-        count_stmt = select(func.count()).select_from(Worksheet)
-        if status_filter:
-            count_stmt = count_stmt.where(Worksheet.status == status_filter)
-        if machine_id:
-            count_stmt = count_stmt.where(Worksheet.machine_id == machine_id)
-        total = db.execute(count_stmt).scalar()
+        total = db.execute(select(func.count()).select_from(Worksheet).where(*criteria)).scalar()
         
-        return WorksheetListResponse(
-            total=total,
-            items=[WorksheetResponse.from_orm(w) for w in worksheets]
-        )
+        if is_projection_requested(fields, expand):
+            return projected_page_response(db, Worksheet, criteria, skip, limit, total, fields, expand)
+        
+        columns = schema_columns(Worksheet, WorksheetResponse, sources={"completed_at": "closed_at"})
+        rows = db.execute(select(*columns).where(*criteria).offset(skip).limit(limit)).all()
+        
+        return list_page_response(WorksheetResponse, rows, total)
+    except ProjectionError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing worksheets: {str(e)}")
         raise HTTPException(
@@ -70,12 +77,36 @@ async def list_worksheets(
         )
 
 
+@router.get(
+    "/export",
+    dependencies=[Depends(get_current_user)]
+)
+def export_worksheets(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    machine_id: Optional[int] = Query(None),
+):
+    """
+    Stream every matching worksheet as NDJSON (default) or CSV
+    
+    Rows are read with a server-side cursor while the body is sent, so the
+    export size is not limited by server memory.
+    
+    **Query Parameters:**
+    - `format`: `ndjson` or `csv`
+    - `status`: Filter by status
+    - `machine_id`: Filter by machine ID
+    """
+    rows = iter_worksheet_rows(machine_id=machine_id, status=status_filter)
+    return stream_rows_response(rows, [column.key for column in WORKSHEET_COLUMNS], fmt, filename="worksheets")
+
+
 @router.get(
     "/{worksheet_id}",
     response_model=WorksheetResponse,
     dependencies=[Depends(get_current_user)]
 )
-async def get_worksheet(worksheet_id: int, db: Session = Depends(get_db)):
+def get_worksheet(worksheet_id: int, db: Session = Depends(get_db)):
     """
     Get worksheet by ID
     """
@@ -106,7 +137,7 @@ async def get_worksheet(worksheet_id: int, db: Session = Depends(get_db)):
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(get_current_user)]
 )
-async def create_worksheet(
+def create_worksheet(
     worksheet_data: WorksheetCreate,
     db: Session = Depends(get_db)
 ):
@@ -142,7 +173,7 @@ async def create_worksheet(
     "/{worksheet_id}",
     response_model=WorksheetResponse
 )
-async def update_worksheet(
+def update_worksheet(
     worksheet_id: int,
     worksheet_data: WorksheetUpdate,
     current_user: TokenData = Depends(get_current_user),
@@ -189,7 +220,7 @@ async def update_worksheet(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(get_current_user)]
 )
-async def delete_worksheet(worksheet_id: int, db: Session = Depends(get_db)):
+def delete_worksheet(worksheet_id: int, db: Session = Depends(get_db)):
     """
     Delete worksheet
     """
@@ -216,3 +247,60 @@ async def delete_worksheet(worksheet_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete worksheet"
         )
+
+
+@router.post(
+    "/bulk",
+    response_model=BatchResponse
+)
+def bulk_create_worksheets(
+    request: WorksheetBulkCreateRequest,
+    current_user: TokenData = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Create several worksheets in one request (one transaction when `atomic`)
+    """
+    operations = [
+        {"op": "worksheet.create", "params": item.model_dump(exclude_none=True)}
+        for item in request.items
+    ]
+    return run_batch(operations, request.atomic, current_user, db)
+
+
+@router.patch(
+    "/bulk",
+    response_model=BatchResponse
+)
+def bulk_update_worksheets(
+    request: WorksheetBulkUpdateRequest,
+    current_user: TokenData = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Update fields and/or status of several worksheets (status changes go through the workflow)
+    """
+    operations = [
+        {"op": "worksheet.update", "params": item.model_dump(exclude_unset=True)}
+        for item in request.items
+    ]
+    return run_batch(operations, request.atomic, current_user, db)
+
+
+@router.post(
+    "/parts/bulk",
+    response_model=BatchResponse
+)
+def bulk_add_worksheet_parts(
+    request: WorksheetPartBulkRequest,
+    current_user: TokenData = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Record part consumption on worksheets (stock is issued FIFO, as for single additions)
+    """
+    operations = [
+        {"op": "worksheet.add_part", "params": item.model_dump(exclude_none=True)}
+        for item in request.items
+    ]
+    return run_batch(operations, request.atomic, current_user, db)
@@ -2,7 +2,7 @@
 Pydantic schemas for API request/response validation
 """
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 from typing import Optional, List, Dict
 from datetime import datetime
 
@@ -191,13 +191,13 @@ class WorksheetResponse(BaseModel):
     """Worksheet response schema"""
     id: int
     machine_id: int
-    maintenance_type: str
+    maintenance_type: Optional[str] = None  # Not stored on Worksheet yet
     description: Optional[str]
     assigned_to_user_id: Optional[int]
     status: str
     created_at: datetime
     updated_at: Optional[datetime]
-    completed_at: Optional[datetime]
+    completed_at: Optional[datetime] = Field(None, validation_alias=AliasChoices("completed_at", "closed_at"))
     
     class Config:
         from_attributes = True
@@ -440,4 +440,108 @@ class ReportsSummaryDto(BaseModel):
     machines_total: int
     worksheets_open: int
     inventory_low_stock: int
-    pm_due_this_week: int
\ No newline at end of file
+    pm_due_this_week: int
+
+# ============================================================================
+# BATCH / BULK SCHEMAS
+# ============================================================================
+
+class BatchOperation(BaseModel):
+    """One operation of a batch request"""
+    op: str  # worksheet.create, worksheet.update, worksheet.add_part, pm.complete
+    params: Dict = Field(default_factory=dict)
+    ref: Optional[str] = None  # Later operations can use "$<ref>" for the created id
+
+
+class BatchRequest(BaseModel):
+    """Ordered operations, executed in one transaction when atomic"""
+    operations: List[BatchOperation] = Field(..., min_length=1)
+    atomic: bool = True
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "operations": [
+                    {"op": "worksheet.create", "ref": "ws", "params": {
+                        "machine_id": 1, "description": "Leaking seal", "breakdown_time": "2026-01-05T08:00:00"}},
+                    {"op": "worksheet.add_part", "params": {"worksheet_id": "$ws", "part_id": 3, "quantity_used": 2}},
+                    {"op": "worksheet.update", "params": {
+                        "worksheet_id": "$ws", "fault_cause": "Wear", "status": "Closed",
+                        "repair_finished_time": "2026-01-05T10:30:00"}}
+                ],
+                "atomic": True
+            }
+        }
+
+
+class BatchOperationResult(BaseModel):
+    """Result of one batch operation"""
+    index: int
+    op: Optional[str]
+    status: str  # ok, error, skipped, rolled_back
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    """Batch response"""
+    committed: bool
+    results: List[BatchOperationResult]
+
+
+class WorksheetBulkCreateItem(BaseModel):
+    """Worksheet to create in bulk"""
+    machine_id: int
+    assigned_to_user_id: Optional[int] = None
+    title: Optional[str] = ""
+    description: Optional[str] = None
+    breakdown_time: Optional[datetime] = None
+
+
+class WorksheetBulkUpdateItem(BaseModel):
+    """Worksheet field and status update in bulk"""
+    worksheet_id: int
+    description: Optional[str] = None
+    notes: Optional[str] = None
+    fault_cause: Optional[str] = None
+    assigned_to_user_id: Optional[int] = None
+    status: Optional[str] = None
+    repair_finished_time: Optional[datetime] = None
+
+
+class WorksheetPartBulkItem(BaseModel):
+    """Part consumption on a worksheet"""
+    worksheet_id: int
+    part_id: int
+    quantity_used: int = Field(..., gt=0)
+    unit_cost_at_time: float = 0.0
+    notes: Optional[str] = None
+    storage_location_id: Optional[int] = None
+
+
+class PMCompletionBulkItem(BaseModel):
+    """PM task completion"""
+    task_id: int
+    notes: Optional[str] = None
+    duration_minutes: Optional[int] = None
+    create_worksheet: bool = True
+
+
+class WorksheetBulkCreateRequest(BaseModel):
+    items: List[WorksheetBulkCreateItem] = Field(..., min_length=1)
+    atomic: bool = True
+
+
+class WorksheetBulkUpdateRequest(BaseModel):
+    items: List[WorksheetBulkUpdateItem] = Field(..., min_length=1)
+    atomic: bool = True
+
+
+class WorksheetPartBulkRequest(BaseModel):
+    items: List[WorksheetPartBulkItem] = Field(..., min_length=1)
+    atomic: bool = True
+
+
+class PMCompletionBulkRequest(BaseModel):
+    items: List[PMCompletionBulkItem] = Field(..., min_length=1)
+    atomic: bool = True
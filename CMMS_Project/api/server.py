@@ -4,21 +4,22 @@ Start REST API server with Uvicorn
 """
 
 import uvicorn
+import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
 # Add project root to path - CRITICAL FOR SERVER DEPLOYMENT
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
-sys.path.insert(0, str(PROJECT_ROOT / "api"))
-sys.path.insert(0, str(PROJECT_ROOT / "services"))
-sys.path.insert(0, str(PROJECT_ROOT / "database"))
-sys.path.insert(0, str(PROJECT_ROOT / "utils"))
-sys.path.insert(0, str(PROJECT_ROOT / "config"))
-sys.path.insert(0, str(PROJECT_ROOT / "localization"))
+# Sub-directories go last so "database" etc. resolve to the packages, not to
+# same-named modules inside them (database/database.py)
+for _subdir in ("api", "services", "database", "utils", "config", "localization"):
+    sys.path.append(str(PROJECT_ROOT / _subdir))
 
 from api.app import create_app
+from config.app_config import API_HOST, API_PORT, API_WORKERS, API_THREADPOOL_SIZE
 
 # Configure logging
 logging.basicConfig(
@@ -28,29 +29,58 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Command line options (defaults come from API_* environment variables)"""
+    parser = argparse.ArgumentParser(description="CMMS REST API server")
+    parser.add_argument("--host", default=API_HOST, help="Bind address")
+    parser.add_argument("--port", type=int, default=API_PORT, help="Port")
+    parser.add_argument("--workers", type=int, default=API_WORKERS,
+                        help="Uvicorn worker processes (each has its own DB engine)")
+    parser.add_argument("--threadpool-size", type=int, default=API_THREADPOOL_SIZE,
+                        help="Threads per worker for the sync route handlers")
+    parser.add_argument("--no-access-log", action="store_true", help="Disable the access log")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Start FastAPI server"""
+    args = parse_args(argv)
+    
     print(f"\n{'='*60}")
     print(f"CMMS REST API v1.0.0")
     print(f"{'='*60}\n")
     
     try:
-        app = create_app()
+        # Worker processes re-import the config, so pass the pool size on via the environment
+        os.environ["API_THREADPOOL_SIZE"] = str(args.threadpool_size)
         
         print("Starting FastAPI server...")
-        print("  📍 API URL: http://localhost:8000")
-        print("  📚 Swagger UI: http://localhost:8000/api/docs")
-        print("  📖 ReDoc: http://localhost:8000/api/redoc")
-        print("  💚 Health Check: http://localhost:8000/api/health/")
+        print(f"  📍 API URL: http://localhost:{args.port}")
+        print(f"  📚 Swagger UI: http://localhost:{args.port}/api/docs")
+        print(f"  📖 ReDoc: http://localhost:{args.port}/api/redoc")
+        print(f"  💚 Health Check: http://localhost:{args.port}/api/health/")
+        print(f"  ⚙ Workers: {args.workers}, threads per worker: {args.threadpool_size}")
         print("\n✅ Server ready. Press Ctrl+C to stop.\n")
         
-        uvicorn.run(
-            app,
-            host="0.0.0.0",
-            port=8000,
-            log_level="info",
-            access_log=True
-        )
+        if args.workers > 1:
+            # Multiple workers need an import string so each process builds its own app
+            uvicorn.run(
+                "api.app:create_app",
+                factory=True,
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+                log_level="info",
+                access_log=not args.no_access_log
+            )
+        else:
+            uvicorn.run(
+                create_app(threadpool_size=args.threadpool_size),
+                host=args.host,
+                port=args.port,
+                log_level="info",
+                access_log=not args.no_access_log
+            )
     except KeyboardInterrupt:
         print("\n\n❌ Server stopped.")
         sys.exit(0)
@@ -0,0 +1,135 @@
+"""
+Streaming Responses
+NDJSON / CSV responses fed by a row iterator (server-side cursor).
+
+The iterator is consumed lazily while the body is sent, in Starlette's
+threadpool, so memory stays flat for any number of rows. Row sources must
+open and close their own database session: the request's `get_db` session
+is already closed by the time the body is streamed. The response closes the
+iterators when it ends for any reason, so a client that disconnects
+mid-download does not leave a session (and pooled connection) open.
+"""
+
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+import anyio
+import anyio.to_thread
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"  # Starlette appends "; charset=utf-8"
+STREAM_FORMATS = ("ndjson", "csv")
+
+# Rows are sent in chunks of about this many bytes
+CHUNK_SIZE = 64 * 1024
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _json_line(row: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(row, default=_json_default, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def iter_ndjson(rows: Iterable[Dict]) -> Iterator[bytes]:
+    """One JSON object per line"""
+    buffer = bytearray()
+    for row in rows:
+        buffer += _json_line(row)
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(rows: Iterable[Dict], fields: Sequence[str]) -> Iterator[bytes]:
+    """Header line with `fields`, then one line per row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for row in rows:
+        writer.writerow([_csv_value(row.get(field)) for field in fields])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """StreamingResponse that closes its iterators when sending ends, completed or not"""
+
+    def __init__(self, content: Iterator[bytes], *, sources: Sequence[Iterable] = (), **kwargs):
+        super().__init__(content, **kwargs)
+        # Outermost first: closing a generator runs its `finally` (session.close())
+        self._sources = [content, *sources]
+
+    def _close_sources(self):
+        for source in self._sources:
+            close = getattr(source, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Error closing stream source: {e}")
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # Also on disconnect / cancellation; the sources close sessions (blocking I/O)
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(self._close_sources)
+
+
+def stream_rows_response(
+    rows: Iterable[Dict],
+    fields: Sequence[str],
+    fmt: str = "ndjson",
+    filename: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    Stream `rows` as NDJSON or CSV
+
+    Args:
+        rows: Row dicts (lazy iterator)
+        fields: CSV columns (NDJSON sends the whole row)
+        fmt: "ndjson" or "csv"
+        filename: Download name without extension (Content-Disposition attachment)
+    """
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"Unknown stream format: {fmt}")
+    if fmt == "csv":
+        body, media_type = iter_csv(rows, fields), CSV_MEDIA_TYPE
+    else:
+        body, media_type = iter_ndjson(rows), NDJSON_MEDIA_TYPE
+    headers = {}
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}.{fmt}"'
+    return ClosingStreamingResponse(body, sources=[rows], media_type=media_type, headers=headers)
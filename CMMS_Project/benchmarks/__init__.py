@@ -0,0 +1,10 @@
+"""
+Performance benchmark suite
+Times the critical service calls, API list endpoints and exports against a
+deterministic synthetic plant (benchmarks.data_generator) and stores the
+results for comparison between versions (benchmarks.results).
+
+Usage:
+    python -m pytest benchmarks --bench-scale small
+    python -m pytest benchmarks --bench-scale full --bench-compare latest
+"""
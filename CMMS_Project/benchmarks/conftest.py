@@ -0,0 +1,247 @@
+"""
+Benchmark fixtures
+`plant` points the application at a working copy of a generated plant
+database for the whole session; `benchmark` times a callable over several
+rounds (the call interface of pytest-benchmark: benchmark(fn, *args) and
+benchmark.pedantic(...)) and additionally records the statements it
+executes and its peak Python memory. Results are written to
+benchmarks/results at the end of the session and optionally compared with an
+earlier run.
+"""
+
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+from sqlalchemy import func, select
+
+from benchmarks import results as bench_results
+from benchmarks.data_generator import SCALES, cached_plant, copy_plant, reference_date
+
+_results_key = pytest.StashKey[List[Dict]]()
+_plant_key = pytest.StashKey["Plant"]()
+_saved_key = pytest.StashKey[Optional[Path]]()
+_comparison_key = pytest.StashKey[tuple]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-scale", choices=sorted(SCALES), default="small",
+                    help="Size of the generated plant (default: small)")
+    group.addoption("--bench-seed", type=int, default=42, help="Seed of the generated plant")
+    group.addoption("--bench-date", type=date.fromisoformat, default=None,
+                    help="Reference day of the generated plant, YYYY-MM-DD (default: today)")
+    group.addoption("--bench-rounds", type=int, default=5, help="Timed rounds per benchmark")
+    group.addoption("--bench-compare", default=None, metavar="PATH|latest",
+                    help="Compare with a stored run; fails the session on regressions")
+    group.addoption("--bench-max-regression", type=float, default=bench_results.DEFAULT_MAX_REGRESSION,
+                    help="Tolerated median slowdown as a ratio (default: %(default)s)")
+    group.addoption("--bench-no-save", action="store_true", help="Do not store the results")
+
+
+def pytest_configure(config):
+    config.stash[_results_key] = []
+
+
+@dataclass
+class Plant:
+    """The generated dataset the session runs against"""
+    path: Path
+    scale: str
+    seed: int
+    reference: datetime
+    rows: Dict[str, int] = field(default_factory=dict)
+
+    def first_id(self, model) -> int:
+        from database.session_manager import ReadSessionLocal
+        with ReadSessionLocal() as session:
+            return session.execute(select(func.min(model.id))).scalar_one()
+
+
+@pytest.fixture(scope="session")
+def plant(request, tmp_path_factory):
+    """Generated plant database installed as the application database"""
+    from database import Base, connection
+    from services import reports_service
+
+    options = request.config.option
+    reference = reference_date(options.bench_date)
+    source = cached_plant(options.bench_scale, options.bench_seed, reference)
+    path = copy_plant(source, tmp_path_factory.mktemp("plant") / source.name)
+
+    engine = connection.create_engine_for_url(f"sqlite:///{path}")
+    mode = connection._current_mode or "production"
+    previous = connection._swap_engine(engine, mode)
+    reports_service._stats_cache.clear()
+    try:
+        with engine.connect() as conn:
+            rows = {
+                table.name: conn.execute(select(func.count()).select_from(table)).scalar_one()
+                for table in Base.metadata.sorted_tables
+            }
+        current = Plant(path, options.bench_scale, options.bench_seed, reference,
+                        {name: count for name, count in rows.items() if count})
+        request.config.stash[_plant_key] = current
+        yield current
+    finally:
+        connection._swap_engine(previous, mode)
+        reports_service._stats_cache.clear()
+        engine.dispose()
+
+
+class BenchmarkFixture:
+    """Times one callable; the last call's return value is handed back to the test"""
+
+    def __init__(self, name: str, rounds: int, results: List[Dict]):
+        self.name = name
+        self.rounds = rounds
+        self._results = results
+        self.stats: Optional[Dict] = None
+        # Free-form figures stored with the result (e.g. rows per second)
+        self.extra_info: Dict = {}
+
+    def __call__(self, target: Callable, *args, **kwargs):
+        return self.pedantic(target, args=args, kwargs=kwargs)
+
+    def pedantic(self, target: Callable, args: tuple = (), kwargs: Optional[Dict] = None,
+                 setup: Optional[Callable] = None, rounds: Optional[int] = None, warmup_rounds: int = 1):
+        """
+        Run target(*args, **kwargs) warmup_rounds + rounds times, plus one
+        instrumented round for the query count and peak memory
+
+        setup is called before every round (outside the timing); when it
+        returns an (args, kwargs) tuple, those are used for that round.
+        """
+        from database import query_profiler
+
+        if self.stats is not None:
+            raise RuntimeError("benchmark fixture can only be used once per test")
+        kwargs = kwargs or {}
+        rounds = rounds or self.rounds
+
+        def prepare():
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    return prepared
+            return args, kwargs
+
+        for _ in range(warmup_rounds):
+            call_args, call_kwargs = prepare()
+            target(*call_args, **call_kwargs)
+
+        timings = []
+        result = None
+        for _ in range(rounds):
+            call_args, call_kwargs = prepare()
+            started = time.perf_counter()
+            result = target(*call_args, **call_kwargs)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        # Profiling and tracemalloc both slow the call down: measured separately
+        call_args, call_kwargs = prepare()
+        was_enabled = query_profiler.profiler.enabled
+        query_profiler.profiler.enabled = True
+        tracemalloc.start()
+        try:
+            with query_profiler.profile_call(f"benchmark.{self.name}") as call:
+                target(*call_args, **call_kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            query_profiler.profiler.enabled = was_enabled
+
+        self.stats = {
+            "name": self.name,
+            "rounds": rounds,
+            "min_ms": round(min(timings), 3),
+            "median_ms": round(statistics.median(timings), 3),
+            "mean_ms": round(statistics.fmean(timings), 3),
+            "max_ms": round(max(timings), 3),
+            "stddev_ms": round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0,
+            "queries": call.queries,
+            "query_ms": round(call.query_seconds * 1000, 3),
+            "peak_memory_bytes": peak,
+            "extra_info": self.extra_info,
+        }
+        self._results.append(self.stats)
+        return result
+
+
+@pytest.fixture
+def benchmark(request, plant):
+    """Time a call against the generated plant: benchmark(fn, *args, **kwargs)"""
+    fixture = BenchmarkFixture(request.node.name, request.config.option.bench_rounds,
+                               request.config.stash[_results_key])
+    yield fixture
+    if fixture.stats is None:
+        pytest.fail("benchmark fixture requested but never called")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    benchmarks = config.stash.get(_results_key, [])
+    current_plant = config.stash.get(_plant_key, None)
+    if not benchmarks or current_plant is None:
+        return
+
+    metadata = bench_results.run_metadata(current_plant.scale, current_plant.seed,
+                                          current_plant.reference, current_plant.rows)
+    saved = None
+    if not config.option.bench_no_save:
+        saved = bench_results.save_results(metadata, benchmarks)
+    config.stash[_saved_key] = saved
+
+    compare = config.option.bench_compare
+    if compare:
+        baseline = (
+            bench_results.find_latest(scale=current_plant.scale, exclude=saved)
+            if compare == "latest" else Path(compare)
+        )
+        if baseline is None or not baseline.exists():
+            config.stash[_comparison_key] = (compare, None)
+            return
+        rows = bench_results.compare_results(
+            bench_results.load_results(baseline),
+            {"metadata": metadata, "benchmarks": benchmarks},
+            config.option.bench_max_regression,
+        )
+        config.stash[_comparison_key] = (baseline, rows)
+        if any(row["regression"] for row in rows) and session.exitstatus == 0:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    benchmarks = config.stash.get(_results_key, [])
+    if not benchmarks:
+        return
+    current_plant = config.stash.get(_plant_key, None)
+    title = "benchmarks"
+    if current_plant is not None:
+        title += f" ({current_plant.scale}, seed {current_plant.seed}, {sum(current_plant.rows.values())} rows)"
+    terminalreporter.write_sep("=", title)
+    terminalreporter.write_line(bench_results.format_results(benchmarks))
+    saved = config.stash.get(_saved_key, None)
+    if saved:
+        terminalreporter.write_line(f"saved: {saved}")
+
+    comparison = config.stash.get(_comparison_key, None)
+    if comparison:
+        baseline, rows = comparison
+        if rows is None:
+            terminalreporter.write_line(f"no stored run to compare with: {baseline}")
+            return
+        terminalreporter.write_sep("-", f"compared with {Path(baseline).name}")
+        terminalreporter.write_line(bench_results.format_comparison(rows))
+        regressions = [row["name"] for row in rows if row["regression"]]
+        if regressions:
+            terminalreporter.write_line(f"REGRESSIONS: {', '.join(regressions)}", red=True)
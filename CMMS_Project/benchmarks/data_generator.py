@@ -0,0 +1,547 @@
+#!/usr/bin/env python
+"""
+Synthetic Plant Data Generator
+Seeds a SQLite database with a realistic maintenance plant: production lines
+and machines, a parts catalogue with stock levels, storage locations, stock
+transactions and FIFO batches, worksheets with used parts, PM tasks and
+their history, shift schedules, vacations and system log rows.
+
+The data is deterministic for a (scale, seed, reference date): every random
+choice comes from one seeded generator and timestamps are spread backwards
+from the end of the reference day (today by default), so the period
+statistics (day, week, month, year) always have data. Rows are written with Core executemany
+in chunks, bypassing the ORM.
+
+Usage:
+    python -m benchmarks.data_generator --scale full --output plant.db
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from database import Base
+from database.models import (
+    InventoryLevel, Machine, Part, PartLocation, PMHistory, PMTask, ProductionLine,
+    Role, ServiceRecord, ShiftSchedule, StockBatch, StockTransaction, StorageLocation,
+    Supplier, SystemLog, User, VacationRequest, Worksheet, WorksheetPart,
+)
+from services.inventory_valuation_service import rebuild_part_valuations
+
+# Bump when the generated data changes: cached databases of older versions are rebuilt
+GENERATOR_VERSION = 2
+
+CACHE_DIR = Path(__file__).parent / ".data"
+
+CHUNK_SIZE = 5000
+
+# Row counts per scale ("full" is the size of a large plant after several years)
+SCALES: Dict[str, Dict[str, int]] = {
+    "tiny": {
+        "users": 20, "production_lines": 4, "machines": 40, "suppliers": 10, "parts": 500,
+        "warehouses": 2, "stock_transactions": 2000, "worksheets": 1500, "pm_histories": 500,
+        "service_records": 100, "system_logs": 2000,
+    },
+    "small": {
+        "users": 60, "production_lines": 10, "machines": 300, "suppliers": 50, "parts": 10_000,
+        "warehouses": 2, "stock_transactions": 30_000, "worksheets": 20_000, "pm_histories": 8_000,
+        "service_records": 1_000, "system_logs": 20_000,
+    },
+    "full": {
+        "users": 300, "production_lines": 40, "machines": 4_000, "suppliers": 300, "parts": 100_000,
+        "warehouses": 4, "stock_transactions": 400_000, "worksheets": 300_000, "pm_histories": 100_000,
+        "service_records": 20_000, "system_logs": 300_000,
+    },
+}
+
+# Spread of the generated history
+HISTORY_DAYS = 730
+
+ROLE_NAMES = ("Developer", "Manager", "Karbantartó", "Műszakvezető - Karbantartó", "Műszakvezető - Termelés")
+SHIFT_TYPES = (("single", "06:00", "14:00"), ("3_shift", None, None), ("4_shift", None, None))
+MACHINE_KINDS = ("Prés", "CNC maró", "Hegesztő robot", "Szállítószalag", "Kompresszor", "Fröccsöntő",
+                 "Csomagológép", "Hűtőtorony", "Festősor", "Daru")
+MANUFACTURERS = ("Siemens", "ABB", "Fanuc", "Bosch Rexroth", "KUKA", "Atlas Copco", "Trumpf", "Engel")
+PART_KINDS = (("Csapágy", "db"), ("Ékszíj", "db"), ("Szűrőbetét", "db"), ("Hidraulika olaj", "l"),
+              ("Tömítés", "db"), ("Mágnesszelep", "db"), ("Kábel", "m"), ("Kenőzsír", "kg"),
+              ("Biztosíték", "db"), ("Frekvenciaváltó", "db"), ("Érzékelő", "db"), ("Fogaskerék", "db"))
+PART_CATEGORIES = ("Mechanika", "Elektromos", "Hidraulika", "Pneumatika", "Kenőanyag", "Fogyóanyag")
+FAULTS = ("Csapágyhiba", "Túlmelegedés", "Szivárgás", "Érzékelő hiba", "Szíjszakadás", "Vezérlés hiba",
+          "Kopás", "Rezgés", "Áramellátás", "Kezelői hiba")
+WORKSHEET_STATUSES = (("Closed", 85), ("Open", 10), ("Waiting for Parts", 5))
+LOG_CATEGORIES = (("worksheet", "Worksheet"), ("inventory", "Part"), ("asset", "Machine"),
+                  ("task", "PMTask"), ("document", "WorkRequest"), ("user", "User"))
+LOG_ACTIONS = ("create", "update", "delete", "generate", "assign", "complete")
+
+# Placeholder hash: generated users cannot log in with a password
+PASSWORD_HASH = "$2b$12$" + "x" * 53
+
+
+def reference_date(day: Optional[date] = None) -> datetime:
+    """Newest timestamp of the generated history: the end of `day` (today by default)"""
+    day = day or date.today()
+    return datetime(day.year, day.month, day.day) + timedelta(days=1)
+
+
+class PlantGenerator:
+    """Writes one synthetic plant into an empty database"""
+
+    def __init__(self, engine, scale: str = "small", seed: int = 42, reference: Optional[datetime] = None):
+        if scale not in SCALES:
+            raise ValueError(f"Unknown scale: {scale} (choose from {', '.join(SCALES)})")
+        self.engine = engine
+        self.scale = scale
+        self.counts = dict(SCALES[scale])
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.reference = reference or reference_date()
+        self.written: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------ helpers
+
+    def _past(self, max_days: int = HISTORY_DAYS) -> datetime:
+        """Random timestamp within `max_days` before the reference, skewed towards recent"""
+        days = max_days * (self.rng.random() ** 1.5)
+        return self.reference - timedelta(days=days, seconds=self.rng.randrange(86400))
+
+    def _insert(self, conn, model, rows: Iterable[Dict]):
+        table = model.__table__
+        chunk = []
+        written = 0
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= CHUNK_SIZE:
+                conn.execute(table.insert(), chunk)
+                written += len(chunk)
+                chunk = []
+        if chunk:
+            conn.execute(table.insert(), chunk)
+            written += len(chunk)
+        self.written[table.name] = self.written.get(table.name, 0) + written
+
+    # ------------------------------------------------------------------ tables
+
+    def _roles(self) -> Iterator[Dict]:
+        for i, name in enumerate(ROLE_NAMES, start=1):
+            yield {"id": i, "name": name, "permissions": {}, "created_at": self.reference}
+
+    def _users(self) -> Iterator[Dict]:
+        for i in range(1, self.counts["users"] + 1):
+            shift_type, start, end = SHIFT_TYPES[i % len(SHIFT_TYPES)]
+            yield {
+                "id": i,
+                "username": "admin" if i == 1 else f"user{i:04d}",
+                "full_name": f"Felhasználó {i}",
+                "email": f"user{i}@plant.example",
+                "password_hash": PASSWORD_HASH,
+                # Mostly technicians, a few managers
+                "role_id": 1 if i == 1 else (2 if i % 15 == 0 else 3),
+                "is_active": i % 40 != 0,
+                "language_preference": "hu" if i % 5 else "en",
+                "shift_type": shift_type,
+                "shift_start_time": start,
+                "shift_end_time": end,
+                "work_days_per_week": 5,
+                "vacation_days_per_year": 20 + i % 6,
+                "created_at": self.reference - timedelta(days=HISTORY_DAYS + 30),
+                "updated_at": self.reference - timedelta(days=HISTORY_DAYS + 30),
+            }
+
+    def _shift_schedules(self) -> Iterator[Dict]:
+        for i in range(1, self.counts["users"] + 1):
+            shift_type, start, end = SHIFT_TYPES[i % len(SHIFT_TYPES)]
+            effective_from = self.reference - timedelta(days=HISTORY_DAYS)
+            yield {
+                "user_id": i,
+                "shift_type": shift_type,
+                "start_time": start,
+                "end_time": end,
+                "effective_from": effective_from,
+                "rotation_start_date": effective_from.date(),
+                "initial_shift": ("DE", "DU", "ÉJ")[i % 3],
+                "rotation_pattern": "weekly",
+                "created_at": effective_from,
+            }
+
+    def _vacation_requests(self) -> Iterator[Dict]:
+        for user_id in range(2, self.counts["users"] + 1):
+            for _ in range(4):
+                start = self._past(400).replace(hour=0, minute=0, second=0)
+                days = self.rng.randint(1, 10)
+                yield {
+                    "user_id": user_id,
+                    "start_date": start,
+                    "end_date": start + timedelta(days=days - 1),
+                    "vacation_type": "annual",
+                    "status": self.rng.choice(("approved", "approved", "approved", "pending", "rejected")),
+                    "requested_at": start - timedelta(days=14),
+                    "days_count": days,
+                }
+
+    def _production_lines(self) -> Iterator[Dict]:
+        for i in range(1, self.counts["production_lines"] + 1):
+            yield {
+                "id": i,
+                "name": f"Gyártósor {i}",
+                "code": f"PL-{i:03d}",
+                "location": f"Csarnok {(i - 1) // 5 + 1}",
+                "status": "Active",
+                "created_at": self.reference - timedelta(days=HISTORY_DAYS + 60),
+                "updated_at": self.reference - timedelta(days=HISTORY_DAYS + 60),
+            }
+
+    def _machines(self) -> Iterator[Dict]:
+        lines = self.counts["production_lines"]
+        for i in range(1, self.counts["machines"] + 1):
+            kind = MACHINE_KINDS[i % len(MACHINE_KINDS)]
+            installed = self.reference - timedelta(days=self.rng.randint(HISTORY_DAYS, HISTORY_DAYS * 5))
+            status = "Active" if i % 50 else ("Stopped" if i % 100 else "Scrapped")
+            yield {
+                "id": i,
+                "production_line_id": (i - 1) % lines + 1,
+                "name": f"{kind} {i}",
+                "serial_number": f"SN-{self.seed}-{i:06d}",
+                "asset_tag": f"AT-{i:06d}",
+                "model": f"{kind[:3].upper()}-{self.rng.randint(100, 999)}",
+                "manufacturer": self.rng.choice(MANUFACTURERS),
+                "install_date": installed,
+                "purchase_date": installed - timedelta(days=30),
+                "purchase_price": round(self.rng.uniform(5_000, 500_000), 2),
+                "status": status,
+                "operating_hours": round(self.rng.uniform(100, 60_000), 1),
+                "criticality_level": self.rng.choice(("Critical", "High", "Medium", "Low")),
+                "last_service_date": self._past(180),
+                "next_service_date": self.reference + timedelta(days=self.rng.randint(-30, 180)),
+                "version": 1,
+                "created_at": installed,
+                "updated_at": installed,
+            }
+
+    def _suppliers(self) -> Iterator[Dict]:
+        for i in range(1, self.counts["suppliers"] + 1):
+            yield {
+                "id": i,
+                "name": f"Beszállító {i} Kft.",
+                "email": f"rendeles{i}@supplier.example",
+                "city": self.rng.choice(("Budapest", "Győr", "Debrecen", "Szeged", "Pécs", "Wien")),
+                "country": "HU",
+                "created_at": self.reference - timedelta(days=HISTORY_DAYS + 60),
+            }
+
+    def _parts(self) -> Iterator[Dict]:
+        suppliers = self.counts["suppliers"]
+        for i in range(1, self.counts["parts"] + 1):
+            kind, unit = PART_KINDS[i % len(PART_KINDS)]
+            price = round(self.rng.lognormvariate(3, 1.2), 2)
+            yield {
+                "id": i,
+                "sku": f"P{i:07d}",
+                "name": f"{kind} {self.rng.randint(100, 9999)}-{i}",
+                "category": PART_CATEGORIES[i % len(PART_CATEGORIES)],
+                "unit": unit,
+                "buy_price": price,
+                "sell_price": round(price * 1.25, 2),
+                "safety_stock": self.rng.choice((0, 0, 2, 5, 10)),
+                "reorder_quantity": self.rng.choice((0, 5, 10, 20)),
+                "supplier_id": self.rng.randint(1, suppliers),
+                "created_at": self.reference - timedelta(days=HISTORY_DAYS + 30),
+                "updated_at": self.reference - timedelta(days=HISTORY_DAYS + 30),
+            }
+
+    def _inventory_levels(self) -> Iterator[Dict]:
+        for part_id in range(1, self.counts["parts"] + 1):
+            yield {
+                "part_id": part_id,
+                "quantity_on_hand": self.rng.choice((0, 1, 2, 5, 10, 25, 50, 120)),
+                "quantity_reserved": 0,
+                "last_updated": self.reference,
+            }
+
+    def _storage_locations(self) -> Iterator[Dict]:
+        """Warehouse > 25 racks > 10 shelves each"""
+        created = self.reference - timedelta(days=HISTORY_DAYS)
+        location_id = 0
+        self.shelf_ids = []
+        for w in range(1, self.counts["warehouses"] + 1):
+            location_id += 1
+            warehouse_id = location_id
+            yield {"id": warehouse_id, "name": f"Raktár {w}", "code": f"W{w}", "parent_id": None,
+                   "location_type": "warehouse", "is_active": True, "created_at": created, "updated_at": created}
+            for r in range(1, 26):
+                location_id += 1
+                rack_id = location_id
+                yield {"id": rack_id, "name": f"Állvány {w}-{r}", "code": f"W{w}-R{r:02d}", "parent_id": warehouse_id,
+                       "location_type": "rack", "is_active": True, "created_at": created, "updated_at": created}
+                for s in range(1, 11):
+                    location_id += 1
+                    self.shelf_ids.append(location_id)
+                    yield {"id": location_id, "name": f"Polc {w}-{r}-{s}", "code": f"W{w}-R{r:02d}-S{s:02d}",
+                           "parent_id": rack_id, "location_type": "shelf", "is_active": s != 10,
+                           "created_at": created, "updated_at": created}
+
+    def _part_locations(self) -> Iterator[Dict]:
+        created = self.reference - timedelta(days=HISTORY_DAYS)
+        # Two thirds of the parts have a location (the rest show up as "without location")
+        for part_id in range(1, self.counts["parts"] + 1):
+            if part_id % 3 == 0:
+                continue
+            yield {
+                "part_id": part_id,
+                "storage_location_id": self.rng.choice(self.shelf_ids),
+                "quantity": self.rng.randint(1, 40),
+                "assigned_date": created,
+                "last_movement_date": self._past(),
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def _stock_transactions_and_batches(self, conn):
+        parts = self.counts["parts"]
+        users = self.counts["users"]
+        transactions, batches = [], []
+        for transaction_id in range(1, self.counts["stock_transactions"] + 1):
+            # Popular parts move far more often than the long tail
+            part_id = min(parts, int(parts * self.rng.random() ** 3) + 1)
+            kind = self.rng.choices(("received", "issued", "adjustment"), weights=(35, 60, 5))[0]
+            quantity = self.rng.randint(1, 50) if kind == "received" else -self.rng.randint(1, 5)
+            timestamp = self._past()
+            transactions.append({
+                "id": transaction_id,
+                "part_id": part_id,
+                "transaction_type": kind,
+                "quantity": quantity,
+                "reference_type": "worksheet" if kind == "issued" else "purchase_order",
+                "user_id": self.rng.randint(1, users),
+                "timestamp": timestamp,
+            })
+            if kind == "received":
+                batches.append({
+                    "part_id": part_id,
+                    "quantity": quantity,
+                    "quantity_remaining": self.rng.randint(0, quantity),
+                    "unit_price": round(self.rng.lognormvariate(3, 1.2), 2),
+                    "received_date": timestamp,
+                    "stock_transaction_id": transaction_id,
+                    "storage_location_id": self.rng.choice(self.shelf_ids),
+                })
+            if len(transactions) >= CHUNK_SIZE:
+                self._insert(conn, StockTransaction, transactions)
+                self._insert(conn, StockBatch, batches)
+                transactions, batches = [], []
+        self._insert(conn, StockTransaction, transactions)
+        self._insert(conn, StockBatch, batches)
+
+    def _worksheets_and_parts(self, conn):
+        machines = self.counts["machines"]
+        users = self.counts["users"]
+        parts = self.counts["parts"]
+        statuses, weights = zip(*WORKSHEET_STATUSES)
+        worksheets, used_parts = [], []
+        for worksheet_id in range(1, self.counts["worksheets"] + 1):
+            created = self._past()
+            status = self.rng.choices(statuses, weights=weights)[0]
+            downtime = round(self.rng.expovariate(1 / 4), 2)
+            finished = created + timedelta(hours=downtime) if status == "Closed" else None
+            worksheets.append({
+                "id": worksheet_id,
+                "machine_id": self.rng.randint(1, machines),
+                "assigned_to_user_id": self.rng.randint(2, users),
+                "title": f"{self.rng.choice(FAULTS)} - munkalap {worksheet_id}",
+                "description": "Generált hibabejelentés",
+                "status": status,
+                "breakdown_time": created,
+                "repair_finished_time": finished,
+                "total_downtime_hours": downtime if finished else 0.0,
+                "fault_cause": self.rng.choice(FAULTS),
+                "version": 1,
+                "created_at": created,
+                "updated_at": finished or created,
+                "closed_at": finished,
+            })
+            for _ in range(self.rng.choice((0, 1, 1, 1, 2, 3))):
+                used_parts.append({
+                    "worksheet_id": worksheet_id,
+                    "part_id": min(parts, int(parts * self.rng.random() ** 3) + 1),
+                    "quantity_used": self.rng.randint(1, 4),
+                    "unit_cost_at_time": round(self.rng.lognormvariate(3, 1.2), 2),
+                    "added_at": created,
+                })
+            if len(worksheets) >= CHUNK_SIZE:
+                self._insert(conn, Worksheet, worksheets)
+                self._insert(conn, WorksheetPart, used_parts)
+                worksheets, used_parts = [], []
+        self._insert(conn, Worksheet, worksheets)
+        self._insert(conn, WorksheetPart, used_parts)
+
+    def _pm_tasks(self) -> Iterator[Dict]:
+        users = self.counts["users"]
+        for i in range(1, self.counts["machines"] * 2 + 1):
+            frequency = self.rng.choice((7, 14, 30, 90, 180, 365))
+            last = self._past(frequency)
+            yield {
+                "id": i,
+                "machine_id": (i - 1) // 2 + 1,
+                "task_name": f"{'Kenés' if i % 2 else 'Átvizsgálás'} #{i}",
+                "task_type": "recurring",
+                "frequency_days": frequency,
+                "last_executed_date": last,
+                "next_due_date": last + timedelta(days=frequency),
+                "is_active": True,
+                "version": 1,
+                "assigned_to_user_id": self.rng.randint(2, users) if i % 3 else None,
+                "priority": self.rng.choice(("low", "normal", "normal", "high", "urgent")),
+                "status": "pending",
+                "estimated_duration_minutes": self.rng.choice((15, 30, 60, 120)),
+                "created_at": self.reference - timedelta(days=HISTORY_DAYS),
+                "updated_at": last,
+            }
+
+    def _pm_histories(self) -> Iterator[Dict]:
+        tasks = self.counts["machines"] * 2
+        users = self.counts["users"]
+        for _ in range(self.counts["pm_histories"]):
+            user_id = self.rng.randint(2, users)
+            yield {
+                "pm_task_id": self.rng.randint(1, tasks),
+                "executed_date": self._past(),
+                "assigned_to_user_id": user_id,
+                "completed_by_user_id": user_id,
+                "completion_status": "completed" if self.rng.random() < 0.93 else "skipped",
+                "duration_minutes": self.rng.choice((15, 30, 45, 60, 90, 120)),
+            }
+
+    def _service_records(self) -> Iterator[Dict]:
+        machines = self.counts["machines"]
+        for _ in range(self.counts["service_records"]):
+            service_date = self._past()
+            yield {
+                "machine_id": self.rng.randint(1, machines),
+                "service_date": service_date,
+                "service_type": self.rng.choice(("Preventive", "Corrective", "Emergency")),
+                "performed_by": self.rng.choice(MANUFACTURERS) + " Service",
+                "service_cost": round(self.rng.uniform(100, 8_000), 2),
+                "service_duration_hours": round(self.rng.uniform(0.5, 16), 1),
+                "created_at": service_date,
+                "updated_at": service_date,
+            }
+
+    def _system_logs(self) -> Iterator[Dict]:
+        users = self.counts["users"]
+        for _ in range(self.counts["system_logs"]):
+            category, entity_type = self.rng.choice(LOG_CATEGORIES)
+            timestamp = self._past()
+            iso = timestamp.isocalendar()
+            yield {
+                "log_category": category,
+                "action_type": self.rng.choice(LOG_ACTIONS),
+                "entity_type": entity_type,
+                "entity_id": self.rng.randint(1, 10_000),
+                "user_id": self.rng.randint(1, users),
+                "description": f"{entity_type} {category} művelet",
+                "log_metadata": {},
+                "timestamp": timestamp,
+                "year": timestamp.year,
+                "month": timestamp.month,
+                "week": iso[1],
+                "day": timestamp.day,
+            }
+
+    # ------------------------------------------------------------------ entry point
+
+    def generate(self) -> Dict[str, int]:
+        """Create the schema and write every table; returns rows written per table"""
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            self._insert(conn, Role, self._roles())
+            self._insert(conn, User, self._users())
+            self._insert(conn, ShiftSchedule, self._shift_schedules())
+            self._insert(conn, VacationRequest, self._vacation_requests())
+            self._insert(conn, ProductionLine, self._production_lines())
+            self._insert(conn, Machine, self._machines())
+            self._insert(conn, Supplier, self._suppliers())
+            self._insert(conn, Part, self._parts())
+            self._insert(conn, InventoryLevel, self._inventory_levels())
+            self._insert(conn, StorageLocation, self._storage_locations())
+            self._insert(conn, PartLocation, self._part_locations())
+            self._stock_transactions_and_batches(conn)
+            self._worksheets_and_parts(conn)
+            self._insert(conn, PMTask, self._pm_tasks())
+            self._insert(conn, PMHistory, self._pm_histories())
+            self._insert(conn, ServiceRecord, self._service_records())
+            self._insert(conn, SystemLog, self._system_logs())
+        # Stock valuation snapshot, as the stock services would have kept it
+        with Session(self.engine) as session:
+            self.written["part_valuations"] = rebuild_part_valuations(
+                session=session, as_of=self.reference - timedelta(seconds=1)
+            )
+        return dict(self.written)
+
+
+def generate_plant(database_path: Path, scale: str = "small", seed: int = 42,
+                   reference: Optional[datetime] = None) -> Dict[str, int]:
+    """Write a synthetic plant into a new SQLite file at `database_path`"""
+    database_path = Path(database_path)
+    if database_path.exists():
+        database_path.unlink()
+    database_path.parent.mkdir(parents=True, exist_ok=True)
+    engine = create_engine(f"sqlite:///{database_path}")
+    try:
+        return PlantGenerator(engine, scale, seed, reference).generate()
+    finally:
+        engine.dispose()
+
+
+def cached_plant(scale: str = "small", seed: int = 42, reference: Optional[datetime] = None,
+                 cache_dir: Path = CACHE_DIR) -> Path:
+    """
+    Path of a generated plant database, built on first use and reused afterwards
+
+    The file name carries the generator version, scale, seed and reference
+    date, so a stale dataset is never reused.
+    """
+    reference = reference or reference_date()
+    path = Path(cache_dir) / f"plant_v{GENERATOR_VERSION}_{scale}_{seed}_{reference:%Y%m%d}.db"
+    if not path.exists():
+        building = path.with_name(path.name + ".building")
+        generate_plant(building, scale, seed, reference)
+        os.replace(building, path)
+    return path
+
+
+def copy_plant(source: Path, target: Path) -> Path:
+    """Working copy of a cached plant (benchmarks may write, e.g. login sessions)"""
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, target)
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic plant database")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--date", type=date.fromisoformat, help="Reference day YYYY-MM-DD (default: today)")
+    parser.add_argument("--output", required=True, help="SQLite file to create (overwritten)")
+    args = parser.parse_args()
+
+    written = generate_plant(Path(args.output), args.scale, args.seed, reference_date(args.date))
+    for table, rows in written.items():
+        print(f"{table:<22} {rows:>10}")
+    print(f"{'total':<22} {sum(written.values()):>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
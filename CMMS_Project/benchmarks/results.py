@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+"""
+Benchmark Results
+Stores the result of a benchmark run as JSON (timings, query counts, peak
+memory and the environment/dataset it was measured on) and compares two runs,
+flagging the benchmarks that got slower than the allowed regression.
+
+Usage:
+    python -m benchmarks.results benchmarks/results/old.json benchmarks/results/new.json
+    python -m benchmarks.results --latest --max-regression 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Median slowdown tolerated before a benchmark counts as a regression
+DEFAULT_MAX_REGRESSION = 0.25
+
+# Differences below this are timer noise, never a regression
+MIN_SIGNIFICANT_MS = 1.0
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root, capture_output=True, text=True, timeout=10, check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_metadata(scale: str, seed: int, reference: datetime, row_counts: Dict[str, int]) -> Dict:
+    """Where and on what data a run was measured"""
+    try:
+        from config.app_config import APP_VERSION
+    except ImportError:
+        APP_VERSION = None
+    return {
+        "app_version": APP_VERSION,
+        "git_revision": _git_revision(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dataset": {
+            "scale": scale,
+            "seed": seed,
+            "reference_date": reference.date().isoformat(),
+            "rows": row_counts,
+        },
+    }
+
+
+def save_results(metadata: Dict, benchmarks: List[Dict], results_dir: Path = RESULTS_DIR) -> Path:
+    """Write one run to results_dir, named by time, version and dataset scale"""
+    results_dir = Path(results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    version = metadata.get("git_revision") or metadata.get("app_version") or "unknown"
+    path = results_dir / f"{stamp}_{version}_{metadata['dataset']['scale']}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"metadata": metadata, "benchmarks": benchmarks}, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def load_results(path: Path) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def find_latest(results_dir: Path = RESULTS_DIR, scale: Optional[str] = None,
+                exclude: Optional[Path] = None) -> Optional[Path]:
+    """Newest stored run (of the given dataset scale)"""
+    results_dir = Path(results_dir)
+    if not results_dir.exists():
+        return None
+    candidates = sorted(results_dir.glob("*.json"), reverse=True)
+    for path in candidates:
+        if exclude is not None and path.resolve() == Path(exclude).resolve():
+            continue
+        if scale is None or path.stem.endswith(f"_{scale}"):
+            return path
+    return None
+
+
+def compare_results(baseline: Dict, current: Dict, max_regression: float = DEFAULT_MAX_REGRESSION) -> List[Dict]:
+    """
+    Per-benchmark change of the median time and query count
+
+    A benchmark regressed when its median grew by more than max_regression
+    (a ratio, 0.25 = 25%) and by at least MIN_SIGNIFICANT_MS, or when it
+    issues more queries than before.
+    """
+    before = {bench["name"]: bench for bench in baseline.get("benchmarks", [])}
+    rows = []
+    for bench in current.get("benchmarks", []):
+        old = before.get(bench["name"])
+        row = {
+            "name": bench["name"],
+            "median_ms": bench["median_ms"],
+            "baseline_median_ms": old["median_ms"] if old else None,
+            "change": None,
+            "queries": bench.get("queries"),
+            "baseline_queries": old.get("queries") if old else None,
+            "regression": False,
+        }
+        if old:
+            delta_ms = bench["median_ms"] - old["median_ms"]
+            if old["median_ms"] > 0:
+                row["change"] = delta_ms / old["median_ms"]
+            slower = row["change"] is not None and row["change"] > max_regression and delta_ms >= MIN_SIGNIFICANT_MS
+            more_queries = (
+                row["queries"] is not None and row["baseline_queries"] is not None
+                and row["queries"] > row["baseline_queries"]
+            )
+            row["regression"] = slower or more_queries
+        rows.append(row)
+    return rows
+
+
+def format_results(benchmarks: List[Dict]) -> str:
+    """Text table of one run"""
+    lines = [f"{'benchmark':<46} {'min ms':>10} {'median ms':>10} {'max ms':>10} {'queries':>8} {'peak MiB':>9}"]
+    for bench in benchmarks:
+        queries = "-" if bench.get("queries") is None else str(bench["queries"])
+        peak = "-" if bench.get("peak_memory_bytes") is None else f"{bench['peak_memory_bytes'] / 1048576:.1f}"
+        lines.append(
+            f"{bench['name']:<46} {bench['min_ms']:>10.2f} {bench['median_ms']:>10.2f} "
+            f"{bench['max_ms']:>10.2f} {queries:>8} {peak:>9}"
+        )
+    for bench in benchmarks:
+        if bench.get("extra_info"):
+            details = ", ".join(f"{key}={value}" for key, value in bench["extra_info"].items())
+            lines.append(f"  {bench['name']}: {details}")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict]) -> str:
+    """Text table of compare_results"""
+    lines = [f"{'benchmark':<46} {'before ms':>10} {'now ms':>10} {'change':>8} {'queries':>12}"]
+    for row in rows:
+        before = "-" if row["baseline_median_ms"] is None else f"{row['baseline_median_ms']:.2f}"
+        change = "new" if row["baseline_median_ms"] is None else (
+            "-" if row["change"] is None else f"{row['change']:+.0%}"
+        )
+        queries = f"{row['baseline_queries'] if row['baseline_queries'] is not None else '-'}->" \
+                  f"{row['queries'] if row['queries'] is not None else '-'}"
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(f"{row['name']:<46} {before:>10} {row['median_ms']:>10.2f} {change:>8} {queries:>12}{flag}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs")
+    parser.add_argument("baseline", nargs="?", help="Older result file")
+    parser.add_argument("current", nargs="?", help="Newer result file")
+    parser.add_argument("--latest", action="store_true", help="Compare the two newest stored runs")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Tolerated median slowdown as a ratio (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.latest:
+        current = find_latest()
+        baseline = find_latest(exclude=current) if current else None
+    else:
+        baseline = Path(args.baseline) if args.baseline else None
+        current = Path(args.current) if args.current else None
+    if baseline is None or current is None:
+        parser.error("two result files are required (or --latest with at least two stored runs)")
+
+    rows = compare_results(load_results(baseline), load_results(current), args.max_regression)
+    print(f"{baseline.name} -> {current.name}")
+    print(format_comparison(rows))
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
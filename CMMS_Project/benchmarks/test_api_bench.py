@@ -0,0 +1,50 @@
+"""
+API benchmarks: the paginated list endpoints, served in-process through ASGI
+"""
+
+import asyncio
+import itertools
+
+import httpx
+import pytest
+
+from api.app import create_app
+from api.security import create_access_token
+
+PAGE_SIZE = 100
+
+
+@pytest.fixture(scope="module")
+def api_client(plant):
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+    loop = asyncio.new_event_loop()
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app()),
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    def get(path: str, **params) -> httpx.Response:
+        return loop.run_until_complete(client.get(path, params=params))
+
+    yield get
+    loop.run_until_complete(client.aclose())
+    loop.close()
+
+
+@pytest.mark.parametrize("path", [
+    "/api/machines/",
+    "/api/worksheets/",
+    "/api/inventory/",
+    "/api/users/",
+    "/api/pm/tasks",
+])
+def test_list_endpoint(benchmark, api_client, path):
+    # A different page every round, so the ETag response cache never answers
+    pages = itertools.count()
+
+    def next_page():
+        return (path,), {"skip": next(pages) * PAGE_SIZE % 1000, "limit": PAGE_SIZE}
+
+    response = benchmark.pedantic(api_client, setup=next_page)
+    assert response.status_code == 200, response.text
@@ -0,0 +1,42 @@
+"""
+Export benchmarks: streaming worksheet/inventory/stock transaction exports
+and the Excel report workbook (peak memory matters as much as time here)
+"""
+
+import pytest
+
+from services import reports_service
+from services.excel_export_service import export_reports_to_excel
+from services.streaming_export_service import (
+    export_full_inventory_streaming,
+    export_stock_transactions_streaming,
+    export_worksheets_streaming,
+)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xlsx"])
+def test_export_worksheets(benchmark, tmp_path, fmt):
+    path = benchmark(export_worksheets_streaming, output_path=tmp_path / "worksheets", fmt=fmt)
+    assert path.stat().st_size > 0
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xlsx"])
+def test_export_full_inventory(benchmark, tmp_path, fmt):
+    path = benchmark(export_full_inventory_streaming, output_path=tmp_path / "inventory", fmt=fmt)
+    assert path.stat().st_size > 0
+
+
+def test_export_stock_transactions(benchmark, tmp_path):
+    path = benchmark(export_stock_transactions_streaming, output_path=tmp_path / "transactions", fmt="csv")
+    assert path.stat().st_size > 0
+
+
+def test_export_reports_to_excel(benchmark, tmp_path):
+    pytest.importorskip("openpyxl")
+    path = benchmark.pedantic(
+        export_reports_to_excel,
+        kwargs={"periods": ["month", "year"], "output_path": tmp_path / "reports.xlsx"},
+        setup=reports_service._stats_cache.clear,
+        rounds=2,
+    )
+    assert path.exists()
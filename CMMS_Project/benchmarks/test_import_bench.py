@@ -0,0 +1,29 @@
+"""
+Bulk import benchmark: parts with initial stock from CSV, in rows per second
+"""
+
+import itertools
+
+from services.bulk_import_service import ENTITY_PARTS, import_file
+
+IMPORT_ROWS = 5000
+
+
+def test_import_parts_csv(benchmark, tmp_path):
+    # Every round imports a new file of new SKUs into the plant
+    rounds = itertools.count()
+
+    def write_file():
+        path = tmp_path / f"parts_{next(rounds)}.csv"
+        prefix = path.stem.upper().replace("_", "")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Cikkszám;Név;Kategória;Beszerzési ár;Szállító;Kezdeti készlet\n")
+            for i in range(IMPORT_ROWS):
+                f.write(f"IMP{prefix}-{i:06d};Import alkatrész {i};Mechanika;{i % 90},50;"
+                        f"Beszállító {i % 10 + 1} Kft.;{i % 5}\n")
+        return (ENTITY_PARTS, path), {}
+
+    result = benchmark.pedantic(import_file, setup=write_file, rounds=3)
+    assert result.created == IMPORT_ROWS and result.failed_rows == 0
+    benchmark.extra_info["rows"] = IMPORT_ROWS
+    benchmark.extra_info["rows_per_second"] = round(IMPORT_ROWS / (benchmark.stats["median_ms"] / 1000))
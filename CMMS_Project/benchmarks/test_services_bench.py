@@ -0,0 +1,80 @@
+"""
+Service benchmarks: search, statistics, reports, stock valuation, shift
+calendar, inventory listing, session validation and the storage tree on the
+generated plant
+"""
+
+import pytest
+
+from database.models import User
+from services import reports_service
+from services.auth_service import create_session, validate_session
+from services.inventory_audit_service import get_inventory_overview, get_usage_report, get_value_change_report
+from services.inventory_service import list_parts
+from services.inventory_valuation_service import rebuild_part_valuations
+from services.reports_service import get_all_statistics
+from services.search_service import global_search
+from services.shift_service import get_shift_calendar
+from services.storage_service import get_storage_location_tree
+
+
+@pytest.mark.parametrize("query", ["Csapágy", "P00012", "nincs ilyen"], ids=["name", "sku", "no_match"])
+def test_global_search(benchmark, query):
+    result = benchmark(global_search, query, limit=20)
+    assert isinstance(result, dict)
+
+
+@pytest.mark.parametrize("period", ["week", "month", "year"])
+def test_get_all_statistics(benchmark, period):
+    # The statistics are cached for 5 minutes: every round computes them
+    result = benchmark.pedantic(
+        get_all_statistics, kwargs={"period": period}, setup=reports_service._stats_cache.clear
+    )
+    assert result
+
+
+def test_get_usage_report(benchmark):
+    result = benchmark(get_usage_report, period="monthly")
+    assert result
+
+
+def test_get_inventory_overview(benchmark):
+    result = benchmark(get_inventory_overview, period="monthly")
+    assert result["total_stock_value"] > 0
+
+
+def test_get_value_change_report(benchmark):
+    result = benchmark(get_value_change_report, period="yearly")
+    assert result["parts"]
+
+
+def test_rebuild_part_valuations(benchmark, plant):
+    result = benchmark.pedantic(rebuild_part_valuations, rounds=3)
+    assert result >= plant.rows["parts"]
+
+
+def test_get_shift_calendar(benchmark, plant):
+    result = benchmark(get_shift_calendar, plant.reference.year)
+    assert result
+
+
+def test_list_parts_page(benchmark):
+    result = benchmark(list_parts, limit=50, offset=0)
+    assert len(result) == 50
+
+
+def test_list_parts_deep_page(benchmark, plant):
+    offset = max(0, plant.rows["parts"] - 100)
+    result = benchmark(list_parts, limit=50, offset=offset)
+    assert len(result) == 50
+
+
+def test_validate_session(benchmark, plant):
+    token = create_session(plant.first_id(User))
+    result = benchmark(validate_session, token)
+    assert result
+
+
+def test_get_storage_location_tree(benchmark):
+    result = benchmark(get_storage_location_tree)
+    assert result
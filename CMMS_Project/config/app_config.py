@@ -228,6 +228,25 @@ for directory in [
         import logging
         logging.warning(f"Could not create directory {directory}: {e}")
 
+# Database connection pool (file databases; in-memory SQLite keeps its single-connection pool)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "30"))  # pool size + overflow ~ API_THREADPOOL_SIZE
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds; -1 disables
+# "optimistic": no ping, dead connections are detected on first error and the pool is
+# invalidated; "always": ping on every checkout (one extra round-trip per checkout)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "optimistic").lower()
+# Optional read replica for reports, audits, search and exports (unset: everything on the primary)
+DB_REPLICA_URL = os.getenv("DB_REPLICA_URL")
+DB_LEARNING_REPLICA_URL = os.getenv("DB_LEARNING_REPLICA_URL")  # replica of the learning database
+DB_REPLICA_MAX_LAG_SECONDS = int(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "30"))  # staleness tolerance
+DB_REPLICA_RETRY_SECONDS = int(os.getenv("DB_REPLICA_RETRY_SECONDS", "30"))  # primary-only after a failure
+# Query profiling (database.query_profiler): statement count and time per service call
+QUERY_PROFILING = os.getenv("QUERY_PROFILING", "1").lower() in ("1", "true", "yes")
+QUERY_PROFILING_BUFFER_SIZE = int(os.getenv("QUERY_PROFILING_BUFFER_SIZE", "2000"))  # finished calls kept
+QUERY_PROFILING_N_PLUS_ONE = int(os.getenv("QUERY_PROFILING_N_PLUS_ONE", "10"))  # same SELECT > N times per call
+QUERY_PROFILING_SLOW_MS = int(os.getenv("QUERY_PROFILING_SLOW_MS", "500"))  # calls logged as slow
+
 # Session Configuration
 SESSION_EXPIRY_HOURS = 24
 SESSION_TOKEN_LENGTH = 32
@@ -235,6 +254,30 @@ SESSION_TOKEN_LENGTH = 32
 # Cache / Redis
 CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", "300"))
 REDIS_URL = os.getenv("REDIS_URL")
+# Dashboard widgets are refreshed when their tables change; this bounds the age of
+# time-dependent figures (e.g. overdue PM tasks) that no write invalidates
+DASHBOARD_SNAPSHOT_TTL = int(os.getenv("DASHBOARD_SNAPSHOT_TTL", "120"))
+
+# Report charts (services.chart_service): rendered PNGs are cached by input hash
+CHART_CACHE_DIR = RUNTIME_DATA_ROOT / "data" / "cache" / "charts"
+CHART_CACHE_MAX_FILES = int(os.getenv("CHART_CACHE_MAX_FILES", "200"))
+CHART_CACHE_MAX_MB = int(os.getenv("CHART_CACHE_MAX_MB", "50"))
+# matplotlib worker processes; 0 renders in the calling process
+CHART_RENDER_PROCESSES = int(os.getenv("CHART_RENDER_PROCESSES", "2"))
+
+# Bulk Excel/CSV import (services.bulk_import_service): rows per transaction
+BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "2000"))
+
+# REST API server
+API_HOST = os.getenv("API_HOST", "0.0.0.0")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+API_WORKERS = int(os.getenv("API_WORKERS", "1"))  # Uvicorn worker processes
+# Threads per worker for the sync (DB) route handlers - keep it close to the DB pool size
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "40"))
+# ETag / response cache for read-heavy GET endpoints
+API_RESPONSE_CACHE = os.getenv("API_RESPONSE_CACHE", "1").lower() in ("1", "true", "yes")
+# Responses at least this large are gzip-compressed (0 disables compression)
+API_GZIP_MINIMUM_SIZE = int(os.getenv("API_GZIP_MINIMUM_SIZE", "1024"))
 
 # Password Configuration
 MIN_PASSWORD_LENGTH = 8
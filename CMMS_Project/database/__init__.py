@@ -1,4 +1,6 @@
 # Database module
 from database.models import Base
+# Registers the ORM flush hooks (delta-sync tombstones)
+import database.change_tracking  # noqa: F401
 
 __all__ = ['Base']
@@ -0,0 +1,148 @@
+"""
+ORM Change Tracking
+Session hooks that keep change metadata consistent:
+- delta sync: tombstones for deleted rows of synced tables, and parts.updated_at
+  bumped when only the stock level (inventory_levels) of a part changes
+- per-table data versions, bumped when a transaction that wrote the table
+  commits (used for API ETags)
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, List, Set
+
+from sqlalchemy import event, insert, update, util
+from sqlalchemy.orm import Session
+
+from database.models import InventoryLevel, Part, SyncTombstone, utcnow
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tables exposed through /api/sync - deletes leave a tombstone behind
+SYNC_TRACKED_TABLES = {"machines", "worksheets", "parts"}
+
+_CHANGED_TABLES_KEY = "change_tracking.changed_tables"
+
+# Process-local table versions; listeners can publish bumps elsewhere (e.g. Redis)
+_table_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+_table_change_listeners: List[Callable[[Set[str]], None]] = []
+
+
+def get_table_versions(table_names: Iterable[str]) -> Dict[str, int]:
+    """Current process-local version of each table (0 = unchanged since start)"""
+    return {name: _table_versions.get(name, 0) for name in table_names}
+
+
+def bump_table_versions(table_names: Iterable[str]) -> None:
+    """Mark tables as changed and notify the listeners"""
+    table_names = set(table_names)
+    if not table_names:
+        return
+    with _versions_lock:
+        for name in table_names:
+            _table_versions[name] = _table_versions.get(name, 0) + 1
+    for listener in list(_table_change_listeners):
+        try:
+            listener(table_names)
+        except Exception as e:
+            logger.warning(f"Table change listener failed: {e}")
+
+
+def add_table_change_listener(listener: Callable[[Set[str]], None]) -> None:
+    """Call `listener(table_names)` after every commit that changed tables"""
+    if listener not in _table_change_listeners:
+        _table_change_listeners.append(listener)
+
+
+def remove_table_change_listener(listener: Callable[[Set[str]], None]) -> None:
+    if listener in _table_change_listeners:
+        _table_change_listeners.remove(listener)
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    return session.info.setdefault(_CHANGED_TABLES_KEY, set())
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    """Runs inside the flush transaction; new/dirty/deleted still show the flushed objects"""
+    changed = _changed_tables(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            changed.add(table.name)
+
+    tombstones = []
+    touched_parts = set()
+    now = utcnow()
+
+    for obj in session.deleted:
+        table_name = getattr(obj, "__tablename__", None)
+        if table_name in SYNC_TRACKED_TABLES:
+            tombstones.append({"table_name": table_name, "entity_id": obj.id, "deleted_at": now})
+        elif isinstance(obj, InventoryLevel):
+            touched_parts.add(obj.part_id)
+
+    for obj in session.new:
+        if isinstance(obj, InventoryLevel):
+            touched_parts.add(obj.part_id)
+
+    for obj in session.dirty:
+        if isinstance(obj, InventoryLevel) and session.is_modified(obj, include_collections=False):
+            touched_parts.add(obj.part_id)
+
+    touched_parts.discard(None)
+    if not tombstones and not touched_parts:
+        return
+
+    connection = session.connection()
+    if tombstones:
+        connection.execute(insert(SyncTombstone.__table__), tombstones)
+        changed.add(SyncTombstone.__tablename__)
+    if touched_parts:
+        changed.add(Part.__tablename__)
+        connection.execute(
+            update(Part.__table__).where(Part.__table__.c.id.in_(touched_parts)).values(updated_at=now)
+        )
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    """Bulk ORM insert/update/delete statements bypass the flush"""
+    if orm_execute_state.is_relationship_load and "yield_per" in orm_execute_state.local_execution_options:
+        # With a do_orm_execute hook registered, SQLAlchemy 2.0.23 passes the
+        # parent's yield_per on to selectinload queries, whose unique() then
+        # rejects it; eager loads of one batch are not streamed anyway
+        orm_execute_state.local_execution_options = util.immutabledict(
+            (key, value) for key, value in orm_execute_state.local_execution_options.items() if key != "yield_per"
+        )
+        return
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _changed_tables(orm_execute_state.session).add(table.name)
+
+
+def _after_commit(session: Session) -> None:
+    bump_table_versions(session.info.pop(_CHANGED_TABLES_KEY, ()))
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED_TABLES_KEY, None)
+
+
+_SESSION_HOOKS = (
+    ("after_flush", _after_flush),
+    ("do_orm_execute", _do_orm_execute),
+    ("after_commit", _after_commit),
+    ("after_rollback", _after_rollback),
+)
+
+
+def register_change_tracking() -> None:
+    """Attach the hooks to every Session (idempotent)"""
+    for name, hook in _SESSION_HOOKS:
+        if not event.contains(Session, name, hook):
+            event.listen(Session, name, hook)
+
+
+register_change_tracking()
@@ -3,17 +3,86 @@ Database Connection Management
 SQLite connection setup with SQLAlchemy
 """
 
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
-from config.app_config import get_database_config, DEBUG
+from typing import Generator, Iterator, Optional
+from config.app_config import (
+    get_database_config,
+    DEBUG,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_REPLICA_URL,
+    DB_LEARNING_REPLICA_URL,
+    DB_REPLICA_MAX_LAG_SECONDS,
+    DB_REPLICA_RETRY_SECONDS,
+)
+from database.pool_metrics import TimedQueuePool, get_pool_status, instrument_engine
+from database.query_profiler import instrument_queries
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Global engine variable
 _engine = None
 _current_mode = None
 SessionLocal = None
 
+# (engine, session factory, read-only session factory) of the current mode -
+# replaced as one unit so a session is never created from a factory bound to
+# a disposed engine
+_engine_state = (None, None, None)
+_swap_lock = threading.Lock()
+
+# Optional read replica of the current mode's database: (engine, read-only
+# session factory) or None. Replica URLs are kept per mode, so switching to
+# learning never reads production data.
+_replica_urls = {"production": DB_REPLICA_URL, "learning": DB_LEARNING_REPLICA_URL}
+_replica_state = None
+_replica_mode = None
+_replica_down_until = 0.0     # time.monotonic() until which the replica is skipped
+_replica_lag = None           # (checked at, lag seconds or None)
+_REPLICA_LAG_CHECK_INTERVAL = 5  # seconds
+
+
+class ReadOnlySessionError(RuntimeError):
+    """Write attempted through a read-only session"""
+    pass
+
+
+class ReadOnlySession(Session):
+    """Session of read_only_session(): queries only, flushing changes is rejected"""
+
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            raise ReadOnlySessionError("Read-only session cannot write; use a regular session")
+        super().flush(objects)
+
+
+def _pool_options(database_url: str) -> dict:
+    """Pool arguments for create_engine (see DB_POOL_* in config.app_config)"""
+    options = {"pool_pre_ping": DB_POOL_PRE_PING == "always"}
+    url = make_url(database_url)
+    in_memory = url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+    if not in_memory:
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+    return options
+
 
 def create_db_engine(mode: str = "production"):
     """
@@ -25,14 +94,18 @@ def create_db_engine(mode: str = "production"):
     Returns:
         SQLAlchemy engine
     """
-    config = get_database_config(mode)
-    database_url = config["url"]
+    return create_engine_for_url(get_database_config(mode)["url"])
+
+
+def create_engine_for_url(database_url: str):
+    """Engine with the connection settings and pool of create_db_engine for any URL"""
+    is_sqlite = make_url(database_url).get_backend_name() == "sqlite"
     
     # SQLite connection arguments
     connect_args = {
         "check_same_thread": False,  # Allow multi-threaded access
         "timeout": 30,               # Timeout for busy database (seconds)
-    }
+    } if is_sqlite else {}
     
     # SQLite engine with optimizations
     engine = create_engine(
@@ -40,12 +113,14 @@ def create_db_engine(mode: str = "production"):
         connect_args=connect_args,
         echo=DEBUG,                  # Log SQL queries if DEBUG=True
         future=True,                 # Use SQLAlchemy 2.0 style
-        pool_pre_ping=True,          # Check connection before using
+        **_pool_options(database_url),
     )
     
     # Enable foreign key constraints for SQLite
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
+        if not is_sqlite:
+            return
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging for better concurrency
@@ -54,9 +129,25 @@ def create_db_engine(mode: str = "production"):
         cursor.execute("PRAGMA temp_store=MEMORY")  # Store temporary tables in memory
         cursor.close()
     
+    instrument_engine(engine)
+    instrument_queries(engine)
     return engine
 
 
+def _swap_engine(new_engine, mode: str):
+    """Make `new_engine` and its session factory current; returns the previous engine"""
+    global engine, _engine, _current_mode, SessionLocal, _engine_state
+    factory = sessionmaker(bind=new_engine, autocommit=False, autoflush=False)
+    read_factory = sessionmaker(bind=new_engine, class_=ReadOnlySession, autocommit=False, autoflush=False)
+    with _swap_lock:
+        previous = _engine_state[0]
+        _engine_state = (new_engine, factory, read_factory)
+        engine = _engine = new_engine
+        SessionLocal = factory
+        _current_mode = mode
+    return previous
+
+
 def recreate_engine(mode: str = "production"):
     """
     Recreate the engine with a new mode
@@ -64,43 +155,172 @@ def recreate_engine(mode: str = "production"):
     Args:
         mode: "production" or "learning"
     """
-    global _engine, _current_mode, SessionLocal
-    
-    # Dispose old engine if exists
-    if _engine is not None:
-        _engine.dispose()
+    previous = _swap_engine(create_db_engine(mode), mode)
     
-    # Create new engine
-    _engine = create_db_engine(mode)
-    _current_mode = mode
+    # Sessions already open on the old engine keep working until closed;
+    # its idle pooled connections are released now
+    if previous is not None:
+        previous.dispose()
     
-    # Recreate SessionLocal with new engine (for connection.py usage)
-    SessionLocal = sessionmaker(bind=_engine, autocommit=False, autoflush=False)
-    
-    # session_manager.py uses DynamicSessionLocal which always gets current engine
-    # No need to update it manually, it will automatically use the new engine
+    # The replica belongs to the database of the mode
+    if _replica_mode != mode:
+        try:
+            configure_read_replica(_replica_urls.get(mode), mode)
+        except Exception as e:
+            logger.warning(f"Could not configure read replica for {mode} mode, using primary only: {e}")
+            configure_read_replica(None, mode)
     
     return _engine
 
 
+def get_engine():
+    """Current engine (follows recreate_engine)"""
+    return engine
+
+
+def get_session_factory() -> sessionmaker:
+    """Cached session factory of the current engine"""
+    current_engine, factory, _ = _engine_state
+    if current_engine is not engine:
+        # `engine` was reassigned directly (maintenance scripts)
+        return sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    return factory
+
+
+# ============================================================================
+# Read replica
+# ============================================================================
+
+def configure_read_replica(database_url: Optional[str], mode: Optional[str] = None):
+    """
+    Route read_only_session() to a replica
+
+    Args:
+        database_url: Replica URL (None: all reads go to the primary)
+        mode: Database mode the replica copies (default: the current mode);
+            it is only used while that mode is active
+    """
+    global _replica_state, _replica_mode, _replica_down_until, _replica_lag
+    mode = mode or _current_mode
+    _replica_urls[mode] = database_url
+    if mode != _current_mode:
+        return
+    new_state = None
+    if database_url:
+        replica_engine = create_engine_for_url(database_url)
+        new_state = (
+            replica_engine,
+            sessionmaker(bind=replica_engine, class_=ReadOnlySession, autocommit=False, autoflush=False),
+        )
+    with _swap_lock:
+        previous = _replica_state
+        _replica_state = new_state
+        _replica_mode = mode
+        _replica_down_until = 0.0
+        _replica_lag = None
+    if previous is not None:
+        previous[0].dispose()
+
+
+def get_replica_engine():
+    """Replica engine, or None if no replica is configured"""
+    state = _replica_state
+    return state[0] if state else None
+
+
+def _replica_lag_seconds(connection) -> Optional[float]:
+    """Replication delay reported by the replica (None: unknown / not replicating)"""
+    if connection.dialect.name != "mysql":
+        # SQLite copies etc. carry no replication status
+        return 0.0
+    for statement in ("SHOW REPLICA STATUS", "SHOW SLAVE STATUS"):
+        try:
+            row = connection.exec_driver_sql(statement).mappings().first()
+        except DBAPIError:
+            continue
+        if row is None:
+            return None
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return None if lag is None else float(lag)
+    return None
+
+
+def _open_replica_session(max_staleness: float) -> Optional[Session]:
+    """Replica session if it is reachable and at most `max_staleness` seconds behind"""
+    global _replica_down_until, _replica_lag
+    state = _replica_state
+    if state is None or _replica_mode != _current_mode or time.monotonic() < _replica_down_until:
+        return None
+    session = state[1]()
+    try:
+        connection = session.connection()
+        checked = _replica_lag
+        now = time.monotonic()
+        if checked is None or now - checked[0] > _REPLICA_LAG_CHECK_INTERVAL:
+            checked = _replica_lag = (now, _replica_lag_seconds(connection))
+    except DBAPIError as e:
+        session.close()
+        _replica_down_until = time.monotonic() + DB_REPLICA_RETRY_SECONDS
+        logger.warning(f"Read replica unavailable, using primary for {DB_REPLICA_RETRY_SECONDS}s: {e}")
+        return None
+    lag = checked[1]
+    if lag is None or lag > max_staleness:
+        session.close()
+        logger.info(f"Read replica lag {lag}s exceeds {max_staleness}s, using primary")
+        return None
+    return session
+
+
+def get_read_session(max_staleness: Optional[float] = None) -> ReadOnlySession:
+    """
+    Read-only session: the replica when configured, reachable and fresh enough,
+    otherwise the primary (remember to close it!)
+
+    Args:
+        max_staleness: Accepted replication lag in seconds (default: DB_REPLICA_MAX_LAG_SECONDS)
+    """
+    if max_staleness is None:
+        max_staleness = DB_REPLICA_MAX_LAG_SECONDS
+    session = _open_replica_session(max_staleness)
+    if session is not None:
+        return session
+    current_engine, _, read_factory = _engine_state
+    if current_engine is not engine:
+        return ReadOnlySession(bind=engine, autoflush=False)
+    return read_factory()
+
+
+@contextmanager
+def read_only_session(max_staleness: Optional[float] = None) -> Iterator[ReadOnlySession]:
+    """Context manager for report / export queries (see get_read_session)"""
+    session = get_read_session(max_staleness)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def get_engine_pool_status() -> dict:
+    """Pool metrics of the current engine (see database.pool_metrics)"""
+    return get_pool_status(get_engine())
+
+
 # Initialize engine with default mode (production)
 # Note: Engine creation doesn't connect immediately - connection happens on first use
 try:
-    engine = create_db_engine("production")
-    _engine = engine
-    _current_mode = "production"
-    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    _swap_engine(create_db_engine("production"), "production")
 except Exception as e:
     # If engine creation fails (e.g., invalid config), create a dummy engine
     # The actual connection will be tested when needed
-    import logging
-    logger = logging.getLogger(__name__)
     logger.warning(f"Could not create database engine at import time: {e}")
     # Create engine anyway - connection will be tested later
-    engine = create_db_engine("production")
-    _engine = engine
-    _current_mode = "production"
-    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    _swap_engine(create_db_engine("production"), "production")
+
+if DB_REPLICA_URL:
+    try:
+        configure_read_replica(DB_REPLICA_URL, "production")
+    except Exception as e:
+        logger.warning(f"Could not configure read replica, using primary only: {e}")
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -111,8 +331,7 @@ def get_db() -> Generator[Session, None, None]:
         SQLAlchemy Session
     """
     # Always use current engine for mode switching support
-    session_factory = sessionmaker(bind=_engine, autocommit=False, autoflush=False)
-    db = session_factory()
+    db = get_session_factory()()
     try:
         yield db
     finally:
@@ -127,5 +346,4 @@ def get_session() -> Session:
         SQLAlchemy Session (remember to close it!)
     """
     # Always use current engine for mode switching support
-    session_factory = sessionmaker(bind=_engine, autocommit=False, autoflush=False)
-    return session_factory()
+    return get_session_factory()()
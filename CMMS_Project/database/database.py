@@ -57,6 +57,9 @@ def run_migrations():
         try:
             _add_missing_storage_location_id_column()
             _add_missing_operating_hours_update_columns()
+            _add_missing_depreciation_columns()
+            _add_missing_next_operating_hours_update_column()
+            _add_missing_sync_columns()
             return True
         except Exception as fallback_error:
             logger.error(f"Fallback column addition also failed: {fallback_error}")
@@ -168,6 +171,111 @@ def _add_missing_operating_hours_update_columns():
         raise
 
 
+def _add_missing_depreciation_columns():
+    """Fallback: Add machine depreciation columns directly if migration fails"""
+    columns = [
+        ("depreciation_method", "VARCHAR(50)"),
+        ("depreciation_rate", "FLOAT"),
+        ("depreciation_period_years", "INT"),
+        ("current_value", "FLOAT"),
+        ("salvage_value", "FLOAT"),
+    ]
+    try:
+        with engine.connect() as conn:
+            for column_name, column_type in columns:
+                result = conn.execute(text("""
+                    SELECT COUNT(*) as col_count
+                    FROM INFORMATION_SCHEMA.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_NAME = 'machines'
+                    AND COLUMN_NAME = :column_name
+                """), {"column_name": column_name})
+                col_exists = result.fetchone()[0] > 0
+
+                if not col_exists:
+                    print(f"  Adding {column_name} column to machines table...")
+                    conn.execute(text(f"ALTER TABLE machines ADD COLUMN {column_name} {column_type} NULL"))
+                    conn.commit()
+                    print("  ✓ Column added successfully")
+                else:
+                    print("  ✓ Column already exists")
+    except Exception as e:
+        logger.error(f"Error adding depreciation columns directly: {e}", exc_info=True)
+        raise
+
+
+def _add_missing_next_operating_hours_update_column():
+    """Fallback: Add the indexed next operating hours update column and backfill it"""
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(text("""
+                SELECT COUNT(*) as col_count
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                AND TABLE_NAME = 'machines'
+                AND COLUMN_NAME = 'next_operating_hours_update_at'
+            """))
+            col_exists = result.fetchone()[0] > 0
+            
+            if col_exists:
+                print("  ✓ Column already exists")
+                return
+            
+            print("  Adding next_operating_hours_update_at column to machines table...")
+            conn.execute(text("""
+                ALTER TABLE machines
+                ADD COLUMN next_operating_hours_update_at DATETIME NULL,
+                ADD INDEX idx_machines_next_operating_hours_update_at (next_operating_hours_update_at)
+            """))
+            conn.commit()
+            print("  ✓ Column added successfully")
+        
+        from services.asset_service import backfill_next_operating_hours_update_at
+        backfill_next_operating_hours_update_at()
+    except Exception as e:
+        logger.error(f"Error adding next operating hours update column directly: {e}", exc_info=True)
+        raise
+
+
+def _add_missing_sync_columns():
+    """Fallback: Add worksheets.updated_at and the delta-sync (updated_at, id) indexes"""
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(text("""
+                SELECT COUNT(*) as col_count
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                AND TABLE_NAME = 'worksheets'
+                AND COLUMN_NAME = 'updated_at'
+            """))
+            if result.fetchone()[0] == 0:
+                print("  Adding updated_at column to worksheets table...")
+                conn.execute(text("ALTER TABLE worksheets ADD COLUMN updated_at DATETIME NULL"))
+                conn.execute(text("UPDATE worksheets SET updated_at = COALESCE(closed_at, created_at)"))
+                conn.commit()
+                print("  ✓ Column added successfully")
+            
+            for table_name, index_name in (
+                ("worksheets", "idx_worksheets_updated_at"),
+                ("machines", "idx_machines_updated_at"),
+                ("parts", "idx_parts_updated_at"),
+            ):
+                result = conn.execute(text("""
+                    SELECT COUNT(*) as idx_count
+                    FROM INFORMATION_SCHEMA.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_NAME = :table_name
+                    AND INDEX_NAME = :index_name
+                """), {"table_name": table_name, "index_name": index_name})
+                if result.fetchone()[0] == 0:
+                    conn.execute(text(f"CREATE INDEX {index_name} ON {table_name} (updated_at, id)"))
+                    conn.commit()
+                    print(f"  ✓ Index {index_name} created")
+    except Exception as e:
+        logger.error(f"Error adding delta sync columns directly: {e}", exc_info=True)
+        raise
+
+
 def init_database():
     """Initialize database schema and default data"""
     
@@ -199,6 +307,12 @@ def init_database():
             create_default_settings(session)
             
             session.commit()
+            
+            # Fill the stock valuation snapshot on the first start after the upgrade
+            from services.inventory_valuation_service import ensure_part_valuations
+            if ensure_part_valuations(session):
+                print("  + Stock valuation snapshot built")
+            
             print("✓ Database initialized successfully")
             
         except Exception as e:
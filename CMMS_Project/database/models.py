@@ -226,6 +226,7 @@ class Machine(Base):
     operating_hours_update_frequency_type = Column(String(20))  # 'day', 'week', 'month'
     operating_hours_update_frequency_value = Column(Integer)  # How many days/weeks/months
     last_operating_hours_update = Column(DateTime)  # Last time operating hours were updated
+    next_operating_hours_update_at = Column(DateTime)  # Computed due date of the next reading (indexed)
     criticality_level = Column(String(50))  # Critical, High, Medium, Low
     energy_consumption = Column(String(100))  # e.g. "15 kW", "220V/3-phase"
     power_requirements = Column(String(200))  # Power requirements description
@@ -235,12 +236,13 @@ class Machine(Base):
     notes = Column(Text)  # Additional notes/comments
     version = Column(Integer, default=1)  # Version number for tracking changes
     
-    # Asset Lifecycle Management fields - commented out, not in DB
-    # depreciation_method = Column(String(50))  # "linear", "declining", "sum_of_years"
-    # depreciation_rate = Column(Float)  # Annual depreciation rate (e.g., 0.20 for 20%)
-    # depreciation_period_years = Column(Integer)  # Useful life in years
-    # current_value = Column(Float)  # Current book value (calculated)
-    # salvage_value = Column(Float, default=0.0)  # Residual value at end of life
+    # Asset Lifecycle Management fields
+    depreciation_method = Column(String(50))  # "linear", "declining", "sum_of_years"
+    depreciation_rate = Column(Float)  # Annual depreciation rate (e.g., 0.20 for 20%)
+    depreciation_period_years = Column(Integer)  # Useful life in years
+    current_value = Column(Float)  # Current book value (calculated)
+    salvage_value = Column(Float, default=0.0)  # Residual value at end of life
+    # Not in DB yet
     # scrapping_date = Column(DateTime)  # Date when machine was scrapped
     # scrapping_reason = Column(Text)  # Reason for scrapping
     # scrapping_cost = Column(Float)  # Cost associated with scrapping
@@ -269,6 +271,8 @@ class Machine(Base):
         Index('idx_production_line_id', 'production_line_id'),
         Index('idx_serial_number', 'serial_number'),
         Index('idx_asset_tag', 'asset_tag'),
+        Index('idx_machines_next_operating_hours_update_at', 'next_operating_hours_update_at'),
+        Index('idx_machines_updated_at', 'updated_at', 'id'),
     )
     
     def __repr__(self):
@@ -403,9 +407,12 @@ class Part(Base):
     compatible_machines = relationship("Machine", secondary="machine_parts", back_populates="id_compatible_parts")
     part_locations = relationship("PartLocation", back_populates="part", cascade="all, delete-orphan")
     reservations = relationship("StockReservation", back_populates="part")
+    valuation = relationship("PartValuation", back_populates="part", uselist=False, cascade="all, delete-orphan")
+    valuation_history = relationship("PartValuationHistory", back_populates="part", cascade="all, delete-orphan")
     
     __table_args__ = (
         Index('idx_sku', 'sku'),
+        Index('idx_parts_updated_at', 'updated_at', 'id'),
     )
     
     def __repr__(self):
@@ -506,6 +513,46 @@ class StockBatch(Base):
         return f"<StockBatch part_id={self.part_id} qty={self.quantity_remaining}/{self.quantity}>"
 
 
+class PartValuation(Base):
+    """FIFO valuation snapshot of a part, updated together with its stock movements"""
+    __tablename__ = "part_valuations"
+    
+    part_id = Column(Integer, ForeignKey("parts.id"), primary_key=True)
+    quantity_on_hand = Column(Integer, nullable=False, default=0)
+    total_value = Column(Float, nullable=False, default=0.0)  # FIFO value of quantity_on_hand
+    average_cost = Column(Float, nullable=False, default=0.0)  # total_value / quantity_on_hand
+    oldest_batch_date = Column(DateTime, nullable=True)  # Oldest batch with remaining quantity
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+    
+    # Relationships
+    part = relationship("Part", back_populates="valuation")
+    
+    def __repr__(self):
+        return f"<PartValuation part_id={self.part_id} qty={self.quantity_on_hand} value={self.total_value}>"
+
+
+class PartValuationHistory(Base):
+    """End-of-day valuation of a part, one row per part and day with a stock change"""
+    __tablename__ = "part_valuation_history"
+    
+    id = Column(Integer, primary_key=True)
+    part_id = Column(Integer, ForeignKey("parts.id"), nullable=False)
+    valuation_date = Column(Date, nullable=False)
+    quantity_on_hand = Column(Integer, nullable=False, default=0)
+    total_value = Column(Float, nullable=False, default=0.0)
+    
+    # Relationships
+    part = relationship("Part", back_populates="valuation_history")
+    
+    __table_args__ = (
+        UniqueConstraint('part_id', 'valuation_date', name='uq_part_valuation_history_part_date'),
+        Index('idx_part_valuation_history_date', 'valuation_date', 'part_id'),
+    )
+    
+    def __repr__(self):
+        return f"<PartValuationHistory part_id={self.part_id} {self.valuation_date} value={self.total_value}>"
+
+
 class StorageLocation(Base):
     """Hierarchical storage locations (warehouse, cabinet, shelf, bin, etc.)"""
     __tablename__ = "storage_locations"
@@ -636,6 +683,7 @@ class Worksheet(Base):
     fault_cause = Column(Text, nullable=True)  # MSZ EN 13460 kötelező mező
     version = Column(Integer, default=1, nullable=False)  # Optimistic locking
     created_at = Column(DateTime, default=utcnow, index=True)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)  # Delta-sync cursor
     closed_at = Column(DateTime)
     notes = Column(Text)
     
@@ -655,6 +703,7 @@ class Worksheet(Base):
         Index('idx_machine_id', 'machine_id'),
         Index('idx_status', 'status'),
         Index('idx_created_at', 'created_at'),
+        Index('idx_worksheets_updated_at', 'updated_at', 'id'),
         CheckConstraint(
             'repair_finished_time IS NULL OR breakdown_time IS NULL OR '
             'repair_finished_time >= breakdown_time',
@@ -1465,6 +1514,27 @@ class SiteUser(Base):
         return f"<SiteUser user_id={self.user_id} site_id={self.site_id}>"
 
 
+# ============================================================================
+# DELTA SYNC MODELS
+# ============================================================================
+
+class SyncTombstone(Base):
+    """Deleted rows of synced tables, so offline clients can drop them (delta sync)"""
+    __tablename__ = "sync_tombstones"
+    
+    id = Column(Integer, primary_key=True)
+    table_name = Column(String(100), nullable=False)  # e.g. "machines", "parts"
+    entity_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=utcnow, nullable=False)
+    
+    __table_args__ = (
+        Index('idx_sync_tombstones_table_deleted_at', 'table_name', 'deleted_at', 'id'),
+    )
+    
+    def __repr__(self):
+        return f"<SyncTombstone {self.table_name}#{self.entity_id}>"
+
+
 # ============================================================================
 # All models listed for reference
 # ============================================================================
@@ -1475,7 +1545,8 @@ __all__ = [
     # Assets
     'ProductionLine', 'Machine', 'Module', 'AssetHistory',
     # Inventory
-    'Supplier', 'Part', 'InventoryLevel', 'StockTransaction', 'StockBatch', 'StorageLocation', 'PartLocation', 'QRCodeData',
+    'Supplier', 'Part', 'InventoryLevel', 'StockTransaction', 'StockBatch', 'PartValuation', 'PartValuationHistory',
+    'StorageLocation', 'PartLocation', 'QRCodeData',
     # Worksheets
     'Worksheet', 'WorksheetPart', 'WorksheetPhoto', 'WorksheetPDF',
     # PM
@@ -1505,4 +1576,6 @@ __all__ = [
     # Multi-site
     'Site',
     'SiteUser',
+    # Delta sync
+    'SyncTombstone',
 ]
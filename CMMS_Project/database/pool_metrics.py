@@ -0,0 +1,153 @@
+"""
+Connection Pool Metrics
+Checkouts, wait time, overflow and invalidations per engine, collected
+through SQLAlchemy pool events and a QueuePool that times its checkouts.
+"""
+
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe counters of one engine's connection pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.soft_invalidations = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.peak_checked_out = 0
+            self.peak_overflow = 0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self, pool):
+        with self._lock:
+            self.checkouts += 1
+            if isinstance(pool, QueuePool):
+                self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+                self.peak_overflow = max(self.peak_overflow, pool.overflow())
+
+    def _increment(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self, pool=None) -> Dict:
+        """Counters plus the live pool status (if `pool` is given)"""
+        with self._lock:
+            data = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_seconds_total * 1000, 3),
+                "wait_ms_avg": round(self.wait_seconds_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+            }
+        if pool is not None:
+            data["pool_class"] = type(pool).__name__
+            if isinstance(pool, QueuePool):
+                data.update(
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    checked_in=pool.checkedin(),
+                    overflow=pool.overflow(),
+                )
+        return data
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout waited for a connection"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() and pool invalidation replace the pool object
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+_engine_metrics: "weakref.WeakKeyDictionary[Engine, PoolMetrics]" = weakref.WeakKeyDictionary()
+
+
+def instrument_engine(engine: Engine) -> PoolMetrics:
+    """Attach pool metrics to `engine` (idempotent)"""
+    metrics = _engine_metrics.get(engine)
+    if metrics is not None:
+        return metrics
+    metrics = PoolMetrics()
+    _engine_metrics[engine] = metrics
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.metrics = metrics
+
+    # Listeners on the engine also apply to pools recreated by dispose()
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        metrics._increment("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, connection_record, connection_proxy):
+        metrics.record_checkout(engine.pool)
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, connection_record):
+        metrics._increment("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_conn, connection_record, exception):
+        metrics._increment("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_conn, connection_record, exception):
+        metrics._increment("soft_invalidations")
+
+    return metrics
+
+
+def get_pool_metrics(engine: Engine) -> Optional[PoolMetrics]:
+    return _engine_metrics.get(engine)
+
+
+def get_pool_status(engine: Engine) -> Dict:
+    """Pool counters and live status of `engine`, for health checks and diagnostics"""
+    metrics = get_pool_metrics(engine)
+    if metrics is None:
+        return {"pool_class": type(engine.pool).__name__, "instrumented": False}
+    return metrics.snapshot(engine.pool)
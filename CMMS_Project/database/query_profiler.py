@@ -0,0 +1,264 @@
+"""
+Query Profiler
+Statement count and database time per service call, collected through the
+engine's before/after_cursor_execute events. Service entry points are marked
+with @profiled (or wrapped in `with profile_call(name):`); every statement
+executed while a call is active is attributed to it and to the calls
+enclosing it (e.g. a UI screen load around several service functions).
+
+Finished calls go to a bounded rolling buffer, aggregated on demand into the
+top offenders by database time and statement count, and N+1 patterns: the
+same SELECT repeated more than QUERY_PROFILING_N_PLUS_ONE times in one call.
+"""
+
+import functools
+import logging
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config.app_config import (
+    QUERY_PROFILING,
+    QUERY_PROFILING_BUFFER_SIZE,
+    QUERY_PROFILING_N_PLUS_ONE,
+    QUERY_PROFILING_SLOW_MS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statements are shortened to this length in reports and logs
+STATEMENT_PREVIEW_LENGTH = 300
+
+
+class _ActiveCall:
+    """Counters of one service call in progress"""
+
+    __slots__ = ("name", "parent", "started", "queries", "query_seconds", "statements")
+
+    def __init__(self, name: str, parent: Optional["_ActiveCall"]):
+        self.name = name
+        self.parent = parent
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, seconds: float):
+        self.queries += 1
+        self.query_seconds += seconds
+        self.statements[statement] += 1
+
+
+_current_call: ContextVar[Optional[_ActiveCall]] = ContextVar("query_profiler_call", default=None)
+
+
+def _preview(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) > STATEMENT_PREVIEW_LENGTH:
+        return statement[:STATEMENT_PREVIEW_LENGTH] + "..."
+    return statement
+
+
+class QueryProfiler:
+    """Rolling buffer of finished calls plus totals of every executed statement"""
+
+    def __init__(self, buffer_size: int = QUERY_PROFILING_BUFFER_SIZE,
+                 n_plus_one_threshold: int = QUERY_PROFILING_N_PLUS_ONE,
+                 slow_call_ms: int = QUERY_PROFILING_SLOW_MS, enabled: bool = QUERY_PROFILING):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.slow_call_ms = slow_call_ms
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls: deque = deque(maxlen=buffer_size)
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+            self._reported_patterns = set()
+            self.total_queries = 0
+            self.total_query_seconds = 0.0
+            self.unattributed_queries = 0
+
+    def record_query(self, statement: str, seconds: float):
+        call = _current_call.get()
+        with self._lock:
+            self.total_queries += 1
+            self.total_query_seconds += seconds
+            if call is None:
+                self.unattributed_queries += 1
+        # A call is only ever active in one thread at a time: no lock needed
+        while call is not None:
+            call.record(statement, seconds)
+            call = call.parent
+
+    def finish(self, call: _ActiveCall):
+        elapsed_ms = (time.perf_counter() - call.started) * 1000
+        repeated = sorted(
+            (
+                (statement, count) for statement, count in call.statements.items()
+                if count > self.n_plus_one_threshold and statement.lstrip()[:6].upper() == "SELECT"
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        record = {
+            "name": call.name,
+            "finished_at": time.time(),
+            "ms": round(elapsed_ms, 3),
+            "queries": call.queries,
+            "query_ms": round(call.query_seconds * 1000, 3),
+            "n_plus_one": [(_preview(statement), count) for statement, count in repeated],
+        }
+        with self._lock:
+            self._calls.append(record)
+            new_patterns = [
+                (statement, count) for statement, count in record["n_plus_one"]
+                if (call.name, statement) not in self._reported_patterns
+            ]
+            self._reported_patterns.update((call.name, statement) for statement, _ in new_patterns)
+
+        for statement, count in new_patterns:
+            logger.warning(f"Possible N+1 in {call.name}: statement executed {count} times: {statement}")
+        if elapsed_ms >= self.slow_call_ms:
+            logger.info(
+                f"Slow call {call.name}: {elapsed_ms:.0f} ms, "
+                f"{call.queries} queries, {call.query_seconds * 1000:.0f} ms in the database"
+            )
+
+    def snapshot(self, limit: int = 10) -> Dict:
+        """Top offenders of the calls in the buffer"""
+        with self._lock:
+            calls = list(self._calls)
+            data = {
+                "enabled": self.enabled,
+                "buffer_size": self._calls.maxlen,
+                "window_calls": len(calls),
+                "total_queries": self.total_queries,
+                "total_query_ms": round(self.total_query_seconds * 1000, 3),
+                "unattributed_queries": self.unattributed_queries,
+                "n_plus_one_threshold": self.n_plus_one_threshold,
+            }
+
+        by_name: Dict[str, Dict] = {}
+        for record in calls:
+            entry = by_name.setdefault(record["name"], {
+                "name": record["name"],
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "queries": 0,
+                "query_ms": 0.0,
+                "n_plus_one_calls": 0,
+                "n_plus_one_statement": None,
+                "n_plus_one_repeats": 0,
+            })
+            entry["calls"] += 1
+            entry["total_ms"] += record["ms"]
+            entry["max_ms"] = max(entry["max_ms"], record["ms"])
+            entry["queries"] += record["queries"]
+            entry["query_ms"] += record["query_ms"]
+            if record["n_plus_one"]:
+                entry["n_plus_one_calls"] += 1
+                statement, count = record["n_plus_one"][0]
+                if count > entry["n_plus_one_repeats"]:
+                    entry["n_plus_one_statement"] = statement
+                    entry["n_plus_one_repeats"] = count
+
+        entries = list(by_name.values())
+        for entry in entries:
+            entry["avg_ms"] = round(entry["total_ms"] / entry["calls"], 3)
+            entry["queries_per_call"] = round(entry["queries"] / entry["calls"], 2)
+            entry["total_ms"] = round(entry["total_ms"], 3)
+            entry["query_ms"] = round(entry["query_ms"], 3)
+
+        data["top_by_query_time"] = sorted(entries, key=lambda e: e["query_ms"], reverse=True)[:limit]
+        data["top_by_query_count"] = sorted(entries, key=lambda e: e["queries"], reverse=True)[:limit]
+        data["n_plus_one"] = sorted(
+            (e for e in entries if e["n_plus_one_calls"]),
+            key=lambda e: e["n_plus_one_repeats"],
+            reverse=True,
+        )[:limit]
+        data["slowest_calls"] = [
+            {key: record[key] for key in ("name", "ms", "queries", "query_ms")}
+            for record in sorted(calls, key=lambda r: r["ms"], reverse=True)[:limit]
+        ]
+        return data
+
+
+profiler = QueryProfiler()
+
+
+@contextmanager
+def profile_call(name: str):
+    """Attribute the statements executed inside the block to `name`"""
+    if not profiler.enabled:
+        yield None
+        return
+    call = _ActiveCall(name, _current_call.get())
+    token = _current_call.set(call)
+    try:
+        yield call
+    finally:
+        _current_call.reset(token)
+        profiler.finish(call)
+
+
+def profiled(func: Optional[Callable] = None, *, name: Optional[str] = None):
+    """
+    Decorator form of profile_call, named module.function by default
+
+    Usage:
+        @profiled
+        def get_all_statistics(...): ...
+
+        @profiled(name="reports.export")
+        def export(...): ...
+    """
+    def decorate(f: Callable) -> Callable:
+        call_name = name or f"{f.__module__}.{f.__qualname__}"
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            with profile_call(call_name):
+                return f(*args, **kwargs)
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+_instrumented_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+def instrument_queries(engine: Engine):
+    """Time every statement executed on `engine` (idempotent)"""
+    if engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if profiler.enabled:
+            conn.info["query_profiler_started"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("query_profiler_started", None)
+        if started is not None:
+            profiler.record_query(statement, time.perf_counter() - started)
+
+
+def get_query_profile(limit: int = 10) -> Dict:
+    """Top offenders of the recent service calls, for health checks and diagnostics"""
+    return profiler.snapshot(limit)
+
+
+def reset_query_profile():
+    profiler.reset()
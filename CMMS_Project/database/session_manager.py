@@ -7,8 +7,15 @@ from sqlalchemy.orm import sessionmaker, Session
 
 def _get_engine():
     """Get the current database engine (always get fresh reference)"""
-    from database.connection import engine
-    return engine
+    from database.connection import get_engine
+    return get_engine()
+
+
+def _get_session_factory() -> sessionmaker:
+    """Cached factory of the current engine (swapped by recreate_engine)"""
+    from database.connection import get_session_factory
+    return get_session_factory()
+
 
 class DynamicSessionLocal:
     """
@@ -17,18 +24,26 @@ class DynamicSessionLocal:
     """
     def __call__(self):
         """Create a new session using the current engine"""
-        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_get_engine())
-        return session_factory()
+        return _get_session_factory()()
+
+class DynamicReadSessionLocal:
+    """
+    Read-only sessions for reports, audits, search and exports: the read
+    replica when configured and fresh enough, otherwise the primary.
+    """
+    def __call__(self):
+        from database.connection import get_read_session
+        return get_read_session()
 
 # Create dynamic SessionLocal instance
 SessionLocal = DynamicSessionLocal()
+ReadSessionLocal = DynamicReadSessionLocal()
 
 
 def get_session() -> Session:
     """Get a new database session (always uses current engine)"""
     # Always create session from current engine to ensure mode switching works
-    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_get_engine())
-    return session_factory()
+    return _get_session_factory()()
 
 
 def get_session_context():
@@ -5,15 +5,20 @@ Handles language selection and persistence
 
 from pathlib import Path
 import json
+import string
 from typing import Optional, Callable
 from config.app_config import DEFAULT_LANGUAGE
 
+_FORMATTER = string.Formatter()
+
 
 class Translator:
     """Singleton translator for managing multilingual content"""
     
     _instance = None
     _translations = {}
+    _compiled = {}  # lang -> {full key: (text, format fields)}, built by initialize()
+    _compiled_fallback = {}
     _current_language = DEFAULT_LANGUAGE
     _observers = []
     
@@ -37,6 +42,67 @@ class Translator:
         if hu_file.exists():
             with open(hu_file, 'r', encoding='utf-8') as f:
                 self._translations['hu'] = json.load(f)
+        
+        self._compile()
+    
+    def _compile(self):
+        """
+        Flatten every language into {full key: (text, format fields)} once
+
+        English entries are merged under every other language, so a lookup
+        never has to fall back at call time. Keys that name a section (a dict)
+        in a language are left out and resolved by the nested walk, which
+        keeps the exact behaviour of get_text for them.
+        """
+        english = {}
+        self._flatten(self._translations.get('en', {}), '', english, set())
+        compiled = {'en': english}
+        for lang, translations in self._translations.items():
+            if lang == 'en':
+                continue
+            table = dict(english)
+            sections = set()
+            self._flatten(translations, '', table, sections)
+            for section in sections:
+                table.pop(section, None)
+            compiled[lang] = table
+        self._compiled = compiled
+        # Unknown language codes fall back to English, like the nested lookup
+        self._compiled_fallback = english
+    
+    @classmethod
+    def _flatten(cls, node: dict, prefix: str, table: dict, sections: set):
+        for k, v in node.items():
+            full_key = f"{prefix}.{k}" if prefix else k
+            if isinstance(v, dict):
+                sections.add(full_key)
+                cls._flatten(v, full_key, table, sections)
+            elif v is not None:
+                text = v if isinstance(v, str) else str(v)
+                # Non-string values are never formatted by get_text
+                table[full_key] = (text, cls._format_fields(text) if isinstance(v, str) else ())
+    
+    @staticmethod
+    def _format_fields(text: str) -> Optional[frozenset]:
+        """
+        Pre-parsed format template: () when there is nothing to format,
+        the set of named fields, or None when str.format must decide
+        (positional fields or a template it cannot parse)
+        """
+        if '{' not in text and '}' not in text:
+            return ()
+        names = set()
+        try:
+            for _, field_name, _, _ in _FORMATTER.parse(text):
+                if field_name is None:
+                    continue
+                name = field_name.split('.', 1)[0].split('[', 1)[0]
+                if not name or name.isdigit():
+                    return None
+                names.add(name)
+        except ValueError:
+            return None
+        return frozenset(names) if names else None
     
     def get_text(self, key: str, lang_code: Optional[str] = None, **params) -> str:
         """
@@ -53,6 +119,26 @@ class Translator:
         if lang_code is None:
             lang_code = self._current_language
         
+        # One dict lookup in the compiled table (English fallback is baked in)
+        entry = self._compiled.get(lang_code, self._compiled_fallback).get(key)
+        if entry is not None:
+            text, fields = entry
+            if not params or fields == ():
+                return text
+            if fields is not None:
+                # Missing parameters leave the template as is (same as the KeyError case)
+                return text.format(**params) if fields <= params.keys() else text
+            try:
+                return text.format(**params)
+            except KeyError:
+                return text
+        
+        # Section keys and keys missing everywhere
+        return self._get_text_nested(key, lang_code, **params)
+    
+    def _get_text_nested(self, key: str, lang_code: str, **params) -> str:
+        """Walk the nested dictionaries (keys that are not in the compiled table)"""
+        
         # Navigate through nested dictionary
         translation_dict = self._translations.get(lang_code, {})
         keys = key.split('.')
@@ -68,7 +154,7 @@ class Translator:
         if value is None:
             # Fallback to English if not found
             if lang_code != 'en':
-                return self.get_text(key, 'en', **params)
+                return self._get_text_nested(key, 'en', **params)
             return key
         
         # Format with parameters if provided
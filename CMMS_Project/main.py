@@ -5,6 +5,7 @@ CMMS - Computerized Maintenance Management System
 
 import sys
 import logging
+import multiprocessing
 from pathlib import Path
 import flet as ft
 
@@ -103,4 +104,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Chart render workers (services.chart_service) are spawned processes
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,71 @@
+"""add_delta_sync_tracking
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYNC_INDEXES = (
+    ('idx_worksheets_updated_at', 'worksheets'),
+    ('idx_machines_updated_at', 'machines'),
+    ('idx_parts_updated_at', 'parts'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add delta-sync cursor columns, (updated_at, id) indexes and tombstones."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    worksheet_columns = {column['name'] for column in inspector.get_columns('worksheets')}
+    if 'updated_at' not in worksheet_columns:
+        op.add_column('worksheets', sa.Column('updated_at', sa.DateTime(), nullable=True))
+        conn.execute(text("UPDATE worksheets SET updated_at = COALESCE(closed_at, created_at)"))
+
+    for index_name, table_name in SYNC_INDEXES:
+        existing = {index['name'] for index in inspector.get_indexes(table_name)}
+        if index_name not in existing:
+            op.create_index(index_name, table_name, ['updated_at', 'id'])
+
+    if 'sync_tombstones' not in inspector.get_table_names():
+        op.create_table(
+            'sync_tombstones',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('table_name', sa.String(length=100), nullable=False),
+            sa.Column('entity_id', sa.Integer(), nullable=False),
+            sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        )
+        op.create_index(
+            'idx_sync_tombstones_table_deleted_at', 'sync_tombstones', ['table_name', 'deleted_at', 'id']
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    try:
+        op.drop_table('sync_tombstones')
+    except Exception:
+        pass
+
+    for index_name, table_name in SYNC_INDEXES:
+        try:
+            op.drop_index(index_name, table_name=table_name)
+        except Exception:
+            pass
+
+    try:
+        op.drop_column('worksheets', 'updated_at')
+    except Exception:
+        pass
@@ -0,0 +1,55 @@
+"""add_machine_depreciation_fields
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, Sequence[str], None] = 'b2c3d4e5f6a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEPRECIATION_COLUMNS = [
+    ('depreciation_method', sa.String(50)),
+    ('depreciation_rate', sa.Float()),
+    ('depreciation_period_years', sa.Integer()),
+    ('current_value', sa.Float()),
+    ('salvage_value', sa.Float()),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add depreciation fields to machines table."""
+    conn = op.get_bind()
+
+    def column_exists(table_name: str, column_name: str) -> bool:
+        """Check if a column exists in a table"""
+        result = conn.execute(text("""
+            SELECT COUNT(*) as col_count
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = :table_name
+            AND COLUMN_NAME = :column_name
+        """), {"table_name": table_name, "column_name": column_name})
+        return result.fetchone()[0] > 0
+
+    for column_name, column_type in DEPRECIATION_COLUMNS:
+        if not column_exists('machines', column_name):
+            op.add_column('machines', sa.Column(column_name, column_type, nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column_name, _ in reversed(DEPRECIATION_COLUMNS):
+        try:
+            op.drop_column('machines', column_name)
+        except Exception:
+            pass
@@ -0,0 +1,89 @@
+"""add_next_operating_hours_update_at
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+from dateutil.relativedelta import relativedelta
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = 'idx_machines_next_operating_hours_update_at'
+
+
+def _next_update_at(freq_type, freq_value, last_update, now):
+    """Same rule as asset_service.compute_next_operating_hours_update_at"""
+    if freq_type not in ('day', 'week', 'month') or not freq_value:
+        return None
+    if not last_update:
+        return now
+    if freq_type == 'day':
+        return last_update + timedelta(days=freq_value)
+    if freq_type == 'week':
+        return last_update + timedelta(weeks=freq_value)
+    return last_update + relativedelta(months=freq_value)
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add indexed next operating hours update date to machines and backfill it."""
+    conn = op.get_bind()
+
+    def column_exists(table_name: str, column_name: str) -> bool:
+        """Check if a column exists in a table"""
+        result = conn.execute(text("""
+            SELECT COUNT(*) as col_count
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = :table_name
+            AND COLUMN_NAME = :column_name
+        """), {"table_name": table_name, "column_name": column_name})
+        return result.fetchone()[0] > 0
+
+    if column_exists('machines', 'next_operating_hours_update_at'):
+        return
+
+    op.add_column('machines', sa.Column('next_operating_hours_update_at', sa.DateTime(), nullable=True))
+    op.create_index(INDEX_NAME, 'machines', ['next_operating_hours_update_at'])
+
+    # One-off backfill for machines that already have a reading frequency
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = conn.execute(text("""
+        SELECT id, operating_hours_update_frequency_type, operating_hours_update_frequency_value,
+               last_operating_hours_update
+        FROM machines
+        WHERE operating_hours_update_frequency_type IS NOT NULL
+        AND operating_hours_update_frequency_value IS NOT NULL
+    """)).fetchall()
+    params = [
+        {"id": row[0], "next_at": _next_update_at(row[1], row[2], row[3], now)}
+        for row in rows
+    ]
+    if params:
+        conn.execute(
+            text("UPDATE machines SET next_operating_hours_update_at = :next_at WHERE id = :id"),
+            params
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    try:
+        op.drop_index(INDEX_NAME, table_name='machines')
+    except Exception:
+        pass
+
+    try:
+        op.drop_column('machines', 'next_operating_hours_update_at')
+    except Exception:
+        pass
@@ -0,0 +1,61 @@
+"""add_part_valuations
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add the FIFO valuation snapshot and its daily history.
+
+    The tables are filled by inventory_valuation_service.rebuild_part_valuations
+    on the next application start (database.init_database).
+    """
+    conn = op.get_bind()
+    tables = sa.inspect(conn).get_table_names()
+
+    if 'part_valuations' not in tables:
+        op.create_table(
+            'part_valuations',
+            sa.Column('part_id', sa.Integer(), sa.ForeignKey('parts.id'), primary_key=True),
+            sa.Column('quantity_on_hand', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('total_value', sa.Float(), nullable=False, server_default='0'),
+            sa.Column('average_cost', sa.Float(), nullable=False, server_default='0'),
+            sa.Column('oldest_batch_date', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+        )
+
+    if 'part_valuation_history' not in tables:
+        op.create_table(
+            'part_valuation_history',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('part_id', sa.Integer(), sa.ForeignKey('parts.id'), nullable=False),
+            sa.Column('valuation_date', sa.Date(), nullable=False),
+            sa.Column('quantity_on_hand', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('total_value', sa.Float(), nullable=False, server_default='0'),
+            sa.UniqueConstraint('part_id', 'valuation_date', name='uq_part_valuation_history_part_date'),
+        )
+        op.create_index(
+            'idx_part_valuation_history_date', 'part_valuation_history', ['valuation_date', 'part_id']
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in ('part_valuation_history', 'part_valuations'):
+        try:
+            op.drop_table(table_name)
+        except Exception:
+            pass
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+"""
+REST API Load Test
+Hammers the list endpoints with concurrent clients and reports requests/s
+and latency percentiles (p50/p95/p99) per endpoint.
+
+Usage:
+    python scripts/api_load_test.py --url http://127.0.0.1:8000 --concurrency 50 --duration 15
+    python scripts/api_load_test.py --spawn --workers 4 --concurrency 50
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+import math
+import subprocess
+import time
+from typing import Dict, List, Optional
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import httpx
+
+DEFAULT_ENDPOINTS = [
+    "/api/machines/?limit=100",
+    "/api/worksheets/?limit=100",
+    "/api/assets/?limit=100",
+    "/api/inventory/?limit=100",
+    "/api/pm/tasks",
+    "/api/users/?limit=100",
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples: Dict[str, List[float]], errors: Dict[str, int], elapsed: float) -> Dict:
+    """Per-endpoint and overall throughput / latency figures (latencies in ms)"""
+    def stats(latencies: List[float], error_count: int) -> Dict:
+        ordered = sorted(latencies)
+        return {
+            "requests": len(ordered),
+            "errors": error_count,
+            "requests_per_second": round(len(ordered) / elapsed, 1) if elapsed > 0 else 0.0,
+            "p50_ms": round(percentile(ordered, 50) * 1000, 1),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 1),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 1),
+        }
+
+    all_latencies = [value for values in samples.values() for value in values]
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "endpoints": {path: stats(samples[path], errors.get(path, 0)) for path in samples},
+        "total": stats(all_latencies, sum(errors.values())),
+    }
+
+
+async def _login(client: httpx.AsyncClient, username: str, password: str) -> str:
+    response = await client.post("/api/auth/login", json={"username": username, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run_load_test(
+    base_url: str,
+    endpoints: List[str],
+    concurrency: int = 50,
+    duration: float = 15.0,
+    token: Optional[str] = None,
+    username: str = "admin",
+    password: str = "admin123",
+) -> Dict:
+    """
+    Run `concurrency` clients against the endpoints (round robin) for `duration` seconds.
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        if token is None:
+            token = await _login(client, username, password)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        samples: Dict[str, List[float]] = {path: [] for path in endpoints}
+        errors: Dict[str, int] = {}
+        deadline = time.perf_counter() + duration
+
+        async def worker(offset: int):
+            index = offset
+            while time.perf_counter() < deadline:
+                path = endpoints[index % len(endpoints)]
+                index += 1
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path, headers=headers)
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    samples[path].append(time.perf_counter() - started)
+                else:
+                    errors[path] = errors.get(path, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        return summarize(samples, errors, time.perf_counter() - started)
+
+
+def _wait_for_server(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/api/health/", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f"API server at {base_url} did not become ready in {timeout:.0f}s")
+
+
+def print_report(report: Dict) -> None:
+    print(f"\n{'Endpoint':<32} {'req':>7} {'err':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    print("-" * 82)
+    rows = list(report["endpoints"].items()) + [("TOTAL", report["total"])]
+    for path, stats in rows:
+        print(f"{path:<32} {stats['requests']:>7} {stats['errors']:>5} {stats['requests_per_second']:>8} "
+              f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}")
+    print(f"\nElapsed: {report['elapsed_seconds']}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CMMS REST API load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="API base URL")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=15.0, help="Test duration in seconds")
+    parser.add_argument("--endpoint", action="append", dest="endpoints", help="Endpoint path (repeatable)")
+    parser.add_argument("--token", help="Bearer token (skips login)")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--spawn", action="store_true", help="Start a local API server for the test")
+    parser.add_argument("--workers", type=int, default=1, help="Workers for the spawned server")
+    parser.add_argument("--threadpool-size", type=int, default=None, help="Threads per spawned worker")
+    parser.add_argument("--json", dest="json_path", help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        port = args.url.rsplit(":", 1)[-1].strip("/")
+        command = [sys.executable, "-m", "api.server", "--port", port, "--workers", str(args.workers),
+                   "--no-access-log"]
+        if args.threadpool_size:
+            command += ["--threadpool-size", str(args.threadpool_size)]
+        server = subprocess.Popen(command, cwd=project_root, stdout=subprocess.DEVNULL)
+        _wait_for_server(args.url)
+
+    try:
+        report = asyncio.run(run_load_test(
+            args.url,
+            args.endpoints or DEFAULT_ENDPOINTS,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            token=args.token,
+            username=args.username,
+            password=args.password,
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report["concurrency"] = args.concurrency
+    report["workers"] = args.workers if args.spawn else None
+    print_report(report)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report saved to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
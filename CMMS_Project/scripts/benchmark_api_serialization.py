@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+API Serialization Benchmark
+Compares the per-page cost of the old list path (ORM entities -> from_orm per
+row -> FastAPI response_model validation -> jsonable JSON) with the fast path
+in api.serialization (column rows -> TypeAdapter -> pydantic-core JSON).
+
+Runs against a throw-away in-memory SQLite database.
+
+Usage:
+    python scripts/benchmark_api_serialization.py --rows 100 --repeat 200
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import time
+import warnings
+from datetime import datetime, timedelta
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from api.schemas import MachineListResponse, MachineResponse, WorksheetListResponse, WorksheetResponse
+from api.serialization import list_page_response, schema_columns
+from database.models import Base, Machine, ProductionLine, Worksheet
+
+
+def seed(session, rows: int) -> None:
+    line = ProductionLine(name="Benchmark line")
+    session.add(line)
+    session.flush()
+    now = datetime(2026, 1, 1)
+    for i in range(rows):
+        machine = Machine(
+            production_line_id=line.id, name=f"Machine {i}", model="X-100",
+            serial_number=f"SN-{i:06d}", status="Active",
+            created_at=now, updated_at=now + timedelta(minutes=i),
+        )
+        session.add(machine)
+        session.flush()
+        session.add(Worksheet(
+            machine_id=machine.id, assigned_to_user_id=1, title=f"Worksheet {i}",
+            description="Bearing replacement " * 5, status="Closed", fault_cause="Wear",
+            created_at=now, updated_at=now, closed_at=now + timedelta(hours=i),
+        ))
+    session.commit()
+
+
+def time_per_page(func, repeat: int) -> float:
+    """Average milliseconds per call"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def run(rows: int, repeat: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    seed(session, rows)
+
+    cases = [
+        ("machines", Machine, MachineResponse, MachineListResponse, {}),
+        ("worksheets", Worksheet, WorksheetResponse, WorksheetListResponse, {"completed_at": "closed_at"}),
+    ]
+    loop = asyncio.new_event_loop()
+    results = []
+    for name, model, schema, list_schema, sources in cases:
+        field = create_response_field(name=f"benchmark_{name}", type_=list_schema)
+        columns = schema_columns(model, schema, sources=sources)
+
+        def old_serialize(entities):
+            content = list_schema(total=len(entities), items=[schema.from_orm(e) for e in entities])
+            data = loop.run_until_complete(serialize_response(field=field, response_content=content))
+            return JSONResponse(data).body
+
+        def new_serialize(tuples):
+            return list_page_response(schema, tuples, len(tuples)).body
+
+        entities = session.execute(select(model).limit(rows)).scalars().all()
+        tuples = session.execute(select(*columns).limit(rows)).all()
+
+        def old_full():
+            session.expunge_all()
+            return old_serialize(session.execute(select(model).limit(rows)).scalars().all())
+
+        def new_full():
+            return new_serialize(session.execute(select(*columns).limit(rows)).all())
+
+        results.append({
+            "entity": name,
+            "old_serialize_ms": time_per_page(lambda: old_serialize(entities), repeat),
+            "new_serialize_ms": time_per_page(lambda: new_serialize(tuples), repeat),
+            "old_total_ms": time_per_page(old_full, repeat),
+            "new_total_ms": time_per_page(new_full, repeat),
+        })
+    loop.close()
+    session.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API list serialization benchmark")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per page")
+    parser.add_argument("--repeat", type=int, default=200, help="Pages per measurement")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")  # from_orm deprecation warnings of the old path
+    results = run(args.rows, args.repeat)
+
+    print(f"\n{args.rows} rows/page, {args.repeat} pages (ms per page)")
+    print(f"{'Entity':<12} {'old ser.':>9} {'new ser.':>9} {'speedup':>8} {'old+query':>10} {'new+query':>10} {'speedup':>8}")
+    print("-" * 72)
+    for row in results:
+        print(f"{row['entity']:<12} {row['old_serialize_ms']:>9.3f} {row['new_serialize_ms']:>9.3f} "
+              f"{row['old_serialize_ms'] / row['new_serialize_ms']:>7.1f}x "
+              f"{row['old_total_ms']:>10.3f} {row['new_total_ms']:>10.3f} "
+              f"{row['old_total_ms'] / row['new_total_ms']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
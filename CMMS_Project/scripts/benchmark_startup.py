@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Desktop Startup Benchmark
+Cold-imports the UI entry point (everything needed to show the login screen)
+in a fresh interpreter with `-X importtime` and fails if it goes over the
+budget or if a library that only some screens need is imported at startup.
+
+Usage:
+    python scripts/benchmark_startup.py --budget-ms 1500 --repeat 3
+"""
+
+import sys
+import os
+import argparse
+import re
+import subprocess
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time of the entry module, median of the runs
+DEFAULT_BUDGET_MS = 1500
+ENTRY_MODULE = "ui.app"
+
+# Libraries that must be imported on demand, never on the way to the login screen
+DEFERRED_LIBRARIES = ("matplotlib", "openpyxl", "pandas", "reportlab", "docx", "PyPDF2", "pypdf")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def measure_imports(module: str = ENTRY_MODULE) -> dict:
+    """
+    Import `module` in a fresh interpreter
+
+    Returns:
+        {"total_ms": cumulative ms of `module`, "modules": {name: (self_us, cumulative_us)}}
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us))
+    if module not in modules:
+        raise RuntimeError(f"{module} not found in -X importtime output")
+    return {"total_ms": modules[module][1] / 1000, "modules": modules}
+
+
+def deferred_imports(modules: dict) -> list:
+    """Top-level names of DEFERRED_LIBRARIES that were imported"""
+    return sorted({name.split(".")[0] for name in modules if name.split(".")[0] in DEFERRED_LIBRARIES})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Desktop cold start (import to login screen) benchmark")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Import time budget (ms)")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters to run (median is used)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--module", default=ENTRY_MODULE, help="Entry module to import")
+    args = parser.parse_args()
+
+    try:
+        runs = [measure_imports(args.module) for _ in range(args.repeat)]
+    except RuntimeError as e:
+        print(e)
+        return 2
+
+    runs.sort(key=lambda run: run["total_ms"])
+    median = runs[len(runs) // 2]
+    deferred = deferred_imports(median["modules"])
+
+    timings = ", ".join(f"{run['total_ms']:.0f}" for run in runs)
+    print(f"\nimport {args.module}: {timings} ms "
+          f"(median {median['total_ms']:.0f} ms, budget {args.budget_ms:.0f} ms)")
+    print(f"{'Module':<50} {'self ms':>9} {'cum. ms':>9}")
+    print("-" * 70)
+    slowest = sorted(median["modules"].items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{name:<50} {self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}")
+
+    failed = False
+    if deferred:
+        print(f"\nFAIL: imported at startup, should be loaded on demand: {', '.join(deferred)}")
+        failed = True
+    if median["total_ms"] > args.budget_ms:
+        print(f"\nFAIL: startup import time {median['total_ms']:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if not failed:
+        print("\nOK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
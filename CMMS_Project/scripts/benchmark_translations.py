@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Translation Lookup Micro-Benchmark
+Times translator.get_text on every translation key: the compiled (flattened)
+table against the nested dictionary walk it replaced, and a simulated
+language switch followed by a render that looks up every key `--rows` times.
+
+Usage:
+    python scripts/benchmark_translations.py --rows 20 --repeat 5
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pathlib import Path
+
+from localization.translator import translator
+
+
+def _best_of(repeat: int, func) -> float:
+    """Fastest of `repeat` runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="translator.get_text micro-benchmark")
+    parser.add_argument("--rows", type=int, default=20, help="Lookups of every key per simulated render")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (fastest is used)")
+    parser.add_argument("--lang", default="hu", help="Language to look up (English is the fallback)")
+    args = parser.parse_args()
+
+    translator.initialize(Path(project_root) / "localization" / "translations")
+    keys = sorted(translator._get_all_keys(translator._translations.get("en", {})))
+    lookups = len(keys) * args.rows
+
+    def nested():
+        for _ in range(args.rows):
+            for key in keys:
+                translator._get_text_nested(key, args.lang)
+
+    def compiled():
+        for _ in range(args.rows):
+            for key in keys:
+                translator.get_text(key, args.lang)
+
+    def switch_and_render():
+        translator.set_current_language("en" if translator.get_current_language() != "en" else args.lang)
+        for _ in range(args.rows):
+            for key in keys:
+                translator.get_text(key)
+
+    compile_s = _best_of(args.repeat, translator._compile)
+    nested_s = _best_of(args.repeat, nested)
+    compiled_s = _best_of(args.repeat, compiled)
+    switch_s = _best_of(args.repeat, switch_and_render)
+
+    print(f"\n{len(keys)} keys x {args.rows} rows = {lookups} lookups ({args.lang})")
+    print(f"{'':<28} {'total ms':>10} {'ns/lookup':>10}")
+    print("-" * 50)
+    print(f"{'compile (initialize)':<28} {compile_s * 1000:>10.2f} {'':>10}")
+    print(f"{'nested walk':<28} {nested_s * 1000:>10.2f} {nested_s / lookups * 1e9:>10.0f}")
+    print(f"{'compiled table':<28} {compiled_s * 1000:>10.2f} {compiled_s / lookups * 1e9:>10.0f}")
+    print(f"{'language switch + render':<28} {switch_s * 1000:>10.2f} {switch_s / lookups * 1e9:>10.0f}")
+    print(f"\nSpeed-up: {nested_s / compiled_s:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Bulk Import Utility Script
+Imports parts, machines or stock receipts from an Excel/CSV file into the
+configured database (e.g. when onboarding a new site) and prints the
+throughput. Invalid rows are skipped and listed in an error report.
+
+Usage:
+    python scripts/bulk_import.py parts alkatreszek.xlsx --create-missing
+    python scripts/bulk_import.py stock keszlet.csv --errors hibak.xlsx
+    python scripts/bulk_import.py machines --template gepek_minta.xlsx
+"""
+
+import sys
+import os
+import argparse
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pathlib import Path
+
+from services.bulk_import_service import (
+    IMPORT_COLUMNS, MODE_INSERT, MODE_UPSERT, create_import_template, import_file,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import from Excel/CSV")
+    parser.add_argument("entity", choices=sorted(IMPORT_COLUMNS))
+    parser.add_argument("path", nargs="?", help="Import file (.xlsx or .csv)")
+    parser.add_argument("--upsert", action="store_true", help="Update existing records instead of rejecting them")
+    parser.add_argument("--create-missing", action="store_true",
+                        help="Create unknown suppliers and production lines by name")
+    parser.add_argument("--sheet", help="Worksheet of an Excel file (default: active sheet)")
+    parser.add_argument("--chunk-size", type=int, help="Rows per transaction")
+    parser.add_argument("--errors", help="Error report file (.xlsx or .csv)")
+    parser.add_argument("--template", help="Only write an empty import template to this file")
+    args = parser.parse_args()
+
+    if args.template:
+        print(f"Template: {create_import_template(args.entity, Path(args.template))}")
+        return 0
+    if not args.path:
+        parser.error("path is required (or --template)")
+
+    options = {"chunk_size": args.chunk_size} if args.chunk_size else {}
+    result = import_file(
+        args.entity,
+        Path(args.path),
+        mode=MODE_UPSERT if args.upsert else MODE_INSERT,
+        create_missing=args.create_missing,
+        sheet_name=args.sheet,
+        error_report_path=Path(args.errors) if args.errors else None,
+        progress_callback=lambda done, total: print(f"  {done} rows...", end="\r"),
+        **options,
+    )
+
+    print(f"\n{result.total_rows} rows in {result.elapsed_seconds:.2f} s ({result.rows_per_second:.0f} rows/s)")
+    print(f"created: {result.created}  updated: {result.updated}  failed rows: {result.failed_rows}")
+    for error in result.errors[:20]:
+        print(f"  row {error.row}: {error.column or '-'}: {error.message} ({error.value or ''})")
+    if len(result.errors) > 20:
+        print(f"  ... {len(result.errors) - 20} more")
+    if result.error_report_path:
+        print(f"Error report: {result.error_report_path}")
+    return 0 if result.succeeded else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
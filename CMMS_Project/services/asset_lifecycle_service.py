@@ -4,11 +4,12 @@ Asset lifecycle management service
 
 from typing import Optional, Dict, List
 from datetime import datetime
+from dateutil.relativedelta import relativedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 from database.models import Machine, Worksheet, WorksheetPart, PMHistory, ServiceRecord, utcnow
 from database.session_manager import SessionLocal
-from services.depreciation_service import calculate_depreciation
+from services.depreciation_service import calculate_depreciation, project_depreciation
 import logging
 
 logger = logging.getLogger(__name__)
@@ -77,6 +78,33 @@ def get_asset_lifecycle_stats(machine_id: int, session: Session = None) -> Dict:
             session.close()
 
 
+def get_depreciation_projection(
+    machine_ids: Optional[List[int]] = None,
+    start_date: Optional[datetime] = None,
+    years: int = 5,
+    step_months: int = 12,
+    session: Session = None
+) -> Dict:
+    """
+    Book value projection for the lifecycle screens (one query, one vectorized run)
+
+    Args:
+        machine_ids: Machines to project (None = all machines)
+        start_date: First projection date (default: today)
+        years: Projection horizon
+        step_months: Distance between projection points
+
+    Returns:
+        project_depreciation result ('dates', 'machines', 'total_book_value')
+    """
+    start = start_date or utcnow()
+    if isinstance(start, datetime):
+        start = start.date()
+    steps = max(1, (years * 12) // max(1, step_months))
+    dates = [start + relativedelta(months=step_months * i) for i in range(steps + 1)]
+    return project_depreciation(dates, machine_ids=machine_ids, session=session)
+
+
 def get_performance_metrics(machine_id: int, session: Session = None) -> Dict:
     """
     Calculate performance metrics: MTBF, MTTR, Availability
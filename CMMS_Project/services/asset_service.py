@@ -3,8 +3,10 @@ Asset service: production line, machine, module, history
 """
 
 from typing import Optional, List, Dict
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 
 from config.constants import ASSET_ACTIONS, MACHINE_STATUS_SCRAPPED
 from database.session_manager import SessionLocal
@@ -16,6 +18,7 @@ from database.models import (
     MachineVersion,
     utcnow,
 )
+from database.query_profiler import profiled
 
 from utils.localization_helper import get_localized_error
 import logging
@@ -280,6 +283,7 @@ def create_machine(production_line_id: int, name: str, serial_number: Optional[s
             created_at=utcnow(),
             updated_at=utcnow(),
         )
+        machine.next_operating_hours_update_at = compute_next_operating_hours_update_at(machine)
         session.add(machine)
         session.flush()  # Flush to get machine.id
         
@@ -495,6 +499,7 @@ def delete_module(module_id: int, session: Session = None) -> bool:
             session.close()
 
 
+@profiled
 def list_machines(production_line_id: Optional[int] = None, session: Session = None) -> List[Machine]:
     """List machines, optionally filtered by production line"""
     session, should_close = _get_session(session)
@@ -515,6 +520,49 @@ def list_machines(production_line_id: Optional[int] = None, session: Session = N
             session.close()
 
 
+def count_machines(production_line_id: Optional[int] = None, session: Session = None) -> int:
+    """Number of machines (COUNT only, no rows are loaded)"""
+    session, should_close = _get_session(session)
+    try:
+        query = session.query(func.count(Machine.id))
+        if production_line_id:
+            query = query.filter(Machine.production_line_id == production_line_id)
+        return query.scalar() or 0
+    finally:
+        if should_close:
+            session.close()
+
+
+@profiled
+def list_machines_page(
+    after_id: Optional[int] = None,
+    limit: int = 50,
+    production_line_id: Optional[int] = None,
+    session: Session = None,
+) -> List[Machine]:
+    """
+    One keyset page of machines ordered by id (WHERE id > after_id LIMIT limit)
+
+    Production line, compatible parts and the last modifier are loaded with
+    one SELECT ... IN each, so a page costs four queries regardless of its size.
+    """
+    session, should_close = _get_session(session)
+    try:
+        query = session.query(Machine).options(
+            selectinload(Machine.production_line),
+            selectinload(Machine.id_compatible_parts),
+            selectinload(Machine.updated_by_user),
+        )
+        if production_line_id:
+            query = query.filter(Machine.production_line_id == production_line_id)
+        if after_id is not None:
+            query = query.filter(Machine.id > after_id)
+        return query.order_by(Machine.id).limit(limit).all()
+    finally:
+        if should_close:
+            session.close()
+
+
 def update_machine(
     machine_id: int,
     name: Optional[str] = None,
@@ -628,6 +676,9 @@ def update_machine(
             if existing:
                 raise AssetServiceError(get_localized_error("asset_tag_exists"))
         
+        if 'operating_hours_update_frequency_type' in changed_fields or 'operating_hours_update_frequency_value' in changed_fields:
+            machine.next_operating_hours_update_at = compute_next_operating_hours_update_at(machine)
+        
         # If there are changes, create version history
         if changed_fields and updated_by_user_id:
             machine.version += 1
@@ -758,6 +809,7 @@ def update_operating_hours(
         old_hours = machine.operating_hours or 0.0
         machine.operating_hours = new_operating_hours
         machine.last_operating_hours_update = utcnow()
+        machine.next_operating_hours_update_at = compute_next_operating_hours_update_at(machine)
         machine.updated_at = utcnow()
         
         # Get user ID
@@ -839,6 +891,24 @@ def get_operating_hours_history(machine_id: int, limit: int = 10, session: Sessi
             session.close()
 
 
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Drop tzinfo from UTC datetimes (the DB returns naive values)"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _add_operating_hours_interval(start: datetime, freq_type: str, freq_value: int) -> Optional[datetime]:
+    """Add the reading interval; months are calendar months (Jan 31 + 1 month = Feb 28/29)"""
+    if freq_type == "day":
+        return start + timedelta(days=freq_value)
+    if freq_type == "week":
+        return start + timedelta(weeks=freq_value)
+    if freq_type == "month":
+        return start + relativedelta(months=freq_value)
+    return None
+
+
 def calculate_next_operating_hours_update_date(machine: Machine) -> Optional[datetime]:
     """Calculate the next operating hours update date based on machine settings"""
     if not machine.operating_hours_update_frequency_type or not machine.operating_hours_update_frequency_value:
@@ -848,97 +918,114 @@ def calculate_next_operating_hours_update_date(machine: Machine) -> Optional[dat
     if not last_update:
         return None
     
-    freq_type = machine.operating_hours_update_frequency_type
-    freq_value = machine.operating_hours_update_frequency_value
-    
-    if freq_type == "day":
-        next_date = last_update + timedelta(days=freq_value)
-    elif freq_type == "week":
-        next_date = last_update + timedelta(weeks=freq_value)
-    elif freq_type == "month":
-        # Approximate month calculation
-        next_date = last_update + timedelta(days=freq_value * 30)
-    else:
+    return _add_operating_hours_interval(
+        last_update,
+        machine.operating_hours_update_frequency_type,
+        machine.operating_hours_update_frequency_value,
+    )
+
+
+def compute_next_operating_hours_update_at(machine: Machine) -> Optional[datetime]:
+    """
+    Value of the indexed next_operating_hours_update_at column.
+
+    None when no (valid) frequency is set. A machine that has a frequency but was
+    never read is due immediately, so it gets the time it was configured.
+    """
+    if not machine.operating_hours_update_frequency_type or not machine.operating_hours_update_frequency_value:
         return None
-    
-    return next_date
+    if not machine.last_operating_hours_update:
+        if machine.operating_hours_update_frequency_type not in ("day", "week", "month"):
+            return None
+        return _naive_utc(utcnow())
+    return _naive_utc(calculate_next_operating_hours_update_date(machine))
 
 
-def get_machines_with_due_operating_hours_update(session: Session = None) -> List[dict]:
-    """Get machines that need operating hours update based on their frequency settings"""
+def backfill_next_operating_hours_update_at(session: Session = None) -> int:
+    """
+    One-off fill of next_operating_hours_update_at for existing machines
+
+    Returns:
+        Number of machines updated
+    """
+    session, should_close = _get_session(session)
+    try:
+        from sqlalchemy import update
+        
+        rows = session.query(
+            Machine.id,
+            Machine.operating_hours_update_frequency_type,
+            Machine.operating_hours_update_frequency_value,
+            Machine.last_operating_hours_update,
+        ).filter(
+            Machine.operating_hours_update_frequency_type.isnot(None),
+            Machine.operating_hours_update_frequency_value.isnot(None),
+        ).all()
+        
+        params = [
+            {"id": row.id, "next_operating_hours_update_at": compute_next_operating_hours_update_at(row)}
+            for row in rows
+        ]
+        if params:
+            session.execute(update(Machine), params)
+            session.commit()
+        logger.info(f"Backfilled next operating hours update date for {len(params)} machines")
+        return len(params)
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error backfilling next operating hours update dates: {e}", exc_info=True)
+        raise
+    finally:
+        if should_close:
+            session.close()
+
+
+def get_machines_with_due_operating_hours_update(
+    days_ahead: Optional[float] = None,
+    session: Session = None
+) -> List[dict]:
+    """
+    Get machines that need operating hours update based on their frequency settings
+
+    Args:
+        days_ahead: Notification window in days (default: operating hours notification settings)
+
+    Range scan on the indexed next_operating_hours_update_at column.
+    """
     session, should_close = _get_session(session)
     try:
-        from datetime import datetime, timedelta
         from sqlalchemy.orm import joinedload
         from services.settings_service import get_operating_hours_notification_settings
         
-        now = utcnow()
-        if isinstance(now, datetime):
-            current_time = now
-        else:
-            current_time = datetime.now()
+        current_time = _naive_utc(utcnow())
         
-        # Get notification settings
-        notif_settings = get_operating_hours_notification_settings(session)
-        days_ahead = (
-            notif_settings['months_ahead'] * 30 +
-            notif_settings['weeks_ahead'] * 7 +
-            notif_settings['days_ahead'] +
-            notif_settings['hours_ahead'] / 24
-        )
+        if days_ahead is None:
+            notif_settings = get_operating_hours_notification_settings(session)
+            notification_cutoff = current_time + relativedelta(
+                months=notif_settings['months_ahead'],
+                weeks=notif_settings['weeks_ahead'],
+                days=notif_settings['days_ahead'],
+                hours=notif_settings['hours_ahead'],
+            )
+        else:
+            notification_cutoff = current_time + timedelta(days=days_ahead)
         
         machines = session.query(Machine).options(
             joinedload(Machine.production_line),
         ).filter(
-            Machine.operating_hours_update_frequency_type.isnot(None),
-            Machine.operating_hours_update_frequency_value.isnot(None),
+            Machine.next_operating_hours_update_at <= notification_cutoff,
             Machine.status != MACHINE_STATUS_SCRAPPED
-        ).all()
-        
-        due_machines = []
-        
-        for machine in machines:
-            if not machine.last_operating_hours_update:
-                # Never updated, consider it due
-                due_machines.append({
-                    'machine': machine,
-                    'next_update_date': current_time,
-                    'is_overdue': True,
-                })
-                continue
-            
-            # Calculate next update date based on frequency
-            last_update = machine.last_operating_hours_update
-            if isinstance(last_update, datetime):
-                last_update_dt = last_update
-            else:
-                last_update_dt = datetime.fromisoformat(str(last_update)) if isinstance(last_update, str) else current_time
-            
-            frequency_type = machine.operating_hours_update_frequency_type
-            frequency_value = machine.operating_hours_update_frequency_value or 1
-            
-            if frequency_type == 'day':
-                next_update = last_update_dt + timedelta(days=frequency_value)
-            elif frequency_type == 'week':
-                next_update = last_update_dt + timedelta(weeks=frequency_value)
-            elif frequency_type == 'month':
-                # Approximate month as 30 days
-                next_update = last_update_dt + timedelta(days=frequency_value * 30)
-            else:
-                continue
-            
-            # Check if update is due within notification period
-            notification_cutoff = current_time + timedelta(days=days_ahead)
-            if next_update <= notification_cutoff:
-                due_machines.append({
-                    'machine': machine,
-                    'next_update_date': next_update,
-                    'is_overdue': next_update < current_time,
-                })
+        ).order_by(Machine.next_operating_hours_update_at).all()
         
-        # Sort by next update date (overdue first)
-        due_machines.sort(key=lambda x: (not x['is_overdue'], x['next_update_date']))
-        return due_machines
+        # Ordered by due date, so overdue machines come first
+        return [
+            {
+                'machine': machine,
+                'next_update_date': machine.next_operating_hours_update_at,
+                'is_overdue': _naive_utc(machine.next_operating_hours_update_at) < current_time,
+            }
+            for machine in machines
+        ]
     finally:
         if should_close:
             session.close()
@@ -0,0 +1,238 @@
+"""
+Batch service: ordered lists of write operations in one request
+(worksheets, worksheet parts, PM completions) on top of the regular services.
+
+Operations:
+    {"op": "worksheet.create", "ref": "ws", "params": {"machine_id": 1, ...}}
+    {"op": "worksheet.add_part", "params": {"worksheet_id": "$ws", "part_id": 7, "quantity_used": 2}}
+
+A string parameter "$<ref>" is replaced with the id returned by the earlier
+operation labelled `ref`. In atomic mode (default) the whole batch is one
+transaction: the first failing operation rolls everything back.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from config.roles import ROLE_DEVELOPER, ROLE_MAINTENANCE_SUPERVISOR, ROLE_MANAGER, ROLE_PRODUCTION_SUPERVISOR
+from database.session_manager import SessionLocal
+from database.models import Worksheet
+from services import pm_service, worksheet_service
+from services.transaction_service import deferred_commits
+from utils.error_handler import CMMSError, NotFoundError, PermissionError, ValidationError
+from utils.localization_helper import get_localized_error
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_OPERATIONS = 200
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_SKIPPED = "skipped"
+STATUS_ROLLED_BACK = "rolled_back"
+
+# Roles that may assign worksheets to another user (API token role names and config.roles)
+ASSIGNING_ROLES = {
+    "admin", "manager",
+    ROLE_DEVELOPER, ROLE_MANAGER, ROLE_MAINTENANCE_SUPERVISOR, ROLE_PRODUCTION_SUPERVISOR,
+}
+
+
+class BatchServiceError(Exception):
+    """Generic batch error"""
+    pass
+
+
+def _get_session(session: Optional[Session]) -> (Session, bool):
+    if session is None:
+        return SessionLocal(), True
+    return session, False
+
+
+def _parse_datetime(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+# ============================================================================
+# Operation handlers: (session, params, user_id) -> result dict
+# ============================================================================
+
+def _worksheet_create(session: Session, params: Dict, user_id: Optional[int]) -> Dict:
+    ws = worksheet_service.create_worksheet(
+        machine_id=params["machine_id"],
+        assigned_to_user_id=params.get("assigned_to_user_id") or user_id,
+        title=params.get("title", ""),
+        description=params.get("description"),
+        breakdown_time=_parse_datetime(params.get("breakdown_time")),
+        session=session,
+    )
+    return {"id": ws.id, "status": ws.status}
+
+
+_WORKSHEET_EDITABLE_FIELDS = ("description", "notes", "fault_cause", "assigned_to_user_id")
+
+
+def _worksheet_update(session: Session, params: Dict, user_id: Optional[int]) -> Dict:
+    """Field updates, then an optional status change through the workflow"""
+    worksheet_id = params["worksheet_id"]
+    ws = session.query(Worksheet).filter_by(id=worksheet_id).first()
+    if not ws:
+        raise NotFoundError("Worksheet", worksheet_id, user_message=get_localized_error("worksheet_not_found"))
+    for field in _WORKSHEET_EDITABLE_FIELDS:
+        if field in params:
+            setattr(ws, field, params[field])
+    session.flush()
+    if params.get("status"):
+        ws = worksheet_service.update_status(
+            worksheet_id,
+            params["status"],
+            repair_finished_time=_parse_datetime(params.get("repair_finished_time")),
+            session=session,
+        )
+    return {"id": ws.id, "status": ws.status}
+
+
+def _worksheet_add_part(session: Session, params: Dict, user_id: Optional[int]) -> Dict:
+    wp = worksheet_service.add_part_to_worksheet(
+        worksheet_id=params["worksheet_id"],
+        part_id=params["part_id"],
+        quantity_used=params["quantity_used"],
+        unit_cost_at_time=params.get("unit_cost_at_time", 0.0),
+        notes=params.get("notes"),
+        user_id=user_id,
+        storage_location_id=params.get("storage_location_id"),
+        session=session,
+    )
+    return {"id": wp.id, "worksheet_id": wp.worksheet_id, "unit_cost_at_time": wp.unit_cost_at_time}
+
+
+def _pm_complete(session: Session, params: Dict, user_id: Optional[int]) -> Dict:
+    history, worksheet_id = pm_service.complete_pm_task(
+        task_id=params["task_id"],
+        completed_by_user_id=user_id,
+        notes=params.get("notes"),
+        duration_minutes=params.get("duration_minutes"),
+        create_worksheet=params.get("create_worksheet", True),
+        session=session,
+    )
+    return {"id": history.id, "worksheet_id": worksheet_id}
+
+
+BATCH_OPERATIONS: Dict[str, Callable[[Session, Dict, Optional[int]], Dict]] = {
+    "worksheet.create": _worksheet_create,
+    "worksheet.update": _worksheet_update,
+    "worksheet.add_part": _worksheet_add_part,
+    "pm.complete": _pm_complete,
+}
+
+
+def _authorize_params(name: str, params: Dict, user_id: Optional[int], role_name: Optional[str]) -> Dict:
+    """
+    Acting-user fields come from the authenticated caller, not the request:
+    completions are always recorded for the caller, and only ASSIGNING_ROLES
+    may assign a worksheet to someone else.
+    """
+    if name == "pm.complete" and params.get("completed_by_user_id") not in (None, user_id):
+        logger.warning(f"Ignoring completed_by_user_id={params['completed_by_user_id']} from user {user_id}")
+    params = {key: value for key, value in params.items() if key != "completed_by_user_id"}
+    assignee = params.get("assigned_to_user_id")
+    if assignee is not None and assignee != user_id and role_name not in ASSIGNING_ROLES:
+        raise PermissionError("assign", "Worksheet")
+    return params
+
+
+def _resolve_refs(params: Dict, refs: Dict[str, Any]) -> Dict:
+    resolved = {}
+    for key, value in params.items():
+        if isinstance(value, str) and value.startswith("$"):
+            if value[1:] not in refs:
+                raise ValidationError(f"Unknown operation reference: {value}", field=key)
+            value = refs[value[1:]]
+        resolved[key] = value
+    return resolved
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, CMMSError):
+        return error.user_message
+    if isinstance(error, KeyError):
+        return f"Missing parameter: {error.args[0]}"
+    return str(error)
+
+
+def execute_batch(
+    operations: List[Dict],
+    user_id: Optional[int] = None,
+    atomic: bool = True,
+    session: Optional[Session] = None,
+    role_name: Optional[str] = None,
+) -> Dict:
+    """
+    Execute operations in order.
+
+    Args:
+        operations: [{"op": name, "params": {...}, "ref": optional label}]
+        user_id: Acting user (default assignee / completed_by / stock movements)
+        role_name: Acting user's role; assigning worksheets to another user
+            requires one of ASSIGNING_ROLES
+        atomic: One transaction for the whole batch; otherwise every operation
+            commits on its own and later operations still run after a failure
+
+    Returns:
+        {"committed": bool, "results": [{index, op, status, result | error}]}
+    """
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise BatchServiceError(f"Too many operations: {len(operations)} (max {MAX_BATCH_OPERATIONS})")
+
+    session, should_close = _get_session(session)
+    results = []
+    refs: Dict[str, Any] = {}
+    failed = False
+    try:
+        for index, operation in enumerate(operations):
+            name = operation.get("op")
+            entry = {"index": index, "op": name}
+            results.append(entry)
+            if failed and atomic:
+                entry["status"] = STATUS_SKIPPED
+                continue
+            try:
+                handler = BATCH_OPERATIONS.get(name)
+                if handler is None:
+                    raise ValidationError(f"Unknown batch operation: {name}", field="op")
+                params = _resolve_refs(operation.get("params") or {}, refs)
+                params = _authorize_params(name, params, user_id, role_name)
+                if atomic:
+                    with deferred_commits(session):
+                        result = handler(session, params, user_id)
+                else:
+                    result = handler(session, params, user_id)
+                    session.commit()
+                entry.update(status=STATUS_OK, result=result)
+                if operation.get("ref"):
+                    refs[operation["ref"]] = result.get("id")
+            except Exception as e:
+                session.rollback()
+                failed = True
+                logger.warning(f"Batch operation {index} ({name}) failed: {e}")
+                entry.update(status=STATUS_ERROR, error=_error_message(e))
+
+        if atomic and failed:
+            for entry in results:
+                if entry["status"] == STATUS_OK:
+                    entry["status"] = STATUS_ROLLED_BACK
+            return {"committed": False, "results": results}
+
+        session.commit()
+        return {"committed": True, "results": results}
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        if should_close:
+            session.close()
@@ -0,0 +1,985 @@
+"""
+Bulk import service for parts, machines and stock receipts from Excel/CSV
+
+The spreadsheet is read in chunks (CSV through pandas' chunked reader, XLSX
+through a read-only openpyxl worksheet) and every chunk is validated as a
+whole with vectorized pandas operations. Suppliers, SKUs, production lines
+and machine identifiers are resolved through dictionaries prefetched once
+per import, and each chunk is written with executemany statements in one
+transaction, followed by a single summary log entry. Invalid rows are
+collected into a per-row error report instead of aborting the import.
+"""
+
+import csv
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session
+
+from config.app_config import BULK_IMPORT_CHUNK_SIZE
+from config.constants import TRANSACTION_TYPE_RECEIVED
+from database.models import (
+    InventoryLevel, Machine, Part, ProductionLine, StockBatch, StockTransaction, Supplier, utcnow,
+)
+from database.session_manager import SessionLocal
+from services.inventory_valuation_service import refresh_part_valuations
+from utils.error_handler import ValidationError
+from utils.validators import SKU_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# pandas does the per-chunk validation; openpyxl streams XLSX input
+PANDAS_AVAILABLE = False
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError as e:
+    logger.error(f"pandas ImportError: {e}")
+
+OPENPYXL_AVAILABLE = False
+try:
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.styles import Font
+    OPENPYXL_AVAILABLE = True
+except ImportError as e:
+    logger.error(f"openpyxl ImportError: {e}")
+
+ENTITY_PARTS = "parts"
+ENTITY_MACHINES = "machines"
+ENTITY_STOCK = "stock"
+
+MODE_INSERT = "insert"  # rows matching an existing record are errors
+MODE_UPSERT = "upsert"  # rows matching an existing record update it
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class ImportColumn:
+    """Column of an import file: accepted headers, type and constraints"""
+
+    def __init__(self, key: str, header: str, aliases: Sequence[str] = (), kind: str = "str",
+                 required: bool = False, max_length: Optional[int] = None):
+        self.key = key
+        self.header = header
+        self.aliases = tuple(aliases)
+        self.kind = kind  # str, int, float, date
+        self.required = required
+        self.max_length = max_length
+
+    def matches(self, header: str) -> bool:
+        normalized = str(header).strip().lower()
+        return normalized in (self.key, self.header.lower(), *self.aliases)
+
+
+PART_COLUMNS = [
+    ImportColumn("sku", "SKU", ("cikkszám", "cikkszam"), required=True, max_length=50),
+    ImportColumn("name", "Név", ("nev", "megnevezés", "alkatrész neve"), required=True, max_length=150),
+    ImportColumn("category", "Kategória", ("kategoria",), max_length=100),
+    ImportColumn("unit", "Mértékegység", ("mertekegyseg", "me"), max_length=20),
+    ImportColumn("buy_price", "Beszerzési ár", ("beszerzesi ar", "unit_price"), kind="float"),
+    ImportColumn("sell_price", "Eladási ár", ("eladasi ar",), kind="float"),
+    ImportColumn("safety_stock", "Biztonsági készlet", ("biztonsagi keszlet",), kind="int"),
+    ImportColumn("reorder_quantity", "Újrarendelési mennyiség", ("ujrarendelesi mennyiseg",), kind="int"),
+    ImportColumn("supplier", "Szállító", ("szallito", "supplier_name"), max_length=150),
+    ImportColumn("supplier_id", "Szállító ID", ("szallito id",), kind="int"),
+    ImportColumn("initial_quantity", "Kezdeti készlet", ("kezdeti keszlet", "quantity"), kind="int"),
+    ImportColumn("bin_location", "Tárolóhely", ("tarolohely",), max_length=100),
+    ImportColumn("description", "Leírás", ("leiras",)),
+]
+
+MACHINE_COLUMNS = [
+    ImportColumn("production_line", "Gyártósor", ("gyartosor", "production_line_code"),
+                 required=True, max_length=100),
+    ImportColumn("name", "Név", ("nev", "megnevezés", "gép neve"), required=True, max_length=100),
+    ImportColumn("serial_number", "Gyári szám", ("gyari szam", "sorozatszám"), max_length=100),
+    ImportColumn("asset_tag", "Eszközazonosító", ("eszkozazonosito", "leltári szám"), max_length=50),
+    ImportColumn("model", "Típus", ("tipus", "modell"), max_length=100),
+    ImportColumn("manufacturer", "Gyártó", ("gyarto",), max_length=100),
+    ImportColumn("status", "Státusz", ("statusz",), max_length=50),
+    ImportColumn("criticality_level", "Kritikusság", ("kritikussag",), max_length=50),
+    ImportColumn("install_date", "Telepítés dátuma", ("telepites datuma",), kind="date"),
+    ImportColumn("purchase_date", "Beszerzés dátuma", ("beszerzes datuma",), kind="date"),
+    ImportColumn("purchase_price", "Beszerzési ár", ("beszerzesi ar",), kind="float"),
+    ImportColumn("operating_hours", "Üzemóra", ("uzemora",), kind="float"),
+    ImportColumn("supplier", "Szállító", ("szallito",), max_length=200),
+    ImportColumn("notes", "Megjegyzés", ("megjegyzes",)),
+]
+
+STOCK_COLUMNS = [
+    ImportColumn("sku", "SKU", ("cikkszám", "cikkszam"), required=True, max_length=50),
+    ImportColumn("quantity", "Mennyiség", ("mennyiseg",), kind="int", required=True),
+    ImportColumn("unit_price", "Egységár", ("egysegar", "buy_price"), kind="float"),
+    ImportColumn("received_date", "Beérkezés dátuma", ("beerkezes datuma",), kind="date"),
+    ImportColumn("supplier", "Szállító", ("szallito",), max_length=150),
+    ImportColumn("invoice_number", "Számlaszám", ("szamlaszam",), max_length=100),
+    ImportColumn("notes", "Megjegyzés", ("megjegyzes",)),
+]
+
+IMPORT_COLUMNS: Dict[str, List[ImportColumn]] = {
+    ENTITY_PARTS: PART_COLUMNS,
+    ENTITY_MACHINES: MACHINE_COLUMNS,
+    ENTITY_STOCK: STOCK_COLUMNS,
+}
+
+# Summary log entry per chunk: (log category, entity type)
+_LOG_TARGETS = {
+    ENTITY_PARTS: ("inventory", "Part"),
+    ENTITY_MACHINES: ("asset", "Machine"),
+    ENTITY_STOCK: ("inventory", "StockTransaction"),
+}
+
+
+@dataclass
+class ImportRowError:
+    """One problem of one input row (row = spreadsheet row number)"""
+    row: int
+    column: Optional[str]
+    value: Optional[str]
+    message: str
+
+
+@dataclass
+class ImportResult:
+    """Outcome of a bulk import"""
+    entity: str
+    source: str
+    total_rows: int = 0
+    created: int = 0
+    updated: int = 0
+    failed_rows: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[ImportRowError] = field(default_factory=list)
+    error_report_path: Optional[Path] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total_rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.failed_rows == 0
+
+
+def _get_session(session: Optional[Session]):
+    if session is None:
+        return SessionLocal(), True
+    return session, False
+
+
+def _require_pandas():
+    if not PANDAS_AVAILABLE:
+        raise ImportError("pandas is required for bulk import")
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+def _sniff_delimiter(path: Path) -> str:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        sample = f.read(8192)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t").delimiter
+    except csv.Error:
+        return ","
+
+
+def _iter_csv_chunks(path: Path, chunk_size: int) -> Iterator["pd.DataFrame"]:
+    reader = pd.read_csv(
+        path,
+        sep=_sniff_delimiter(path),
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8-sig",
+        chunksize=chunk_size,
+        skip_blank_lines=True,
+    )
+    for chunk in reader:
+        # Spreadsheet row numbers: the header is row 1
+        chunk.index = chunk.index + 2
+        yield chunk
+
+
+def _iter_xlsx_chunks(path: Path, chunk_size: int, sheet_name: Optional[str]) -> Iterator["pd.DataFrame"]:
+    if not OPENPYXL_AVAILABLE:
+        raise ImportError("openpyxl is required for Excel import")
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
+        headers = None
+        rows, row_numbers = [], []
+        for row_number, values in enumerate(ws.iter_rows(values_only=True), start=1):
+            if all(value is None or str(value).strip() == "" for value in values):
+                continue
+            if headers is None:
+                headers = [str(value).strip() if value is not None else f"column_{i}" for i, value in enumerate(values)]
+                continue
+            rows.append(values[:len(headers)])
+            row_numbers.append(row_number)
+            if len(rows) >= chunk_size:
+                yield pd.DataFrame(rows, columns=headers, index=row_numbers)
+                rows, row_numbers = [], []
+        if rows:
+            yield pd.DataFrame(rows, columns=headers, index=row_numbers)
+    finally:
+        wb.close()
+
+
+def iter_import_chunks(path: Path, chunk_size: int = BULK_IMPORT_CHUNK_SIZE,
+                       sheet_name: Optional[str] = None) -> Iterator["pd.DataFrame"]:
+    """Raw chunks of an import file, indexed by spreadsheet row number"""
+    _require_pandas()
+    path = Path(path)
+    if path.suffix.lower() in (".csv", ".txt"):
+        return _iter_csv_chunks(path, chunk_size)
+    if path.suffix.lower() in (".xlsx", ".xlsm"):
+        return _iter_xlsx_chunks(path, chunk_size, sheet_name)
+    raise ValidationError(f"Unsupported import file type: {path.suffix}", field="path")
+
+
+def _map_headers(frame: "pd.DataFrame", columns: List[ImportColumn]) -> "pd.DataFrame":
+    """Rename the file's headers to column keys; unknown columns are dropped"""
+    renames = {}
+    for header in frame.columns:
+        for column in columns:
+            if column.key not in renames.values() and column.matches(header):
+                renames[header] = column.key
+                break
+    missing = [column.header for column in columns if column.required and column.key not in renames.values()]
+    if missing:
+        raise ValidationError(f"Missing required column(s): {', '.join(missing)}", field="columns")
+    return frame[list(renames)].rename(columns=renames)
+
+
+# ---------------------------------------------------------------------------
+# Validation (vectorized per chunk)
+# ---------------------------------------------------------------------------
+
+class _ChunkErrors:
+    """Row errors of one chunk, collected from boolean masks"""
+
+    def __init__(self):
+        self.errors: List[ImportRowError] = []
+        self.rows: Set[int] = set()
+
+    def add(self, mask: "pd.Series", column: Optional[ImportColumn], raw: Optional["pd.Series"], message: str):
+        for row in mask.index[mask.fillna(False).to_numpy(dtype=bool)]:
+            value = None if raw is None or pd.isna(raw.at[row]) else str(raw.at[row])
+            self.errors.append(ImportRowError(int(row), column.header if column else None, value, message))
+            self.rows.add(int(row))
+
+    def add_rows(self, rows: Iterable[int], message: str):
+        for row in rows:
+            self.errors.append(ImportRowError(int(row), None, None, message))
+            self.rows.add(int(row))
+
+
+def _values(values: Iterable, keep: "pd.Series", convert: Callable = lambda value: value) -> "pd.Series":
+    """Object series of plain Python values: convert(value) where keep, None elsewhere"""
+    return pd.Series(
+        [convert(value) if use else None for value, use in zip(values, keep.fillna(False).tolist())],
+        index=keep.index, dtype=object,
+    )
+
+
+def _validate_types(frame: "pd.DataFrame", columns: List[ImportColumn], errors: _ChunkErrors) -> "pd.DataFrame":
+    """Typed copy of the chunk (None for blank cells), recording type/constraint errors"""
+    typed = pd.DataFrame(index=frame.index)
+    for column in columns:
+        if column.key not in frame:
+            continue
+        raw = frame[column.key]
+        text = raw.astype("string").str.strip()
+        empty = text.isna() | (text == "")
+
+        if column.kind == "str":
+            typed[column.key] = _values(text.tolist(), ~empty)
+            if column.max_length:
+                errors.add(~empty & (text.str.len() > column.max_length), column, raw,
+                           f"Longer than {column.max_length} characters")
+        elif column.kind in ("int", "float"):
+            numbers = pd.to_numeric(text.str.replace(" ", "", regex=False).str.replace(",", ".", regex=False),
+                                    errors="coerce")
+            invalid = ~empty & numbers.isna()
+            if column.kind == "int":
+                invalid |= ~empty & numbers.notna() & (numbers % 1 != 0)
+            errors.add(invalid, column, raw, "Not a valid number" if column.kind == "float" else "Not a whole number")
+            errors.add(~invalid & (numbers < 0), column, raw, "Must not be negative")
+            typed[column.key] = _values(numbers.tolist(), ~empty & ~invalid,
+                                        int if column.kind == "int" else float)
+        elif column.kind == "date":
+            normalized = text.str.rstrip(".").str.replace(".", "-", regex=False).str.replace(" ", "T", n=1, regex=False)
+            dates = pd.to_datetime(normalized.where(~empty), errors="coerce", format="ISO8601")
+            invalid = ~empty & dates.isna()
+            errors.add(invalid, column, raw, "Not a valid date (YYYY-MM-DD)")
+            typed[column.key] = _values(dates, dates.notna(), lambda value: value.to_pydatetime())
+
+        if column.required:
+            errors.add(empty, column, raw, "Required value is missing")
+    return typed
+
+
+def _flag_duplicates(values: "pd.Series", seen: Set[str], column: ImportColumn, raw: "pd.Series",
+                     errors: _ChunkErrors) -> "pd.Series":
+    """Keys repeated within the file (earlier chunks included): every repeat after the first is an error"""
+    present = values.notna()
+    keys = values.where(present).str.lower()
+    duplicate = present & (keys.duplicated(keep="first") | keys.isin(seen))
+    errors.add(duplicate, column, raw, f"Duplicate {column.header} in the file")
+    seen.update(keys[present & ~duplicate])
+    return duplicate
+
+
+def _column(columns: List[ImportColumn], key: str) -> ImportColumn:
+    return next(column for column in columns if column.key == key)
+
+
+def _records(frame: "pd.DataFrame", keys: Sequence[str]) -> List[Dict]:
+    """Row dicts of the given columns (absent columns and blank cells are None)"""
+    present = [key for key in keys if key in frame]
+    records = frame[present].to_dict("records")
+    for record in records:
+        for key in keys:
+            record.setdefault(key, None)
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Importers
+# ---------------------------------------------------------------------------
+
+class _Importer:
+    """Shared chunk loop; subclasses prefetch lookups, validate and write one chunk"""
+
+    entity = ""
+
+    def __init__(self, session: Session, mode: str, create_missing: bool, user_id: Optional[int]):
+        if mode not in (MODE_INSERT, MODE_UPSERT):
+            raise ValidationError(f"Unknown import mode: {mode}", field="mode")
+        self.session = session
+        self.mode = mode
+        self.create_missing = create_missing
+        self.user_id = user_id
+        self.columns = IMPORT_COLUMNS[self.entity]
+        self.seen_keys: Dict[str, Set[str]] = {}
+        self.prefetch()
+
+    def prefetch(self):
+        raise NotImplementedError
+
+    def write_chunk(self, frame: "pd.DataFrame", typed: "pd.DataFrame", errors: _ChunkErrors) -> Dict[str, int]:
+        """Validate references and write the chunk's valid rows; returns created/updated counts"""
+        raise NotImplementedError
+
+    def after_commit(self):
+        """Chunk committed: lookups collected during write_chunk become permanent"""
+
+    def after_rollback(self):
+        """Chunk rolled back: forget lookups collected during write_chunk"""
+
+    # Helpers for the subclasses
+
+    def _supplier_ids(self, typed: "pd.DataFrame", frame: "pd.DataFrame", errors: _ChunkErrors) -> "pd.Series":
+        """supplier_id per row from the supplier_id or supplier (name) column"""
+        supplier_ids = pd.Series(None, index=typed.index, dtype=object)
+        if "supplier_id" in typed:
+            ids = typed["supplier_id"]
+            given = ids.notna()
+            known = ids.map(lambda value: value is not None and int(value) in self.supplier_id_set)
+            errors.add(given & ~known, _column(self.columns, "supplier_id"), frame.get("supplier_id"),
+                       "Unknown supplier ID")
+            supplier_ids = supplier_ids.where(
+                ~(given & known), ids.map(lambda value: None if value is None else int(value))
+            )
+        if "supplier" in typed:
+            names = typed["supplier"]
+            use = names.notna() & supplier_ids.isna()
+            resolved = names.where(use).str.lower().map(self.suppliers)
+            missing = use & resolved.isna()
+            if missing.any() and self.create_missing:
+                new_names = {}
+                for name in names[missing]:
+                    new_names.setdefault(name.lower(), name)
+                rows = [{"name": name, "created_at": utcnow()} for name in new_names.values()]
+                created = self.session.execute(
+                    insert(Supplier.__table__).returning(Supplier.id, Supplier.name, sort_by_parameter_order=True), rows
+                ).all()
+                for supplier_id, name in created:
+                    self.pending_suppliers[name.lower()] = supplier_id
+                resolved = names.where(use).str.lower().map({**self.suppliers, **self.pending_suppliers})
+                missing = use & resolved.isna()
+            errors.add(missing, _column(self.columns, "supplier"), frame.get("supplier"), "Unknown supplier")
+            supplier_ids = supplier_ids.where(~(use & ~missing), resolved.astype(object))
+        return _values(supplier_ids.tolist(), supplier_ids.notna(), int)
+
+    def _prefetch_suppliers(self):
+        self.suppliers = {
+            name.lower(): supplier_id
+            for supplier_id, name in self.session.execute(select(Supplier.id, Supplier.name))
+        }
+        self.supplier_id_set = set(self.suppliers.values())
+        self.pending_suppliers: Dict[str, int] = {}
+
+    def _commit_suppliers(self):
+        self.suppliers.update(self.pending_suppliers)
+        self.supplier_id_set.update(self.pending_suppliers.values())
+        self.pending_suppliers = {}
+
+
+class _PartImporter(_Importer):
+    entity = ENTITY_PARTS
+
+    PART_FIELDS = ("sku", "name", "category", "unit", "buy_price", "sell_price", "safety_stock",
+                   "reorder_quantity", "description")
+
+    def prefetch(self):
+        self.parts = {
+            sku.lower(): part_id for part_id, sku in self.session.execute(select(Part.id, Part.sku))
+        }
+        self.pending_parts: Dict[str, int] = {}
+        self._prefetch_suppliers()
+
+    def write_chunk(self, frame, typed, errors):
+        sku_column = _column(self.columns, "sku")
+        skus = typed["sku"]
+        errors.add(skus.notna() & ~skus.fillna("").str.fullmatch(SKU_PATTERN.pattern), sku_column, frame["sku"],
+                   "Invalid SKU format")
+        duplicate = _flag_duplicates(skus, self.seen_keys.setdefault("sku", set()), sku_column, frame["sku"], errors)
+
+        existing_ids = skus.str.lower().map(self.parts)
+        exists = existing_ids.notna()
+        if self.mode == MODE_INSERT:
+            # A repeat of a row imported earlier in this file is already reported as a duplicate
+            errors.add(exists & ~duplicate, sku_column, frame["sku"], "SKU already exists")
+
+        supplier_ids = self._supplier_ids(typed, frame, errors)
+        valid = ~typed.index.isin(list(errors.rows))
+        now = utcnow()
+
+        # Updates of existing parts (blank cells keep the stored value)
+        updates = []
+        if self.mode == MODE_UPSERT:
+            for row, record in zip(typed.index[valid & exists], _records(typed[valid & exists], self.PART_FIELDS)):
+                # The SKU is the match key: its stored spelling is kept
+                values = {key: value for key, value in record.items() if value is not None and key != "sku"}
+                if supplier_ids[row] is not None:
+                    values["supplier_id"] = supplier_ids[row]
+                values["id"] = int(existing_ids[row])
+                values["updated_at"] = now
+                updates.append(values)
+            if updates:
+                self.session.execute(update(Part), updates)
+
+        # New parts, with inventory level and initial stock as one FIFO batch each
+        new = valid & ~exists
+        records = _records(typed[new], self.PART_FIELDS + ("initial_quantity", "bin_location"))
+        for row, record in zip(typed.index[new], records):
+            record["row"] = int(row)
+            record["supplier_id"] = supplier_ids[row]
+            record["unit"] = record["unit"] or "db"
+            for key in ("buy_price", "sell_price"):
+                record[key] = float(record[key] or 0.0)
+            for key in ("safety_stock", "reorder_quantity", "initial_quantity"):
+                record[key] = int(record[key] or 0)
+        if records:
+            part_rows = [
+                {**{key: record[key] for key in self.PART_FIELDS}, "supplier_id": record["supplier_id"],
+                 "created_at": now, "updated_at": now}
+                for record in records
+            ]
+            # RETURNING rows are matched by SKU: with sort_by_parameter_order
+            # SQLite would insert row by row
+            created = dict(
+                (sku, part_id) for part_id, sku in self.session.execute(
+                    insert(Part.__table__).returning(Part.id, Part.sku), part_rows
+                )
+            )
+            for record in records:
+                record["part_id"] = created[record["sku"]]
+                self.pending_parts[record["sku"].lower()] = record["part_id"]
+
+            self.session.execute(insert(InventoryLevel.__table__), [
+                {"part_id": record["part_id"], "quantity_on_hand": record["initial_quantity"],
+                 "quantity_reserved": 0, "bin_location": record["bin_location"], "last_updated": now}
+                for record in records
+            ])
+            stocked = [record for record in records if record["initial_quantity"] > 0]
+            if stocked:
+                _insert_receipts(self.session, [
+                    {"row": record["row"], "part_id": record["part_id"], "quantity": record["initial_quantity"],
+                     "unit_price": record["buy_price"], "supplier_id": record["supplier_id"],
+                     "notes": "Kezdeti készlet / Initial stock (bulk import)"}
+                    for record in stocked
+                ], self.user_id, now, increment_levels=False)
+        refresh_part_valuations(
+            [values["id"] for values in updates] + [record["part_id"] for record in records], self.session
+        )
+        return {"created": len(records), "updated": len(updates)}
+
+    def after_commit(self):
+        self.parts.update(self.pending_parts)
+        self.pending_parts = {}
+        self._commit_suppliers()
+
+    def after_rollback(self):
+        self.pending_parts = {}
+        self.pending_suppliers = {}
+
+
+class _MachineImporter(_Importer):
+    entity = ENTITY_MACHINES
+
+    MACHINE_FIELDS = ("name", "serial_number", "asset_tag", "model", "manufacturer", "status",
+                      "criticality_level", "install_date", "purchase_date", "purchase_price",
+                      "operating_hours", "supplier", "notes")
+
+    def prefetch(self):
+        self.lines: Dict[str, int] = {}
+        for line_id, code, name in self.session.execute(
+            select(ProductionLine.id, ProductionLine.code, ProductionLine.name)
+        ):
+            self.lines.setdefault(name.lower(), line_id)
+            if code:
+                self.lines[code.lower()] = line_id  # a code wins over an equal name
+        self.pending_lines: Dict[str, int] = {}
+        self.serials: Dict[str, int] = {}
+        self.asset_tags: Dict[str, int] = {}
+        for machine_id, serial_number, asset_tag in self.session.execute(
+            select(Machine.id, Machine.serial_number, Machine.asset_tag)
+        ):
+            if serial_number:
+                self.serials[serial_number.lower()] = machine_id
+            if asset_tag:
+                self.asset_tags[asset_tag.lower()] = machine_id
+        self.pending_serials: List[str] = []
+        self.pending_asset_tags: List[str] = []
+
+    def write_chunk(self, frame, typed, errors):
+        line_column = _column(self.columns, "production_line")
+        lines = typed["production_line"]
+        line_ids = lines.str.lower().map(self.lines)
+        missing = lines.notna() & line_ids.isna()
+        if missing.any() and self.create_missing:
+            new_names = {}
+            for name in lines[missing]:
+                new_names.setdefault(name.lower(), name)
+            now = utcnow()
+            created = self.session.execute(
+                insert(ProductionLine.__table__).returning(
+                    ProductionLine.id, ProductionLine.name, sort_by_parameter_order=True
+                ),
+                [{"name": name, "status": "Active", "created_at": now, "updated_at": now}
+                 for name in new_names.values()],
+            ).all()
+            for line_id, name in created:
+                self.pending_lines[name.lower()] = line_id
+            line_ids = lines.str.lower().map({**self.lines, **self.pending_lines})
+            missing = lines.notna() & line_ids.isna()
+        errors.add(missing, line_column, frame["production_line"], "Unknown production line")
+
+        # A machine is identified by its serial number, or by its asset tag without one
+        existing_ids = pd.Series(None, index=typed.index, dtype=object)
+        duplicate = pd.Series(False, index=typed.index)
+        for key, known in (("serial_number", self.serials), ("asset_tag", self.asset_tags)):
+            if key not in typed:
+                continue
+            column = _column(self.columns, key)
+            duplicate |= _flag_duplicates(typed[key], self.seen_keys.setdefault(key, set()), column, frame[key], errors)
+            matches = typed[key].str.lower().map(known)
+            conflict = existing_ids.notna() & matches.notna() & (existing_ids != matches)
+            errors.add(conflict, column, frame[key], "Serial number and asset tag belong to different machines")
+            existing_ids = existing_ids.where(existing_ids.notna(), matches.astype(object))
+        exists = existing_ids.notna()
+        if self.mode == MODE_INSERT:
+            errors.add(exists & ~duplicate, None, None, "Machine already exists (serial number or asset tag)")
+
+        valid = ~typed.index.isin(list(errors.rows))
+        now = utcnow()
+
+        updates = []
+        if self.mode == MODE_UPSERT:
+            for row, record in zip(typed.index[valid & exists], _records(typed[valid & exists], self.MACHINE_FIELDS)):
+                values = {key: value for key, value in record.items() if value is not None}
+                values["production_line_id"] = int(line_ids[row])
+                values["id"] = int(existing_ids[row])
+                values["updated_by_user_id"] = self.user_id
+                values["updated_at"] = now
+                updates.append(values)
+            if updates:
+                self.session.execute(update(Machine), updates)
+
+        new = valid & ~exists
+        records = _records(typed[new], self.MACHINE_FIELDS)
+        for row, record in zip(typed.index[new], records):
+            record.update(
+                production_line_id=int(line_ids[row]),
+                status=record["status"] or "Active",
+                operating_hours=float(record["operating_hours"] or 0.0),
+                purchase_price=None if record["purchase_price"] is None else float(record["purchase_price"]),
+                version=1,
+                created_by_user_id=self.user_id,
+                updated_by_user_id=self.user_id,
+                created_at=now,
+                updated_at=now,
+            )
+        if records:
+            self.session.execute(insert(Machine.__table__), records)
+            for record in records:
+                if record["serial_number"]:
+                    self.pending_serials.append(record["serial_number"])
+                if record["asset_tag"]:
+                    self.pending_asset_tags.append(record["asset_tag"])
+        return {"created": len(records), "updated": len(updates)}
+
+    def after_commit(self):
+        self.lines.update(self.pending_lines)
+        if self.pending_serials or self.pending_asset_tags:
+            # Ids of the new machines, needed only if a later chunk updates them (upsert)
+            for known, column, keys in ((self.serials, Machine.serial_number, self.pending_serials),
+                                        (self.asset_tags, Machine.asset_tag, self.pending_asset_tags)):
+                for start in range(0, len(keys), 500):
+                    known.update({
+                        key.lower(): machine_id for machine_id, key in self.session.execute(
+                            select(Machine.id, column).where(column.in_(keys[start:start + 500]))
+                        )
+                    })
+        self.after_rollback()
+
+    def after_rollback(self):
+        self.pending_lines = {}
+        self.pending_serials = []
+        self.pending_asset_tags = []
+
+
+class _StockImporter(_Importer):
+    entity = ENTITY_STOCK
+
+    def prefetch(self):
+        self.parts = {
+            sku.lower(): part_id for part_id, sku in self.session.execute(select(Part.id, Part.sku))
+        }
+        self._prefetch_suppliers()
+
+    def write_chunk(self, frame, typed, errors):
+        part_ids = typed["sku"].str.lower().map(self.parts)
+        errors.add(typed["sku"].notna() & part_ids.isna(), _column(self.columns, "sku"), frame["sku"], "Unknown SKU")
+        quantities = typed["quantity"]
+        errors.add(quantities.notna() & (quantities.fillna(0) == 0), _column(self.columns, "quantity"),
+                   frame["quantity"], "Quantity must be greater than zero")
+        supplier_ids = self._supplier_ids(typed, frame, errors)
+
+        valid = ~typed.index.isin(list(errors.rows))
+        records = _records(typed[valid], ("quantity", "unit_price", "received_date", "invoice_number", "notes"))
+        for row, record in zip(typed.index[valid], records):
+            record["row"] = int(row)
+            record["part_id"] = int(part_ids[row])
+            record["supplier_id"] = supplier_ids[row]
+            record["quantity"] = int(record["quantity"])
+            record["unit_price"] = float(record["unit_price"] or 0.0)
+        if records:
+            _insert_receipts(self.session, records, self.user_id, utcnow())
+            refresh_part_valuations([record["part_id"] for record in records], self.session)
+        return {"created": len(records), "updated": 0}
+
+    def after_commit(self):
+        self._commit_suppliers()
+
+    def after_rollback(self):
+        self.pending_suppliers = {}
+
+
+_IMPORTERS = {
+    ENTITY_PARTS: _PartImporter,
+    ENTITY_MACHINES: _MachineImporter,
+    ENTITY_STOCK: _StockImporter,
+}
+
+
+def _insert_receipts(session: Session, receipts: List[Dict], user_id: Optional[int], now: datetime,
+                     increment_levels: bool = True):
+    """
+    Stock receipts as in inventory_service.receive_stock, in three executemany
+    statements: transactions, FIFO batches and the inventory level increments
+
+    The transactions reference their source row (reference_type
+    "bulk_import", reference_id = row), which also matches the RETURNING
+    rows to the batches. The Core level writes bypass the change tracking
+    flush hook, so parts.updated_at is stamped here for the delta sync feed.
+    """
+    transaction_ids = dict(
+        (row, transaction_id) for transaction_id, row in session.execute(
+            insert(StockTransaction.__table__).returning(StockTransaction.id, StockTransaction.reference_id),
+            [
+                {"part_id": receipt["part_id"], "transaction_type": TRANSACTION_TYPE_RECEIVED,
+                 "quantity": receipt["quantity"], "reference_type": "bulk_import", "reference_id": receipt["row"],
+                 "user_id": user_id, "notes": receipt.get("notes"),
+                 "timestamp": receipt.get("received_date") or now}
+                for receipt in receipts
+            ],
+        )
+    )
+    session.execute(insert(StockBatch.__table__), [
+        {"part_id": receipt["part_id"], "quantity": receipt["quantity"], "quantity_remaining": receipt["quantity"],
+         "unit_price": receipt["unit_price"], "received_date": receipt.get("received_date") or now,
+         "supplier_id": receipt.get("supplier_id"), "invoice_number": receipt.get("invoice_number"),
+         "notes": receipt.get("notes"), "stock_transaction_id": transaction_ids[receipt["row"]]}
+        for receipt in receipts
+    ])
+    if not increment_levels:
+        return
+
+    totals: Dict[int, int] = {}
+    for receipt in receipts:
+        totals[receipt["part_id"]] = totals.get(receipt["part_id"], 0) + receipt["quantity"]
+    with_level = set(session.execute(
+        select(InventoryLevel.part_id).where(InventoryLevel.part_id.in_(list(totals)))
+    ).scalars())
+    levels = InventoryLevel.__table__
+    increments = [{"b_part_id": part_id, "b_quantity": quantity} for part_id, quantity in totals.items()
+                  if part_id in with_level]
+    if increments:
+        session.execute(
+            update(levels)
+            .where(levels.c.part_id == bindparam("b_part_id"))
+            .values(quantity_on_hand=levels.c.quantity_on_hand + bindparam("b_quantity"), last_updated=now),
+            increments,
+        )
+    missing = [{"part_id": part_id, "quantity_on_hand": quantity, "quantity_reserved": 0, "last_updated": now}
+               for part_id, quantity in totals.items() if part_id not in with_level]
+    if missing:
+        session.execute(insert(InventoryLevel.__table__), missing)
+    session.execute(update(Part.__table__).where(Part.__table__.c.id.in_(list(totals))).values(updated_at=now))
+
+
+def _log_chunk(session: Session, entity: str, source: str, chunk: int, first_row: int, last_row: int,
+               counts: Dict[str, int], failed: int, user_id: Optional[int]):
+    from services.log_service import log_action
+
+    category, entity_type = _LOG_TARGETS[entity]
+    try:
+        log_action(
+            category=category,
+            action_type="import",
+            entity_type=entity_type,
+            user_id=user_id,
+            description=(
+                f"Tömeges import ({source}, {chunk}. blokk): {counts['created']} új, "
+                f"{counts['updated']} frissített, {failed} hibás sor"
+            ),
+            metadata={
+                "source": source,
+                "chunk": chunk,
+                "first_row": first_row,
+                "last_row": last_row,
+                "created": counts["created"],
+                "updated": counts["updated"],
+                "failed": failed,
+            },
+            session=session,
+        )
+    except Exception as e:
+        logger.warning(f"Error logging bulk import chunk: {e}")
+
+
+def _run_import(entity: str, chunks: Iterable["pd.DataFrame"], source: str, mode: str, create_missing: bool,
+                strict: bool, user_id: Optional[int], progress_callback: Optional[ProgressCallback],
+                total: Optional[int], session: Optional[Session]) -> ImportResult:
+    _require_pandas()
+    if user_id is None:
+        from services.context_service import get_current_user_id
+        user_id = get_current_user_id()
+
+    session, should_close = _get_session(session)
+    result = ImportResult(entity=entity, source=source)
+    started = time.perf_counter()
+    pending_logs = []
+    try:
+        importer = _IMPORTERS[entity](session, mode, create_missing, user_id)
+        for frame in chunks:
+            result.chunks += 1
+            frame = _map_headers(frame, importer.columns)
+            errors = _ChunkErrors()
+            typed = _validate_types(frame, importer.columns, errors)
+            try:
+                counts = importer.write_chunk(frame, typed, errors)
+                if not strict:
+                    session.commit()
+                    importer.after_commit()
+            except Exception as e:
+                session.rollback()
+                importer.after_rollback()
+                if strict:
+                    raise
+                logger.error(f"Bulk import chunk {result.chunks} of {source} failed: {e}", exc_info=True)
+                counts = {"created": 0, "updated": 0}
+                errors.add_rows(
+                    (row for row in frame.index if row not in errors.rows),
+                    f"Database error, chunk not imported: {e}",
+                )
+
+            result.total_rows += len(frame)
+            result.created += counts["created"]
+            result.updated += counts["updated"]
+            result.failed_rows += len(errors.rows)
+            result.errors.extend(sorted(errors.errors, key=lambda error: error.row))
+            log_entry = (result.chunks, int(frame.index.min()), int(frame.index.max()), counts, len(errors.rows))
+            if strict:
+                if errors.rows:
+                    raise ValidationError(
+                        f"Bulk import of {source} rejected: {len(errors.rows)} invalid row(s); "
+                        + "; ".join(f"row {e.row}: {e.column or ''} {e.message}".strip() for e in errors.errors[:5]),
+                        field="rows",
+                    )
+                pending_logs.append(log_entry)
+            else:
+                _log_chunk(session, entity, source, *log_entry, user_id)
+            if progress_callback:
+                progress_callback(result.total_rows, total)
+
+        if strict:
+            session.commit()
+            importer.after_commit()
+            for log_entry in pending_logs:
+                _log_chunk(session, entity, source, *log_entry, user_id)
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        if should_close:
+            session.close()
+
+    result.elapsed_seconds = time.perf_counter() - started
+    logger.info(
+        f"Bulk import of {source} ({entity}): {result.total_rows} rows in {result.elapsed_seconds:.2f} s "
+        f"({result.rows_per_second:.0f} rows/s), {result.created} created, {result.updated} updated, "
+        f"{result.failed_rows} failed"
+    )
+    return result
+
+
+def import_file(
+    entity: str,
+    path: Path,
+    mode: str = MODE_INSERT,
+    create_missing: bool = False,
+    sheet_name: Optional[str] = None,
+    chunk_size: int = BULK_IMPORT_CHUNK_SIZE,
+    error_report_path: Optional[Path] = None,
+    user_id: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    session: Session = None,
+) -> ImportResult:
+    """
+    Import parts, machines or stock receipts from an Excel or CSV file.
+
+    Args:
+        entity: ENTITY_PARTS, ENTITY_MACHINES or ENTITY_STOCK
+        path: .xlsx or .csv file (first row is the header, see IMPORT_COLUMNS)
+        mode: MODE_INSERT (existing SKU / serial number is an error) or
+            MODE_UPSERT (existing records are updated, blank cells kept)
+        create_missing: Create unknown suppliers and production lines by name
+        sheet_name: Worksheet of an Excel file (default: the active sheet)
+        chunk_size: Rows validated and committed together
+        error_report_path: Write the per-row error report here when rows failed
+        user_id: User recorded on the transactions and logs (default: current user)
+        progress_callback: Called as callback(processed_rows, None) after each chunk
+        session: Database session
+
+    Returns:
+        ImportResult with counts, per-row errors and throughput
+    """
+    if entity not in _IMPORTERS:
+        raise ValidationError(f"Unknown import entity: {entity}", field="entity")
+    path = Path(path)
+    if not path.exists():
+        raise ValidationError(f"Import file not found: {path}", field="path")
+
+    result = _run_import(
+        entity, iter_import_chunks(path, chunk_size, sheet_name), path.name, mode, create_missing,
+        strict=False, user_id=user_id, progress_callback=progress_callback, total=None, session=session,
+    )
+    if error_report_path and result.errors:
+        result.error_report_path = write_error_report(result, error_report_path)
+    return result
+
+
+def import_records(
+    entity: str,
+    records: List[Dict],
+    mode: str = MODE_INSERT,
+    create_missing: bool = False,
+    strict: bool = False,
+    chunk_size: int = BULK_IMPORT_CHUNK_SIZE,
+    user_id: Optional[int] = None,
+    session: Session = None,
+) -> ImportResult:
+    """
+    Import already parsed rows (dicts keyed by column key or header).
+
+    With strict=True all rows are written in one transaction and any invalid
+    row rejects the whole import with ValidationError. Row numbers in the
+    errors are 1-based positions in `records`.
+    """
+    _require_pandas()
+    if entity not in _IMPORTERS:
+        raise ValidationError(f"Unknown import entity: {entity}", field="entity")
+    chunk_size = max(1, chunk_size)
+
+    def chunks():
+        for start in range(0, len(records), chunk_size):
+            part = records[start:start + chunk_size]
+            yield pd.DataFrame(part, index=range(start + 1, start + len(part) + 1))
+
+    return _run_import(entity, chunks(), "records", mode, create_missing, strict, user_id,
+                       None, len(records), session)
+
+
+def write_error_report(result: ImportResult, path: Path) -> Path:
+    """Per-row error report as .xlsx (or .csv, by suffix or without openpyxl)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    headers = ["Sor / Row", "Oszlop / Column", "Érték / Value", "Hiba / Error"]
+    rows = [(error.row, error.column or "", error.value or "", error.message) for error in result.errors]
+
+    if path.suffix.lower() == ".xlsx" and OPENPYXL_AVAILABLE:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Import errors")
+        ws.append(headers)
+        for row in rows:
+            ws.append(row)
+        wb.save(str(path))
+    else:
+        path = path.with_suffix(".csv")
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f, delimiter=";")
+            writer.writerow(headers)
+            writer.writerows(rows)
+    logger.info(f"Bulk import error report: {path} ({len(rows)} errors)")
+    return path
+
+
+def create_import_template(entity: str, path: Path) -> Path:
+    """Empty .xlsx (or .csv) import file with the header row of `entity`"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    headers = [column.header for column in IMPORT_COLUMNS[entity]]
+    if path.suffix.lower() == ".xlsx" and OPENPYXL_AVAILABLE:
+        wb = Workbook()
+        ws = wb.active
+        ws.title = entity
+        ws.append(headers)
+        for index, column in enumerate(IMPORT_COLUMNS[entity], start=1):
+            ws.cell(1, index).font = Font(bold=column.required)
+            ws.column_dimensions[ws.cell(1, index).column_letter].width = max(14, len(column.header) + 4)
+        wb.save(str(path))
+    else:
+        path = path.with_suffix(".csv")
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            csv.writer(f, delimiter=";").writerow(headers)
+    return path
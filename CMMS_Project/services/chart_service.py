@@ -1,301 +1,506 @@
 """
 Chart generation service using matplotlib
+
+Charts are rendered to PNG in a small pool of worker processes (matplotlib is
+slow and pyplot is not thread-safe) and cached on disk under a hash of the
+chart type and its input statistics, so a repeated Reports visit or export
+with unchanged data serves the existing image. The cache is bounded by file
+count and size, the least recently used images are evicted first.
 """
 
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Union
 import logging
 import sys
 
+from config.app_config import (
+    CHART_CACHE_DIR,
+    CHART_CACHE_MAX_FILES,
+    CHART_CACHE_MAX_MB,
+    CHART_RENDER_PROCESSES,
+)
+from utils.cache import LRUCache
+
 logger = logging.getLogger(__name__)
 
-# Try to import matplotlib with detailed error logging
-MATPLOTLIB_AVAILABLE = False
+# matplotlib is imported on first chart generation, not at module import:
+# it costs more than the rest of the desktop startup together
+MATPLOTLIB_AVAILABLE = None  # None = not attempted yet
 plt = None
-try:
-    import matplotlib
-    matplotlib.use('Agg')  # Use non-interactive backend
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as mpatches
-    from matplotlib import font_manager
-    MATPLOTLIB_AVAILABLE = True
-    logger.info("matplotlib successfully imported")
-except ImportError as e:
-    MATPLOTLIB_AVAILABLE = False
-    plt = None
-    logger.error(f"matplotlib ImportError: {e}")
-    logger.error(f"Python executable: {sys.executable if 'sys' in dir() else 'unknown'}")
-except Exception as e:
-    MATPLOTLIB_AVAILABLE = False
-    plt = None
-    logger.error(f"matplotlib import failed with exception: {type(e).__name__}: {e}")
-    import sys
-    logger.error(f"Python executable: {sys.executable}")
-    logger.error(f"Python path: {sys.path[:3]}")
-
-
-def _ensure_charts_dir() -> Path:
-    """Ensure charts directory exists"""
-    charts_dir = Path("generated_charts")
-    charts_dir.mkdir(exist_ok=True)
-    return charts_dir
-
-
-def generate_cost_chart(all_periods_stats: Dict, output_path: Optional[Path] = None) -> Optional[Path]:
-    """Generate cost comparison bar chart"""
-    if not MATPLOTLIB_AVAILABLE:
-        logger.warning("matplotlib not available, skipping chart generation")
-        return None
-    
+mpatches = None
+font_manager = None
+
+# Part of every cache key: bump when the look of the charts changes
+RENDER_VERSION = 1
+
+
+def _load_matplotlib() -> bool:
+    """Import matplotlib (Agg backend) on first use; returns availability"""
+    global MATPLOTLIB_AVAILABLE, plt, mpatches, font_manager
+    if MATPLOTLIB_AVAILABLE is not None:
+        return MATPLOTLIB_AVAILABLE
     try:
-        period_labels = {
-            "day": "Nap",
-            "week": "Hét",
-            "month": "Hó",
-            "year": "Év"
-        }
-        
-        periods = list(all_periods_stats.keys())
-        labels = [period_labels.get(p, p) for p in periods]
-        
-        worksheet_costs = [all_periods_stats[p].get('cost', {}).get('worksheet_cost', 0) for p in periods]
-        service_costs = [all_periods_stats[p].get('cost', {}).get('service_cost', 0) for p in periods]
-        
-        x = range(len(periods))
-        width = 0.35
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        bars1 = ax.bar([i - width/2 for i in x], worksheet_costs, width, label='Munkalap Költség', color='#10B981')
-        bars2 = ax.bar([i + width/2 for i in x], service_costs, width, label='Szerviz Költség', color='#6366F1')
-        
-        ax.set_xlabel('Időszak', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Költség (€)', fontsize=12, fontweight='bold')
-        ax.set_title('Költség Elemzés Időszakonként', fontsize=14, fontweight='bold', pad=20)
-        ax.set_xticks(x)
-        ax.set_xticklabels(labels)
-        ax.legend()
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels on bars
-        for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{height:,.0f}',
-                           ha='center', va='bottom', fontsize=9)
-        
-        plt.tight_layout()
-        
-        if output_path is None:
-            charts_dir = _ensure_charts_dir()
-            output_path = charts_dir / "cost_chart.png"
-        
-        # Ensure directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        fig.savefig(str(output_path), dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        
-        # Verify file was created
-        if not output_path.exists():
-            logger.error(f"Failed to create chart file: {output_path}")
-            return None
-        
-        logger.info(f"Cost chart generated: {output_path}")
-        return output_path
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as _plt
+        import matplotlib.patches as _mpatches
+        from matplotlib import font_manager as _font_manager
+        plt, mpatches, font_manager = _plt, _mpatches, _font_manager
+        MATPLOTLIB_AVAILABLE = True
+        logger.info("matplotlib successfully imported")
+    except ImportError as e:
+        MATPLOTLIB_AVAILABLE = False
+        logger.error(f"matplotlib ImportError: {e}")
+        logger.error(f"Python executable: {sys.executable}")
     except Exception as e:
-        logger.error(f"Error generating cost chart: {e}")
+        MATPLOTLIB_AVAILABLE = False
+        logger.error(f"matplotlib import failed with exception: {type(e).__name__}: {e}")
+        logger.error(f"Python executable: {sys.executable}")
+        logger.error(f"Python path: {sys.path[:3]}")
+    return MATPLOTLIB_AVAILABLE
+
+
+# ---------------------------------------------------------------------------
+# Drawing (runs in the render worker processes)
+# ---------------------------------------------------------------------------
+
+def _draw_cost_chart(all_periods_stats: Dict):
+    """Cost comparison bar chart"""
+    period_labels = {
+        "day": "Nap",
+        "week": "Hét",
+        "month": "Hó",
+        "year": "Év"
+    }
+
+    periods = list(all_periods_stats.keys())
+    labels = [period_labels.get(p, p) for p in periods]
+
+    worksheet_costs = [all_periods_stats[p].get('cost', {}).get('worksheet_cost', 0) for p in periods]
+    service_costs = [all_periods_stats[p].get('cost', {}).get('service_cost', 0) for p in periods]
+
+    x = range(len(periods))
+    width = 0.35
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    bars1 = ax.bar([i - width/2 for i in x], worksheet_costs, width, label='Munkalap Költség', color='#10B981')
+    bars2 = ax.bar([i + width/2 for i in x], service_costs, width, label='Szerviz Költség', color='#6366F1')
+
+    ax.set_xlabel('Időszak', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Költség (€)', fontsize=12, fontweight='bold')
+    ax.set_title('Költség Elemzés Időszakonként', fontsize=14, fontweight='bold', pad=20)
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels)
+    ax.legend()
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    # Add value labels on bars
+    for bars in [bars1, bars2]:
+        for bar in bars:
+            height = bar.get_height()
+            if height > 0:
+                ax.text(bar.get_x() + bar.get_width()/2., height,
+                       f'{height:,.0f}',
+                       ha='center', va='bottom', fontsize=9)
+    return fig
+
+
+def _draw_time_chart(all_periods_stats: Dict):
+    """Time comparison line chart"""
+    period_labels = {
+        "day": "Nap",
+        "week": "Hét",
+        "month": "Hó",
+        "year": "Év"
+    }
+
+    periods = list(all_periods_stats.keys())
+    labels = [period_labels.get(p, p) for p in periods]
+
+    downtime = [all_periods_stats[p].get('time', {}).get('worksheet_downtime_hours', 0) for p in periods]
+    pm_time = [all_periods_stats[p].get('time', {}).get('pm_duration_hours', 0) for p in periods]
+    service_time = [all_periods_stats[p].get('time', {}).get('service_duration_hours', 0) for p in periods]
+    total_time = [all_periods_stats[p].get('time', {}).get('total_time_hours', 0) for p in periods]
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    ax.plot(labels, downtime, marker='o', linewidth=2, label='Leállás', color='#EF4444')
+    ax.plot(labels, pm_time, marker='s', linewidth=2, label='PM Idő', color='#F59E0B')
+    ax.plot(labels, service_time, marker='^', linewidth=2, label='Szerviz Idő', color='#8B5CF6')
+    ax.plot(labels, total_time, marker='D', linewidth=3, label='Összesen', color='#6366F1', linestyle='--')
+
+    ax.set_xlabel('Időszak', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Idő (óra)', fontsize=12, fontweight='bold')
+    ax.set_title('Idő Elemzés Időszakonként', fontsize=14, fontweight='bold', pad=20)
+    ax.legend(loc='best')
+    ax.grid(alpha=0.3, linestyle='--')
+    return fig
+
+
+def _draw_tasks_chart(all_periods_stats: Dict):
+    """Tasks comparison bar chart"""
+    period_labels = {
+        "day": "Nap",
+        "week": "Hét",
+        "month": "Hó",
+        "year": "Év"
+    }
+
+    periods = list(all_periods_stats.keys())
+    labels = [period_labels.get(p, p) for p in periods]
+
+    worksheets = [all_periods_stats[p].get('tasks', {}).get('worksheet_count', 0) for p in periods]
+    pm_tasks = [all_periods_stats[p].get('tasks', {}).get('pm_count', 0) for p in periods]
+
+    x = range(len(periods))
+    width = 0.35
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    bars1 = ax.bar([i - width/2 for i in x], worksheets, width, label='Munkalapok', color='#F59E0B')
+    bars2 = ax.bar([i + width/2 for i in x], pm_tasks, width, label='PM Feladatok', color='#8B5CF6')
+
+    ax.set_xlabel('Időszak', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Feladatok száma', fontsize=12, fontweight='bold')
+    ax.set_title('Feladat Elemzés Időszakonként', fontsize=14, fontweight='bold', pad=20)
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels)
+    ax.legend()
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    # Add value labels on bars
+    for bars in [bars1, bars2]:
+        for bar in bars:
+            height = bar.get_height()
+            if height > 0:
+                ax.text(bar.get_x() + bar.get_width()/2., height,
+                       f'{int(height)}',
+                       ha='center', va='bottom', fontsize=9)
+    return fig
+
+
+def _draw_tasks_pie_chart(all_periods_stats: Dict, period: str = "year"):
+    """Tasks pie chart for a specific period (None if there are no tasks)"""
+    stats = all_periods_stats.get(period, {})
+    task_stats = stats.get('tasks', {})
+
+    worksheet_count = task_stats.get('worksheet_count', 0)
+    pm_count = task_stats.get('pm_count', 0)
+
+    if worksheet_count == 0 and pm_count == 0:
         return None
 
+    period_labels = {
+        "day": "Nap",
+        "week": "Hét",
+        "month": "Hó",
+        "year": "Év"
+    }
 
-def generate_time_chart(all_periods_stats: Dict, output_path: Optional[Path] = None) -> Optional[Path]:
-    """Generate time comparison line chart"""
-    if not MATPLOTLIB_AVAILABLE:
+    labels = ['Munkalapok', 'PM Feladatok']
+    sizes = [worksheet_count, pm_count]
+    colors = ['#F59E0B', '#8B5CF6']
+    explode = (0.05, 0.05)  # Slight separation
+
+    fig, ax = plt.subplots(figsize=(8, 8))
+    wedges, texts, autotexts = ax.pie(sizes, explode=explode, labels=labels, colors=colors,
+                                     autopct='%1.1f%%', shadow=True, startangle=90,
+                                     textprops={'fontsize': 12, 'fontweight': 'bold'})
+
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+
+    period_label = period_labels.get(period, period)
+    ax.set_title(f'Feladat Eloszlás ({period_label})', fontsize=14, fontweight='bold', pad=20)
+    return fig
+
+
+_DRAWERS = {
+    "cost": _draw_cost_chart,
+    "time": _draw_time_chart,
+    "tasks": _draw_tasks_chart,
+    "tasks_pie": _draw_tasks_pie_chart,
+}
+
+
+def _render_png(chart_type: str, all_periods_stats: Dict, options: Dict) -> Optional[bytes]:
+    """Draw one chart and return it as PNG bytes (None if there is nothing to draw)"""
+    if not _load_matplotlib():
         logger.warning("matplotlib not available, skipping chart generation")
         return None
-    
+    fig = _DRAWERS[chart_type](all_periods_stats, **options)
+    if fig is None:
+        return None
     try:
-        period_labels = {
-            "day": "Nap",
-            "week": "Hét",
-            "month": "Hó",
-            "year": "Év"
-        }
-        
-        periods = list(all_periods_stats.keys())
-        labels = [period_labels.get(p, p) for p in periods]
-        
-        downtime = [all_periods_stats[p].get('time', {}).get('worksheet_downtime_hours', 0) for p in periods]
-        pm_time = [all_periods_stats[p].get('time', {}).get('pm_duration_hours', 0) for p in periods]
-        service_time = [all_periods_stats[p].get('time', {}).get('service_duration_hours', 0) for p in periods]
-        total_time = [all_periods_stats[p].get('time', {}).get('total_time_hours', 0) for p in periods]
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        ax.plot(labels, downtime, marker='o', linewidth=2, label='Leállás', color='#EF4444')
-        ax.plot(labels, pm_time, marker='s', linewidth=2, label='PM Idő', color='#F59E0B')
-        ax.plot(labels, service_time, marker='^', linewidth=2, label='Szerviz Idő', color='#8B5CF6')
-        ax.plot(labels, total_time, marker='D', linewidth=3, label='Összesen', color='#6366F1', linestyle='--')
-        
-        ax.set_xlabel('Időszak', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Idő (óra)', fontsize=12, fontweight='bold')
-        ax.set_title('Idő Elemzés Időszakonként', fontsize=14, fontweight='bold', pad=20)
-        ax.legend(loc='best')
-        ax.grid(alpha=0.3, linestyle='--')
-        
         plt.tight_layout()
-        
-        if output_path is None:
-            charts_dir = _ensure_charts_dir()
-            output_path = charts_dir / "time_chart.png"
-        
-        # Ensure directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        fig.savefig(str(output_path), dpi=100, bbox_inches='tight')
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=100, bbox_inches='tight')
+        return buffer.getvalue()
+    finally:
         plt.close(fig)
-        
-        # Verify file was created
-        if not output_path.exists():
-            logger.error(f"Failed to create chart file: {output_path}")
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+class ChartCache:
+    """Bounded directory of rendered charts; the least recently used are evicted first"""
+
+    def __init__(self, directory: Path, max_files: int = CHART_CACHE_MAX_FILES,
+                 max_bytes: int = CHART_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.png"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Cached image of `key` (marked as recently used), None on a miss"""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
             return None
-        
-        logger.info(f"Time chart generated: {output_path}")
-        return output_path
-    except Exception as e:
-        logger.error(f"Error generating time chart: {e}")
-        return None
+        return path
 
+    def put(self, key: str, png: bytes) -> Path:
+        path = self.path_for(key)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name, so a reader never sees a partial image
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(png)
+            os.replace(tmp_path, path)
+            self._evict(keep=path)
+        return path
 
-def generate_tasks_chart(all_periods_stats: Dict, output_path: Optional[Path] = None) -> Optional[Path]:
-    """Generate tasks comparison bar chart"""
-    if not MATPLOTLIB_AVAILABLE:
-        logger.warning("matplotlib not available, skipping chart generation")
-        return None
-    
+    def _evict(self, keep: Path):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".png"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        entries.sort(key=lambda item: item[0])  # least recently used first
+        count = len(entries)
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if count <= self.max_files and total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            count -= 1
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            if self.directory.exists():
+                for path in self.directory.glob("*.png"):
+                    path.unlink(missing_ok=True)
+
+
+_disk_cache = ChartCache(CHART_CACHE_DIR)
+# PNG bytes of as_bytes=True requests (never written to disk)
+_bytes_cache = LRUCache(max_size=32, default_ttl=3600)
+_bytes_cache_lock = threading.Lock()
+
+
+def chart_key(chart_type: str, all_periods_stats: Dict, **options) -> str:
+    """Cache key of a chart: its type plus a hash of everything it is drawn from"""
+    payload = json.dumps([RENDER_VERSION, chart_type, all_periods_stats, options],
+                         sort_keys=True, default=str)
+    return f"{chart_type}_{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+
+
+# ---------------------------------------------------------------------------
+# Render pool
+# ---------------------------------------------------------------------------
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+# Renders in progress: concurrent requests for the same chart share one render
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+# pyplot keeps global state: in-process renders must not overlap
+_draw_lock = threading.Lock()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    with _pool_lock:
+        if _pool is None and CHART_RENDER_PROCESSES > 0:
+            # spawn, not fork: the parent runs UI and database threads
+            _pool = ProcessPoolExecutor(
+                max_workers=CHART_RENDER_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_chart_pool():
+    """Stop the render worker processes (started again on the next render)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_in_process(chart_type: str, all_periods_stats: Dict, options: Dict) -> Future:
+    future = Future()
     try:
-        period_labels = {
-            "day": "Nap",
-            "week": "Hét",
-            "month": "Hó",
-            "year": "Év"
-        }
-        
-        periods = list(all_periods_stats.keys())
-        labels = [period_labels.get(p, p) for p in periods]
-        
-        worksheets = [all_periods_stats[p].get('tasks', {}).get('worksheet_count', 0) for p in periods]
-        pm_tasks = [all_periods_stats[p].get('tasks', {}).get('pm_count', 0) for p in periods]
-        
-        x = range(len(periods))
-        width = 0.35
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        bars1 = ax.bar([i - width/2 for i in x], worksheets, width, label='Munkalapok', color='#F59E0B')
-        bars2 = ax.bar([i + width/2 for i in x], pm_tasks, width, label='PM Feladatok', color='#8B5CF6')
-        
-        ax.set_xlabel('Időszak', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Feladatok száma', fontsize=12, fontweight='bold')
-        ax.set_title('Feladat Elemzés Időszakonként', fontsize=14, fontweight='bold', pad=20)
-        ax.set_xticks(x)
-        ax.set_xticklabels(labels)
-        ax.legend()
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels on bars
-        for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{int(height)}',
-                           ha='center', va='bottom', fontsize=9)
-        
-        plt.tight_layout()
-        
-        if output_path is None:
-            charts_dir = _ensure_charts_dir()
-            output_path = charts_dir / "tasks_chart.png"
-        
-        # Ensure directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        fig.savefig(str(output_path), dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        
-        # Verify file was created
-        if not output_path.exists():
-            logger.error(f"Failed to create chart file: {output_path}")
-            return None
-        
-        logger.info(f"Tasks chart generated: {output_path}")
-        return output_path
+        with _draw_lock:
+            future.set_result(_render_png(chart_type, all_periods_stats, options))
     except Exception as e:
-        logger.error(f"Error generating tasks chart: {e}")
-        return None
+        future.set_exception(e)
+    return future
 
 
-def generate_tasks_pie_chart(all_periods_stats: Dict, period: str = "year", output_path: Optional[Path] = None) -> Optional[Path]:
-    """Generate tasks pie chart for a specific period"""
-    if not MATPLOTLIB_AVAILABLE:
-        logger.warning("matplotlib not available, skipping chart generation")
-        return None
-    
+def _start_render(chart_type: str, all_periods_stats: Dict, options: Dict) -> Future:
+    pool = _get_pool()
+    if pool is not None:
+        try:
+            return pool.submit(_render_png, chart_type, all_periods_stats, options)
+        except Exception as e:
+            # Broken pool or a worker that cannot start (e.g. restricted environment)
+            logger.error(f"Chart render pool unavailable, rendering in process: {e}")
+            shutdown_chart_pool()
+    return _render_in_process(chart_type, all_periods_stats, options)
+
+
+def _finish_render(chart_type: str, key: str, as_bytes: bool, render: Future, result: Future,
+                   all_periods_stats: Dict, options: Dict):
     try:
-        stats = all_periods_stats.get(period, {})
-        task_stats = stats.get('tasks', {})
-        
-        worksheet_count = task_stats.get('worksheet_count', 0)
-        pm_count = task_stats.get('pm_count', 0)
-        
-        if worksheet_count == 0 and pm_count == 0:
-            return None
-        
-        period_labels = {
-            "day": "Nap",
-            "week": "Hét",
-            "month": "Hó",
-            "year": "Év"
-        }
-        
-        labels = ['Munkalapok', 'PM Feladatok']
-        sizes = [worksheet_count, pm_count]
-        colors = ['#F59E0B', '#8B5CF6']
-        explode = (0.05, 0.05)  # Slight separation
-        
-        fig, ax = plt.subplots(figsize=(8, 8))
-        wedges, texts, autotexts = ax.pie(sizes, explode=explode, labels=labels, colors=colors,
-                                         autopct='%1.1f%%', shadow=True, startangle=90,
-                                         textprops={'fontsize': 12, 'fontweight': 'bold'})
-        
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-        
-        period_label = period_labels.get(period, period)
-        ax.set_title(f'Feladat Eloszlás ({period_label})', fontsize=14, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        if output_path is None:
-            charts_dir = _ensure_charts_dir()
-            output_path = charts_dir / f"tasks_pie_{period}.png"
-        
-        # Ensure directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        fig.savefig(str(output_path), dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        
-        # Verify file was created
-        if not output_path.exists():
-            logger.error(f"Failed to create chart file: {output_path}")
-            return None
-        
-        logger.info(f"Tasks pie chart generated: {output_path}")
-        return output_path
+        try:
+            png = render.result()
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed by the OS): retry here, start a new pool next time
+            logger.error(f"Chart render worker failed, rendering in process: {e}")
+            shutdown_chart_pool()
+            png = _render_in_process(chart_type, all_periods_stats, options).result()
+        if png is None:
+            value = None
+        elif as_bytes:
+            with _bytes_cache_lock:
+                _bytes_cache.set(key, png)
+            value = png
+        else:
+            value = _disk_cache.put(key, png)
+            logger.info(f"{chart_type} chart generated: {value}")
     except Exception as e:
-        logger.error(f"Error generating tasks pie chart: {e}")
-        return None
+        logger.error(f"Error generating {chart_type} chart: {e}")
+        value = None
+    with _inflight_lock:
+        _inflight.pop((key, as_bytes), None)
+    result.set_result(value)
+
+
+def _completed(value) -> Future:
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def submit_chart(chart_type: str, all_periods_stats: Dict, as_bytes: bool = False, **options) -> Future:
+    """
+    Start rendering a chart without waiting for it
+
+    Args:
+        chart_type: "cost", "time", "tasks" or "tasks_pie"
+        all_periods_stats: {period: statistics} as returned by get_period_comparison
+        as_bytes: Resolve to the PNG bytes instead of a cached file path
+        **options: Drawing options (tasks_pie: period)
+
+    Returns:
+        Future of the PNG path (or bytes); None if there is nothing to draw,
+        matplotlib is missing or rendering failed
+    """
+    if chart_type not in _DRAWERS:
+        raise ValueError(f"Unknown chart type: {chart_type}")
+    key = chart_key(chart_type, all_periods_stats, **options)
+
+    if as_bytes:
+        with _bytes_cache_lock:
+            png = _bytes_cache.get(key)
+        if png is not None:
+            return _completed(png)
+    else:
+        path = _disk_cache.get(key)
+        if path is not None:
+            return _completed(path)
+
+    with _inflight_lock:
+        pending = _inflight.get((key, as_bytes))
+        if pending is not None:
+            return pending
+        result = Future()
+        _inflight[(key, as_bytes)] = result
+
+    render = _start_render(chart_type, all_periods_stats, options)
+    render.add_done_callback(
+        lambda done: _finish_render(chart_type, key, as_bytes, done, result, all_periods_stats, options)
+    )
+    return result
+
+
+def render_chart(chart_type: str, all_periods_stats: Dict, output_path: Optional[Path] = None,
+                 as_bytes: bool = False, **options) -> Optional[Union[Path, bytes]]:
+    """
+    Render a chart and wait for it (see submit_chart)
 
+    Returns the cached PNG path, a copy of it at output_path if given,
+    or the PNG bytes with as_bytes=True
+    """
+    result = submit_chart(chart_type, all_periods_stats, as_bytes=as_bytes, **options).result()
+    if output_path is None or not isinstance(result, Path):
+        return result
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(result, output_path)
+    return output_path
+
+
+def clear_chart_cache():
+    """Remove every cached chart image"""
+    _disk_cache.clear()
+    with _bytes_cache_lock:
+        _bytes_cache.clear()
+
+
+def generate_cost_chart(all_periods_stats: Dict, output_path: Optional[Path] = None,
+                        as_bytes: bool = False) -> Optional[Union[Path, bytes]]:
+    """Generate cost comparison bar chart"""
+    return render_chart("cost", all_periods_stats, output_path, as_bytes)
+
+
+def generate_time_chart(all_periods_stats: Dict, output_path: Optional[Path] = None,
+                        as_bytes: bool = False) -> Optional[Union[Path, bytes]]:
+    """Generate time comparison line chart"""
+    return render_chart("time", all_periods_stats, output_path, as_bytes)
+
+
+def generate_tasks_chart(all_periods_stats: Dict, output_path: Optional[Path] = None,
+                         as_bytes: bool = False) -> Optional[Union[Path, bytes]]:
+    """Generate tasks comparison bar chart"""
+    return render_chart("tasks", all_periods_stats, output_path, as_bytes)
+
+
+def generate_tasks_pie_chart(all_periods_stats: Dict, period: str = "year", output_path: Optional[Path] = None,
+                             as_bytes: bool = False) -> Optional[Union[Path, bytes]]:
+    """Generate tasks pie chart for a specific period"""
+    return render_chart("tasks_pie", all_periods_stats, output_path, as_bytes, period=period)
@@ -1,10 +1,20 @@
 """
 Application Context Service
-Holds current user/session/language context in memory
+Holds current user/session/language context in memory.
+
+The context is resolved per execution context, so one process can serve many
+users (Flet web sessions, API requests):
+    1. a context bound with bind_app_context() / use_app_context() (contextvar;
+       set per API request and inherited by tasks and copied contexts)
+    2. the first registered resolver returning one (the UI registers a resolver
+       that returns the AppContext of the Flet page handling the event)
+    3. the process-wide default context (desktop app, scripts, tests)
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from typing import Callable, Dict, Iterator, List, Optional
 
 
 @dataclass
@@ -21,38 +31,85 @@ class AppContext:
     def is_authenticated(self) -> bool:
         return self.user_id is not None
 
+    def reset(self):
+        """Clear every field back to its default (logout)"""
+        for name, value in vars(AppContext()).items():
+            setattr(self, name, value)
 
-# Global singleton context (desktop app single-user at a time)
-_context = AppContext()
+
+# Fallback context when nothing is bound (desktop app single-user at a time)
+_default_context = AppContext()
+
+_current_context: ContextVar[Optional[AppContext]] = ContextVar("cmms_app_context", default=None)
+
+_context_resolvers: List[Callable[[], Optional[AppContext]]] = []
+
+
+def add_context_resolver(resolver: Callable[[], Optional[AppContext]]):
+    """Register a lookup used when no context is bound in the current execution context"""
+    if resolver not in _context_resolvers:
+        _context_resolvers.append(resolver)
+
+
+def remove_context_resolver(resolver: Callable[[], Optional[AppContext]]):
+    if resolver in _context_resolvers:
+        _context_resolvers.remove(resolver)
+
+
+def bind_app_context(ctx: Optional[AppContext]) -> Token:
+    """Bind `ctx` to the current execution context; returns the token for unbind_app_context()"""
+    return _current_context.set(ctx)
+
+
+def unbind_app_context(token: Token):
+    _current_context.reset(token)
+
+
+@contextmanager
+def use_app_context(ctx: AppContext) -> Iterator[AppContext]:
+    """Run a block (e.g. a worker thread body) as the user of `ctx`"""
+    token = bind_app_context(ctx)
+    try:
+        yield ctx
+    finally:
+        unbind_app_context(token)
 
 
 def get_app_context() -> AppContext:
-    return _context
+    ctx = _current_context.get()
+    if ctx is not None:
+        return ctx
+    for resolver in _context_resolvers:
+        ctx = resolver()
+        if ctx is not None:
+            return ctx
+    return _default_context
 
 
 def set_app_context(user_info: dict, token: str):
-    _context.user_id = user_info.get("user_id")
-    _context.username = user_info.get("username")
-    _context.full_name = user_info.get("full_name")  # Store full_name in context
-    _context.email = user_info.get("email")
-    _context.role = user_info.get("role")
-    _context.language = user_info.get("language", "hu")
-    _context.permissions = user_info.get("permissions", {})
-    _context.token = token
+    ctx = get_app_context()
+    ctx.user_id = user_info.get("user_id")
+    ctx.username = user_info.get("username")
+    ctx.full_name = user_info.get("full_name")  # Store full_name in context
+    ctx.email = user_info.get("email")
+    ctx.role = user_info.get("role")
+    ctx.language = user_info.get("language", "hu")
+    ctx.permissions = user_info.get("permissions", {})
+    ctx.token = token
 
 
 def clear_app_context():
-    global _context
-    _context = AppContext()
+    get_app_context().reset()
 
 
 def get_current_user():
     """Get current user object from database based on context"""
-    if not _context.user_id:
+    user_id = get_app_context().user_id
+    if not user_id:
         return None
     
     from services import user_service
-    return user_service.get_user(_context.user_id)
+    return user_service.get_user(user_id)
 
 
 def get_user(user_id: int):
@@ -63,7 +120,7 @@ def get_user(user_id: int):
 
 def get_current_user_id() -> Optional[int]:
     """Get current user ID from context"""
-    return _context.user_id
+    return get_app_context().user_id
 
 
 def get_client_ip() -> Optional[str]:
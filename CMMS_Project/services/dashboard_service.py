@@ -0,0 +1,183 @@
+"""
+Dashboard Snapshot Service
+The dashboard is composed of independent widget datasets. They are queried in
+parallel, each on its own session, and cached per user/role together with the
+versions of the tables they read (database.change_tracking). A later visit
+only re-queries the widgets whose tables changed since, or whose TTL ran out;
+when nothing changed the snapshot is served from memory.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from config.app_config import DASHBOARD_SNAPSHOT_TTL
+from database.change_tracking import get_table_versions
+from database.models import Machine, PMTask, Worksheet
+from database.query_profiler import profile_call, profiled
+from database.session_manager import SessionLocal
+from services.inventory_valuation_service import get_total_inventory_value
+from services.reports_service import compute_statistics
+from services.reports_service_extended import compare_statistics
+from utils.cache import LRUCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tables read by get_cost/time/task_statistics
+STATISTICS_TABLES = ("worksheets", "worksheet_parts", "pm_histories", "pm_tasks", "service_records")
+
+
+class DashboardWidget:
+    """One independently loaded dataset of the dashboard"""
+
+    def __init__(
+        self,
+        name: str,
+        tables: Tuple[str, ...],
+        load: Callable[[Session, Optional[int]], Dict],
+        ttl: int = DASHBOARD_SNAPSHOT_TTL,
+    ):
+        self.name = name
+        self.tables = tables
+        self.load = load
+        self.ttl = ttl
+
+
+def _load_counts(session: Session, user_id: Optional[int]) -> Dict:
+    """Worksheet, overdue PM task and machine counts (count queries only)"""
+    return {
+        "worksheet_count": session.query(func.count(Worksheet.id)).scalar() or 0,
+        "active_worksheets": session.query(func.count(Worksheet.id)).filter(
+            Worksheet.status == "Open"
+        ).scalar() or 0,
+        "pm_count": session.query(func.count(PMTask.id)).filter(
+            PMTask.next_due_date <= datetime.utcnow()
+        ).scalar() or 0,
+        "machine_count": session.query(func.count(Machine.id)).scalar() or 0,
+    }
+
+
+def _load_inventory(session: Session, user_id: Optional[int]) -> Dict:
+    """Total FIFO stock value (one SUM over the valuation snapshot)"""
+    return {"total_stock_value": get_total_inventory_value(session=session)}
+
+
+def _period_loader(period: str) -> Callable[[Session, Optional[int]], Dict]:
+    def load(session: Session, user_id: Optional[int]) -> Dict:
+        return compute_statistics(period, user_id, session=session)
+    return load
+
+
+WIDGETS: Dict[str, DashboardWidget] = {
+    widget.name: widget
+    for widget in (
+        DashboardWidget("counts", ("worksheets", "pm_tasks", "machines"), _load_counts),
+        DashboardWidget("inventory", ("part_valuations",), _load_inventory),
+        DashboardWidget("month", STATISTICS_TABLES, _period_loader("month")),
+        DashboardWidget("week", STATISTICS_TABLES, _period_loader("week")),
+    )
+}
+
+# (user_id, role, widget) -> (data, table versions); the LRU TTL is the widget TTL
+_widget_cache = LRUCache(max_size=500, default_ttl=DASHBOARD_SNAPSHOT_TTL)
+# (user_id, role) -> last composed snapshot
+_snapshots = LRUCache(max_size=100, default_ttl=DASHBOARD_SNAPSHOT_TTL)
+_cache_lock = threading.Lock()
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=len(WIDGETS), thread_name_prefix="dashboard")
+        return _pool
+
+
+def _load_widget(widget: DashboardWidget, user_id: Optional[int]) -> Dict:
+    # Own session per widget so the queries run concurrently; the primary is used
+    # because the cached table versions describe the primary
+    session = SessionLocal()
+    try:
+        with profile_call(f"{__name__}.widget.{widget.name}"):
+            return widget.load(session, user_id)
+    finally:
+        session.close()
+
+
+@profiled
+def get_dashboard_snapshot(user_id: Optional[int] = None, role: Optional[str] = None,
+                           force: bool = False) -> Dict:
+    """
+    Dashboard data of a user, re-querying only the widgets that are stale
+
+    Args:
+        user_id: User whose statistics are shown
+        role: Role of the user (snapshots are kept per user and role)
+        force: Re-query every widget
+
+    Returns:
+        {"counts": {...}, "inventory": {...}, "month": {...}, "week": {...}, "trend_comparison": {...},
+         "refreshed": [widget names queried by this call], "generated_at": datetime}
+    """
+    cache_key = (user_id, role)
+    cached: Dict[str, Dict] = {}
+    stale: List[Tuple[DashboardWidget, Dict[str, int]]] = []
+
+    with _cache_lock:
+        for widget in WIDGETS.values():
+            # Versions are read before querying: a commit during the load only
+            # makes the widget stale again, it is never missed
+            versions = get_table_versions(widget.tables)
+            entry = None if force else _widget_cache.get((user_id, role, widget.name))
+            if entry is not None and entry[1] == versions:
+                cached[widget.name] = entry[0]
+            else:
+                stale.append((widget, versions))
+        previous = _snapshots.get(cache_key)
+
+    if not stale and previous is not None:
+        return dict(previous, refreshed=[])
+
+    futures = [(widget, versions, _get_pool().submit(_load_widget, widget, user_id))
+               for widget, versions in stale]
+    for widget, versions, future in futures:
+        try:
+            data = future.result()
+        except Exception as e:
+            logger.error(f"Error loading dashboard widget {widget.name}: {e}", exc_info=True)
+            # Keep showing the last good data of the widget (not cached, retried next time)
+            data = (previous or {}).get(widget.name, {})
+            cached[widget.name] = data
+            continue
+        cached[widget.name] = data
+        with _cache_lock:
+            _widget_cache.set((user_id, role, widget.name), (data, versions), ttl=widget.ttl)
+
+    snapshot = dict(cached)
+    snapshot["trend_comparison"] = compare_statistics(cached.get("month", {}), cached.get("week", {}))
+    snapshot["generated_at"] = datetime.utcnow()
+    with _cache_lock:
+        _snapshots.set(cache_key, snapshot)
+    return dict(snapshot, refreshed=[widget.name for widget, _ in stale])
+
+
+def get_cached_snapshot(user_id: Optional[int] = None, role: Optional[str] = None) -> Optional[Dict]:
+    """Last composed snapshot without touching the database (may be slightly stale)"""
+    with _cache_lock:
+        snapshot = _snapshots.get((user_id, role))
+    return dict(snapshot, refreshed=[]) if snapshot is not None else None
+
+
+def invalidate_dashboard_snapshots():
+    """Drop every cached snapshot (e.g. after switching the database)"""
+    with _cache_lock:
+        _widget_cache.clear()
+        _snapshots.clear()
@@ -1,9 +1,14 @@
 """
 Depreciation calculation service for asset lifecycle management
+
+Schedules are computed as NumPy arrays (machines x as-of dates), so the
+whole fleet is valued from one query and written back with one bulk UPDATE.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Iterable, Union
 from datetime import datetime, date
+import numpy as np
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from database.models import Machine, utcnow
 from database.session_manager import SessionLocal
@@ -11,6 +16,163 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+DAYS_PER_YEAR = 365.25
+DEFAULT_PERIOD_YEARS = 10
+DEFAULT_DECLINING_RATE = 0.20  # 20% per year
+
+# Method codes used in the vectorized engine
+METHOD_LINEAR = 0
+METHOD_DECLINING = 1
+METHOD_SUM_OF_YEARS = 2
+_METHOD_CODES = {"linear": METHOD_LINEAR, "declining": METHOD_DECLINING, "sum_of_years": METHOD_SUM_OF_YEARS}
+
+# Columns the engine needs - loaded with one query, no ORM objects
+_INPUT_COLUMNS = (
+    Machine.id,
+    Machine.purchase_price,
+    Machine.purchase_date,
+    Machine.salvage_value,
+    Machine.depreciation_period_years,
+    Machine.depreciation_method,
+    Machine.depreciation_rate,
+    Machine.current_value,
+)
+
+DateLike = Union[datetime, date]
+
+
+def _to_date(value: DateLike) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _build_inputs(rows: Iterable) -> Dict[str, np.ndarray]:
+    """
+    Turn machine rows (query rows or Machine objects) into input arrays.
+
+    Missing settings get the same defaults as the single-machine calculation:
+    10 year period, linear method, 20% declining rate, no salvage value.
+    """
+    rows = list(rows)
+    n = len(rows)
+    inputs = {
+        "machine_ids": np.empty(n, dtype=np.int64),
+        "price": np.zeros(n),
+        "purchase_date": np.full(n, np.datetime64("NaT"), dtype="datetime64[D]"),
+        "salvage": np.zeros(n),
+        "period": np.full(n, float(DEFAULT_PERIOD_YEARS)),
+        "period_configured": np.zeros(n),
+        "method": np.zeros(n, dtype=np.int8),
+        "rate": np.full(n, DEFAULT_DECLINING_RATE),
+        "stored_value": np.full(n, np.nan),
+    }
+    for i, row in enumerate(rows):
+        inputs["machine_ids"][i] = row.id
+        inputs["price"][i] = float(row.purchase_price or 0.0)
+        if row.purchase_date:
+            inputs["purchase_date"][i] = np.datetime64(_to_date(row.purchase_date), "D")
+        inputs["salvage"][i] = float(row.salvage_value or 0.0)
+        if row.depreciation_period_years:
+            inputs["period"][i] = row.depreciation_period_years
+            inputs["period_configured"][i] = row.depreciation_period_years
+        inputs["method"][i] = _METHOD_CODES.get(row.depreciation_method or "linear", METHOD_LINEAR)
+        if row.depreciation_rate:
+            inputs["rate"][i] = row.depreciation_rate
+        if row.current_value is not None:
+            inputs["stored_value"][i] = row.current_value
+    return inputs
+
+
+def compute_depreciation(inputs: Dict[str, np.ndarray], as_of_dates: List[DateLike]) -> Dict[str, np.ndarray]:
+    """
+    Vectorized depreciation for every machine at every as-of date.
+
+    Args:
+        inputs: Arrays from _build_inputs
+        as_of_dates: Valuation dates
+
+    Returns:
+        Dict of (machines x dates) arrays: current_value, depreciation_to_date,
+        annual_depreciation, years_depreciated, remaining_years
+    """
+    as_of = np.array([np.datetime64(_to_date(d), "D") for d in as_of_dates], dtype="datetime64[D]")
+    has_price = (inputs["price"] > 0)[:, None]
+    has_date = (~np.isnat(inputs["purchase_date"]))[:, None]
+
+    purchase = np.where(np.isnat(inputs["purchase_date"]), as_of.min() if len(as_of) else np.datetime64("today"),
+                        inputs["purchase_date"])
+    days = (as_of[None, :] - purchase[:, None]).astype(np.float64)
+    years = np.where(has_date, np.maximum(0.0, days / DAYS_PER_YEAR), 0.0)
+
+    price = inputs["price"][:, None]
+    salvage = inputs["salvage"][:, None]
+    period = inputs["period"][:, None]
+    rate = inputs["rate"][:, None]
+    method = inputs["method"][:, None]
+    base = price - salvage
+    safe_period = np.where(period > 0, period, 1.0)
+
+    # Straight-line
+    linear_annual = np.broadcast_to(base / safe_period, years.shape)
+    linear_dep = linear_annual * years
+
+    # Declining balance
+    declining_annual = np.broadcast_to(price * rate, years.shape)
+    declining_dep = price - price * (1.0 - rate) ** years
+
+    # Sum of years' digits: whole years use the digit fractions, the running
+    # year is depreciated pro rata
+    total_digits = safe_period * (safe_period + 1.0) / 2.0
+    whole_years = np.floor(np.minimum(years, safe_period))
+    fraction = np.minimum(years, safe_period) - whole_years
+    digits_used = whole_years * safe_period - whole_years * (whole_years - 1.0) / 2.0
+    digits_used += fraction * (safe_period - whole_years)
+    syd_dep = base * digits_used / total_digits
+    syd_annual = base * (safe_period - whole_years) / total_digits
+
+    depreciation = np.select(
+        [method == METHOD_DECLINING, method == METHOD_SUM_OF_YEARS], [declining_dep, syd_dep], linear_dep
+    )
+    annual = np.select(
+        [method == METHOD_DECLINING, method == METHOD_SUM_OF_YEARS], [declining_annual, syd_annual], linear_annual
+    )
+
+    # Past the useful life the asset sits at its salvage value
+    fully_depreciated = years >= period
+    depreciation = np.where(fully_depreciated, base, depreciation)
+    annual = np.where(fully_depreciated, np.where(period > 0, base / safe_period, 0.0), annual)
+    current_value = price - depreciation
+    remaining = np.maximum(0.0, period - years)
+
+    # Machines without a purchase date keep their purchase price,
+    # machines without a price have no book value at all
+    dated = has_price & has_date
+    current_value = np.where(dated, current_value, np.where(has_price, price, 0.0))
+    depreciation = np.where(dated, depreciation, 0.0)
+    annual = np.where(dated, annual, 0.0)
+    years = np.where(dated, years, 0.0)
+    remaining = np.where(
+        dated, remaining, np.where(has_price, inputs["period_configured"][:, None], 0.0)
+    )
+    shape = (len(inputs["machine_ids"]), len(as_of))
+
+    return {
+        "current_value": np.broadcast_to(current_value, shape),
+        "depreciation_to_date": np.broadcast_to(depreciation, shape),
+        "annual_depreciation": np.broadcast_to(annual, shape),
+        "years_depreciated": np.broadcast_to(years, shape),
+        "remaining_years": np.broadcast_to(remaining, shape),
+    }
+
+
+def _result_dict(result: Dict[str, np.ndarray], row: int, col: int) -> Dict:
+    return {
+        'current_value': round(float(result["current_value"][row, col]), 2),
+        'depreciation_to_date': round(float(result["depreciation_to_date"][row, col]), 2),
+        'annual_depreciation': round(float(result["annual_depreciation"][row, col]), 2),
+        'years_depreciated': round(float(result["years_depreciated"][row, col]), 2),
+        'remaining_years': float(result["remaining_years"][row, col])
+    }
+
 
 def calculate_depreciation(
     machine_id: int,
@@ -19,7 +181,7 @@ def calculate_depreciation(
 ) -> Dict:
     """
     Calculate depreciation for a machine using the configured method
-    
+
     Returns:
         {
             'current_value': float,
@@ -29,141 +191,121 @@ def calculate_depreciation(
             'remaining_years': float
         }
     """
-    from database.session_manager import SessionLocal
-    if session is None:
-        session = SessionLocal()
-        should_close = True
-    else:
-        should_close = False
-    
+    session, should_close = _get_session(session)
+
     try:
         machine = session.query(Machine).filter_by(id=machine_id).first()
         if not machine:
             raise ValueError(f"Machine {machine_id} not found")
-        
-        if not machine.purchase_price or machine.purchase_price <= 0:
-            return {
-                'current_value': 0.0,
-                'depreciation_to_date': 0.0,
-                'annual_depreciation': 0.0,
-                'years_depreciated': 0.0,
-                'remaining_years': 0.0
-            }
-        
-        if not machine.purchase_date:
-            return {
-                'current_value': machine.purchase_price or 0.0,
-                'depreciation_to_date': 0.0,
-                'annual_depreciation': 0.0,
-                'years_depreciated': 0.0,
-                'remaining_years': machine.depreciation_period_years or 0.0
-            }
-        
-        as_of = as_of_date or utcnow()
-        if isinstance(as_of, datetime):
-            as_of_date_obj = as_of.date()
-        else:
-            as_of_date_obj = as_of
-        
-        purchase_date_obj = machine.purchase_date
-        if isinstance(purchase_date_obj, datetime):
-            purchase_date_obj = purchase_date_obj.date()
-        
-        purchase_price = float(machine.purchase_price)
-        salvage_value = float(machine.salvage_value or 0.0)
-        period_years = machine.depreciation_period_years or 10
-        method = machine.depreciation_method or "linear"
-        
-        # Calculate years since purchase
-        days_diff = (as_of_date_obj - purchase_date_obj).days
-        years_depreciated = max(0.0, days_diff / 365.25)
-        
-        if years_depreciated >= period_years:
-            # Fully depreciated
-            current_value = salvage_value
-            depreciation_to_date = purchase_price - salvage_value
-            annual_depreciation = depreciation_to_date / period_years if period_years > 0 else 0.0
-        else:
-            if method == "linear":
-                annual_depreciation = (purchase_price - salvage_value) / period_years
-                depreciation_to_date = annual_depreciation * years_depreciated
-                current_value = purchase_price - depreciation_to_date
-            
-            elif method == "declining":
-                # Declining balance method
-                rate = machine.depreciation_rate or 0.20  # Default 20%
-                current_value = purchase_price * ((1 - rate) ** years_depreciated)
-                depreciation_to_date = purchase_price - current_value
-                annual_depreciation = purchase_price * rate
-            
-            elif method == "sum_of_years":
-                # Sum of years digits method
-                total_digits = sum(range(1, period_years + 1))
-                remaining_years = period_years - years_depreciated
-                if remaining_years > 0:
-                    depreciation_rate = remaining_years / total_digits
-                    annual_depreciation = (purchase_price - salvage_value) * depreciation_rate
-                    depreciation_to_date = purchase_price - (purchase_price - salvage_value) * (remaining_years / total_digits)
-                    current_value = purchase_price - depreciation_to_date
-                else:
-                    current_value = salvage_value
-                    depreciation_to_date = purchase_price - salvage_value
-                    annual_depreciation = 0.0
-            
-            else:
-                # Default to linear
-                annual_depreciation = (purchase_price - salvage_value) / period_years
-                depreciation_to_date = annual_depreciation * years_depreciated
-                current_value = purchase_price - depreciation_to_date
-        
+
+        result = compute_depreciation(_build_inputs([machine]), [as_of_date or utcnow()])
+        values = _result_dict(result, 0, 0)
+
         # Update machine's current_value
-        machine.current_value = current_value
-        
-        return {
-            'current_value': round(current_value, 2),
-            'depreciation_to_date': round(depreciation_to_date, 2),
-            'annual_depreciation': round(annual_depreciation, 2),
-            'years_depreciated': round(years_depreciated, 2),
-            'remaining_years': max(0.0, period_years - years_depreciated)
-        }
-    
+        if machine.purchase_price and machine.purchase_price > 0 and machine.purchase_date:
+            machine.current_value = float(result["current_value"][0, 0])
+
+        return values
+
     finally:
         if should_close:
             session.close()
 
 
-def update_all_machines_depreciation(session: Session = None):
-    """Update depreciation for all machines"""
-    from database.session_manager import SessionLocal
-    if session is None:
-        session = SessionLocal()
-        should_close = True
-    else:
-        should_close = False
-    
+def update_all_machines_depreciation(as_of_date: Optional[datetime] = None, session: Session = None) -> int:
+    """
+    Update depreciation for all machines
+
+    One query for the inputs, one vectorized valuation and one bulk UPDATE
+    for the machines whose book value actually changed.
+
+    Returns:
+        Number of machines valued
+    """
+    session, should_close = _get_session(session)
+
     try:
-        machines = session.query(Machine).filter(
+        rows = session.query(*_INPUT_COLUMNS).filter(
             Machine.purchase_price.isnot(None),
-            Machine.purchase_price > 0
+            Machine.purchase_price > 0,
+            Machine.purchase_date.isnot(None)
         ).all()
-        
-        updated_count = 0
-        for machine in machines:
-            try:
-                result = calculate_depreciation(machine.id, session=session)
-                session.commit()
-                updated_count += 1
-            except Exception as e:
-                logger.error(f"Error calculating depreciation for machine {machine.id}: {e}")
-                session.rollback()
-        
-        logger.info(f"Updated depreciation for {updated_count} machines")
-        return updated_count
-    
+        if not rows:
+            return 0
+
+        inputs = _build_inputs(rows)
+        result = compute_depreciation(inputs, [as_of_date or utcnow()])
+        new_values = np.round(result["current_value"][:, 0], 2)
+        stored = inputs["stored_value"]
+        changed = np.isnan(stored) | (np.abs(stored - new_values) >= 0.005)
+
+        params = [
+            {"id": int(machine_id), "current_value": float(value)}
+            for machine_id, value in zip(inputs["machine_ids"][changed], new_values[changed])
+        ]
+        if params:
+            # ORM bulk UPDATE by primary key: one executemany statement
+            session.execute(update(Machine), params)
+            session.commit()
+
+        logger.info(f"Updated depreciation for {len(rows)} machines ({len(params)} book values changed)")
+        return len(rows)
+
+    except Exception as e:
+        logger.error(f"Error updating machine depreciation: {e}", exc_info=True)
+        session.rollback()
+        raise
+
     finally:
         if should_close:
             session.close()
 
 
+def project_depreciation(
+    as_of_dates: List[DateLike],
+    machine_ids: Optional[List[int]] = None,
+    session: Session = None
+) -> Dict:
+    """
+    Depreciation "as of" several dates for many machines in one call
 
+    Args:
+        as_of_dates: Valuation dates (e.g. year ends for a lifecycle chart)
+        machine_ids: Machines to value (None = all machines)
+        session: Database session
 
+    Returns:
+        {
+            'dates': [date, ...],
+            'machines': {machine_id: [calculate_depreciation-style dict per date]},
+            'total_book_value': [float per date]
+        }
+    """
+    session, should_close = _get_session(session)
+
+    try:
+        query = session.query(*_INPUT_COLUMNS)
+        if machine_ids is not None:
+            query = query.filter(Machine.id.in_(machine_ids))
+        inputs = _build_inputs(query.order_by(Machine.id).all())
+        dates = [_to_date(d) for d in as_of_dates]
+        result = compute_depreciation(inputs, dates)
+
+        return {
+            'dates': dates,
+            'machines': {
+                int(machine_id): [_result_dict(result, row, col) for col in range(len(dates))]
+                for row, machine_id in enumerate(inputs["machine_ids"])
+            },
+            'total_book_value': [round(float(v), 2) for v in result["current_value"].sum(axis=0)]
+        }
+
+    finally:
+        if should_close:
+            session.close()
+
+
+def _get_session(session: Session = None) -> tuple:
+    if session is None:
+        return SessionLocal(), True
+    return session, False
@@ -0,0 +1,269 @@
+"""
+Compiled DOCX template cache and batch document generation
+
+A template is parsed once with python-docx, the paragraphs that contain
+placeholders (``${worksheet.id}`` or ``{PART_NAME}`` style) are located and
+split into literal/placeholder segments, and the compiled form is cached by
+(path, mtime). Rendering then only deep-copies the pristine body and fills
+the pre-located paragraphs - no re-parsing, no str.replace scan over every
+paragraph for every placeholder.
+"""
+
+from pathlib import Path
+from typing import Optional, Dict, List, Callable, Tuple, Iterable
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import copy
+import os
+import re
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# python-docx is imported when the first template is compiled
+DOCX_AVAILABLE = None  # None = not attempted yet
+Document = None
+qn = None
+Paragraph = None
+
+
+def _load_docx() -> bool:
+    """Import python-docx on first use; returns availability"""
+    global DOCX_AVAILABLE, Document, qn, Paragraph
+    if DOCX_AVAILABLE is None:
+        try:
+            from docx import Document
+            from docx.oxml.ns import qn
+            from docx.text.paragraph import Paragraph
+            DOCX_AVAILABLE = True
+        except Exception:
+            DOCX_AVAILABLE = False
+    return DOCX_AVAILABLE
+
+# ${dotted.key} (worksheet/PM templates) or {UPPER_KEY} (storage templates)
+PLACEHOLDER_PATTERN = re.compile(r"\$?\{[^{}]+\}")
+
+# Maximum number of compiled templates kept in memory
+MAX_CACHED_TEMPLATES = 32
+
+
+class CompiledTemplate:
+    """A parsed DOCX template with pre-located placeholder paragraphs"""
+
+    def __init__(self, template_path: Path):
+        if not _load_docx():
+            raise ImportError("python-docx not available")
+        self.template_path = Path(template_path)
+        self.document = Document(str(self.template_path))
+        body = self.document.element.body
+        self._pristine_body = copy.deepcopy(body)
+        self._lock = threading.Lock()
+
+        # slots: (paragraph index in document order, segments)
+        # segments alternate literal text and placeholder tokens
+        self.slots: List[Tuple[int, List[str]]] = []
+        self.placeholders = set()
+        for index, p in enumerate(body.iter(qn('w:p'))):
+            text = Paragraph(p, None).text
+            if not PLACEHOLDER_PATTERN.search(text):
+                continue
+            segments = []
+            pos = 0
+            for match in PLACEHOLDER_PATTERN.finditer(text):
+                segments.append(text[pos:match.start()])
+                segments.append(match.group(0))
+                self.placeholders.add(match.group(0))
+                pos = match.end()
+            segments.append(text[pos:])
+            self.slots.append((index, segments))
+
+    def _fill(self, replacements: Dict) -> None:
+        """Replace the current body with a fresh copy and fill the slots"""
+        body = self.document.element.body
+        fresh_body = copy.deepcopy(self._pristine_body)
+        body.getparent().replace(body, fresh_body)
+        # python-docx caches the _Body proxy (used by doc.tables/doc.paragraphs)
+        self.document._Document__body = None
+
+        values = {
+            key: (str(value) if value is not None else "-")
+            for key, value in replacements.items()
+        }
+        unknown = [key for key in values if not PLACEHOLDER_PATTERN.fullmatch(key)]
+        if unknown:
+            logger.warning(f"Ignoring non-placeholder replacement keys: {unknown}")
+
+        paragraphs = None
+        for index, segments in self.slots:
+            # Odd positions are placeholder tokens
+            if not any(segments[i] in values for i in range(1, len(segments), 2)):
+                continue
+            if paragraphs is None:
+                paragraphs = list(fresh_body.iter(qn('w:p')))
+            p = paragraphs[index]
+            text = "".join(
+                values.get(segment, segment) if i % 2 else segment
+                for i, segment in enumerate(segments)
+            )
+            paragraph = Paragraph(p, None)
+            for run in list(paragraph.runs):
+                p.remove(run._element)
+            if text:
+                p.add_r().text = text
+
+    def render(
+        self,
+        replacements: Dict,
+        output_path: Path,
+        post_process: Optional[Callable] = None
+    ) -> Path:
+        """
+        Fill the template and save it.
+
+        Args:
+            replacements: Placeholder -> value (None is rendered as "-")
+            output_path: Target .docx path
+            post_process: Optional callable(document) run before saving
+                          (e.g. dynamic table rows)
+
+        Returns:
+            Path of the saved document
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # The document object is shared by every render of this template
+        with self._lock:
+            self._fill(replacements)
+            if post_process is not None:
+                post_process(self.document)
+            self.document.save(str(output_path))
+        return output_path
+
+
+_cache: "OrderedDict[str, Tuple[int, CompiledTemplate]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_compiled_template(template_path: Path) -> CompiledTemplate:
+    """Return the compiled template, recompiling when the file has changed"""
+    template_path = Path(template_path)
+    key = str(template_path.resolve())
+    mtime = os.stat(key).st_mtime_ns
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            _cache.move_to_end(key)
+            _cache_stats["hits"] += 1
+            return cached[1]
+
+    compiled = CompiledTemplate(template_path)
+
+    with _cache_lock:
+        _cache_stats["misses"] += 1
+        _cache[key] = (mtime, compiled)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_TEMPLATES:
+            _cache.popitem(last=False)
+    logger.debug(f"Compiled DOCX template {template_path} ({len(compiled.slots)} placeholder paragraphs)")
+    return compiled
+
+
+def render_template(
+    template_path: Path,
+    replacements: Dict,
+    output_path: Path,
+    post_process: Optional[Callable] = None
+) -> Path:
+    """Render a DOCX template through the compiled-template cache"""
+    return get_compiled_template(template_path).render(replacements, output_path, post_process)
+
+
+def clear_template_cache() -> None:
+    """Drop all compiled templates"""
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats["hits"] = 0
+        _cache_stats["misses"] = 0
+
+
+def get_template_cache_stats() -> Dict:
+    """Cache hit/miss counters (for diagnostics)"""
+    with _cache_lock:
+        return {**_cache_stats, "size": len(_cache)}
+
+
+# ============================================================================
+# BATCH RENDERING
+# ============================================================================
+
+def _render_job(job: Tuple[str, Dict, str]) -> str:
+    """Process pool entry point (each worker keeps its own template cache)"""
+    template_path, replacements, output_path = job
+    return str(render_template(Path(template_path), replacements, Path(output_path)))
+
+
+def render_batch(
+    jobs: Iterable[Tuple[Path, Dict, Path]],
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> Dict:
+    """
+    Render many documents across a process pool.
+
+    Args:
+        jobs: Iterable of (template_path, replacements, output_path)
+        max_workers: Pool size (defaults to CPU count); 1 renders in-process
+        progress_callback: Called as callback(done, total)
+
+    Returns:
+        Dict with rendered paths, failures and throughput figures
+    """
+    jobs = [(str(t), dict(r), str(o)) for t, r, o in jobs]
+    total = len(jobs)
+    rendered: List[str] = []
+    failed: List[Dict] = []
+    started = time.perf_counter()
+
+    if max_workers is None:
+        max_workers = min(total, os.cpu_count() or 1)
+
+    if total and (max_workers <= 1 or total == 1):
+        for job in jobs:
+            try:
+                rendered.append(_render_job(job))
+            except Exception as e:
+                logger.error(f"Error rendering {job[2]}: {e}", exc_info=True)
+                failed.append({"output_path": job[2], "error": str(e)})
+            if progress_callback:
+                progress_callback(len(rendered) + len(failed), total)
+    elif total:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_render_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    rendered.append(future.result())
+                except Exception as e:
+                    logger.error(f"Error rendering {job[2]}: {e}", exc_info=True)
+                    failed.append({"output_path": job[2], "error": str(e)})
+                if progress_callback:
+                    progress_callback(len(rendered) + len(failed), total)
+
+    elapsed = time.perf_counter() - started
+    result = {
+        "rendered": rendered,
+        "failed": failed,
+        "total": total,
+        "elapsed_seconds": elapsed,
+        "documents_per_second": (len(rendered) / elapsed) if elapsed > 0 else 0.0,
+        "workers": max_workers,
+    }
+    logger.info(
+        f"Batch rendered {len(rendered)}/{total} documents in {elapsed:.2f}s "
+        f"({result['documents_per_second']:.1f} docs/s, {max_workers} workers)"
+    )
+    return result
@@ -9,40 +9,46 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Try to import openpyxl with detailed error logging
-OPENPYXL_AVAILABLE = False
+# openpyxl is imported on the first export, not at module import
+OPENPYXL_AVAILABLE = None  # None = not attempted yet
 Workbook = None
 BarChart = None
 LineChart = None
 PieChart = None
-try:
-    from openpyxl import Workbook
-    from openpyxl.chart import BarChart, LineChart, PieChart, Reference
-    from openpyxl.chart.label import DataLabelList
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.utils import get_column_letter
-    OPENPYXL_AVAILABLE = True
-    logger.info("openpyxl successfully imported")
-except ImportError as e:
-    OPENPYXL_AVAILABLE = False
-    Workbook = None
-    BarChart = None
-    LineChart = None
-    PieChart = None
-    logger.error(f"openpyxl ImportError: {e}")
-    import sys
-    logger.error(f"Python executable: {sys.executable}")
-    logger.error(f"Python path: {sys.path[:3]}")
-except Exception as e:
-    OPENPYXL_AVAILABLE = False
-    Workbook = None
-    BarChart = None
-    LineChart = None
-    PieChart = None
-    logger.error(f"openpyxl import failed with exception: {type(e).__name__}: {e}")
-    import sys
-    logger.error(f"Python executable: {sys.executable}")
-    logger.error(f"Python path: {sys.path[:3]}")
+Reference = None
+DataLabelList = None
+Font = Alignment = PatternFill = Border = Side = None
+get_column_letter = None
+
+
+def _load_openpyxl() -> bool:
+    """Import openpyxl on first use; returns availability"""
+    global OPENPYXL_AVAILABLE, Workbook, BarChart, LineChart, PieChart, Reference, DataLabelList
+    global Font, Alignment, PatternFill, Border, Side, get_column_letter
+    if OPENPYXL_AVAILABLE is not None:
+        return OPENPYXL_AVAILABLE
+    try:
+        from openpyxl import Workbook
+        from openpyxl.chart import BarChart, LineChart, PieChart, Reference
+        from openpyxl.chart.label import DataLabelList
+        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+        from openpyxl.utils import get_column_letter
+        OPENPYXL_AVAILABLE = True
+        logger.info("openpyxl successfully imported")
+    except ImportError as e:
+        OPENPYXL_AVAILABLE = False
+        logger.error(f"openpyxl ImportError: {e}")
+        import sys
+        logger.error(f"Python executable: {sys.executable}")
+        logger.error(f"Python path: {sys.path[:3]}")
+    except Exception as e:
+        OPENPYXL_AVAILABLE = False
+        logger.error(f"openpyxl import failed with exception: {type(e).__name__}: {e}")
+        import sys
+        logger.error(f"Python executable: {sys.executable}")
+        logger.error(f"Python path: {sys.path[:3]}")
+    return OPENPYXL_AVAILABLE
+
 
 from services.reports_service import get_all_statistics, get_period_comparison
 from localization.translator import translator
@@ -102,7 +108,7 @@ def export_reports_to_excel(
     output_path: Optional[Path] = None
 ) -> Path:
     """Export reports to Excel with charts"""
-    if not OPENPYXL_AVAILABLE:
+    if not _load_openpyxl():
         raise ImportError("openpyxl is required for Excel export")
     
     # user_id is passed as parameter, no need to get from context here
@@ -212,7 +218,7 @@ def export_reports_to_csv(
     return output_path
 
 
-def _create_summary_sheet(wb: Workbook, all_stats: Dict, periods: List[str], user_id: Optional[int]):
+def _create_summary_sheet(wb: "Workbook", all_stats: Dict, periods: List[str], user_id: Optional[int]):
     """Create summary sheet"""
     ws = wb.create_sheet("Összefoglaló")
     
@@ -279,7 +285,7 @@ def _create_summary_sheet(wb: Workbook, all_stats: Dict, periods: List[str], use
     ws.column_dimensions['D'].width = 20
 
 
-def _create_cost_sheet(wb: Workbook, all_stats: Dict, periods: List[str], user_id: Optional[int]):
+def _create_cost_sheet(wb: "Workbook", all_stats: Dict, periods: List[str], user_id: Optional[int]):
     """Create cost analysis sheet with chart"""
     ws = wb.create_sheet("Költség")
     
@@ -348,7 +354,7 @@ def _create_cost_sheet(wb: Workbook, all_stats: Dict, periods: List[str], user_i
     ws.column_dimensions['D'].width = 25
 
 
-def _create_time_sheet(wb: Workbook, all_stats: Dict, periods: List[str], user_id: Optional[int]):
+def _create_time_sheet(wb: "Workbook", all_stats: Dict, periods: List[str], user_id: Optional[int]):
     """Create time analysis sheet with chart"""
     ws = wb.create_sheet("Idő")
     
@@ -419,7 +425,7 @@ def _create_time_sheet(wb: Workbook, all_stats: Dict, periods: List[str], user_i
         ws.column_dimensions[col].width = 25
 
 
-def _create_tasks_sheet(wb: Workbook, all_stats: Dict, periods: List[str], user_id: Optional[int]):
+def _create_tasks_sheet(wb: "Workbook", all_stats: Dict, periods: List[str], user_id: Optional[int]):
     """Create tasks analysis sheet with chart"""
     ws = wb.create_sheet("Feladatok")
     
@@ -526,7 +532,7 @@ def _create_tasks_sheet(wb: Workbook, all_stats: Dict, periods: List[str], user_
         ws.column_dimensions[col].width = 25
 
 
-def _create_detailed_sheet(wb: Workbook, all_stats: Dict, periods: List[str], user_id: Optional[int]):
+def _create_detailed_sheet(wb: "Workbook", all_stats: Dict, periods: List[str], user_id: Optional[int]):
     """Create detailed breakdown sheet"""
     ws = wb.create_sheet("Részletes")
     
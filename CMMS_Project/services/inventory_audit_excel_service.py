@@ -4,7 +4,7 @@ Excel export service for inventory audit reports
 
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Callable
 import logging
 
 logger = logging.getLogger(__name__)
@@ -601,83 +601,28 @@ def export_maintenance_trend_to_excel(
 
 
 def export_full_inventory_to_excel(
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    progress_callback: Optional[Callable[[int, Optional[int]], None]] = None
 ) -> Path:
-    """Export full inventory with all information to Excel"""
+    """
+    Export full inventory with all information to Excel.
+
+    Uses the streaming export engine (write-only worksheet, server-side cursor),
+    so memory usage does not grow with the number of parts.
+    """
     if not OPENPYXL_AVAILABLE:
         raise ImportError("openpyxl is required for Excel export")
     
+    from services.streaming_export_service import export_full_inventory_streaming
+    
     if output_path is None:
         output_dir = Path("generated_reports")
         output_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = output_dir / f"full_inventory_{timestamp}.xlsx"
     
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Teljes Készlet"
-    
-    data = get_stock_quantity_report(include_zero=True)
-    
-    # Header
-    ws['A1'] = "Teljes Készlet Kimutatás"
-    ws['A1'].font = Font(bold=True, size=16)
-    ws['A2'] = f"Dátum: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    
-    # Table headers
-    row = 4
-    headers = [
-        "Alkatrész neve", "SKU", "Kategória", "Mértékegység",
-        "Jelenlegi készlet", "Biztonsági készlet", "Újrarendelési mennyiség",
-        "Beszerzési ár", "FIFO egységár", "Készlet érték",
-        "Szállító", "Státusz", "Utolsó beérkezés", "Utolsó kiadás"
-    ]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row, col, header)
-        _style_header(cell)
-    
-    # Data rows
-    for part_data in data:
-        row += 1
-        ws.cell(row, 1, part_data.get("part_name", ""))
-        ws.cell(row, 2, part_data.get("sku", ""))
-        ws.cell(row, 3, part_data.get("category", ""))
-        ws.cell(row, 4, part_data.get("unit", ""))
-        ws.cell(row, 5, part_data.get("current_quantity", 0))
-        ws.cell(row, 6, part_data.get("safety_stock", 0))
-        ws.cell(row, 7, part_data.get("reorder_quantity", 0))
-        ws.cell(row, 8, _format_currency(part_data.get("buy_price", 0.0)))
-        ws.cell(row, 9, _format_currency(part_data.get("fifo_unit_cost", 0.0)))
-        ws.cell(row, 10, _format_currency(part_data.get("stock_value", 0.0)))
-        ws.cell(row, 11, part_data.get("supplier_name", "") or "")
-        ws.cell(row, 12, part_data.get("status", ""))
-        ws.cell(row, 13, part_data.get("last_receipt_date").strftime("%Y-%m-%d") if part_data.get("last_receipt_date") else "")
-        ws.cell(row, 14, part_data.get("last_issue_date").strftime("%Y-%m-%d") if part_data.get("last_issue_date") else "")
-        
-        for col in range(1, len(headers) + 1):
-            cell = ws.cell(row, col)
-            if col in [5, 6, 7, 8, 9, 10]:
-                _style_number_cell(cell)
-            else:
-                _style_data_cell(cell)
-    
-    # Summary row
-    row += 2
-    total_value = sum(p.get("stock_value", 0.0) for p in data)
-    total_quantity = sum(p.get("current_quantity", 0) for p in data)
-    ws.cell(row, 1, "Összesen:")
-    ws.cell(row, 5, total_quantity)
-    ws.cell(row, 10, _format_currency(total_value))
-    ws.cell(row, 1).font = Font(bold=True)
-    ws.cell(row, 5).font = Font(bold=True)
-    ws.cell(row, 10).font = Font(bold=True)
-    
-    # Auto-adjust column widths
-    for col in range(1, len(headers) + 1):
-        ws.column_dimensions[get_column_letter(col)].width = 18
-    
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(output_path))
-    logger.info(f"Full inventory exported to {output_path}")
-    return output_path
-
+    return export_full_inventory_streaming(
+        output_path=output_path,
+        fmt="xlsx",
+        progress_callback=progress_callback,
+    )
@@ -8,12 +8,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, desc, asc
 from sqlalchemy.orm import joinedload
 
-from database.session_manager import SessionLocal
+from database.session_manager import SessionLocal, ReadSessionLocal
 from database.models import (
     Part, InventoryLevel, StockTransaction, StockBatch, InventoryThreshold,
     Machine, Worksheet, WorksheetPart, PMHistory, ServiceRecord, User, Supplier
 )
 from services import inventory_service
+from services.inventory_valuation_service import (
+    get_part_valuations, get_total_inventory_value, get_valuation_changes,
+)
 from services.context_service import get_app_context, get_current_user_id
 
 import logging
@@ -28,6 +31,13 @@ def _get_session(session: Optional[Session]) -> Tuple[Session, bool]:
     return session, False
 
 
+def _get_read_session(session: Optional[Session]) -> Tuple[Session, bool]:
+    """Get database session for report queries (read replica when configured)"""
+    if session is None:
+        return ReadSessionLocal(), True
+    return session, False
+
+
 def _get_date_range(period: str, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> Tuple[datetime, datetime]:
     """Get date range for period (weekly/monthly/yearly)"""
     now = datetime.utcnow()
@@ -67,7 +77,7 @@ def get_inventory_overview(
     session: Session = None
 ) -> Dict:
     """Get inventory overview statistics"""
-    session, should_close = _get_session(session)
+    session, should_close = _get_read_session(session)
     try:
         period_start, period_end = _get_date_range(period, start_date, end_date)
         
@@ -98,20 +108,14 @@ def get_inventory_overview(
             total_quantity_query = total_quantity_query.filter(InventoryLevel.part_id.in_(session.query(parts_used.c.part_id)))
         total_quantity = total_quantity_query.scalar() or 0
         
-        # Total stock value (FIFO based)
-        total_value = 0.0
-        parts_query = session.query(Part)
+        # Total stock value (FIFO based, from the valuation snapshot)
+        valued_parts = None
         if machine_id:
             parts_used = session.query(WorksheetPart.part_id).join(Worksheet).filter(
                 Worksheet.machine_id == machine_id
             ).distinct().subquery()
-            parts_query = parts_query.filter(Part.id.in_(session.query(parts_used.c.part_id)))
-        
-        for part in parts_query.all():
-            inv_level = session.query(InventoryLevel).filter_by(part_id=part.id).first()
-            if inv_level and inv_level.quantity_on_hand > 0:
-                fifo_cost = inventory_service.get_fifo_cost(part.id, inv_level.quantity_on_hand, session=session)
-                total_value += inv_level.quantity_on_hand * fifo_cost
+            valued_parts = session.query(parts_used.c.part_id)
+        total_value = get_total_inventory_value(valued_parts, session=session)
         
         # Active parts count
         active_parts_query = session.query(func.count(Part.id)).join(InventoryLevel).filter(
@@ -231,7 +235,7 @@ def get_usage_report(
     session: Session = None
 ) -> Dict:
     """Get usage report with breakdown by period"""
-    session, should_close = _get_session(session)
+    session, should_close = _get_read_session(session)
     try:
         period_start, period_end = _get_date_range(period, start_date, end_date)
         
@@ -385,68 +389,70 @@ def get_value_change_report(
     session: Session = None
 ) -> Dict:
     """Get value change report showing inventory value changes"""
-    session, should_close = _get_session(session)
+    session, should_close = _get_read_session(session)
     try:
         period_start, period_end = _get_date_range(period, start_date, end_date)
         
-        # Get all parts with inventory
-        parts = session.query(Part).join(InventoryLevel).filter(
-            InventoryLevel.quantity_on_hand > 0
-        ).all()
-        
-        result = []
-        total_initial_value = 0.0
-        total_final_value = 0.0
-        total_received_value = 0.0
-        total_issued_value = 0.0
-        
-        for part in parts:
-            inv_level = session.query(InventoryLevel).filter_by(part_id=part.id).first()
-            if not inv_level:
-                continue
-            
-            # Calculate initial value (at period start)
-            # For simplicity, use current FIFO cost - in real scenario would need historical data
-            initial_qty = inv_level.quantity_on_hand  # Simplified - should query historical
-            initial_unit_cost = inventory_service.get_fifo_cost(part.id, initial_qty, session=session)
-            initial_value = initial_qty * initial_unit_cost
-            
-            # Calculate final value (at period end = current)
-            final_qty = inv_level.quantity_on_hand
-            final_unit_cost = inventory_service.get_fifo_cost(part.id, final_qty, session=session)
-            final_value = final_qty * final_unit_cost
-            
-            # Calculate received value (stock transactions with positive quantity)
-            received_txs = session.query(
+        # Stock value at the period start and end (valuation history snapshots)
+        changes = {
+            part_id: change for part_id, change in get_valuation_changes(period_start, period_end, session=session).items()
+            if change["initial_quantity"] > 0 or change["final_quantity"] > 0
+        }
+        parts = [
+            part for part in session.query(Part.id, Part.name, Part.sku).order_by(Part.id)
+            if part.id in changes
+        ]
+        
+        # Received value (stock transactions with positive quantity)
+        received = {
+            row.part_id: row for row in session.query(
+                StockTransaction.part_id,
                 func.sum(StockTransaction.quantity).label('total_qty'),
                 func.sum(StockTransaction.quantity * StockBatch.unit_price).label('total_value')
             ).join(StockBatch, StockTransaction.id == StockBatch.stock_transaction_id).filter(
                 and_(
-                    StockTransaction.part_id == part.id,
                     StockTransaction.quantity > 0,
                     StockTransaction.timestamp >= period_start,
                     StockTransaction.timestamp <= period_end
                 )
-            ).first()
-            
-            received_qty = received_txs.total_qty or 0
-            received_value = float(received_txs.total_value or 0.0)
-            
-            # Calculate issued value (negative transactions)
-            issued_txs = session.query(
+            ).group_by(StockTransaction.part_id)
+        }
+        
+        # Issued value (negative transactions)
+        issued = {
+            row.part_id: row for row in session.query(
+                StockTransaction.part_id,
                 func.sum(func.abs(StockTransaction.quantity)).label('total_qty'),
                 func.sum(func.abs(StockTransaction.quantity) * WorksheetPart.unit_cost_at_time).label('total_value')
             ).join(WorksheetPart, StockTransaction.reference_id == WorksheetPart.worksheet_id).filter(
                 and_(
-                    StockTransaction.part_id == part.id,
                     StockTransaction.quantity < 0,
                     StockTransaction.timestamp >= period_start,
                     StockTransaction.timestamp <= period_end
                 )
-            ).first()
+            ).group_by(StockTransaction.part_id)
+        }
+        
+        result = []
+        total_initial_value = 0.0
+        total_final_value = 0.0
+        total_received_value = 0.0
+        total_issued_value = 0.0
+        
+        for part in parts:
+            change = changes[part.id]
+            initial_qty = change["initial_quantity"]
+            initial_value = change["initial_value"]
+            final_qty = change["final_quantity"]
+            final_value = change["final_value"]
             
-            issued_qty = issued_txs.total_qty or 0
-            issued_value = float(issued_txs.total_value or 0.0)
+            received_txs = received.get(part.id)
+            received_qty = (received_txs.total_qty if received_txs else 0) or 0
+            received_value = float((received_txs.total_value if received_txs else 0.0) or 0.0)
+            
+            issued_txs = issued.get(part.id)
+            issued_qty = (issued_txs.total_qty if issued_txs else 0) or 0
+            issued_value = float((issued_txs.total_value if issued_txs else 0.0) or 0.0)
             
             # Value change
             value_change = final_value - initial_value
@@ -507,7 +513,7 @@ def get_stock_quantity_report(
     session: Session = None
 ) -> List[Dict]:
     """Get stock quantity report with all part information"""
-    session, should_close = _get_session(session)
+    session, should_close = _get_read_session(session)
     try:
         query = session.query(Part).join(InventoryLevel)
         
@@ -522,6 +528,7 @@ def get_stock_quantity_report(
             query = query.filter(Part.id.in_(session.query(parts_used.c.part_id)))
         
         parts = query.all()
+        valuations = get_part_valuations([part.id for part in parts], session=session)
         
         result = []
         for part in parts:
@@ -551,8 +558,12 @@ def get_stock_quantity_report(
             else:
                 status = "ok"
             
-            # Calculate stock value using FIFO
-            fifo_unit_cost = inventory_service.get_fifo_cost(part.id, qty, session=session)
+            # Stock value using FIFO (snapshot, unless it lags behind the level)
+            valuation = valuations.get(part.id)
+            if valuation is not None and valuation.quantity_on_hand == qty:
+                fifo_unit_cost = valuation.average_cost if qty > 0 else 0.0
+            else:
+                fifo_unit_cost = inventory_service.get_fifo_cost(part.id, qty, session=session)
             stock_value = qty * fifo_unit_cost
             
             result.append({
@@ -589,7 +600,7 @@ def get_stock_change_report(
     session: Session = None
 ) -> Dict:
     """Get stock change report showing quantity changes"""
-    session, should_close = _get_session(session)
+    session, should_close = _get_read_session(session)
     try:
         period_start, period_end = _get_date_range(period, start_date, end_date)
         
@@ -689,7 +700,7 @@ def get_machine_usage_trend(
     session: Session = None
 ) -> Dict:
     """Get machine usage trend with breakdown by period"""
-    session, should_close = _get_session(session)
+    session, should_close = _get_read_session(session)
     try:
         machine = session.query(Machine).filter_by(id=machine_id).first()
         if not machine:
@@ -855,7 +866,7 @@ def get_maintenance_trend_report(
     session: Session = None
 ) -> Dict:
     """Get maintenance trend report with MTBF, MTTR, availability"""
-    session, should_close = _get_session(session)
+    session, should_close = _get_read_session(session)
     try:
         period_start, period_end = _get_date_range(period)
         
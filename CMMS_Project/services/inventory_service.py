@@ -2,12 +2,15 @@
 Készletkezelő szolgáltatás (beszállítók, cikkek, készletmozgások)
 """
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
 
 from database.session_manager import SessionLocal
-from database.models import Supplier, Part, InventoryLevel, StockTransaction, StockBatch, utcnow
+from database.models import Supplier, Part, InventoryLevel, StockTransaction, StockBatch, PartValuation, utcnow
+from database.query_profiler import profiled
+from services.inventory_valuation_service import refresh_part_valuations
 from utils.validators import validate_sku, validate_email
 from utils.localization_helper import get_localized_error
 from config.constants import TRANSACTION_TYPE_RECEIVED, TRANSACTION_TYPE_INITIAL_STOCK
@@ -147,6 +150,7 @@ def create_part(
             last_updated=utcnow(),
         )
         session.add(inv)
+        refresh_part_valuations([part.id], session)
         session.commit()
         
         # Stock transaction létrehozása, ha van kezdeti mennyiség
@@ -209,6 +213,34 @@ def create_part(
             session.close()
 
 
+def bulk_import_parts(parts_data: List[Dict], create_missing_suppliers: bool = False,
+                      user_id: Optional[int] = None, session: Session = None):
+    """
+    Create many parts in one transaction (all or nothing).
+
+    Rows use create_part's argument names (sku, name, supplier_id,
+    initial_quantity, buy_price / unit_price, ...) or a supplier name under
+    "supplier". Any invalid row, existing or repeated SKU raises
+    ValidationError and nothing is written. For spreadsheet files with a
+    per-row error report use services.bulk_import_service.import_file.
+
+    Returns:
+        ImportResult with the created count and throughput
+    """
+    from services.bulk_import_service import ENTITY_PARTS, MODE_INSERT, import_records
+
+    return import_records(
+        ENTITY_PARTS,
+        parts_data,
+        mode=MODE_INSERT,
+        create_missing=create_missing_suppliers,
+        strict=True,
+        chunk_size=max(1, len(parts_data)),
+        user_id=user_id,
+        session=session,
+    )
+
+
 def get_part_by_sku(sku: str, session: Session = None) -> Optional[Part]:
     session, should_close = _get_session(session)
     try:
@@ -330,6 +362,7 @@ def adjust_stock(part_id: int, quantity: int, transaction_type: str,
                 timestamp=utcnow(),
             )
             session.add(tx)
+            refresh_part_valuations([part_id], session)
             session.commit()
             logger.info(f"Készletmozgás (nincs batch): part_id={part_id} mennyiség={quantity} típus={transaction_type}, storage_location_id={storage_location_id}")
             return tx
@@ -426,6 +459,7 @@ def adjust_stock(part_id: int, quantity: int, transaction_type: str,
         except Exception as e:
             logger.warning(f"Error logging stock issuance: {e}")
         
+        refresh_part_valuations([part_id], session)
         session.commit()
         
         # Validate inventory level consistency if storage_location_id was provided
@@ -583,6 +617,7 @@ def receive_stock(
         except Exception as e:
             logger.warning(f"Error logging stock receipt: {e}")
         
+        refresh_part_valuations([part_id], session)
         session.commit()
         logger.info(f"Készletbeérkezés: part_id={part_id} mennyiség={quantity} ár={unit_price} batch_id={batch.id}")
         return batch
@@ -608,6 +643,11 @@ def get_fifo_cost(part_id: int, quantity: int, session: Session = None) -> float
         if quantity <= 0:
             return 0.0
         
+        # Valuing the whole stock: the snapshot already holds its FIFO average
+        valuation = session.get(PartValuation, part_id)
+        if valuation is not None and valuation.quantity_on_hand == quantity:
+            return valuation.average_cost
+        
         # Get batches in FIFO order
         batches = session.query(StockBatch).filter(
             StockBatch.part_id == part_id,
@@ -679,6 +719,7 @@ def migrate_existing_stock_to_batches(session: Session = None) -> int:
     """
     session, should_close = _get_session(session)
     batches_created = 0
+    migrated_part_ids = []
     try:
         # Get all inventory levels with positive quantity
         inventory_levels = session.query(InventoryLevel).filter(
@@ -724,9 +765,11 @@ def migrate_existing_stock_to_batches(session: Session = None) -> int:
                 stock_transaction_id=tx.id,
             )
             session.add(batch)
+            migrated_part_ids.append(inv.part_id)
             batches_created += 1
             logger.info(f"Created batch for part {inv.part_id}: {inv.quantity_on_hand} @ {part.buy_price or 0.0}")
         
+        refresh_part_valuations(migrated_part_ids, session)
         session.commit()
         logger.info(f"Migration completed: {batches_created} batches created")
         return batches_created
@@ -739,6 +782,7 @@ def migrate_existing_stock_to_batches(session: Session = None) -> int:
             session.close()
 
 
+@profiled
 def validate_inventory_levels(part_id: Optional[int] = None, session: Session = None) -> List[Dict]:
     """Validálja, hogy InventoryLevel.quantity_on_hand = SUM(PartLocation.quantity)
     
@@ -808,6 +852,7 @@ def fix_inventory_level_discrepancy(part_id: int, session: Session = None) -> bo
         inv_level = session.query(InventoryLevel).filter_by(part_id=part_id).first()
         if inv_level:
             inv_level.quantity_on_hand = total_in_locations
+            refresh_part_valuations([part_id], session)
             session.commit()
             return True
         return False
@@ -828,6 +873,35 @@ def list_stock_transactions(part_id: Optional[int] = None, limit: int = 100, ses
             session.close()
 
 
+def iter_stock_transactions(
+    part_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    batch_size: int = 1000,
+    session: Session = None
+) -> Iterator[StockTransaction]:
+    """Iterate stock transactions (newest first) in batches of `batch_size` rows (yield_per)"""
+    session, should_close = _get_session(session)
+    try:
+        stmt = (
+            select(StockTransaction)
+            .options(joinedload(StockTransaction.part), joinedload(StockTransaction.user))
+            .order_by(StockTransaction.timestamp.desc(), StockTransaction.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        if part_id:
+            stmt = stmt.where(StockTransaction.part_id == part_id)
+        if start_date:
+            stmt = stmt.where(StockTransaction.timestamp >= start_date)
+        if end_date:
+            stmt = stmt.where(StockTransaction.timestamp <= end_date)
+        yield from session.execute(stmt).scalars()
+    finally:
+        if should_close:
+            session.close()
+
+
+@profiled
 def list_parts(session: Session = None, limit: Optional[int] = None, offset: int = 0) -> List[Part]:
     """List parts with inventory levels loaded in batch (with optional pagination)"""
     session, should_close = _get_session(session)
@@ -990,6 +1064,10 @@ def update_part(
                     changes["bin_location"] = {"old": inv.bin_location or "-", "new": bin_location or "-"}
                 inv.bin_location = bin_location
         
+        # Parts without open batches are valued at their buy price
+        if "buy_price" in changes:
+            refresh_part_valuations([part_id], session)
+        
         part.updated_at = utcnow()
         session.commit()
         
@@ -0,0 +1,404 @@
+"""
+Inventory valuation snapshot service
+
+part_valuations holds the FIFO value of every part's on-hand quantity
+(quantity, total value, average cost, oldest open batch) and
+part_valuation_history its end-of-day value per part. Stock movements refresh
+the rows of the parts they touched in their own transaction, so the total
+inventory value is one SUM instead of a walk over every open StockBatch, and
+value changes over a period are the difference of two history snapshots.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from database.models import InventoryLevel, Part, PartValuation, PartValuationHistory, StockBatch, utcnow
+from database.session_manager import ReadSessionLocal, SessionLocal
+from database.query_profiler import profiled
+
+logger = logging.getLogger(__name__)
+
+# pandas does the full rebuild in a few vectorized passes; imported on the
+# first rebuild, not at module import (the stock services import this module)
+PANDAS_AVAILABLE = None  # None = not attempted yet
+pd = None
+
+# Parts refreshed per query (keeps IN lists within the database's bind limit)
+REFRESH_CHUNK_SIZE = 500
+
+
+def _load_pandas() -> bool:
+    """Import pandas on first use; returns availability"""
+    global PANDAS_AVAILABLE, pd
+    if PANDAS_AVAILABLE is not None:
+        return PANDAS_AVAILABLE
+    try:
+        import pandas as _pd
+        pd = _pd
+        PANDAS_AVAILABLE = True
+    except ImportError as e:
+        PANDAS_AVAILABLE = False
+        logger.error(f"pandas ImportError: {e}")
+    return PANDAS_AVAILABLE
+
+
+def _get_session(session: Optional[Session]) -> Tuple[Session, bool]:
+    if session is None:
+        return SessionLocal(), True
+    return session, False
+
+
+def _get_read_session(session: Optional[Session]) -> Tuple[Session, bool]:
+    if session is None:
+        return ReadSessionLocal(), True
+    return session, False
+
+
+def _chunks(values: Sequence[int], size: int = REFRESH_CHUNK_SIZE) -> Iterable[Sequence[int]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def fifo_value(quantity: int, batches: Iterable[Tuple[int, float]], buy_price: Optional[float]) -> float:
+    """
+    FIFO value of quantity from (quantity_remaining, unit_price) batches, oldest first
+
+    Same rule as inventory_service.get_fifo_cost: the oldest batches cover
+    the quantity, and a part without open batches is valued at its buy price.
+    """
+    if quantity <= 0:
+        return 0.0
+    value = 0.0
+    remaining = quantity
+    has_batches = False
+    for batch_quantity, unit_price in batches:
+        has_batches = True
+        if remaining <= 0:
+            break
+        taken = min(remaining, batch_quantity)
+        value += taken * (unit_price or 0.0)
+        remaining -= taken
+    if not has_batches:
+        return quantity * (buy_price or 0.0)
+    return value
+
+
+def _compute(session: Session, part_ids: Sequence[int]) -> Dict[int, Dict]:
+    """Current valuation of the given parts (two aggregate queries; batches only loaded when they exceed stock)"""
+    stock = session.execute(
+        select(Part.id, Part.buy_price, InventoryLevel.quantity_on_hand)
+        .outerjoin(InventoryLevel, InventoryLevel.part_id == Part.id)
+        .where(Part.id.in_(part_ids))
+    ).all()
+    open_batches = {
+        row.part_id: row for row in session.execute(
+            select(
+                StockBatch.part_id,
+                func.sum(StockBatch.quantity_remaining).label("batch_quantity"),
+                func.sum(StockBatch.quantity_remaining * StockBatch.unit_price).label("batch_value"),
+                func.min(StockBatch.received_date).label("oldest_batch_date"),
+            )
+            .where(StockBatch.part_id.in_(part_ids), StockBatch.quantity_remaining > 0)
+            .group_by(StockBatch.part_id)
+        )
+    }
+
+    valuations = {}
+    partial = []
+    for part_id, buy_price, quantity in stock:
+        quantity = max(quantity or 0, 0)
+        batches = open_batches.get(part_id)
+        if batches is None:
+            value = fifo_value(quantity, (), buy_price)
+        elif quantity >= batches.batch_quantity:
+            value = float(batches.batch_value or 0.0)
+        else:
+            # Open batches exceed the stock: only the oldest ones are counted
+            value = None
+            partial.append(part_id)
+        valuations[part_id] = {
+            "part_id": part_id,
+            "quantity_on_hand": quantity,
+            "total_value": value,
+            "oldest_batch_date": batches.oldest_batch_date if batches is not None else None,
+        }
+
+    if partial:
+        rows: Dict[int, List[Tuple[int, float]]] = {part_id: [] for part_id in partial}
+        for part_id, quantity, unit_price in session.execute(
+            select(StockBatch.part_id, StockBatch.quantity_remaining, StockBatch.unit_price)
+            .where(StockBatch.part_id.in_(partial), StockBatch.quantity_remaining > 0)
+            .order_by(StockBatch.part_id, StockBatch.received_date, StockBatch.id)
+        ):
+            rows[part_id].append((quantity, unit_price))
+        for part_id in partial:
+            valuation = valuations[part_id]
+            valuation["total_value"] = fifo_value(valuation["quantity_on_hand"], rows[part_id], None)
+
+    for valuation in valuations.values():
+        quantity = valuation["quantity_on_hand"]
+        valuation["average_cost"] = valuation["total_value"] / quantity if quantity > 0 else 0.0
+    return valuations
+
+
+def _write_history(session: Session, valuations: Sequence[Dict], day: date):
+    """Upsert the day's history row of each valuation"""
+    if not valuations:
+        return
+    existing = {
+        row.part_id: row for row in session.query(PartValuationHistory).filter(
+            PartValuationHistory.valuation_date == day,
+            PartValuationHistory.part_id.in_([valuation["part_id"] for valuation in valuations]),
+        )
+    }
+    new_rows = []
+    for valuation in valuations:
+        row = existing.get(valuation["part_id"])
+        if row is None:
+            new_rows.append({
+                "part_id": valuation["part_id"],
+                "valuation_date": day,
+                "quantity_on_hand": valuation["quantity_on_hand"],
+                "total_value": valuation["total_value"],
+            })
+        else:
+            row.quantity_on_hand = valuation["quantity_on_hand"]
+            row.total_value = valuation["total_value"]
+    if new_rows:
+        session.execute(insert(PartValuationHistory.__table__), new_rows)
+
+
+def refresh_part_valuations(part_ids: Iterable[int], session: Session):
+    """
+    Recompute the snapshot of the given parts in the caller's transaction
+
+    Called by every stock movement after it changed levels or batches; the
+    caller commits. A changed value also updates today's history row.
+    """
+    part_ids = sorted({int(part_id) for part_id in part_ids if part_id is not None})
+    if not part_ids:
+        return
+    session.flush()
+    now = utcnow()
+    for chunk in _chunks(part_ids):
+        valuations = _compute(session, chunk)
+        snapshots = {
+            row.part_id: row for row in session.query(PartValuation).filter(PartValuation.part_id.in_(chunk))
+        }
+        changed = []
+        new_rows = []
+        for part_id, valuation in valuations.items():
+            snapshot = snapshots.get(part_id)
+            if snapshot is None:
+                # New parts (bulk imports): one executemany instead of a flush per object
+                new_rows.append({**valuation, "updated_at": now})
+                changed.append(valuation)
+                continue
+            if (snapshot.quantity_on_hand, snapshot.total_value, snapshot.oldest_batch_date) == (
+                valuation["quantity_on_hand"], valuation["total_value"], valuation["oldest_batch_date"]
+            ):
+                continue
+            snapshot.quantity_on_hand = valuation["quantity_on_hand"]
+            snapshot.total_value = valuation["total_value"]
+            snapshot.average_cost = valuation["average_cost"]
+            snapshot.oldest_batch_date = valuation["oldest_batch_date"]
+            snapshot.updated_at = now
+            changed.append(valuation)
+        if new_rows:
+            session.execute(insert(PartValuation.__table__), new_rows)
+        _write_history(session, changed, now.date())
+    session.flush()
+
+
+def _rebuild_frame(session: Session) -> "pd.DataFrame":
+    """Valuation of every part from two full scans, FIFO cut done with grouped cumulative sums"""
+    stock = pd.DataFrame(
+        session.execute(
+            select(Part.id.label("part_id"), Part.buy_price, InventoryLevel.quantity_on_hand)
+            .outerjoin(InventoryLevel, InventoryLevel.part_id == Part.id)
+        ).all(),
+        columns=["part_id", "buy_price", "quantity_on_hand"],
+    )
+    stock["quantity_on_hand"] = stock["quantity_on_hand"].fillna(0).astype("int64").clip(lower=0)
+    stock["buy_price"] = stock["buy_price"].astype("float64").fillna(0.0)
+
+    batches = pd.DataFrame(
+        session.execute(
+            select(StockBatch.part_id, StockBatch.received_date, StockBatch.quantity_remaining, StockBatch.unit_price)
+            .where(StockBatch.quantity_remaining > 0)
+            .order_by(StockBatch.part_id, StockBatch.received_date, StockBatch.id)
+        ).all(),
+        columns=["part_id", "received_date", "quantity_remaining", "unit_price"],
+    )
+    batches["unit_price"] = batches["unit_price"].astype("float64").fillna(0.0)
+    batches = batches.merge(stock[["part_id", "quantity_on_hand"]], on="part_id", how="inner")
+    # Quantity of older batches before each one; the batch covers what is left of the stock
+    before = batches.groupby("part_id")["quantity_remaining"].cumsum() - batches["quantity_remaining"]
+    taken = (batches["quantity_on_hand"] - before).clip(lower=0)
+    taken = taken.where(taken < batches["quantity_remaining"], batches["quantity_remaining"])
+    batches["value"] = taken * batches["unit_price"]
+    per_part = batches.groupby("part_id").agg(
+        batch_value=("value", "sum"), oldest_batch_date=("received_date", "min")
+    )
+
+    frame = stock.merge(per_part, left_on="part_id", right_index=True, how="left")
+    has_batches = frame["batch_value"].notna()
+    frame["total_value"] = frame["batch_value"].where(
+        has_batches, frame["quantity_on_hand"] * frame["buy_price"]
+    ).astype("float64")
+    quantity = frame["quantity_on_hand"]
+    frame["average_cost"] = (frame["total_value"] / quantity.where(quantity > 0)).fillna(0.0)
+    return frame[["part_id", "quantity_on_hand", "total_value", "average_cost", "oldest_batch_date"]]
+
+
+@profiled
+def rebuild_part_valuations(session: Session = None, as_of: Optional[datetime] = None) -> int:
+    """
+    Recompute the snapshot of every part from levels and open batches
+
+    For the initial fill and after changes that bypass the stock services
+    (restores, manual SQL). Replaces today's history rows as well.
+
+    Args:
+        as_of: Timestamp of the snapshot and day of its history rows (default: now)
+
+    Returns:
+        int: Number of parts valued
+    """
+    session, should_close = _get_session(session)
+    try:
+        if not _load_pandas():
+            # Same result part by part, without the vectorized pass
+            part_ids = session.execute(select(Part.id)).scalars().all()
+            refresh_part_valuations(part_ids, session)
+            session.commit()
+            return len(part_ids)
+
+        now = as_of or utcnow()
+        frame = _rebuild_frame(session)
+        records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        for record in records:
+            date_value = record["oldest_batch_date"]
+            record["oldest_batch_date"] = date_value.to_pydatetime() if hasattr(date_value, "to_pydatetime") else date_value
+            record["updated_at"] = now
+
+        today = now.date()
+        session.execute(delete(PartValuation))
+        session.execute(delete(PartValuationHistory).where(PartValuationHistory.valuation_date == today))
+        if records:
+            session.execute(insert(PartValuation.__table__), records)
+            session.execute(insert(PartValuationHistory.__table__), [
+                {"part_id": record["part_id"], "valuation_date": today,
+                 "quantity_on_hand": record["quantity_on_hand"], "total_value": record["total_value"]}
+                for record in records
+            ])
+        session.commit()
+        logger.info(f"Part valuations rebuilt: {len(records)} parts, total value {frame['total_value'].sum():.2f}")
+        return len(records)
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error rebuilding part valuations: {e}", exc_info=True)
+        raise
+    finally:
+        if should_close:
+            session.close()
+
+
+def ensure_part_valuations(session: Session) -> bool:
+    """Rebuild the snapshot if it is empty while stock exists (first start after the upgrade)"""
+    if session.query(PartValuation.part_id).first() is not None:
+        return False
+    if session.query(InventoryLevel.id).first() is None:
+        return False
+    rebuild_part_valuations(session=session)
+    return True
+
+
+def get_part_valuation(part_id: int, session: Session = None) -> Optional[PartValuation]:
+    session, should_close = _get_read_session(session)
+    try:
+        return session.get(PartValuation, part_id)
+    finally:
+        if should_close:
+            session.close()
+
+
+def get_part_valuations(part_ids: Sequence[int], session: Session = None) -> Dict[int, PartValuation]:
+    """Snapshots of the given parts by part id"""
+    session, should_close = _get_read_session(session)
+    try:
+        valuations = {}
+        for chunk in _chunks(sorted(set(part_ids))):
+            for row in session.query(PartValuation).filter(PartValuation.part_id.in_(chunk)):
+                valuations[row.part_id] = row
+        return valuations
+    finally:
+        if should_close:
+            session.close()
+
+
+def get_total_inventory_value(part_ids=None, session: Session = None) -> float:
+    """
+    Total FIFO value of the stock: one SUM over the snapshot
+
+    Args:
+        part_ids: Optional part id list or subquery to restrict the sum to
+    """
+    session, should_close = _get_read_session(session)
+    try:
+        query = session.query(func.coalesce(func.sum(PartValuation.total_value), 0.0))
+        if part_ids is not None:
+            query = query.filter(PartValuation.part_id.in_(part_ids))
+        return float(query.scalar() or 0.0)
+    finally:
+        if should_close:
+            session.close()
+
+
+def _history_at(session: Session, day: date, inclusive: bool) -> Dict[int, Tuple[int, float]]:
+    """Latest history row of every part on or before day (strictly before unless inclusive)"""
+    bound = PartValuationHistory.valuation_date <= day if inclusive else PartValuationHistory.valuation_date < day
+    latest = (
+        select(PartValuationHistory.part_id, func.max(PartValuationHistory.valuation_date).label("valuation_date"))
+        .where(bound)
+        .group_by(PartValuationHistory.part_id)
+        .subquery()
+    )
+    rows = session.execute(
+        select(PartValuationHistory.part_id, PartValuationHistory.quantity_on_hand, PartValuationHistory.total_value)
+        .join(latest, (latest.c.part_id == PartValuationHistory.part_id)
+              & (latest.c.valuation_date == PartValuationHistory.valuation_date))
+    )
+    return {part_id: (quantity, value) for part_id, quantity, value in rows}
+
+
+def get_valuation_changes(period_start: datetime, period_end: datetime, session: Session = None) -> Dict[int, Dict]:
+    """
+    Quantity and value of every part at the start and end of a period
+
+    The start is the last snapshot before period_start's day, the end the
+    last one up to period_end's day. Parts without a snapshot before the
+    period start from zero (history begins with the first rebuild).
+    """
+    session, should_close = _get_read_session(session)
+    try:
+        initial = _history_at(session, period_start.date(), inclusive=False)
+        final = _history_at(session, period_end.date(), inclusive=True)
+        changes = {}
+        for part_id in initial.keys() | final.keys():
+            initial_quantity, initial_value = initial.get(part_id, (0, 0.0))
+            final_quantity, final_value = final.get(part_id, (0, 0.0))
+            changes[part_id] = {
+                "initial_quantity": initial_quantity,
+                "initial_value": initial_value,
+                "final_quantity": final_quantity,
+                "final_value": final_value,
+            }
+        return changes
+    finally:
+        if should_close:
+            session.close()
@@ -9,52 +9,51 @@ from typing import Optional
 from datetime import datetime
 
 from sqlalchemy.orm import Session, joinedload
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable, KeepTogether, Flowable, PageBreak
-from reportlab.graphics.barcode import qr
-from reportlab.graphics.shapes import Drawing
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from tempfile import TemporaryDirectory
 
-try:
-    from PyPDF2 import PdfReader, PdfWriter
-    PYPDF2_AVAILABLE = True
-except ImportError:
+# python-docx and the PDF merger are imported on first use: the service is
+# imported at startup by the screens, documents are generated much later
+DOCX_AVAILABLE = None  # None = not attempted yet
+Document = None
+WD_ALIGN_PARAGRAPH = None
+WD_ALIGN_VERTICAL = None
+RGBColor = None
+Inches = None
+Cm = None
+Pt = None
+
+
+def _load_docx() -> bool:
+    """Import python-docx on first use; returns availability"""
+    global DOCX_AVAILABLE, Document, WD_ALIGN_PARAGRAPH, WD_ALIGN_VERTICAL, RGBColor, Inches, Cm, Pt
+    if DOCX_AVAILABLE is None:
+        try:
+            from docx import Document  # python-docx
+            from docx.enum.text import WD_ALIGN_PARAGRAPH
+            from docx.enum.table import WD_ALIGN_VERTICAL
+            from docx.shared import RGBColor, Inches, Cm, Pt
+            DOCX_AVAILABLE = True
+        except Exception:
+            DOCX_AVAILABLE = False
+    return DOCX_AVAILABLE
+
+
+def _load_pdf_merger():
+    """(PdfReader, PdfWriter) from PyPDF2 or pypdf, None if neither is installed"""
     try:
-        from pypdf import PdfReader, PdfWriter
-        PYPDF2_AVAILABLE = True
+        from PyPDF2 import PdfReader, PdfWriter
     except ImportError:
-        PYPDF2_AVAILABLE = False
-
-try:
-    from docx import Document  # python-docx
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.table import WD_ALIGN_VERTICAL
-    from docx.shared import RGBColor, Inches, Cm, Pt
-    DOCX_AVAILABLE = True
-except Exception:
-    DOCX_AVAILABLE = False
-    WD_ALIGN_PARAGRAPH = None
-    WD_ALIGN_VERTICAL = None
-    RGBColor = None
-    Inches = None
-    Cm = None
-    Pt = None
-
-try:
-    from docx2pdf import convert as docx_to_pdf_convert
-    DOCX2PDF_AVAILABLE = True
-except Exception:
-    DOCX2PDF_AVAILABLE = False
+        try:
+            from pypdf import PdfReader, PdfWriter
+        except ImportError:
+            return None
+    return PdfReader, PdfWriter
 
 from database.models import Worksheet, WorksheetPart, WorksheetPDF, Machine, utcnow, PMTask, PMHistory, WorkRequestPDF, PMWorksheetPDF, User, Part, VacationRequest, VacationDocument
 from services.worksheet_service import _get_session
 from config.app_config import TEMPLATES_DIR
 from services.settings_service import get_selected_worksheet_template, get_selected_work_request_template, get_selected_scrapping_template
+from services.docx_template_service import render_template, render_batch
 
 import logging
 
@@ -75,66 +74,9 @@ def _format_dt(dt: Optional[datetime]) -> str:
     return dt.strftime("%Y-%m-%d %H:%M")
 
 
-def _replace_placeholders_in_docx(doc_path: Path, replacements: dict) -> Document:
-    """Replace placeholders in DOCX template and return modified document"""
-    if not DOCX_AVAILABLE:
-        raise ImportError("python-docx not available")
-    
-    doc = Document(str(doc_path))
-    
-    # Replace in paragraphs
-    for paragraph in doc.paragraphs:
-        original_text = paragraph.text
-        substituted_text = original_text
-        for key, value in replacements.items():
-            substituted_text = substituted_text.replace(key, str(value) if value is not None else "-")
-        
-        if original_text != substituted_text:
-            # Clear all runs and rebuild
-            for _ in range(len(paragraph.runs)):
-                run_elem = paragraph.runs[0]._element
-                run_elem.getparent().remove(run_elem)
-            if substituted_text:
-                paragraph.add_run(substituted_text)
-    
-    # Replace in tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                # Replace in paragraphs within cells
-                for paragraph in cell.paragraphs:
-                    original_text = paragraph.text
-                    substituted_text = original_text
-                    for key, value in replacements.items():
-                        substituted_text = substituted_text.replace(key, str(value) if value is not None else "-")
-                    
-                    if original_text != substituted_text:
-                        # Clear all runs and rebuild
-                        for _ in range(len(paragraph.runs)):
-                            run_elem = paragraph.runs[0]._element
-                            run_elem.getparent().remove(run_elem)
-                        if substituted_text:
-                            paragraph.add_run(substituted_text)
-                
-                # Also replace directly in cell text (in case there's no paragraph)
-                if cell.text:
-                    original_cell_text = cell.text
-                    substituted_cell_text = original_cell_text
-                    for key, value in replacements.items():
-                        substituted_cell_text = substituted_cell_text.replace(key, str(value) if value is not None else "-")
-                    
-                    if original_cell_text != substituted_cell_text:
-                        # Clear all paragraphs and set new text
-                        cell.paragraphs.clear()
-                        if substituted_cell_text:
-                            cell.paragraphs[0].add_run(substituted_cell_text)
-    
-    return doc
-
-
-def _populate_parts_table(doc: Document, parts: list):
+def _populate_parts_table(doc: "Document", parts: list):
     """Populate the parts table in the DOCX document with used parts data"""
-    if not DOCX_AVAILABLE:
+    if not _load_docx():
         return
     
     # Find the parts table (look for table with "SKU" in first header cell)
@@ -237,7 +179,7 @@ def generate_worksheet_pdf(worksheet_id: int, generated_by: str = "system", outp
             output_dir = _ensure_output_dir()
             docx_path = output_dir / f"worksheet_{ws.id}.docx"
 
-        if not DOCX_AVAILABLE:
+        if not _load_docx():
             raise ImportError("python-docx not available for DOCX generation")
 
         # Use worksheet DOCX template
@@ -273,13 +215,13 @@ def generate_worksheet_pdf(worksheet_id: int, generated_by: str = "system", outp
         else:
             replacements["${worksheet.parts}"] = "-"
         
-        # Load template, replace placeholders, save as DOCX
-        doc = _replace_placeholders_in_docx(template_path, replacements)
-        
-        # Populate parts table dynamically
-        _populate_parts_table(doc, ws.parts if ws.parts else [])
-        
-        doc.save(str(docx_path))
+        # Fill compiled template, populate parts table dynamically, save as DOCX
+        render_template(
+            template_path,
+            replacements,
+            docx_path,
+            post_process=lambda doc: _populate_parts_table(doc, ws.parts if ws.parts else []),
+        )
         
         # Save record (storing DOCX path)
         pdf_record = session.query(WorksheetPDF).filter_by(worksheet_id=ws.id).first()
@@ -298,6 +240,31 @@ def generate_worksheet_pdf(worksheet_id: int, generated_by: str = "system", outp
             session.close()
 
 
+def _work_request_replacements(task: PMTask, generated_by: str) -> dict:
+    """Placeholder values for the work request template"""
+    return {
+        "${pm_task.id}": str(task.id),
+        "${pm_task.task_name}": task.task_name or "-",
+        "${pm_task.task_type}": task.task_type or "-",
+        "${pm_task.priority}": task.priority or "-",
+        "${pm_task.status}": task.status or "-",
+        "${pm_task.due_date}": _format_dt(task.due_date or task.next_due_date),
+        "${pm_task.estimated_duration_minutes}": f"{task.estimated_duration_minutes} perc / minutes" if task.estimated_duration_minutes else "-",
+        "${pm_task.task_description}": task.task_description or "-",
+        "${pm_task.location}": task.location or "-",
+        "${pm_task.created_at}": _format_dt(task.created_at),
+        "${machine.name}": task.machine.name if task.machine else "-",
+        "${machine.serial_number}": task.machine.serial_number if task.machine and task.machine.serial_number else "-",
+        "${machine.manufacturer_model}": f"{task.machine.manufacturer or '-'} / {task.machine.model or '-'}" if task.machine else "-",
+        "${production_line.name}": task.machine.production_line.name if task.machine and task.machine.production_line else "-",
+        "${assigned_user.full_name}": task.assigned_user.full_name if task.assigned_user else "Globális / Global",
+        "${assignment_type}": "Személyre szabott / Assigned" if task.assigned_user else "Globális / Global",
+        "${created_by_user.full_name}": task.created_by_user.full_name if task.created_by_user else generated_by,
+        "${generated_at}": _format_dt(utcnow()),
+        "${generated_by}": generated_by,
+    }
+
+
 def generate_work_request_pdf(pm_task_id: int, generated_by: str = "system", output_path: str | None = None, session: Session = None) -> str:
     """Generate work request PDF for PM task (ISO 9001)"""
     session, should_close = _get_session(session)
@@ -326,33 +293,11 @@ def generate_work_request_pdf(pm_task_id: int, generated_by: str = "system", out
 
         # Use DOCX template if available (check selected template first)
         template_path = get_selected_work_request_template(session) or (TEMPLATES_DIR / "work_request_template.docx")
-        if template_path.exists() and DOCX_AVAILABLE:
-            # Prepare replacements
-            replacements = {
-                "${pm_task.id}": str(task.id),
-                "${pm_task.task_name}": task.task_name or "-",
-                "${pm_task.task_type}": task.task_type or "-",
-                "${pm_task.priority}": task.priority or "-",
-                "${pm_task.status}": task.status or "-",
-                "${pm_task.due_date}": _format_dt(task.due_date or task.next_due_date),
-                "${pm_task.estimated_duration_minutes}": f"{task.estimated_duration_minutes} perc / minutes" if task.estimated_duration_minutes else "-",
-                "${pm_task.task_description}": task.task_description or "-",
-                "${pm_task.location}": task.location or "-",
-                "${pm_task.created_at}": _format_dt(task.created_at),
-                "${machine.name}": task.machine.name if task.machine else "-",
-                "${machine.serial_number}": task.machine.serial_number if task.machine and task.machine.serial_number else "-",
-                "${machine.manufacturer_model}": f"{task.machine.manufacturer or '-'} / {task.machine.model or '-'}" if task.machine else "-",
-                "${production_line.name}": task.machine.production_line.name if task.machine and task.machine.production_line else "-",
-                "${assigned_user.full_name}": task.assigned_user.full_name if task.assigned_user else "Globális / Global",
-                "${assignment_type}": "Személyre szabott / Assigned" if task.assigned_user else "Globális / Global",
-                "${created_by_user.full_name}": task.created_by_user.full_name if task.created_by_user else generated_by,
-                "${generated_at}": _format_dt(utcnow()),
-                "${generated_by}": generated_by,
-            }
+        if template_path.exists() and _load_docx():
+            replacements = _work_request_replacements(task, generated_by)
             
-            # Load template, replace placeholders, save as DOCX
-            doc = _replace_placeholders_in_docx(template_path, replacements)
-            doc.save(str(docx_path))
+            # Fill compiled template, save as DOCX
+            render_template(template_path, replacements, docx_path)
         else:
             # No fallback - template is required
             raise FileNotFoundError(f"Work request template not found: {template_path}")
@@ -376,6 +321,94 @@ def generate_work_request_pdf(pm_task_id: int, generated_by: str = "system", out
             session.close()
 
 
+def generate_work_requests_batch(
+    pm_task_ids: list[int],
+    generated_by: str = "system",
+    output_dir: str | None = None,
+    max_workers: int | None = None,
+    progress_callback=None,
+    session: Session = None
+) -> dict:
+    """
+    Generate work request documents for many PM tasks at once (e.g. next week's PM plan).
+    
+    Placeholder values are collected with one query in this process, the DOCX
+    rendering runs in a process pool, and the WorkRequestPDF records are written
+    in a single commit.
+    
+    Args:
+        pm_task_ids: PM task IDs
+        generated_by: Name written into the documents
+        output_dir: Target directory (defaults to generated_pdfs)
+        max_workers: Process pool size (defaults to CPU count)
+        progress_callback: Called as callback(done, total)
+        session: Database session
+    
+    Returns:
+        dict: render_batch result (rendered paths, failures, documents_per_second)
+    """
+    if not _load_docx():
+        raise ImportError("python-docx not available for DOCX generation")
+    
+    session, should_close = _get_session(session)
+    try:
+        template_path = get_selected_work_request_template(session) or (TEMPLATES_DIR / "work_request_template.docx")
+        if not template_path.exists():
+            raise FileNotFoundError(f"Work request template not found: {template_path}")
+        
+        target_dir = Path(output_dir) if output_dir else _ensure_output_dir()
+        target_dir.mkdir(parents=True, exist_ok=True)
+        
+        tasks = (
+            session.query(PMTask)
+            .options(
+                joinedload(PMTask.machine).joinedload(Machine.production_line),
+                joinedload(PMTask.assigned_user),
+                joinedload(PMTask.created_by_user),
+            )
+            .filter(PMTask.id.in_(pm_task_ids))
+            .all()
+        )
+        
+        jobs = []
+        tasks_by_path = {}
+        for task in tasks:
+            docx_path = target_dir / f"work_request_{task.id}.docx"
+            jobs.append((template_path, _work_request_replacements(task, generated_by), docx_path))
+            tasks_by_path[str(docx_path)] = task
+        
+        result = render_batch(jobs, max_workers=max_workers, progress_callback=progress_callback)
+        
+        # Save records for every rendered document in one transaction
+        rendered_task_ids = [tasks_by_path[path].id for path in result["rendered"]]
+        existing = {
+            record.pm_task_id: record
+            for record in session.query(WorkRequestPDF).filter(WorkRequestPDF.pm_task_id.in_(rendered_task_ids)).all()
+        } if rendered_task_ids else {}
+        now = utcnow()
+        for path in result["rendered"]:
+            task = tasks_by_path[path]
+            pdf_record = existing.get(task.id) or WorkRequestPDF(pm_task_id=task.id)
+            pdf_record.pdf_path = path
+            pdf_record.generated_at = now
+            pdf_record.page_count = 1
+            if task.created_by_user_id:
+                pdf_record.generated_by_user_id = task.created_by_user_id
+            session.add(pdf_record)
+        session.commit()
+        
+        missing = set(pm_task_ids) - {task.id for task in tasks}
+        if missing:
+            logger.warning(f"Work request batch: PM tasks not found: {sorted(missing)}")
+        return result
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        if should_close:
+            session.close()
+
+
 def generate_pm_worksheet_pdf(pm_history_id: int, generated_by: str = "system", output_path: str | None = None, session: Session = None) -> str:
     """Generate worksheet PDF for completed PM task (ISO 9001)"""
     session, should_close = _get_session(session)
@@ -406,7 +439,7 @@ def generate_pm_worksheet_pdf(pm_history_id: int, generated_by: str = "system",
 
         # Use worksheet DOCX template (same as regular worksheets)
         template_path = get_selected_worksheet_template(session) or (TEMPLATES_DIR / "worksheet_template.docx")
-        if template_path.exists() and DOCX_AVAILABLE:
+        if template_path.exists() and _load_docx():
             # Prepare replacements for worksheet template
             replacements = {
                 "${worksheet.id}": str(history.id),
@@ -425,27 +458,16 @@ def generate_pm_worksheet_pdf(pm_history_id: int, generated_by: str = "system",
                 "${generated_by}": generated_by,
             }
             
-            # Load template, replace placeholders, save as DOCX
-            doc = _replace_placeholders_in_docx(template_path, replacements)
-            
             # Add parts information if worksheet has parts
             if history.worksheet and history.worksheet.parts:
                 parts_list = []
                 for link in history.worksheet.parts:
                     part = link.part
                     parts_list.append(f"{part.sku if part else '-'} - {part.name if part else '-'} ({link.quantity_used}x)")
-                # Try to find and replace parts placeholder in document
-                for paragraph in doc.paragraphs:
-                    if "${worksheet.parts}" in paragraph.text:
-                        paragraph.text = paragraph.text.replace("${worksheet.parts}", "\n".join(parts_list) if parts_list else "-")
-                for table in doc.tables:
-                    for row in table.rows:
-                        for cell in row.cells:
-                            for paragraph in cell.paragraphs:
-                                if "${worksheet.parts}" in paragraph.text:
-                                    paragraph.text = paragraph.text.replace("${worksheet.parts}", "\n".join(parts_list) if parts_list else "-")
+                replacements["${worksheet.parts}"] = "\n".join(parts_list) if parts_list else "-"
             
-            doc.save(str(docx_path))
+            # Fill compiled template, save as DOCX
+            render_template(template_path, replacements, docx_path)
         else:
             # No fallback - template is required
             raise FileNotFoundError(f"PM worksheet template not found: {template_path}")
@@ -471,8 +493,10 @@ def generate_pm_worksheet_pdf(pm_history_id: int, generated_by: str = "system",
 
 def merge_pdfs(pdf_paths: list[str], output_path: str) -> str:
     """Merge multiple PDFs into one document"""
-    if not PYPDF2_AVAILABLE:
+    merger = _load_pdf_merger()
+    if merger is None:
         raise ImportError("PyPDF2 or pypdf not available for PDF merging")
+    PdfReader, PdfWriter = merger
     
     if not pdf_paths:
         raise ValueError("No PDF paths provided")
@@ -553,7 +577,7 @@ def generate_scrapping_docx(
             template_path = TEMPLATES_DIR / "default_scrapping_template.docx"
             if not template_path.exists():
                 # Create a simple default template
-                if not DOCX_AVAILABLE:
+                if not _load_docx():
                     raise ImportError("python-docx not available for DOCX generation")
                 
                 doc = Document()
@@ -570,7 +594,7 @@ def generate_scrapping_docx(
         output_dir = _ensure_output_dir()
         docx_path = output_dir / f"scrapping_{entity_type.lower()}_{entity_id}_{utcnow().strftime('%Y%m%d_%H%M%S')}.docx"
         
-        if not DOCX_AVAILABLE:
+        if not _load_docx():
             raise ImportError("python-docx not available for DOCX generation")
         
         # Get current user
@@ -743,7 +767,7 @@ def generate_vacation_document(
         
         # Create default template if it doesn't exist
         if not template_path.exists():
-            if not DOCX_AVAILABLE:
+            if not _load_docx():
                 raise ImportError("python-docx not available for DOCX generation")
             
             doc = Document()
@@ -771,7 +795,7 @@ def generate_vacation_document(
             output_dir = _ensure_output_dir()
             docx_path = output_dir / f"vacation_request_{vacation_request_id}_{utcnow().strftime('%Y%m%d_%H%M%S')}.docx"
         
-        if not DOCX_AVAILABLE:
+        if not _load_docx():
             raise ImportError("python-docx not available for DOCX generation")
         
         # Get user information
@@ -798,9 +822,8 @@ def generate_vacation_document(
             "${generated_at}": _format_dt(utcnow()),
         }
         
-        # Load template, replace placeholders, save as DOCX
-        doc = _replace_placeholders_in_docx(template_path, replacements)
-        doc.save(str(docx_path))
+        # Fill compiled template, save as DOCX
+        render_template(template_path, replacements, docx_path)
         
         # Save document record
         from services.context_service import get_current_user_id
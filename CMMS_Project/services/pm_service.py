@@ -3,15 +3,18 @@ Preventive Maintenance (PM) szolgáltatás
 """
 
 from datetime import timedelta, datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Tuple
 from pathlib import Path
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 import uuid
 
 from database.session_manager import SessionLocal
 from database.models import PMTask, PMHistory, Machine, User, utcnow
+from database.query_profiler import profiled
 from config.constants import PM_STATUS_COMPLETED, PM_STATUS_SKIPPED, PM_STATUS_PENDING
 from utils.localization_helper import get_localized_error
+from utils.pagination import keyset_after_desc
 from utils.error_handler import (
     ValidationError,
     BusinessLogicError,
@@ -578,6 +581,7 @@ def record_execution(task_id: int, assigned_to_user_id: Optional[int] = None,
             session.close()
 
 
+@profiled
 def list_due_tasks(reference_time=None, user_id: Optional[int] = None, session: Session = None, include_future: bool = True) -> List[PMTask]:
     """List due PM tasks, optionally filtered by assigned user
     
@@ -615,6 +619,7 @@ def list_due_tasks(reference_time=None, user_id: Optional[int] = None, session:
             session.close()
 
 
+@profiled
 def list_pm_history(
     user_id: Optional[int] = None,
     task_id: Optional[int] = None,
@@ -652,6 +657,111 @@ def list_pm_history(
             session.close()
 
 
+def _pm_history_criteria(
+    user_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    completion_status: Optional[str] = None,
+) -> list:
+    """WHERE criteria of the list_pm_history filters"""
+    criteria = []
+    if task_id:
+        criteria.append(PMHistory.pm_task_id == task_id)
+    if completion_status:
+        criteria.append(PMHistory.completion_status == completion_status)
+    if user_id:
+        criteria.append(
+            (PMHistory.assigned_to_user_id == user_id) | (PMHistory.completed_by_user_id == user_id)
+        )
+    return criteria
+
+
+def iter_pm_history(
+    user_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    completion_status: Optional[str] = None,
+    batch_size: int = 1000,
+    session: Session = None
+) -> Iterator[PMHistory]:
+    """
+    Iterate PM history records (most recent first) in batches of `batch_size`
+    rows (yield_per), with the same filters as list_pm_history.
+    """
+    session, should_close = _get_session(session)
+    try:
+        stmt = (
+            select(PMHistory)
+            .options(
+                joinedload(PMHistory.pm_task).joinedload(PMTask.machine),
+                joinedload(PMHistory.assigned_user),
+                joinedload(PMHistory.completed_user),
+            )
+            .order_by(PMHistory.executed_date.desc(), PMHistory.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        stmt = stmt.where(*_pm_history_criteria(user_id, task_id, completion_status))
+        yield from session.execute(stmt).scalars()
+    finally:
+        if should_close:
+            session.close()
+
+
+def count_pm_history(
+    user_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    completion_status: Optional[str] = None,
+    session: Session = None
+) -> int:
+    """Number of PM history records matching the list_pm_history filters (COUNT only)"""
+    session, should_close = _get_session(session)
+    try:
+        stmt = select(func.count(PMHistory.id)).where(
+            *_pm_history_criteria(user_id, task_id, completion_status)
+        )
+        return session.execute(stmt).scalar() or 0
+    finally:
+        if should_close:
+            session.close()
+
+
+@profiled
+def list_pm_history_page(
+    user_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    completion_status: Optional[str] = None,
+    after: Optional[Tuple[Optional[datetime], int]] = None,
+    limit: int = 50,
+    session: Session = None
+) -> List[PMHistory]:
+    """
+    One keyset page of PM history, most recent first (ORDER BY executed_date DESC, id DESC)
+
+    Args:
+        after: (executed_date, id) of the last record of the previous page
+        limit: Page size
+    """
+    session, should_close = _get_session(session)
+    try:
+        stmt = (
+            select(PMHistory)
+            .options(
+                joinedload(PMHistory.pm_task).joinedload(PMTask.machine),
+                joinedload(PMHistory.assigned_user),
+                joinedload(PMHistory.completed_user),
+            )
+            .where(*_pm_history_criteria(user_id, task_id, completion_status))
+            .order_by(PMHistory.executed_date.desc(), PMHistory.id.desc())
+            .limit(limit)
+        )
+        keyset = keyset_after_desc(PMHistory.executed_date, PMHistory.id, after)
+        if keyset is not None:
+            stmt = stmt.where(keyset)
+        return session.execute(stmt).scalars().all()
+    finally:
+        if should_close:
+            session.close()
+
+
+@profiled
 def list_pm_tasks(user_id: Optional[int] = None, status: Optional[str] = None, 
                  machine_id: Optional[int] = None, session: Session = None) -> List[PMTask]:
     """List all PM tasks, optionally filtered by assigned user, status, or machine
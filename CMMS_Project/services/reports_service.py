@@ -8,10 +8,11 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 from sqlalchemy.orm import joinedload
 
-from database.session_manager import SessionLocal
+from database.session_manager import ReadSessionLocal
 from database.models import (
     Worksheet, WorksheetPart, PMHistory, PMTask, ServiceRecord, User, Machine
 )
+from database.query_profiler import profiled
 from sqlalchemy import distinct, case
 
 import logging
@@ -25,7 +26,7 @@ _stats_cache = LRUCache(max_size=50, default_ttl=300)
 
 def _get_session(session: Optional[Session]) -> (Session, bool):
     if session is None:
-        return SessionLocal(), True
+        return ReadSessionLocal(), True
     return session, False
 
 
@@ -302,6 +303,19 @@ def get_task_statistics(period: str = "month", user_id: Optional[int] = None,
             session.close()
 
 
+@profiled
+def compute_statistics(period: str = "month", user_id: Optional[int] = None,
+                       machine_id: Optional[int] = None, status: Optional[str] = None,
+                       priority: Optional[str] = None, session: Session = None) -> Dict:
+    """Cost, time and task statistics for period (uncached)"""
+    return {
+        'cost': get_cost_statistics(period, user_id, machine_id, status, priority, session),
+        'time': get_time_statistics(period, user_id, machine_id, status, priority, session),
+        'tasks': get_task_statistics(period, user_id, machine_id, status, priority, session),
+    }
+
+
+@profiled
 def get_all_statistics(period: str = "month", user_id: Optional[int] = None,
                       machine_id: Optional[int] = None, status: Optional[str] = None,
                       priority: Optional[str] = None, session: Session = None) -> Dict:
@@ -316,17 +330,14 @@ def get_all_statistics(period: str = "month", user_id: Optional[int] = None,
         return cached_result
     
     # Calculate statistics
-    result = {
-        'cost': get_cost_statistics(period, user_id, machine_id, status, priority, session),
-        'time': get_time_statistics(period, user_id, machine_id, status, priority, session),
-        'tasks': get_task_statistics(period, user_id, machine_id, status, priority, session),
-    }
+    result = compute_statistics(period, user_id, machine_id, status, priority, session)
     
     # Cache for 5 minutes
     _stats_cache.set(cache_key, result, ttl=300)
     return result
 
 
+@profiled
 def get_period_comparison(periods: List[str], user_id: Optional[int] = None,
                          machine_id: Optional[int] = None, status: Optional[str] = None,
                          priority: Optional[str] = None, session: Session = None) -> Dict:
@@ -337,6 +348,7 @@ def get_period_comparison(periods: List[str], user_id: Optional[int] = None,
     return result
 
 
+@profiled
 def get_technician_statistics(period: str = "month", session: Session = None) -> List[Dict]:
     """Get statistics grouped by technician/user"""
     session, should_close = _get_session(session)
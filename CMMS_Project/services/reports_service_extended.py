@@ -12,6 +12,7 @@ from database.session_manager import SessionLocal
 from database.models import (
     Worksheet, WorksheetPart, PMHistory, PMTask, ServiceRecord, User, Machine
 )
+from database.query_profiler import profiled
 from sqlalchemy import distinct
 
 import logging
@@ -25,6 +26,7 @@ def _get_session(session: Optional[Session]) -> (Session, bool):
     return session, False
 
 
+@profiled
 def get_trend_statistics(periods: List[str], user_id: Optional[int] = None, 
                         machine_id: Optional[int] = None, session: Session = None) -> Dict:
     """Get trend statistics across multiple periods"""
@@ -40,27 +42,31 @@ def get_trend_statistics(periods: List[str], user_id: Optional[int] = None,
         prev_period = periods[0]
         current_period = periods[-1]
         
-        prev_stats = trends.get(prev_period, {})
-        current_stats = trends.get(current_period, {})
-        
-        trends['_comparison'] = {
-            'cost_change': _calculate_percentage_change(
-                prev_stats.get('cost', {}).get('total_cost', 0),
-                current_stats.get('cost', {}).get('total_cost', 0)
-            ),
-            'time_change': _calculate_percentage_change(
-                prev_stats.get('time', {}).get('total_time_hours', 0),
-                current_stats.get('time', {}).get('total_time_hours', 0)
-            ),
-            'tasks_change': _calculate_percentage_change(
-                prev_stats.get('tasks', {}).get('total_tasks', 0),
-                current_stats.get('tasks', {}).get('total_tasks', 0)
-            ),
-        }
+        trends['_comparison'] = compare_statistics(
+            trends.get(prev_period, {}), trends.get(current_period, {})
+        )
     
     return trends
 
 
+def compare_statistics(prev_stats: Dict, current_stats: Dict) -> Dict:
+    """Percentage change of cost, time and task totals between two get_all_statistics() results"""
+    return {
+        'cost_change': _calculate_percentage_change(
+            prev_stats.get('cost', {}).get('total_cost', 0),
+            current_stats.get('cost', {}).get('total_cost', 0)
+        ),
+        'time_change': _calculate_percentage_change(
+            prev_stats.get('time', {}).get('total_time_hours', 0),
+            current_stats.get('time', {}).get('total_time_hours', 0)
+        ),
+        'tasks_change': _calculate_percentage_change(
+            prev_stats.get('tasks', {}).get('total_tasks', 0),
+            current_stats.get('tasks', {}).get('total_tasks', 0)
+        ),
+    }
+
+
 def _calculate_percentage_change(old_value: float, new_value: float) -> float:
     """Calculate percentage change between two values"""
     from decimal import Decimal
@@ -80,6 +86,7 @@ def _calculate_percentage_change(old_value: float, new_value: float) -> float:
     return ((new_value - old_value) / old_value) * 100.0
 
 
+@profiled
 def get_average_statistics(period: str = "month", user_id: Optional[int] = None, 
                           machine_id: Optional[int] = None, session: Session = None) -> Dict:
     """Get average statistics (average cost per task, average time per task, etc.)"""
@@ -128,6 +135,7 @@ def _get_days_in_period(period: str) -> int:
     return 1
 
 
+@profiled
 def get_machine_statistics(period: str = "month", machine_id: Optional[int] = None, 
                           session: Session = None) -> List[Dict]:
     """Get statistics grouped by machine"""
@@ -5,7 +5,7 @@ Provides unified search functionality across all entities
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, func
-from database.session_manager import SessionLocal
+from database.session_manager import ReadSessionLocal
 from database.models import Machine, Part, Worksheet, User, ProductionLine, StorageLocation
 import logging
 
@@ -16,7 +16,7 @@ def _get_session(session: Optional[Session]) -> tuple:
     """Get or create database session"""
     if session is not None:
         return session, False
-    return SessionLocal(), True
+    return ReadSessionLocal(), True
 
 
 def global_search(query: str, limit: int = 20, session: Session = None) -> Dict[str, List[Dict]]:
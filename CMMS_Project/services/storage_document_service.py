@@ -26,6 +26,7 @@ from database.models import PartLocation, StorageLocation, Part, User, utcnow
 from services.settings_service import get_selected_storage_receipt_template, get_selected_storage_transfer_template
 from config.app_config import TEMPLATES_DIR
 from services.storage_service import get_storage_location_path
+from services.docx_template_service import render_template
 import logging
 
 logger = logging.getLogger(__name__)
@@ -38,50 +39,6 @@ def _ensure_output_dir() -> Path:
     return output_dir
 
 
-def _replace_placeholders_in_docx(doc_path: Path, replacements: dict) -> Document:
-    """Replace placeholders in DOCX template and return modified document"""
-    if not DOCX_AVAILABLE:
-        raise ImportError("python-docx not available")
-    
-    doc = Document(str(doc_path))
-    
-    # Replace in paragraphs
-    for paragraph in doc.paragraphs:
-        original_text = paragraph.text
-        substituted_text = original_text
-        for key, value in replacements.items():
-            substituted_text = substituted_text.replace(key, str(value) if value is not None else "-")
-        
-        if original_text != substituted_text:
-            # Clear all runs and rebuild
-            for _ in range(len(paragraph.runs)):
-                run_elem = paragraph.runs[0]._element
-                run_elem.getparent().remove(run_elem)
-            if substituted_text:
-                paragraph.add_run(substituted_text)
-    
-    # Replace in tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                # Replace in paragraphs within cells
-                for paragraph in cell.paragraphs:
-                    original_text = paragraph.text
-                    substituted_text = original_text
-                    for key, value in replacements.items():
-                        substituted_text = substituted_text.replace(key, str(value) if value is not None else "-")
-                    
-                    if original_text != substituted_text:
-                        # Clear all runs and rebuild
-                        for _ in range(len(paragraph.runs)):
-                            run_elem = paragraph.runs[0]._element
-                            run_elem.getparent().remove(run_elem)
-                        if substituted_text:
-                            paragraph.add_run(substituted_text)
-    
-    return doc
-
-
 def generate_storage_receipt_document(
     part_location_id: int,
     output_path: Optional[Path] = None,
@@ -145,16 +102,13 @@ def generate_storage_receipt_document(
             "{CURRENT_DATE}": datetime.now().strftime("%Y-%m-%d %H:%M"),
         }
         
-        # Generate document
-        doc = _replace_placeholders_in_docx(template_path, replacements)
-        
-        # Save document
         if output_path is None:
             output_dir = _ensure_output_dir()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = output_dir / f"storage_receipt_{part_location_id}_{timestamp}.docx"
         
-        doc.save(str(output_path))
+        # Generate document from the compiled (cached) template
+        output_path = render_template(template_path, replacements, output_path)
         logger.info(f"Generated storage receipt document: {output_path}")
         return output_path
     
@@ -253,16 +207,13 @@ def generate_storage_transfer_document(
             "{NOTES}": transfer_notes if transfer_notes else "-",
         }
         
-        # Generate document
-        doc = _replace_placeholders_in_docx(template_path, replacements)
-        
-        # Save document
         if output_path is None:
             output_dir = _ensure_output_dir()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = output_dir / f"storage_transfer_{source_part_location_id}_{target_location_id}_{timestamp}.docx"
         
-        doc.save(str(output_path))
+        # Generate document from the compiled (cached) template
+        output_path = render_template(template_path, replacements, output_path)
         logger.info(f"Generated storage transfer document: {output_path}")
         return output_path
     
@@ -10,6 +10,7 @@ import sqlalchemy as sa
 from sqlalchemy import and_, or_, func
 from database.models import StorageLocation, PartLocation, Part, StockBatch, InventoryLevel, User
 from database.session_manager import SessionLocal
+from database.query_profiler import profiled
 from services.context_service import get_current_user_id
 from services.log_service import log_action
 from utils.error_handler import (
@@ -294,6 +295,7 @@ def get_storage_location(location_id: int, session: Session = None) -> Optional[
             session.close()
 
 
+@profiled
 def get_storage_location_tree(root_id: Optional[int] = None, session: Session = None) -> List[Dict]:
     """Get storage location hierarchy as tree structure"""
     session, should_close = _get_session(session)
@@ -866,6 +868,51 @@ def get_parts_at_location(
             session.close()
 
 
+def _parts_without_location_query(session: Session, *columns):
+    """Parts that have an inventory level but no PartLocation"""
+    return session.query(*columns).join(
+        InventoryLevel, Part.id == InventoryLevel.part_id
+    ).filter(
+        ~sa.exists().where(PartLocation.part_id == Part.id)
+    )
+
+
+def count_parts_without_location(session: Session = None) -> int:
+    """Number of stocked parts without a storage location (COUNT only)"""
+    session, should_close = _get_session(session)
+    try:
+        return _parts_without_location_query(session, func.count(Part.id)).scalar() or 0
+    finally:
+        if should_close:
+            session.close()
+
+
+@profiled
+def list_parts_without_location_page(
+    after_id: Optional[int] = None,
+    limit: int = 50,
+    session: Session = None
+) -> List[Dict]:
+    """
+    One keyset page (ordered by part id) of stocked parts without a storage location
+
+    Returns:
+        [{'id', 'name', 'sku', 'category', 'unit', 'quantity_on_hand'}]
+    """
+    session, should_close = _get_session(session)
+    try:
+        query = _parts_without_location_query(
+            session,
+            Part.id, Part.name, Part.sku, Part.category, Part.unit, InventoryLevel.quantity_on_hand,
+        )
+        if after_id is not None:
+            query = query.filter(Part.id > after_id)
+        return [row._asdict() for row in query.order_by(Part.id).limit(limit).all()]
+    finally:
+        if should_close:
+            session.close()
+
+
 def get_part_locations(part_id: int, session: Session = None) -> List[Dict]:
     """Get all storage locations for a specific part"""
     session, should_close = _get_session(session)
@@ -0,0 +1,808 @@
+"""
+Streaming export service for large inventory and report exports
+
+Rows are read from the database with server-side cursors (yield_per) and
+written straight into a write-only openpyxl worksheet and/or a CSV file, so
+memory stays flat regardless of the number of exported rows.
+"""
+
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, Dict, List, Iterable, Iterator, Callable, Sequence
+import csv
+import logging
+
+from sqlalchemy import select, func, and_
+from sqlalchemy.orm import Session
+
+from database.session_manager import ReadSessionLocal
+from database.models import (
+    Part, InventoryLevel, StockTransaction, StockBatch, Supplier, User, Worksheet, PMHistory
+)
+
+logger = logging.getLogger(__name__)
+
+# Try to import openpyxl (CSV export works without it)
+OPENPYXL_AVAILABLE = False
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+    from openpyxl.utils import get_column_letter
+    OPENPYXL_AVAILABLE = True
+except ImportError as e:
+    logger.error(f"openpyxl ImportError: {e}")
+    OPENPYXL_AVAILABLE = False
+
+# Rows fetched per database round-trip
+DEFAULT_BATCH_SIZE = 1000
+# Progress callback is invoked every N written rows
+PROGRESS_INTERVAL = 500
+
+# Shared named styles (registered once per workbook instead of per-cell styling)
+STYLE_HEADER = "cmms_header"
+STYLE_DATA = "cmms_data"
+STYLE_NUMBER = "cmms_number"
+STYLE_TITLE = "cmms_title"
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def _get_session(session: Optional[Session]):
+    if session is None:
+        return ReadSessionLocal(), True
+    return session, False
+
+
+def _format_currency(value: float) -> str:
+    """Format value as currency"""
+    return f"{value:,.2f} €"
+
+
+def _format_date(value: Optional[datetime]) -> str:
+    return value.strftime("%Y-%m-%d") if value else ""
+
+
+def _format_datetime(value: Optional[datetime]) -> str:
+    return value.strftime("%Y-%m-%d %H:%M") if value else ""
+
+
+def _thin_border():
+    side = Side(style='thin')
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
+def register_named_styles(wb) -> None:
+    """Register the shared header/data/number named styles on a workbook"""
+    existing = set(wb.named_styles)
+
+    if STYLE_HEADER not in existing:
+        header = NamedStyle(name=STYLE_HEADER)
+        header.font = Font(bold=True, size=12, color="FFFFFF")
+        header.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        header.alignment = Alignment(horizontal="center", vertical="center")
+        header.border = _thin_border()
+        wb.add_named_style(header)
+
+    if STYLE_DATA not in existing:
+        data = NamedStyle(name=STYLE_DATA)
+        data.alignment = Alignment(horizontal="left", vertical="center")
+        data.border = _thin_border()
+        wb.add_named_style(data)
+
+    if STYLE_NUMBER not in existing:
+        number = NamedStyle(name=STYLE_NUMBER)
+        number.alignment = Alignment(horizontal="right", vertical="center")
+        number.border = _thin_border()
+        wb.add_named_style(number)
+
+    if STYLE_TITLE not in existing:
+        title = NamedStyle(name=STYLE_TITLE)
+        title.font = Font(bold=True, size=16)
+        wb.add_named_style(title)
+
+
+class ExportColumn:
+    """Column definition for a streaming export"""
+
+    def __init__(self, header: str, key: str, width: int = 18, numeric: bool = False,
+                 formatter: Optional[Callable] = None):
+        self.header = header
+        self.key = key
+        self.width = width
+        self.numeric = numeric
+        self.formatter = formatter
+
+    def value(self, row: Dict):
+        value = row.get(self.key)
+        if self.formatter is not None:
+            return self.formatter(value)
+        return "" if value is None else value
+
+
+class _XlsxSink:
+    """Write-only worksheet sink (rows are flushed to disk by openpyxl)"""
+
+    def __init__(self, output_path: Path, sheet_title: str, title: Optional[str],
+                 columns: Sequence[ExportColumn]):
+        if not OPENPYXL_AVAILABLE:
+            raise ImportError("openpyxl is required for Excel export")
+        self.output_path = output_path
+        self.columns = columns
+        self.wb = Workbook(write_only=True)
+        register_named_styles(self.wb)
+        self.ws = self.wb.create_sheet(title=sheet_title)
+
+        # Column widths must be set before the first row is written
+        for col, column in enumerate(columns, 1):
+            self.ws.column_dimensions[get_column_letter(col)].width = column.width
+
+        if title:
+            self.ws.append([self._cell(title, STYLE_TITLE)])
+            self.ws.append([f"Dátum: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+            self.ws.append([])
+        self.ws.append([self._cell(column.header, STYLE_HEADER) for column in columns])
+
+    def _cell(self, value, style: str):
+        cell = WriteOnlyCell(self.ws, value=value)
+        cell.style = style
+        return cell
+
+    def write(self, values: List) -> None:
+        self.ws.append([
+            self._cell(value, STYLE_NUMBER if column.numeric else STYLE_DATA)
+            for column, value in zip(self.columns, values)
+        ])
+
+    def write_footer(self, values: List) -> None:
+        self.ws.append([])
+        footer = []
+        for value in values:
+            cell = WriteOnlyCell(self.ws, value=value)
+            if value not in (None, ""):
+                cell.font = Font(bold=True)
+            footer.append(cell)
+        self.ws.append(footer)
+
+    def close(self) -> None:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.wb.save(str(self.output_path))
+
+
+class _CsvSink:
+    """CSV fast path - no styling, one line per row"""
+
+    def __init__(self, output_path: Path, columns: Sequence[ExportColumn]):
+        self.output_path = output_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # utf-8-sig so Excel opens Hungarian characters correctly
+        self._file = open(output_path, 'w', newline='', encoding='utf-8-sig')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([column.header for column in columns])
+
+    def write(self, values: List) -> None:
+        self._writer.writerow(values)
+
+    def write_footer(self, values: List) -> None:
+        self._writer.writerow(values)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def stream_export(
+    rows: Iterable[Dict],
+    columns: Sequence[ExportColumn],
+    xlsx_path: Optional[Path] = None,
+    csv_path: Optional[Path] = None,
+    sheet_title: str = "Export",
+    title: Optional[str] = None,
+    total: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    footer: Optional[Callable[[Dict], Dict]] = None,
+) -> Dict:
+    """
+    Write rows to Excel and/or CSV in a single pass over the row iterator.
+
+    Args:
+        rows: Iterable of row dicts (typically a server-side cursor generator)
+        columns: Column definitions
+        xlsx_path: Target .xlsx file (write-only worksheet), optional
+        csv_path: Target .csv file, optional
+        sheet_title: Worksheet title
+        title: Optional title line above the table (Excel only)
+        total: Expected row count (for progress reporting)
+        progress_callback: Called as callback(written_rows, total)
+        footer: Optional function(totals) -> {column key: value} for a summary row;
+                totals holds the running sum of every numeric column
+
+    Returns:
+        Dict with row count and written paths
+    """
+    if xlsx_path is None and csv_path is None:
+        raise ValueError("At least one of xlsx_path or csv_path is required")
+
+    sinks = []
+    if xlsx_path is not None:
+        sinks.append(_XlsxSink(Path(xlsx_path), sheet_title, title, columns))
+    if csv_path is not None:
+        sinks.append(_CsvSink(Path(csv_path), columns))
+
+    totals = {column.key: 0 for column in columns if column.numeric}
+    count = 0
+    try:
+        for row in rows:
+            values = [column.value(row) for column in columns]
+            for sink in sinks:
+                sink.write(values)
+
+            for key in totals:
+                raw = row.get(key)
+                if isinstance(raw, (int, float)):
+                    totals[key] += raw
+
+            count += 1
+            if progress_callback and count % PROGRESS_INTERVAL == 0:
+                progress_callback(count, total)
+
+        if footer is not None:
+            footer_values = footer(totals)
+            values = [footer_values.get(column.key, "") for column in columns]
+            for sink in sinks:
+                sink.write_footer(values)
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    if progress_callback:
+        progress_callback(count, total if total is not None else count)
+
+    return {
+        "rows": count,
+        "xlsx_path": Path(xlsx_path) if xlsx_path is not None else None,
+        "csv_path": Path(csv_path) if csv_path is not None else None,
+    }
+
+
+# ============================================================================
+# ROW SOURCES (server-side cursor iteration)
+# ============================================================================
+
+def _full_inventory_statement():
+    """Single SELECT with correlated aggregates - no per-part follow-up queries"""
+    batch_qty = (
+        select(func.coalesce(func.sum(StockBatch.quantity_remaining), 0))
+        .where(and_(StockBatch.part_id == Part.id, StockBatch.quantity_remaining > 0))
+        .correlate(Part)
+        .scalar_subquery()
+    )
+    batch_value = (
+        select(func.coalesce(func.sum(StockBatch.quantity_remaining * StockBatch.unit_price), 0.0))
+        .where(and_(StockBatch.part_id == Part.id, StockBatch.quantity_remaining > 0))
+        .correlate(Part)
+        .scalar_subquery()
+    )
+    last_receipt = (
+        select(func.max(StockBatch.received_date))
+        .where(StockBatch.part_id == Part.id)
+        .correlate(Part)
+        .scalar_subquery()
+    )
+    last_issue = (
+        select(func.max(StockTransaction.timestamp))
+        .where(and_(StockTransaction.part_id == Part.id, StockTransaction.quantity < 0))
+        .correlate(Part)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            Part.id, Part.name, Part.sku, Part.category, Part.unit,
+            Part.safety_stock, Part.reorder_quantity, Part.buy_price,
+            Supplier.name.label("supplier_name"),
+            InventoryLevel.quantity_on_hand,
+            batch_qty.label("batch_qty"),
+            batch_value.label("batch_value"),
+            last_receipt.label("last_receipt_date"),
+            last_issue.label("last_issue_date"),
+        )
+        .join(InventoryLevel, InventoryLevel.part_id == Part.id)
+        .outerjoin(Supplier, Supplier.id == Part.supplier_id)
+        .order_by(Part.id)
+    )
+
+
+def _stock_valuation(qty: int, batch_qty: int, batch_value: float, buy_price: float):
+    """
+    FIFO value of the on-hand quantity from batch aggregates.
+
+    Matches inventory_service.get_fifo_cost when the on-hand quantity is fully
+    covered by batches (the normal invariant checked by validate_inventory_levels).
+    """
+    if qty <= 0:
+        return 0.0, 0.0
+    if not batch_qty:
+        unit_cost = buy_price or 0.0
+        return unit_cost, qty * unit_cost
+    if qty >= batch_qty:
+        stock_value = batch_value
+    else:
+        stock_value = batch_value * qty / batch_qty
+    return stock_value / qty, stock_value
+
+
+def iter_full_inventory_rows(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session: Session = None
+) -> Iterator[Dict]:
+    """Yield one dict per part (same keys as get_stock_quantity_report)"""
+    session, should_close = _get_session(session)
+    try:
+        stmt = _full_inventory_statement().execution_options(yield_per=batch_size)
+        for row in session.execute(stmt):
+            qty = row.quantity_on_hand or 0
+            safety_stock = row.safety_stock or 0
+            if qty == 0:
+                status = "out_of_stock"
+            elif qty <= safety_stock:
+                status = "low_stock"
+            else:
+                status = "ok"
+
+            fifo_unit_cost, stock_value = _stock_valuation(
+                qty, row.batch_qty or 0, row.batch_value or 0.0, row.buy_price
+            )
+            yield {
+                "part_id": row.id,
+                "part_name": row.name,
+                "sku": row.sku,
+                "category": row.category,
+                "unit": row.unit,
+                "current_quantity": qty,
+                "safety_stock": safety_stock,
+                "reorder_quantity": row.reorder_quantity or 0,
+                "buy_price": row.buy_price or 0.0,
+                "fifo_unit_cost": fifo_unit_cost,
+                "stock_value": stock_value,
+                "supplier_name": row.supplier_name or "",
+                "status": status,
+                "last_receipt_date": row.last_receipt_date,
+                "last_issue_date": row.last_issue_date,
+            }
+    finally:
+        if should_close:
+            session.close()
+
+
+def _stock_transaction_filters(part_id, start_date, end_date):
+    filters = []
+    if part_id:
+        filters.append(StockTransaction.part_id == part_id)
+    if start_date:
+        filters.append(StockTransaction.timestamp >= start_date)
+    if end_date:
+        filters.append(StockTransaction.timestamp <= end_date)
+    return filters
+
+
+def iter_stock_transaction_rows(
+    part_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session: Session = None
+) -> Iterator[Dict]:
+    """Yield stock transactions (newest first) as flat dicts"""
+    session, should_close = _get_session(session)
+    try:
+        stmt = (
+            select(
+                StockTransaction.id, StockTransaction.timestamp,
+                StockTransaction.transaction_type, StockTransaction.quantity,
+                StockTransaction.reference_type, StockTransaction.reference_id,
+                StockTransaction.notes,
+                Part.sku, Part.name.label("part_name"), Part.unit,
+                User.username,
+            )
+            .join(Part, Part.id == StockTransaction.part_id)
+            .outerjoin(User, User.id == StockTransaction.user_id)
+            .where(*_stock_transaction_filters(part_id, start_date, end_date))
+            .order_by(StockTransaction.timestamp.desc(), StockTransaction.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        for row in session.execute(stmt):
+            yield {
+                "transaction_id": row.id,
+                "timestamp": row.timestamp,
+                "transaction_type": row.transaction_type,
+                "quantity": row.quantity,
+                "reference": f"{row.reference_type} #{row.reference_id}" if row.reference_type else "",
+                "notes": row.notes or "",
+                "sku": row.sku,
+                "part_name": row.part_name,
+                "unit": row.unit,
+                "username": row.username or "",
+            }
+    finally:
+        if should_close:
+            session.close()
+
+
+def worksheet_row(ws: Worksheet) -> Dict:
+    """Flat export row of a worksheet (relations must be eager-loaded)"""
+    parts = ws.parts or []
+    return {
+        "worksheet_id": ws.id,
+        "title": ws.title,
+        "status": ws.status,
+        "machine_id": ws.machine_id,
+        "machine_name": ws.machine.name if ws.machine else "",
+        "assigned_user": ws.assigned_user.username if ws.assigned_user else "",
+        "breakdown_time": ws.breakdown_time,
+        "repair_finished_time": ws.repair_finished_time,
+        "total_downtime_hours": ws.total_downtime_hours or 0.0,
+        "fault_cause": ws.fault_cause or "",
+        "created_at": ws.created_at,
+        "closed_at": ws.closed_at,
+        "parts_count": len(parts),
+        "parts_cost": sum((wp.quantity_used or 0) * (wp.unit_cost_at_time or 0.0) for wp in parts),
+    }
+
+
+def iter_worksheet_rows(
+    machine_id: Optional[int] = None,
+    status: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session: Session = None
+) -> Iterator[Dict]:
+    """Yield worksheets (newest first) as flat dicts"""
+    from services import worksheet_service
+
+    session, should_close = _get_session(session)
+    try:
+        for ws in worksheet_service.iter_worksheets(machine_id, status, batch_size=batch_size, session=session):
+            yield worksheet_row(ws)
+    finally:
+        if should_close:
+            session.close()
+
+
+def pm_history_row(history: PMHistory) -> Dict:
+    """Flat export row of a PM history record (relations must be eager-loaded)"""
+    task = history.pm_task
+    return {
+        "history_id": history.id,
+        "executed_date": history.executed_date,
+        "task_name": task.task_name if task else "",
+        "machine_name": task.machine.name if task and task.machine else "",
+        "completion_status": history.completion_status,
+        "assigned_user": history.assigned_user.username if history.assigned_user else "",
+        "completed_by": history.completed_user.username if history.completed_user else "",
+        "duration_minutes": history.duration_minutes or 0,
+        "worksheet_id": history.worksheet_id,
+        "notes": history.notes or "",
+    }
+
+
+def iter_pm_history_rows(
+    user_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    completion_status: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session: Session = None
+) -> Iterator[Dict]:
+    """Yield PM history records (most recent first) as flat dicts"""
+    from services import pm_service
+
+    session, should_close = _get_session(session)
+    try:
+        for history in pm_service.iter_pm_history(
+            user_id, task_id, completion_status, batch_size=batch_size, session=session
+        ):
+            yield pm_history_row(history)
+    finally:
+        if should_close:
+            session.close()
+
+
+def count_full_inventory_rows(session: Session = None) -> int:
+    """Number of rows iter_full_inventory_rows will yield"""
+    session, should_close = _get_session(session)
+    try:
+        return session.execute(
+            select(func.count(Part.id)).join(InventoryLevel, InventoryLevel.part_id == Part.id)
+        ).scalar() or 0
+    finally:
+        if should_close:
+            session.close()
+
+
+def count_stock_transaction_rows(
+    part_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    session: Session = None
+) -> int:
+    """Number of rows iter_stock_transaction_rows will yield"""
+    session, should_close = _get_session(session)
+    try:
+        return session.execute(
+            select(func.count(StockTransaction.id))
+            .where(*_stock_transaction_filters(part_id, start_date, end_date))
+        ).scalar() or 0
+    finally:
+        if should_close:
+            session.close()
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+FULL_INVENTORY_COLUMNS = [
+    ExportColumn("Alkatrész neve", "part_name", width=30),
+    ExportColumn("SKU", "sku"),
+    ExportColumn("Kategória", "category"),
+    ExportColumn("Mértékegység", "unit", width=12),
+    ExportColumn("Jelenlegi készlet", "current_quantity", numeric=True),
+    ExportColumn("Biztonsági készlet", "safety_stock", numeric=True),
+    ExportColumn("Újrarendelési mennyiség", "reorder_quantity", numeric=True),
+    ExportColumn("Beszerzési ár", "buy_price", numeric=True, formatter=_format_currency),
+    ExportColumn("FIFO egységár", "fifo_unit_cost", numeric=True, formatter=_format_currency),
+    ExportColumn("Készlet érték", "stock_value", numeric=True, formatter=_format_currency),
+    ExportColumn("Szállító", "supplier_name", width=25),
+    ExportColumn("Státusz", "status", width=14),
+    ExportColumn("Utolsó beérkezés", "last_receipt_date", formatter=_format_date),
+    ExportColumn("Utolsó kiadás", "last_issue_date", formatter=_format_date),
+]
+
+STOCK_TRANSACTION_COLUMNS = [
+    ExportColumn("Azonosító", "transaction_id", width=12, numeric=True),
+    ExportColumn("Időpont", "timestamp", width=20,
+                 formatter=lambda v: v.strftime("%Y-%m-%d %H:%M:%S") if v else ""),
+    ExportColumn("SKU", "sku"),
+    ExportColumn("Alkatrész neve", "part_name", width=30),
+    ExportColumn("Típus", "transaction_type", width=16),
+    ExportColumn("Mennyiség", "quantity", width=12, numeric=True),
+    ExportColumn("Mértékegység", "unit", width=12),
+    ExportColumn("Hivatkozás", "reference", width=22),
+    ExportColumn("Felhasználó", "username"),
+    ExportColumn("Megjegyzés", "notes", width=40),
+]
+
+
+WORKSHEET_COLUMNS = [
+    ExportColumn("Azonosító", "worksheet_id", width=12, numeric=True),
+    ExportColumn("Cím", "title", width=30),
+    ExportColumn("Státusz", "status", width=16),
+    ExportColumn("Gép", "machine_name", width=25),
+    ExportColumn("Felelős", "assigned_user"),
+    ExportColumn("Meghibásodás", "breakdown_time", width=18, formatter=_format_datetime),
+    ExportColumn("Javítás vége", "repair_finished_time", width=18, formatter=_format_datetime),
+    ExportColumn("Állásidő (óra)", "total_downtime_hours", numeric=True),
+    ExportColumn("Hiba oka", "fault_cause", width=30),
+    ExportColumn("Létrehozva", "created_at", width=18, formatter=_format_datetime),
+    ExportColumn("Lezárva", "closed_at", width=18, formatter=_format_datetime),
+    ExportColumn("Alkatrészek", "parts_count", width=12, numeric=True),
+    ExportColumn("Alkatrész költség", "parts_cost", numeric=True, formatter=_format_currency),
+]
+
+PM_HISTORY_COLUMNS = [
+    ExportColumn("Azonosító", "history_id", width=12, numeric=True),
+    ExportColumn("Végrehajtva", "executed_date", width=18, formatter=_format_datetime),
+    ExportColumn("Feladat", "task_name", width=30),
+    ExportColumn("Gép", "machine_name", width=25),
+    ExportColumn("Státusz", "completion_status", width=14),
+    ExportColumn("Felelős", "assigned_user"),
+    ExportColumn("Elvégezte", "completed_by"),
+    ExportColumn("Időtartam (perc)", "duration_minutes", numeric=True),
+    ExportColumn("Munkalap", "worksheet_id", width=12),
+    ExportColumn("Megjegyzés", "notes", width=40),
+]
+
+
+def _default_output_path(prefix: str, suffix: str) -> Path:
+    output_dir = Path("generated_reports")
+    output_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return output_dir / f"{prefix}_{timestamp}{suffix}"
+
+
+def _resolve_paths(prefix: str, output_path: Optional[Path], fmt: str):
+    if fmt not in ("xlsx", "csv", "both"):
+        raise ValueError(f"Unknown export format: {fmt}")
+    if output_path is None:
+        base = _default_output_path(prefix, "")
+    else:
+        base = Path(output_path).with_suffix("")
+    xlsx_path = base.with_suffix(".xlsx") if fmt in ("xlsx", "both") else None
+    csv_path = base.with_suffix(".csv") if fmt in ("csv", "both") else None
+    return xlsx_path, csv_path
+
+
+def export_full_inventory_streaming(
+    output_path: Optional[Path] = None,
+    fmt: str = "xlsx",
+    progress_callback: Optional[ProgressCallback] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session: Session = None
+) -> Path:
+    """
+    Export full inventory with flat memory usage.
+
+    Args:
+        output_path: Target file (suffix is replaced according to fmt)
+        fmt: "xlsx", "csv" or "both"
+        progress_callback: Called as callback(written_rows, total)
+        batch_size: Rows fetched per database round-trip
+        session: Database session
+
+    Returns:
+        Path of the written file (the .xlsx file when fmt="both")
+    """
+    xlsx_path, csv_path = _resolve_paths("full_inventory", output_path, fmt)
+    session, should_close = _get_session(session)
+    try:
+        total = count_full_inventory_rows(session=session)
+        result = stream_export(
+            iter_full_inventory_rows(batch_size=batch_size, session=session),
+            FULL_INVENTORY_COLUMNS,
+            xlsx_path=xlsx_path,
+            csv_path=csv_path,
+            sheet_title="Teljes Készlet",
+            title="Teljes Készlet Kimutatás",
+            total=total,
+            progress_callback=progress_callback,
+            footer=lambda totals: {
+                "part_name": "Összesen:",
+                "current_quantity": totals["current_quantity"],
+                "stock_value": _format_currency(totals["stock_value"]),
+            },
+        )
+        logger.info(f"Full inventory exported ({result['rows']} rows) to {xlsx_path or csv_path}")
+        return xlsx_path or csv_path
+    finally:
+        if should_close:
+            session.close()
+
+
+def export_stock_transactions_streaming(
+    part_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    output_path: Optional[Path] = None,
+    fmt: str = "xlsx",
+    progress_callback: Optional[ProgressCallback] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session: Session = None
+) -> Path:
+    """
+    Export stock transactions with flat memory usage.
+
+    Args:
+        part_id: Optional part filter
+        start_date: Optional start of the period
+        end_date: Optional end of the period
+        output_path: Target file (suffix is replaced according to fmt)
+        fmt: "xlsx", "csv" or "both"
+        progress_callback: Called as callback(written_rows, total)
+        batch_size: Rows fetched per database round-trip
+        session: Database session
+
+    Returns:
+        Path of the written file (the .xlsx file when fmt="both")
+    """
+    xlsx_path, csv_path = _resolve_paths("stock_transactions", output_path, fmt)
+    session, should_close = _get_session(session)
+    try:
+        total = count_stock_transaction_rows(part_id, start_date, end_date, session=session)
+        result = stream_export(
+            iter_stock_transaction_rows(part_id, start_date, end_date,
+                                        batch_size=batch_size, session=session),
+            STOCK_TRANSACTION_COLUMNS,
+            xlsx_path=xlsx_path,
+            csv_path=csv_path,
+            sheet_title="Készletmozgások",
+            title="Készletmozgások",
+            total=total,
+            progress_callback=progress_callback,
+        )
+        logger.info(f"Stock transactions exported ({result['rows']} rows) to {xlsx_path or csv_path}")
+        return xlsx_path or csv_path
+    finally:
+        if should_close:
+            session.close()
+
+
+def export_worksheets_streaming(
+    machine_id: Optional[int] = None,
+    status: Optional[str] = None,
+    output_path: Optional[Path] = None,
+    fmt: str = "xlsx",
+    progress_callback: Optional[ProgressCallback] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session: Session = None
+) -> Path:
+    """
+    Export worksheets with flat memory usage.
+
+    Args:
+        machine_id: Optional machine filter
+        status: Optional status filter
+        output_path: Target file (suffix is replaced according to fmt)
+        fmt: "xlsx", "csv" or "both"
+        progress_callback: Called as callback(written_rows, total)
+        batch_size: Rows fetched per database round-trip
+        session: Database session
+
+    Returns:
+        Path of the written file (the .xlsx file when fmt="both")
+    """
+    xlsx_path, csv_path = _resolve_paths("worksheets", output_path, fmt)
+    session, should_close = _get_session(session)
+    try:
+        criteria = []
+        if machine_id:
+            criteria.append(Worksheet.machine_id == machine_id)
+        if status:
+            criteria.append(Worksheet.status == status)
+        total = session.execute(select(func.count(Worksheet.id)).where(*criteria)).scalar() or 0
+        result = stream_export(
+            iter_worksheet_rows(machine_id, status, batch_size=batch_size, session=session),
+            WORKSHEET_COLUMNS,
+            xlsx_path=xlsx_path,
+            csv_path=csv_path,
+            sheet_title="Munkalapok",
+            title="Munkalapok",
+            total=total,
+            progress_callback=progress_callback,
+        )
+        logger.info(f"Worksheets exported ({result['rows']} rows) to {xlsx_path or csv_path}")
+        return xlsx_path or csv_path
+    finally:
+        if should_close:
+            session.close()
+
+
+def export_pm_history_streaming(
+    user_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    completion_status: Optional[str] = None,
+    output_path: Optional[Path] = None,
+    fmt: str = "xlsx",
+    progress_callback: Optional[ProgressCallback] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session: Session = None
+) -> Path:
+    """
+    Export PM history with flat memory usage.
+
+    Args:
+        user_id: Optional filter (assigned to or completed by)
+        task_id: Optional PM task filter
+        completion_status: Optional status filter
+        output_path: Target file (suffix is replaced according to fmt)
+        fmt: "xlsx", "csv" or "both"
+        progress_callback: Called as callback(written_rows, total)
+        batch_size: Rows fetched per database round-trip
+        session: Database session
+
+    Returns:
+        Path of the written file (the .xlsx file when fmt="both")
+    """
+    xlsx_path, csv_path = _resolve_paths("pm_history", output_path, fmt)
+    session, should_close = _get_session(session)
+    try:
+        result = stream_export(
+            iter_pm_history_rows(user_id, task_id, completion_status, batch_size=batch_size, session=session),
+            PM_HISTORY_COLUMNS,
+            xlsx_path=xlsx_path,
+            csv_path=csv_path,
+            sheet_title="PM előzmények",
+            title="Karbantartási előzmények",
+            progress_callback=progress_callback,
+        )
+        logger.info(f"PM history exported ({result['rows']} rows) to {xlsx_path or csv_path}")
+        return xlsx_path or csv_path
+    finally:
+        if should_close:
+            session.close()
@@ -0,0 +1,172 @@
+"""
+Delta sync service
+Change feed for offline (Android) clients: rows changed and deleted since an
+opaque, resumable cursor, in bounded batches.
+
+The feed is keyset-paged on (updated_at, id) for live rows and on
+(deleted_at, id) for tombstones (see database.change_tracking), both backed by
+composite indexes, so every page is a single index range scan.
+"""
+
+import base64
+import json
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from database.session_manager import SessionLocal
+from database.models import InventoryLevel, Machine, Part, SyncTombstone, Worksheet, utcnow
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+MAX_BATCH_SIZE = 2000
+
+# Rows younger than this are held back until the next pull, so a transaction
+# that stamped updated_at earlier but committed later cannot slip behind a cursor
+SYNC_SETTLE_SECONDS = 5
+
+# entity name -> model; "inventory" additionally joins the stock level columns
+SYNC_ENTITIES = {
+    "machines": Machine,
+    "worksheets": Worksheet,
+    "assets": Part,
+    "inventory": Part,
+}
+
+_INVENTORY_COLUMNS = (
+    InventoryLevel.quantity_on_hand,
+    InventoryLevel.quantity_reserved,
+    InventoryLevel.bin_location,
+)
+
+
+class SyncServiceError(Exception):
+    """Generic delta sync error"""
+    pass
+
+
+class UnknownSyncEntityError(SyncServiceError):
+    """Entity is not exposed through the sync feed"""
+    pass
+
+
+class InvalidSyncCursorError(SyncServiceError):
+    """Cursor could not be decoded"""
+    pass
+
+
+def _get_session(session: Optional[Session]) -> (Session, bool):
+    if session is None:
+        return SessionLocal(), True
+    return session, False
+
+
+def encode_cursor(updated: Optional[Tuple[datetime, int]], deleted: Optional[Tuple[datetime, int]]) -> str:
+    """Opaque cursor: urlsafe base64 of the last (timestamp, id) seen for rows and tombstones"""
+    payload = {
+        "u": [updated[0].isoformat(), updated[1]] if updated else None,
+        "d": [deleted[0].isoformat(), deleted[1]] if deleted else None,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Tuple[Optional[Tuple[datetime, int]], Optional[Tuple[datetime, int]]]:
+    """Inverse of encode_cursor; an empty cursor means a full sync"""
+    if not cursor:
+        return None, None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+
+        def position(value):
+            if value is None:
+                return None
+            stamp, row_id = value
+            return datetime.fromisoformat(stamp), int(row_id)
+
+        return position(payload.get("u")), position(payload.get("d"))
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise InvalidSyncCursorError(f"Invalid sync cursor: {cursor}") from e
+
+
+def _serialize(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _after(column_ts, column_id, position):
+    """Keyset predicate (ts, id) > position, written out for portability"""
+    stamp, row_id = position
+    return or_(column_ts > stamp, and_(column_ts == stamp, column_id > row_id))
+
+
+def get_changes(
+    entity: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_BATCH_SIZE,
+    session: Optional[Session] = None,
+) -> Dict:
+    """
+    One page of the change feed for an entity.
+
+    Returns:
+        {entity, items, deleted, cursor, has_more, server_time}. Clients store
+        `cursor` and keep pulling while `has_more` is true.
+    """
+    model = SYNC_ENTITIES.get(entity)
+    if model is None:
+        raise UnknownSyncEntityError(f"Unknown sync entity: {entity}")
+    limit = max(1, min(int(limit), MAX_BATCH_SIZE))
+    updated_pos, deleted_pos = decode_cursor(cursor)
+
+    session, should_close = _get_session(session)
+    try:
+        server_time = utcnow().replace(tzinfo=None)
+        settled = server_time - timedelta(seconds=SYNC_SETTLE_SECONDS)
+        table = model.__table__
+
+        stmt = select(*table.c)
+        if entity == "inventory":
+            stmt = select(*table.c, *_INVENTORY_COLUMNS).outerjoin(
+                InventoryLevel, InventoryLevel.part_id == table.c.id
+            )
+        stmt = stmt.where(table.c.updated_at.isnot(None), table.c.updated_at <= settled)
+        if updated_pos:
+            stmt = stmt.where(_after(table.c.updated_at, table.c.id, updated_pos))
+        stmt = stmt.order_by(table.c.updated_at, table.c.id).limit(limit + 1)
+        rows = session.execute(stmt).mappings().all()
+
+        tomb = SyncTombstone.__table__
+        tomb_stmt = select(tomb.c.id, tomb.c.entity_id, tomb.c.deleted_at).where(
+            tomb.c.table_name == table.name, tomb.c.deleted_at <= settled
+        )
+        if deleted_pos:
+            tomb_stmt = tomb_stmt.where(_after(tomb.c.deleted_at, tomb.c.id, deleted_pos))
+        tomb_stmt = tomb_stmt.order_by(tomb.c.deleted_at, tomb.c.id).limit(limit + 1)
+        tombstones = session.execute(tomb_stmt).all()
+
+        has_more = len(rows) > limit or len(tombstones) > limit
+        rows, tombstones = rows[:limit], tombstones[:limit]
+
+        if rows:
+            updated_pos = (rows[-1]["updated_at"], rows[-1]["id"])
+        if tombstones:
+            deleted_pos = (tombstones[-1].deleted_at, tombstones[-1].id)
+
+        return {
+            "entity": entity,
+            "items": [{key: _serialize(value) for key, value in row.items()} for row in rows],
+            "deleted": [row.entity_id for row in tombstones],
+            "cursor": encode_cursor(updated_pos, deleted_pos),
+            "has_more": has_more,
+            "server_time": server_time.isoformat(),
+        }
+    finally:
+        if should_close:
+            session.close()
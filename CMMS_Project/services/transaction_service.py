@@ -78,6 +78,33 @@ def nested_transaction(session: Session):
         raise
 
 
+@contextmanager
+def deferred_commits(session: Session):
+    """
+    Turn session.commit() into a flush while active
+    
+    Service functions commit their own work; inside this block those commits
+    only flush, so several service calls join one outer transaction that the
+    caller commits or rolls back.
+    
+    Usage:
+        with transaction() as session, deferred_commits(session):
+            create_worksheet(..., session=session)
+            add_part_to_worksheet(..., session=session)
+    
+    Args:
+        session: Existing session
+    
+    Yields:
+        Session: Same session
+    """
+    session.commit = session.flush
+    try:
+        yield session
+    finally:
+        del session.commit
+
+
 def transactional(func: Callable) -> Callable:
     """
     Decorator for automatic transaction management
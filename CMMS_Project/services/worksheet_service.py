@@ -2,8 +2,10 @@
 Worksheet service: alap CRUD, státuszkezelés, alkatrész felhasználás
 """
 
-from typing import Optional
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from config.constants import (
     WORKSHEET_STATUS_OPEN,
@@ -14,6 +16,7 @@ from config.constants import (
 )
 from database.session_manager import SessionLocal
 from database.models import Worksheet, WorksheetPart, Machine, User, PMHistory, PMTask, WorkRequestPDF, utcnow
+from database.query_profiler import profiled
 from sqlalchemy.orm import aliased
 from services import inventory_service
 from services.transaction_service import transaction
@@ -30,7 +33,7 @@ from utils.error_handler import (
     NotFoundError,
     CMMSError
 )
-from utils.pagination import paginate_query, PaginatedResult
+from utils.pagination import paginate_query, PaginatedResult, keyset_after_desc
 
 import logging
 
@@ -212,7 +215,7 @@ def update_status(worksheet_id: int, new_status: str, repair_finished_time=None,
             raise NotFoundError("Worksheet", worksheet_id, user_message=get_localized_error("worksheet_not_found"))
         
         # Use centralized workflow validation
-        is_valid, error_msg = transition_state(
+        is_valid = transition_state(
             "worksheet",
             ws.status,
             new_status,
@@ -589,6 +592,7 @@ def list_worksheets_for_machine(machine_id: int, session: Session = None) -> lis
             session.close()
 
 
+@profiled
 def list_all_worksheets(session: Session = None) -> list:
     """List all worksheets (including closed), with PM task information if available"""
     session, should_close = _get_session(session)
@@ -610,6 +614,97 @@ def list_all_worksheets(session: Session = None) -> list:
             session.close()
 
 
+def iter_worksheets(
+    machine_id: Optional[int] = None,
+    status: Optional[str] = None,
+    batch_size: int = 1000,
+    session: Session = None
+) -> Iterator[Worksheet]:
+    """
+    Iterate worksheets (newest first) in batches of `batch_size` rows.
+
+    Unlike list_all_worksheets the result is never materialized at once:
+    rows are fetched with yield_per (server-side cursor), machine and user
+    are joined, and selectinload fetches the parts collection of each batch
+    with one SELECT ... IN (joinedload collections cannot be combined with
+    yield_per).
+    """
+    session, should_close = _get_session(session)
+    try:
+        stmt = (
+            select(Worksheet)
+            .options(
+                joinedload(Worksheet.machine),
+                joinedload(Worksheet.assigned_user),
+                selectinload(Worksheet.parts).joinedload(WorksheetPart.part),
+            )
+            .order_by(Worksheet.created_at.desc(), Worksheet.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        if machine_id:
+            stmt = stmt.where(Worksheet.machine_id == machine_id)
+        if status:
+            stmt = stmt.where(Worksheet.status == status)
+        for batch in session.execute(stmt).scalars().partitions():
+            yield from batch
+    finally:
+        if should_close:
+            session.close()
+
+
+def _worksheet_list_criteria(include_closed: bool) -> list:
+    return [] if include_closed else [Worksheet.status != WORKSHEET_STATUS_CLOSED]
+
+
+def count_worksheets(include_closed: bool = True, session: Session = None) -> int:
+    """Number of worksheets listed by list_worksheets_page (COUNT only)"""
+    session, should_close = _get_session(session)
+    try:
+        stmt = select(func.count(Worksheet.id)).where(*_worksheet_list_criteria(include_closed))
+        return session.execute(stmt).scalar() or 0
+    finally:
+        if should_close:
+            session.close()
+
+
+@profiled
+def list_worksheets_page(
+    include_closed: bool = True,
+    after: Optional[Tuple[Optional[datetime], int]] = None,
+    limit: int = 50,
+    session: Session = None,
+) -> list:
+    """
+    One keyset page of worksheets, newest first (ORDER BY created_at DESC, id DESC)
+
+    Args:
+        include_closed: False lists only active worksheets (list_active_worksheets)
+        after: (created_at, id) of the last worksheet of the previous page
+        limit: Page size
+    """
+    session, should_close = _get_session(session)
+    try:
+        stmt = (
+            select(Worksheet)
+            .options(
+                joinedload(Worksheet.machine),
+                joinedload(Worksheet.assigned_user),
+                selectinload(Worksheet.parts).joinedload(WorksheetPart.part),
+            )
+            .where(*_worksheet_list_criteria(include_closed))
+            .order_by(Worksheet.created_at.desc(), Worksheet.id.desc())
+            .limit(limit)
+        )
+        keyset = keyset_after_desc(Worksheet.created_at, Worksheet.id, after)
+        if keyset is not None:
+            stmt = stmt.where(keyset)
+        return session.execute(stmt).scalars().all()
+    finally:
+        if should_close:
+            session.close()
+
+
+@profiled
 def list_worksheets(
     machine_id: Optional[int] = None,
     status: Optional[str] = None,
@@ -0,0 +1,148 @@
+"""
+ETag / conditional GET response cache tesztek
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from sqlalchemy import event, update
+
+from api.app import create_app
+from api.security import create_access_token
+from database.connection import engine
+from database.database import reset_database
+from database.session_manager import SessionLocal
+from database.models import Machine, ProductionLine
+from services import asset_service
+from utils.cache import InMemoryCacheBackend
+
+
+@pytest.fixture(autouse=True)
+def _reset_db():
+    reset_database()
+    yield
+
+
+@pytest.fixture
+def statements():
+    """Counts SQL statements sent to the database"""
+    executed = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield executed
+    event.remove(engine, "before_cursor_execute", count)
+
+
+def _seed_machine(name):
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line(f"PL-{name}", session=session)
+        return asset_service.create_machine(pl.id, name, session=session).id
+    finally:
+        session.close()
+
+
+def _get_all(app, requests):
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = []
+            for path, headers in requests:
+                headers = {"Authorization": f"Bearer {token}", **headers}
+                responses.append(await client.get(path, headers=headers))
+            return responses
+
+    return asyncio.run(run())
+
+
+def test_conditional_get_skips_the_database(statements):
+    _seed_machine("Cached")
+    app = create_app(response_cache=InMemoryCacheBackend())
+
+    first, = _get_all(app, [("/api/machines/", {})])
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    del statements[:]
+    not_modified, cached = _get_all(app, [
+        ("/api/machines/", {"If-None-Match": etag}),
+        ("/api/machines/", {}),
+    ])
+    assert not_modified.status_code == 304
+    assert cached.status_code == 200 and cached.json() == first.json()
+    assert cached.headers["etag"] == etag
+    assert statements == []
+
+    # A write through the ORM bumps the table version
+    _seed_machine("New")
+    changed, = _get_all(app, [("/api/machines/", {"If-None-Match": etag})])
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["total"] == 2
+
+
+def test_bulk_update_and_other_tables():
+    machine_id = _seed_machine("Bulk")
+    app = create_app(response_cache=InMemoryCacheBackend())
+    machines, config = _get_all(app, [("/api/machines/", {}), ("/api/permissions/config", {})])
+
+    session = SessionLocal()
+    try:
+        session.execute(update(Machine).where(Machine.id == machine_id).values(name="Renamed"))
+        session.commit()
+    finally:
+        session.close()
+
+    machines_after, config_after = _get_all(app, [
+        ("/api/machines/", {"If-None-Match": machines.headers["etag"]}),
+        ("/api/permissions/config", {"If-None-Match": config.headers["etag"]}),
+    ])
+    assert machines_after.status_code == 200
+    assert machines_after.json()["items"][0]["name"] == "Renamed"
+    # roles did not change
+    assert config_after.status_code == 304
+
+
+def test_expanded_relation_change_invalidates_etag():
+    machine_id = _seed_machine("Expanded")
+    app = create_app(response_cache=InMemoryCacheBackend())
+    path = "/api/machines/?expand=production_line"
+    first, = _get_all(app, [(path, {})])
+    assert first.json()["items"][0]["production_line"]["name"] == "PL-Expanded"
+
+    session = SessionLocal()
+    try:
+        line_id = session.get(Machine, machine_id).production_line_id
+        session.execute(update(ProductionLine).where(ProductionLine.id == line_id).values(name="PL-Renamed"))
+        session.commit()
+    finally:
+        session.close()
+
+    renamed, = _get_all(app, [(path, {"If-None-Match": first.headers["etag"]})])
+    assert renamed.status_code == 200
+    assert renamed.headers["etag"] != first.headers["etag"]
+    assert renamed.json()["items"][0]["production_line"]["name"] == "PL-Renamed"
+
+
+def test_requests_without_valid_token_are_not_cached():
+    app = create_app(response_cache=InMemoryCacheBackend())
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/machines/", headers={"If-None-Match": "*"})
+
+    response = asyncio.run(run())
+    assert response.status_code in (401, 403)
+    assert "etag" not in response.headers
@@ -0,0 +1,87 @@
+"""
+REST API execution model tesztek (DB work stays off the event loop)
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from fastapi.routing import APIRoute
+
+from api.app import create_app
+from api.dependencies import get_db
+from api.security import create_access_token
+from database.connection import engine
+from sqlalchemy.orm import Session
+
+
+def _depends_on(dependant, dependency) -> bool:
+    return any(
+        sub.call is dependency or _depends_on(sub, dependency)
+        for sub in dependant.dependencies
+    )
+
+
+def test_db_routes_are_sync_handlers():
+    app = create_app()
+    db_routes = [
+        route for route in app.routes
+        if isinstance(route, APIRoute) and _depends_on(route.dependant, get_db)
+    ]
+    assert db_routes
+    for route in db_routes:
+        assert not asyncio.iscoroutinefunction(route.endpoint), route.path
+
+
+def test_slow_queries_do_not_block_the_event_loop():
+    app = create_app(threadpool_size=8)
+    delay = 0.5
+
+    class SlowSession(Session):
+        """Every statement blocks the calling thread, like a slow query"""
+        def execute(self, *args, **kwargs):
+            time.sleep(delay / 2)
+            return super().execute(*args, **kwargs)
+
+    def slow_get_db():
+        db = SlowSession(bind=engine)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = slow_get_db
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test",
+                                     headers={"Authorization": f"Bearer {token}"}) as client:
+            # Run the startup hook (threadpool sizing) like uvicorn would
+            await app.router.startup()
+
+            async def timed(path):
+                started = time.perf_counter()
+                response = await client.get(path)
+                return response.status_code, time.perf_counter() - started
+
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                *(timed("/api/machines/") for _ in range(4)),
+                timed("/api/health/"),
+            )
+            return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(run())
+    health_status, health_elapsed = results[-1]
+
+    assert [status for status, _ in results] == [200] * 5
+    assert health_elapsed < delay
+    # The four slow requests overlap in the threadpool instead of queueing
+    assert elapsed < 4 * delay
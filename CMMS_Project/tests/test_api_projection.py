@@ -0,0 +1,118 @@
+"""
+Sparse fieldsets (fields=) and relation expansion (expand=) tesztek
+"""
+
+import sys
+import asyncio
+from datetime import datetime
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from sqlalchemy import event
+
+from api.app import create_app
+from api.security import create_access_token
+from database.connection import engine
+from database.database import reset_database
+from database.session_manager import SessionLocal
+from database.models import Worksheet
+from services import asset_service
+from services.inventory_service import create_part
+
+
+@pytest.fixture(autouse=True)
+def _reset_db():
+    reset_database()
+    yield
+
+
+@pytest.fixture
+def statements():
+    """SQL statements sent to the database"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _seed():
+    session = SessionLocal()
+    try:
+        for line in range(2):
+            pl = asset_service.create_production_line(f"PL-{line}", session=session)
+            for i in range(3):
+                machine = asset_service.create_machine(pl.id, f"M{line}-{i}", serial_number=f"SN{line}{i}",
+                                                       session=session)
+                session.add(Worksheet(machine_id=machine.id, assigned_to_user_id=1, title=f"WS {line}-{i}",
+                                      status="Open", created_at=datetime(2026, 1, 1)))
+        for i in range(4):
+            create_part(f"PRJ-{i:03d}", f"Part {i}", initial_quantity=i + 1, bin_location=f"B{i}", session=session)
+        session.commit()
+    finally:
+        session.close()
+
+
+def _get(app, path):
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test",
+                                     headers={"Authorization": f"Bearer {token}"}) as client:
+            return await client.get(path)
+
+    return asyncio.run(run())
+
+
+def test_machines_fields_and_expand(statements):
+    _seed()
+    app = create_app()
+    del statements[:]
+
+    response = _get(app, "/api/machines/?fields=name,status&expand=production_line&limit=100")
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 6
+    assert set(items[0]) == {"id", "name", "status", "production_line"}
+    assert {item["production_line"]["name"] for item in items} == {"PL-0", "PL-1"}
+    # count + page + one SELECT ... IN for the production lines, whatever the page size
+    assert len(statements) == 3
+    page_sql = statements[1]
+    assert "serial_number" not in page_sql and "purchase_price" not in page_sql
+
+
+def test_worksheets_and_assets_expand_without_n_plus_one(statements):
+    _seed()
+    app = create_app()
+
+    del statements[:]
+    worksheets = _get(app, "/api/worksheets/?fields=title&expand=machine,assigned_user&limit=100")
+    assert worksheets.status_code == 200
+    assert len(statements) == 4
+    item = worksheets.json()["items"][0]
+    assert set(item) == {"id", "title", "machine", "assigned_user"}
+    assert item["assigned_user"]["username"] == "admin"
+    assert item["machine"]["serial_number"].startswith("SN")
+
+    del statements[:]
+    assets = _get(app, "/api/assets/?fields=sku&expand=inventory_level,supplier&limit=100")
+    assert assets.status_code == 200
+    # No part has a supplier, so only the inventory level SELECT ... IN runs
+    assert len(statements) == 3
+    levels = {item["sku"]: item["inventory_level"] for item in assets.json()["items"]}
+    assert levels["PRJ-002"] == {"quantity_on_hand": 3, "quantity_reserved": 0, "bin_location": "B2"}
+
+
+def test_unknown_fields_are_rejected():
+    app = create_app()
+    assert _get(app, "/api/machines/?fields=name,password").status_code == 400
+    assert _get(app, "/api/worksheets/?expand=photos").status_code == 400
@@ -0,0 +1,94 @@
+"""
+API list serialization (fast path, orjson, gzip) tesztek
+"""
+
+import sys
+import asyncio
+from datetime import datetime
+from pathlib import Path
+import json
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from sqlalchemy import select
+
+from api.app import create_app
+from api.schemas import MachineListResponse, MachineResponse
+from api.security import create_access_token
+from api.serialization import ORJSONResponse, list_page_response, schema_columns
+from database.database import reset_database
+from database.session_manager import SessionLocal
+from database.models import Machine, Worksheet
+from services import asset_service
+
+
+@pytest.fixture(autouse=True)
+def _reset_db():
+    reset_database()
+    yield
+
+
+def _get(app, path, headers=None):
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers={"Authorization": f"Bearer {token}", **(headers or {})})
+
+    return asyncio.run(run())
+
+
+def test_fast_path_matches_model_serialization():
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line("PL-SER", session=session)
+        for i in range(3):
+            asset_service.create_machine(pl.id, f"M{i}", model="X-1", session=session)
+
+        machines = session.execute(select(Machine).order_by(Machine.id)).scalars().all()
+        expected = MachineListResponse(
+            total=3, items=[MachineResponse.model_validate(m) for m in machines]
+        ).model_dump(mode="json")
+
+        rows = session.execute(select(*schema_columns(Machine, MachineResponse)).order_by(Machine.id)).all()
+        assert json.loads(list_page_response(MachineResponse, rows, 3).body) == expected
+    finally:
+        session.close()
+
+
+def test_list_endpoints_use_fast_path_and_gzip():
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line("PL-GZIP", session=session)
+        machine = asset_service.create_machine(pl.id, "Gzip", session=session)
+        for i in range(40):
+            session.add(Worksheet(
+                machine_id=machine.id, assigned_to_user_id=1, title=f"WS {i}", status="Closed",
+                fault_cause="Wear", closed_at=datetime(2026, 1, 2),
+            ))
+        session.commit()
+    finally:
+        session.close()
+
+    app = create_app()
+    assert app.router.default_response_class is ORJSONResponse
+
+    plain = _get(app, "/api/worksheets/?limit=100", headers={"Accept-Encoding": "identity"})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers
+    body = plain.json()
+    assert body["total"] == 40
+    assert body["items"][0]["completed_at"] == "2026-01-02T00:00:00"
+    assert body["items"][0]["maintenance_type"] is None
+
+    compressed = _get(app, "/api/worksheets/?limit=100", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.json() == body
+
+    # Small bodies stay uncompressed
+    small = _get(app, "/api/health/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
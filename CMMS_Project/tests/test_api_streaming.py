@@ -0,0 +1,124 @@
+"""
+NDJSON / CSV streaming export végpont tesztek
+"""
+
+import sys
+import csv
+import io
+import json
+import asyncio
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+
+from api import streaming
+from api.app import create_app
+from api.security import create_access_token
+from database.connection import get_engine
+from database.database import reset_database
+from database.models import Machine, ProductionLine, Worksheet
+from database.session_manager import SessionLocal
+
+
+@pytest.fixture(autouse=True)
+def _reset_db():
+    reset_database()
+    yield
+
+
+def _seed_worksheets(count):
+    session = SessionLocal()
+    try:
+        line = ProductionLine(name="Export line")
+        session.add(line)
+        session.flush()
+        machine = Machine(production_line_id=line.id, name="Export press", serial_number="EXP-1")
+        session.add(machine)
+        session.flush()
+        session.add_all([
+            Worksheet(machine_id=machine.id, assigned_to_user_id=1, title=f"Munkalap {i}", status="Open")
+            for i in range(count)
+        ])
+        session.commit()
+    finally:
+        session.close()
+
+
+def _get(path):
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+
+    async def run():
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers={"Authorization": f"Bearer {token}"})
+
+    return asyncio.run(run())
+
+
+def test_worksheet_export_streams_ndjson():
+    _seed_worksheets(25)
+    response = _get("/api/worksheets/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 25
+    assert rows[0]["machine_name"] == "Export press"
+    assert rows[0]["created_at"]  # datetimes are ISO strings
+
+
+def test_worksheet_export_streams_csv_and_validates_format():
+    _seed_worksheets(3)
+    response = _get("/api/worksheets/export?format=csv&status=Open")
+
+    assert response.status_code == 200
+    assert 'filename="worksheets.csv"' in response.headers["content-disposition"]
+    lines = list(csv.reader(io.StringIO(response.text)))
+    assert lines[0][:3] == ["worksheet_id", "title", "status"]
+    assert len(lines) == 1 + 3
+
+    assert _get("/api/worksheets/export?format=xml").status_code == 422
+
+
+def test_abandoned_stream_returns_its_connection(monkeypatch):
+    """Letöltés közbeni bontáskor is lezárul a session, a kapcsolat visszakerül a poolba"""
+    _seed_worksheets(25)
+    monkeypatch.setattr(streaming, "CHUNK_SIZE", 1)  # one chunk per row
+    app = create_app()
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+    assert len(_get("/api/worksheets/export").text.splitlines()) == 25  # warms the pool up
+    pool = get_engine().pool
+    checked_in = pool.checkedin()
+
+    async def abandon():
+        disconnected = asyncio.Event()
+        chunks = []
+
+        async def receive():
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                chunks.append(message["body"])
+                if len(chunks) == 3:
+                    assert pool.checkedout() == 1  # the export session is still reading
+                    disconnected.set()
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "server": ("test", 80), "client": ("test", 1234), "root_path": "",
+            "path": "/api/worksheets/export", "raw_path": b"/api/worksheets/export", "query_string": b"",
+            "headers": [(b"host", b"test"), (b"authorization", f"Bearer {token}".encode())],
+        }
+        await app(scope, receive, send)
+        return chunks
+
+    chunks = asyncio.run(abandon())
+    assert 3 <= len(chunks) < 25
+    assert pool.checkedout() == 0
+    assert pool.checkedin() == checked_in
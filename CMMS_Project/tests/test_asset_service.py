@@ -3,6 +3,7 @@ Asset service tesztek
 """
 
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
 import pytest
 
@@ -11,6 +12,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from database.database import reset_database
 from database.session_manager import SessionLocal
+from database.models import Machine
 from services import asset_service
 from services.asset_service import AssetServiceError
 from config.constants import ACTION_CREATED
@@ -44,5 +46,71 @@ def test_duplicate_serial_fails():
     session.close()
 
 
+def test_next_operating_hours_update_uses_calendar_months():
+    machine = Machine(
+        operating_hours_update_frequency_type="month",
+        operating_hours_update_frequency_value=1,
+        last_operating_hours_update=datetime(2026, 1, 31, 8, 0),
+    )
+    assert asset_service.calculate_next_operating_hours_update_date(machine) == datetime(2026, 2, 28, 8, 0)
+    machine.operating_hours_update_frequency_value = 12
+    assert asset_service.compute_next_operating_hours_update_at(machine) == datetime(2027, 1, 31, 8, 0)
+
+
+def test_due_operating_hours_updates_use_stored_due_date():
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line("Line-OH", session=session)
+        weekly = asset_service.create_machine(
+            pl.id, "Weekly", operating_hours_update_frequency_type="week",
+            operating_hours_update_frequency_value=1, session=session
+        )
+        monthly = asset_service.create_machine(
+            pl.id, "Monthly", operating_hours_update_frequency_type="month",
+            operating_hours_update_frequency_value=1, session=session
+        )
+        asset_service.create_machine(pl.id, "NoFrequency", session=session)
+        session.commit()
+
+        # Never read: due immediately
+        due = asset_service.get_machines_with_due_operating_hours_update(days_ahead=3, session=session)
+        assert {entry['machine'].id for entry in due} == {weekly.id, monthly.id}
+
+        asset_service.update_operating_hours(weekly.id, 120.0, session=session)
+        asset_service.update_operating_hours(monthly.id, 80.0, session=session)
+        assert asset_service.get_machines_with_due_operating_hours_update(days_ahead=3, session=session) == []
+
+        due = asset_service.get_machines_with_due_operating_hours_update(days_ahead=8, session=session)
+        assert [entry['machine'].id for entry in due] == [weekly.id]
+        assert not due[0]['is_overdue']
+
+        # Changing the frequency recomputes the due date
+        asset_service.update_machine(monthly.id, operating_hours_update_frequency_type="day", session=session)
+        due = asset_service.get_machines_with_due_operating_hours_update(days_ahead=8, session=session)
+        assert [entry['machine'].id for entry in due] == [monthly.id, weekly.id]
+    finally:
+        session.close()
+
+
+def test_backfill_next_operating_hours_update_at():
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line("Line-BF", session=session)
+        machine = asset_service.create_machine(
+            pl.id, "Legacy", operating_hours_update_frequency_type="day",
+            operating_hours_update_frequency_value=10, session=session
+        )
+        last_read = datetime(2026, 3, 1, 6, 0)
+        machine.last_operating_hours_update = last_read
+        machine.next_operating_hours_update_at = None
+        session.commit()
+
+        assert asset_service.backfill_next_operating_hours_update_at(session=session) == 1
+        session.refresh(machine)
+        assert machine.next_operating_hours_update_at == last_read + timedelta(days=10)
+    finally:
+        session.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,176 @@
+"""
+Batch / bulk write operations tesztek
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from api.app import create_app
+from api.security import create_access_token
+from database.database import reset_database
+from database.session_manager import SessionLocal
+from database.models import InventoryLevel, PMHistory, User, Worksheet, WorksheetPart
+from services import asset_service, pm_service
+from services.batch_service import execute_batch
+from services.inventory_service import create_part
+
+
+@pytest.fixture(autouse=True)
+def _reset_db():
+    reset_database()
+    yield
+
+
+@pytest.fixture
+def commits():
+    """Counts committed transactions"""
+    committed = []
+
+    def count(session):
+        committed.append(session)
+
+    event.listen(Session, "after_commit", count)
+    yield committed
+    event.remove(Session, "after_commit", count)
+
+
+def _seed():
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line("PL-BATCH", session=session)
+        machine = asset_service.create_machine(pl.id, "Batch machine", session=session)
+        part = create_part("BATCH-001", "Filter", buy_price=10.0, initial_quantity=5, session=session)
+        return machine.id, part.id
+    finally:
+        session.close()
+
+
+def _stock(part_id):
+    session = SessionLocal()
+    try:
+        return session.query(InventoryLevel).filter_by(part_id=part_id).one().quantity_on_hand
+    finally:
+        session.close()
+
+
+def _worksheet_flow(machine_id, part_id, quantity):
+    return [
+        {"op": "worksheet.create", "ref": "ws", "params": {
+            "machine_id": machine_id, "description": "Leak", "breakdown_time": "2026-01-05T08:00:00"}},
+        {"op": "worksheet.add_part", "params": {"worksheet_id": "$ws", "part_id": part_id, "quantity_used": quantity}},
+        {"op": "worksheet.update", "params": {
+            "worksheet_id": "$ws", "fault_cause": "Wear", "status": "Closed",
+            "repair_finished_time": "2026-01-05T10:30:00"}},
+    ]
+
+
+def test_atomic_batch_is_one_transaction(commits):
+    machine_id, part_id = _seed()
+    del commits[:]
+
+    outcome = execute_batch(_worksheet_flow(machine_id, part_id, 2), user_id=1)
+
+    assert outcome["committed"] is True
+    assert [entry["status"] for entry in outcome["results"]] == ["ok"] * 3
+    assert len(commits) == 1
+    worksheet_id = outcome["results"][0]["result"]["id"]
+    session = SessionLocal()
+    try:
+        assert session.get(Worksheet, worksheet_id).status == "Closed"
+        assert session.query(WorksheetPart).filter_by(worksheet_id=worksheet_id).count() == 1
+    finally:
+        session.close()
+    assert _stock(part_id) == 3
+
+
+def test_failed_operation_rolls_back_the_batch():
+    machine_id, part_id = _seed()
+
+    outcome = execute_batch(_worksheet_flow(machine_id, part_id, 50), user_id=1)
+
+    assert outcome["committed"] is False
+    assert [entry["status"] for entry in outcome["results"]] == ["rolled_back", "error", "skipped"]
+    assert outcome["results"][1]["error"]
+    session = SessionLocal()
+    try:
+        assert session.query(Worksheet).count() == 0
+    finally:
+        session.close()
+    assert _stock(part_id) == 5
+
+    # Non-atomic: every operation stands on its own
+    outcome = execute_batch([
+        {"op": "worksheet.create", "params": {"machine_id": machine_id}},
+        {"op": "worksheet.create", "params": {"machine_id": 999999}},
+        {"op": "unknown.op"},
+    ], user_id=1, atomic=False)
+    assert [entry["status"] for entry in outcome["results"]] == ["ok", "error", "error"]
+
+
+def test_batch_and_bulk_endpoints():
+    machine_id, part_id = _seed()
+    app = create_app()
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test",
+                                     headers={"Authorization": f"Bearer {token}"}) as client:
+            created = await client.post("/api/worksheets/bulk", json={
+                "items": [{"machine_id": machine_id}, {"machine_id": machine_id, "description": "Second"}]
+            })
+            ids = [entry["result"]["id"] for entry in created.json()["results"]]
+            parts = await client.post("/api/worksheets/parts/bulk", json={
+                "items": [{"worksheet_id": ws_id, "part_id": part_id, "quantity_used": 1} for ws_id in ids]
+            })
+            batch = await client.post("/api/batch", json={"operations": _worksheet_flow(machine_id, part_id, 1)})
+            return created, parts, batch
+
+    created, parts, batch = asyncio.run(run())
+    assert created.status_code == 200 and created.json()["committed"] is True
+    assert parts.status_code == 200 and parts.json()["committed"] is True
+    assert batch.status_code == 200 and batch.json()["committed"] is True
+    assert _stock(part_id) == 2
+
+
+def test_acting_user_fields_cannot_be_spoofed():
+    """A completed_by_user_id paraméter figyelmen kívül marad; más felelőst csak jogosult szerepkör adhat meg"""
+    machine_id, _ = _seed()
+    session = SessionLocal()
+    try:
+        admin = session.get(User, 1)
+        other = User(username="masik", password_hash=admin.password_hash, role_id=admin.role_id)
+        session.add(other)
+        session.commit()
+        other_id = other.id
+        task_id = pm_service.create_pm_task(machine_id, "Kenés", 7, session=session).id
+    finally:
+        session.close()
+
+    outcome = execute_batch([
+        {"op": "pm.complete", "params": {"task_id": task_id, "completed_by_user_id": other_id,
+                                         "create_worksheet": False}},
+    ], user_id=1, role_name="technician")
+    assert outcome["committed"] is True
+    session = SessionLocal()
+    try:
+        assert session.get(PMHistory, outcome["results"][0]["result"]["id"]).completed_by_user_id == 1
+    finally:
+        session.close()
+
+    assign = [{"op": "worksheet.create", "params": {"machine_id": machine_id, "assigned_to_user_id": other_id}}]
+    denied = execute_batch(assign, user_id=1, role_name="technician")
+    assert denied["committed"] is False and denied["results"][0]["status"] == "error"
+    assert execute_batch([{"op": "worksheet.update", "params": {"worksheet_id": 1, "assigned_to_user_id": other_id}}],
+                         user_id=1)["results"][0]["error"] == "Permission denied: assign on Worksheet"
+    allowed = execute_batch(assign, user_id=1, role_name="manager")
+    assert allowed["committed"] is True
@@ -0,0 +1,79 @@
+"""
+Benchmark eszközök tesztjei (determinisztikus adatgenerátor, eredmények összehasonlítása)
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine, func, select
+
+from benchmarks import results
+from benchmarks.data_generator import SCALES, cached_plant, generate_plant, reference_date
+from database.models import Part, Worksheet
+
+
+def _fingerprint(path):
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        with engine.connect() as conn:
+            return (
+                conn.execute(select(Part.sku, Part.name, Part.buy_price).order_by(Part.id)).all(),
+                conn.execute(select(Worksheet.machine_id, Worksheet.status, Worksheet.created_at)
+                             .order_by(Worksheet.id)).all(),
+                conn.execute(select(func.max(Worksheet.created_at))).scalar_one(),
+            )
+    finally:
+        engine.dispose()
+
+
+def test_generator_is_deterministic(tmp_path):
+    """Azonos seed és referencia nap: azonos adatbázis; más seed: más adat"""
+    reference = reference_date(date(2026, 3, 15))
+    first = generate_plant(tmp_path / "a.db", "tiny", seed=7, reference=reference)
+    generate_plant(tmp_path / "b.db", "tiny", seed=7, reference=reference)
+    generate_plant(tmp_path / "c.db", "tiny", seed=8, reference=reference)
+
+    assert first["parts"] == SCALES["tiny"]["parts"]
+    assert first["worksheets"] == SCALES["tiny"]["worksheets"]
+    parts, worksheets, newest = _fingerprint(tmp_path / "a.db")
+    assert _fingerprint(tmp_path / "b.db") == (parts, worksheets, newest)
+    assert _fingerprint(tmp_path / "c.db")[1] != worksheets
+    # The history ends on the reference day
+    assert str(newest).startswith("2026-03-15")
+
+    cached = cached_plant("tiny", seed=7, reference=reference, cache_dir=tmp_path / "cache")
+    assert cached_plant("tiny", seed=7, reference=reference, cache_dir=tmp_path / "cache") == cached
+    assert _fingerprint(cached) == (parts, worksheets, newest)
+
+
+def test_compare_flags_slower_and_chattier_benchmarks(tmp_path):
+    """Lassulás a küszöb felett vagy több lekérdezés: regresszió"""
+    def run(*benchmarks):
+        return {"benchmarks": [
+            {"name": name, "median_ms": median, "min_ms": median, "max_ms": median, "queries": queries}
+            for name, median, queries in benchmarks
+        ]}
+
+    baseline = run(("search", 10.0, 6), ("stats", 100.0, 8), ("tiny", 0.2, 1), ("export", 50.0, 2))
+    current = run(("search", 11.0, 6), ("stats", 140.0, 8), ("tiny", 0.9, 1), ("export", 40.0, 3), ("new", 5.0, 1))
+    rows = {row["name"]: row for row in results.compare_results(baseline, current, max_regression=0.25)}
+
+    assert not rows["search"]["regression"]
+    assert rows["stats"]["regression"] and round(rows["stats"]["change"], 2) == 0.4
+    assert not rows["tiny"]["regression"]  # below MIN_SIGNIFICANT_MS
+    assert rows["export"]["regression"]  # faster, but one more query
+    assert rows["new"]["baseline_median_ms"] is None and not rows["new"]["regression"]
+    assert "REGRESSION" in results.format_comparison(list(rows.values()))
+
+    metadata = results.run_metadata("tiny", 7, reference_date(date(2026, 3, 15)), {"parts": 500})
+    older = results.save_results(metadata, baseline["benchmarks"], tmp_path)
+    newer = tmp_path / "29991231_000000_x_tiny.json"
+    newer.write_text(older.read_text(encoding="utf-8"), encoding="utf-8")
+    assert results.find_latest(tmp_path, scale="tiny") == newer
+    assert results.find_latest(tmp_path, scale="tiny", exclude=newer) == older
+    assert results.find_latest(tmp_path, scale="full") is None
+    assert results.load_results(older)["metadata"]["dataset"]["seed"] == 7
@@ -0,0 +1,178 @@
+"""
+Tömeges import tesztek (alkatrészek, gépek, készletbevételezés Excel/CSV fájlból)
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from database.models import (
+    InventoryLevel, Machine, Part, ProductionLine, StockBatch, StockTransaction, Supplier, SystemLog,
+)
+from services import bulk_import_service as bulk_import
+from services import inventory_service, sync_service
+from utils.error_handler import ValidationError
+
+
+def _levels(session):
+    return {
+        sku: quantity for sku, quantity in
+        session.query(Part.sku, InventoryLevel.quantity_on_hand).join(InventoryLevel, InventoryLevel.part_id == Part.id)
+    }
+
+
+def test_parts_csv_import_reports_bad_rows_and_keeps_good_ones(test_session, tmp_path):
+    """Hibás sorok a hibajelentésbe kerülnek, a többi blokkonként beíródik"""
+    test_session.add(Supplier(name="Acme Kft."))
+    test_session.commit()
+    path = tmp_path / "alkatreszek.csv"
+    path.write_text(
+        "Cikkszám;Név;Beszerzési ár;Szállító;Kezdeti készlet;Biztonsági készlet\n"
+        "CSA-001;Csapágy;12,50;acme kft.;4;2\n"
+        "bad sku!;Rossz;1;Acme Kft.;0;0\n"
+        "SZI-002;Szíj;3;Új Beszállító;0;x\n"
+        "SZU-003;Szűrő;7;Új Beszállító;2;\n"
+        "CSA-001;Duplikált;1;;;\n"
+        "OLA-004;;2;;;\n",
+        encoding="utf-8",
+    )
+
+    result = bulk_import.import_file(
+        bulk_import.ENTITY_PARTS, path, create_missing=True, chunk_size=2,
+        error_report_path=tmp_path / "hibak.xlsx", session=test_session,
+    )
+
+    assert (result.total_rows, result.created, result.failed_rows, result.chunks) == (6, 2, 4, 3)
+    assert result.rows_per_second > 0
+    assert [(error.row, error.column, error.message) for error in result.errors] == [
+        (3, "SKU", "Invalid SKU format"),
+        (4, "Biztonsági készlet", "Not a whole number"),
+        (6, "SKU", "Duplicate SKU in the file"),
+        (7, "Név", "Required value is missing"),
+    ]
+    report = load_workbook(result.error_report_path).active
+    assert [cell.value for cell in report[2]] == [3, "SKU", "bad sku!", "Invalid SKU format"]
+
+    bearing = test_session.query(Part).filter_by(sku="CSA-001").one()
+    assert bearing.buy_price == 12.5 and bearing.safety_stock == 2 and bearing.unit == "db"
+    assert {supplier.name for supplier in test_session.query(Supplier)} == {"Acme Kft.", "Új Beszállító"}
+    assert _levels(test_session) == {"CSA-001": 4, "SZU-003": 2}
+    # Initial stock becomes a FIFO batch linked to its receipt
+    batch = test_session.query(StockBatch).filter_by(part_id=bearing.id).one()
+    receipt = test_session.get(StockTransaction, batch.stock_transaction_id)
+    assert (batch.quantity_remaining, batch.unit_price, receipt.quantity, receipt.reference_id) == (4, 12.5, 4, 2)
+    # One summary log entry per chunk
+    logs = test_session.query(SystemLog).filter_by(action_type="import").all()
+    assert len(logs) == 3 and logs[0].log_metadata["created"] == 1
+
+
+def test_upsert_and_stock_receipts_from_excel(test_session, tmp_path):
+    """Upsert mód: az üres cella megtartja az értéket; bevételezés növeli a készletet"""
+    inventory_service.bulk_import_parts(
+        [{"sku": "CSA-001", "name": "Csapágy", "buy_price": 10.0, "initial_quantity": 5},
+         {"sku": "SZI-002", "name": "Szíj", "buy_price": 3.0}],
+        session=test_session,
+    )
+    with pytest.raises(ValidationError):
+        inventory_service.bulk_import_parts(
+            [{"sku": "NEW-003", "name": "Új"}, {"sku": "CSA-001", "name": "Már létezik"}], session=test_session
+        )
+    assert test_session.query(Part).filter_by(sku="NEW-003").count() == 0
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["SKU", "Név", "Beszerzési ár"])
+    ws.append(["csa-001", "Csapágy 6204", None])
+    ws.append(["NEW-003", "Új alkatrész", 8])
+    wb.save(tmp_path / "frissites.xlsx")
+    result = bulk_import.import_file(
+        bulk_import.ENTITY_PARTS, tmp_path / "frissites.xlsx", mode=bulk_import.MODE_UPSERT, session=test_session
+    )
+    assert (result.created, result.updated, result.failed_rows) == (1, 1, 0)
+    test_session.expire_all()
+    bearing = test_session.query(Part).filter_by(sku="CSA-001").one()
+    assert (bearing.name, bearing.buy_price) == ("Csapágy 6204", 10.0)
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Cikkszám", "Mennyiség", "Egységár", "Beérkezés dátuma", "Számlaszám"])
+    ws.append(["CSA-001", 10, 11.5, datetime(2026, 3, 2), "SZ-1"])
+    ws.append(["CSA-001", 2, 12, "2026.03.05.", None])
+    ws.append(["NEW-003", 3, None, None, None])
+    ws.append(["NINCS-1", 1, 1, None, None])
+    ws.append(["SZI-002", 0, 1, None, None])
+    wb.save(tmp_path / "keszlet.xlsx")
+    result = bulk_import.import_file(bulk_import.ENTITY_STOCK, tmp_path / "keszlet.xlsx", session=test_session)
+
+    assert result.created == 3
+    assert [(error.row, error.message) for error in result.errors] == [
+        (5, "Unknown SKU"), (6, "Quantity must be greater than zero"),
+    ]
+    test_session.expire_all()
+    assert _levels(test_session) == {"CSA-001": 17, "SZI-002": 0, "NEW-003": 3}
+    batches = test_session.query(StockBatch).filter_by(part_id=bearing.id).order_by(StockBatch.received_date).all()
+    assert [(b.quantity, b.unit_price) for b in batches][:2] == [(10, 11.5), (2, 12.0)]
+    assert batches[0].invoice_number == "SZ-1"
+    assert batches[0].received_date == datetime(2026, 3, 2)
+
+
+def test_machines_resolve_production_lines_by_code_or_name(test_session, tmp_path):
+    """Gyártósor kód vagy név alapján; ismeretlen sor hiba, create_missing létrehozza"""
+    test_session.add(ProductionLine(name="Présüzem", code="PL-01"))
+    test_session.commit()
+    path = tmp_path / "gepek.csv"
+    path.write_text(
+        "Gyártósor,Név,Gyári szám,Telepítés dátuma,Üzemóra\n"
+        "pl-01,Prés 1,SN-1,2020-01-05,1200\n"
+        "Présüzem,Prés 2,SN-2,,\n"
+        "Festősor,Festő robot,SN-3,2021-13-40,\n"
+        "Festősor,Szárító,SN-2,,\n",
+        encoding="utf-8",
+    )
+
+    result = bulk_import.import_file(bulk_import.ENTITY_MACHINES, path, session=test_session)
+    assert result.created == 2
+    assert [(error.row, error.column, error.message) for error in result.errors] == [
+        (4, "Telepítés dátuma", "Not a valid date (YYYY-MM-DD)"),
+        (4, "Gyártósor", "Unknown production line"),
+        (5, "Gyártósor", "Unknown production line"),
+        (5, "Gyári szám", "Duplicate Gyári szám in the file"),
+    ]
+    press = test_session.query(Machine).filter_by(serial_number="SN-1").one()
+    assert (press.install_date, press.operating_hours, press.status) == (datetime(2020, 1, 5), 1200.0, "Active")
+
+    path.write_text("Gyártósor,Név,Gyári szám\nFestősor,Festő robot,SN-3\nPL-01,Prés 1 (felújított),SN-1\n",
+                    encoding="utf-8")
+    result = bulk_import.import_file(
+        bulk_import.ENTITY_MACHINES, path, mode=bulk_import.MODE_UPSERT, create_missing=True, session=test_session
+    )
+    assert (result.created, result.updated, result.failed_rows) == (1, 1, 0)
+    test_session.expire_all()
+    painter = test_session.query(Machine).filter_by(serial_number="SN-3").one()
+    assert test_session.get(ProductionLine, painter.production_line_id).name == "Festősor"
+    assert test_session.get(Machine, press.id).name == "Prés 1 (felújított)"
+
+    with pytest.raises(ValidationError):
+        path.write_text("Név,Gyári szám\nPrés 9,SN-9\n", encoding="utf-8")
+        bulk_import.import_file(bulk_import.ENTITY_MACHINES, path, session=test_session)
+
+
+def test_stock_import_reaches_the_sync_feed(test_session, tmp_path, monkeypatch):
+    """A tömeges bevételezés frissíti a parts.updated_at mezőt, így a delta sync továbbítja"""
+    monkeypatch.setattr(sync_service, "SYNC_SETTLE_SECONDS", 0)
+    inventory_service.create_part("CSA-001", "Csapágy", buy_price=10.0, initial_quantity=1, session=test_session)
+    inventory_service.create_part("SZI-002", "Szíj", session=test_session)
+    cursor = sync_service.get_changes("inventory", session=test_session)["cursor"]
+
+    path = tmp_path / "keszlet.csv"
+    path.write_text("Cikkszám,Mennyiség,Egységár\nCSA-001,5,11\n", encoding="utf-8")
+    assert bulk_import.import_file(bulk_import.ENTITY_STOCK, path, session=test_session).created == 1
+
+    page = sync_service.get_changes("inventory", cursor=cursor, session=test_session)
+    assert [(item["sku"], item["quantity_on_hand"]) for item in page["items"]] == [("CSA-001", 6)]
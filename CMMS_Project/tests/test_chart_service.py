@@ -0,0 +1,100 @@
+"""
+Chart service tesztek (gyorsítótár, kiürítés, renderelés külön folyamatban)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from services import chart_service
+
+STATS = {
+    period: {
+        "cost": {"worksheet_cost": 100 * i, "service_cost": 50},
+        "time": {"total_time_hours": i},
+        "tasks": {"worksheet_count": i + 1, "pm_count": 2},
+    }
+    for i, period in enumerate(("day", "week", "month", "year"))
+}
+
+
+@pytest.fixture
+def chart_cache(tmp_path, monkeypatch):
+    cache = chart_service.ChartCache(tmp_path / "charts", max_files=10)
+    monkeypatch.setattr(chart_service, "_disk_cache", cache)
+    chart_service.clear_chart_cache()
+    yield cache
+    chart_service.clear_chart_cache()
+
+
+def test_repeated_chart_is_served_from_cache(chart_cache, monkeypatch):
+    """Azonos bemenetre a második kérés nem renderel újra"""
+    renders = []
+
+    def fake_render(chart_type, all_periods_stats, options):
+        renders.append(chart_type)
+        return b"\x89PNG fake"
+
+    monkeypatch.setattr(chart_service, "CHART_RENDER_PROCESSES", 0)
+    monkeypatch.setattr(chart_service, "_render_png", fake_render)
+
+    first = chart_service.generate_cost_chart(STATS)
+    second = chart_service.generate_cost_chart(dict(reversed(list(STATS.items()))))
+    assert first == second and first.parent == chart_cache.directory
+    assert renders == ["cost"]
+
+    changed = dict(STATS, day={"cost": {"worksheet_cost": 1}})
+    assert chart_service.generate_cost_chart(changed) != first
+    assert chart_service.generate_tasks_pie_chart(STATS, "year") != chart_service.generate_tasks_pie_chart(STATS, "week")
+    assert renders == ["cost", "cost", "tasks_pie", "tasks_pie"]
+
+    # Bytes are kept in memory only
+    assert chart_service.generate_time_chart(STATS, as_bytes=True) == b"\x89PNG fake"
+    assert len(list(chart_cache.directory.glob("time_*"))) == 0
+
+    copy = chart_service.generate_cost_chart(STATS, output_path=chart_cache.directory.parent / "out" / "cost.png")
+    assert copy.read_bytes() == first.read_bytes()
+    assert renders == ["cost", "cost", "tasks_pie", "tasks_pie", "time"]
+
+
+def test_least_recently_used_chart_is_evicted(tmp_path):
+    """A fájlszám korlát túllépésekor a legrégebben használt kép törlődik"""
+    cache = chart_service.ChartCache(tmp_path, max_files=2)
+    a = cache.put("a", b"a")
+    b = cache.put("b", b"b")
+    os.utime(a, (1, 1))
+    os.utime(b, (2, 2))
+    assert cache.get("a") == a  # use refreshes "a"
+    cache.put("c", b"c")
+    assert cache.get("b") is None
+    assert cache.get("a") == a and cache.get("c") is not None
+
+    small = chart_service.ChartCache(tmp_path / "small", max_files=10, max_bytes=5)
+    small.put("x", b"123")
+    small.put("y", b"456")
+    assert sorted(p.name for p in small.directory.iterdir()) == ["y.png"]
+
+
+def test_charts_render_in_worker_processes(chart_cache):
+    """Valódi renderelés a munkafolyamatokban, párhuzamosan"""
+    pytest.importorskip("matplotlib")
+    futures = [
+        chart_service.submit_chart("cost", STATS),
+        chart_service.submit_chart("tasks", STATS),
+        chart_service.submit_chart("tasks_pie", STATS, as_bytes=True, period="year"),
+        chart_service.submit_chart("tasks_pie", {}, period="year"),
+    ]
+    cost, tasks, pie, empty = [future.result(timeout=120) for future in futures]
+    chart_service.shutdown_chart_pool()
+
+    assert cost.read_bytes().startswith(b"\x89PNG")
+    assert tasks.read_bytes().startswith(b"\x89PNG")
+    assert pie.startswith(b"\x89PNG")
+    assert empty is None
+    with pytest.raises(ValueError):
+        chart_service.submit_chart("radar", STATS)
@@ -8,7 +8,18 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from services.context_service import get_app_context, set_app_context, clear_app_context
+import threading
+
+from services.context_service import (
+    AppContext,
+    add_context_resolver,
+    clear_app_context,
+    get_app_context,
+    get_current_user_id,
+    remove_context_resolver,
+    set_app_context,
+    use_app_context,
+)
 
 
 def test_context_set_and_clear():
@@ -36,6 +47,46 @@ def test_context_set_and_clear():
     assert ctx.user_id is None
 
 
+def test_bound_contexts_are_isolated_between_threads():
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def session(user_id):
+        with use_app_context(AppContext()):
+            set_app_context({"user_id": user_id, "username": f"user{user_id}"}, token=f"t{user_id}")
+            barrier.wait()  # both users logged in at the same time
+            seen[user_id] = (get_current_user_id(), get_app_context().token)
+            clear_app_context()
+
+    threads = [threading.Thread(target=session, args=(user_id,)) for user_id in (1, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {1: (1, "t1"), 2: (2, "t2")}
+    # The process-wide default context was never touched
+    assert get_app_context().user_id is None
+
+
+def test_resolver_supplies_context_when_nothing_is_bound():
+    page_context = AppContext(user_id=7, username="web")
+    resolver = lambda: page_context
+    add_context_resolver(resolver)
+    try:
+        assert get_current_user_id() == 7
+        with use_app_context(AppContext(user_id=3)):
+            assert get_current_user_id() == 3
+        clear_app_context()
+        assert page_context.user_id is None
+        assert page_context.permissions == {}
+    finally:
+        remove_context_resolver(resolver)
+    assert get_app_context() is not page_context
+
+
 if __name__ == "__main__":
     test_context_set_and_clear()
+    test_bound_contexts_are_isolated_between_threads()
+    test_resolver_supplies_context_when_nothing_is_bound()
     print("Context service tests passed")
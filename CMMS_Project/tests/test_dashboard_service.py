@@ -0,0 +1,64 @@
+"""
+Dashboard snapshot service tesztek
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from database.models import Machine, ProductionLine
+from services import dashboard_service
+
+
+@pytest.fixture
+def dashboard_db(tmp_path, monkeypatch):
+    """File based database, so the parallel widget sessions see the same data"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'dashboard.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(dashboard_service, "SessionLocal", factory)
+    dashboard_service.invalidate_dashboard_snapshots()
+    yield factory
+    dashboard_service.invalidate_dashboard_snapshots()
+    engine.dispose()
+
+
+def test_snapshot_refreshes_only_changed_widgets(dashboard_db):
+    session = dashboard_db()
+    line = ProductionLine(name="Line")
+    session.add(line)
+    session.flush()
+    session.add_all([Machine(production_line_id=line.id, name=f"M{i}") for i in range(2)])
+    session.commit()
+
+    first = dashboard_service.get_dashboard_snapshot(user_id=1, role="Admin")
+    assert sorted(first["refreshed"]) == ["counts", "inventory", "month", "week"]
+    assert first["counts"]["machine_count"] == 2
+    assert "cost_change" in first["trend_comparison"]
+
+    # Nothing changed: served from memory
+    second = dashboard_service.get_dashboard_snapshot(user_id=1, role="Admin")
+    assert second["refreshed"] == []
+    assert second["counts"] == first["counts"]
+
+    # A commit to machines only makes the counts widget stale
+    session.add(Machine(production_line_id=line.id, name="M2"))
+    session.commit()
+    third = dashboard_service.get_dashboard_snapshot(user_id=1, role="Admin")
+    assert third["refreshed"] == ["counts"]
+    assert third["counts"]["machine_count"] == 3
+    assert third["month"] == first["month"]
+    session.close()
+
+    # Snapshots are kept per user and role
+    other = dashboard_service.get_dashboard_snapshot(user_id=1, role="Technician")
+    assert sorted(other["refreshed"]) == ["counts", "inventory", "month", "week"]
+    assert dashboard_service.get_cached_snapshot(user_id=1, role="Admin")["counts"]["machine_count"] == 3
+    assert dashboard_service.get_cached_snapshot(user_id=2, role="Admin") is None
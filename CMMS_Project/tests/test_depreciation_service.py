@@ -0,0 +1,127 @@
+"""
+Vectorized depreciation engine tesztek
+"""
+
+import sys
+from datetime import datetime, date
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from database.database import reset_database
+from database.session_manager import SessionLocal
+from database.models import Machine
+from services import asset_service
+from services.asset_lifecycle_service import get_depreciation_projection
+from services.depreciation_service import (
+    calculate_depreciation,
+    update_all_machines_depreciation,
+    project_depreciation,
+)
+
+AS_OF = datetime(2026, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def _reset_db():
+    reset_database()
+    yield
+
+
+def _seed_machines(session):
+    pl = asset_service.create_production_line("PL-DEPR", session=session)
+    specs = [
+        ("Linear", 11000.0, datetime(2021, 1, 1), 1000.0, 10, "linear", None),
+        ("Declining", 10000.0, datetime(2023, 1, 1), 0.0, 10, "declining", 0.25),
+        ("SYD", 5500.0, datetime(2024, 1, 1), 0.0, 10, "sum_of_years", None),
+        ("Expired", 8000.0, datetime(2010, 1, 1), 500.0, 5, "linear", None),
+        ("NoDate", 3000.0, None, 0.0, 4, None, None),
+        ("NoPrice", None, datetime(2020, 1, 1), 0.0, None, None, None),
+    ]
+    machines = {}
+    for name, price, purchased, salvage, period, method, rate in specs:
+        machine = asset_service.create_machine(
+            pl.id, name, purchase_price=price, purchase_date=purchased, session=session
+        )
+        machine.salvage_value = salvage
+        machine.depreciation_period_years = period
+        machine.depreciation_method = method
+        machine.depreciation_rate = rate
+        machines[name] = machine
+    session.commit()
+    return machines
+
+
+def test_schedules_per_method():
+    session = SessionLocal()
+    try:
+        machines = _seed_machines(session)
+
+        linear = calculate_depreciation(machines["Linear"].id, AS_OF, session=session)
+        # 5 years (1826 days) of 1000/year
+        assert linear["annual_depreciation"] == pytest.approx(1000.0)
+        assert linear["current_value"] == pytest.approx(11000.0 - 1826 / 365.25 * 1000.0, abs=0.01)
+
+        declining = calculate_depreciation(machines["Declining"].id, AS_OF, session=session)
+        years = 1096 / 365.25
+        assert declining["current_value"] == pytest.approx(10000.0 * 0.75 ** years, abs=0.01)
+
+        syd = calculate_depreciation(machines["SYD"].id, datetime(2026, 1, 1), session=session)
+        # Two full years of 10/55 + 9/55 (730 days are just short of 2 * 365.25)
+        assert syd["current_value"] == pytest.approx(5500.0 - 1900.0, abs=2.0)
+
+        expired = calculate_depreciation(machines["Expired"].id, AS_OF, session=session)
+        assert expired["current_value"] == 500.0
+        assert expired["remaining_years"] == 0.0
+
+        assert calculate_depreciation(machines["NoDate"].id, AS_OF, session=session)["current_value"] == 3000.0
+        assert calculate_depreciation(machines["NoPrice"].id, AS_OF, session=session)["current_value"] == 0.0
+    finally:
+        session.close()
+
+
+def test_bulk_update_matches_single_machine_calculation():
+    session = SessionLocal()
+    try:
+        machines = _seed_machines(session)
+        expected = {
+            machine.id: calculate_depreciation(machine.id, AS_OF, session=session)["current_value"]
+            for machine in machines.values()
+            if machine.purchase_price and machine.purchase_date
+        }
+        session.rollback()
+
+        assert update_all_machines_depreciation(as_of_date=AS_OF, session=session) == len(expected)
+        stored = dict(session.query(Machine.id, Machine.current_value).all())
+        for machine_id, value in expected.items():
+            assert stored[machine_id] == pytest.approx(value, abs=0.01)
+        assert stored[machines["NoDate"].id] is None
+    finally:
+        session.close()
+
+
+def test_projection_over_dates():
+    session = SessionLocal()
+    try:
+        machines = _seed_machines(session)
+        dates = [date(2022, 1, 1), date(2026, 1, 1), date(2035, 1, 1)]
+        projection = project_depreciation(dates, session=session)
+
+        linear = projection["machines"][machines["Linear"].id]
+        assert [row["current_value"] for row in linear] == [
+            calculate_depreciation(machines["Linear"].id, d, session=session)["current_value"] for d in dates
+        ]
+        assert linear[-1]["current_value"] == 1000.0
+        # Book values only go down over time
+        totals = projection["total_book_value"]
+        assert totals[0] >= totals[1] >= totals[2]
+
+        lifecycle = get_depreciation_projection(
+            [machines["Linear"].id], start_date=datetime(2026, 1, 1), years=2, step_months=6, session=session
+        )
+        assert len(lifecycle["dates"]) == 5
+        assert list(lifecycle["machines"]) == [machines["Linear"].id]
+    finally:
+        session.close()
@@ -0,0 +1,135 @@
+"""
+Compiled DOCX template cache tesztek
+"""
+
+import os
+import sys
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from docx import Document
+
+from services import docx_template_service
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    docx_template_service.clear_template_cache()
+    yield
+    docx_template_service.clear_template_cache()
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Munkalap: ${worksheet.id}")
+    doc.add_paragraph("Gép: ${machine.name} / ${machine.serial_number}")
+    doc.add_paragraph("Statikus szöveg")
+    table = doc.add_table(rows=1, cols=2)
+    table.rows[0].cells[0].text = "Alkatrész"
+    table.rows[0].cells[1].text = "{PART_NAME} - ${unknown.key}"
+    path = tmp_path / "template.docx"
+    doc.save(str(path))
+    return path
+
+
+def _texts(path):
+    doc = Document(str(path))
+    cells = [cell.text for table in doc.tables for row in table.rows for cell in row.cells]
+    return [p.text for p in doc.paragraphs], cells
+
+
+def test_render_fills_placeholders_and_keeps_template_pristine(template_path, tmp_path):
+    first = docx_template_service.render_template(
+        template_path,
+        {"${worksheet.id}": 1, "${machine.name}": "Prés", "${machine.serial_number}": None, "{PART_NAME}": "Szűrő"},
+        tmp_path / "first.docx",
+    )
+    second = docx_template_service.render_template(
+        template_path,
+        {"${worksheet.id}": 2, "${machine.name}": "Eszterga"},
+        tmp_path / "second.docx",
+    )
+
+    paragraphs, cells = _texts(first)
+    assert paragraphs[:3] == ["Munkalap: 1", "Gép: Prés / -", "Statikus szöveg"]
+    # Unknown placeholders are left untouched
+    assert cells[1] == "Szűrő - ${unknown.key}"
+
+    paragraphs, cells = _texts(second)
+    assert paragraphs[:2] == ["Munkalap: 2", "Gép: Eszterga / ${machine.serial_number}"]
+    assert cells[1] == "{PART_NAME} - ${unknown.key}"
+
+
+def test_compiled_template_is_cached_by_mtime(template_path, tmp_path):
+    compiled = docx_template_service.get_compiled_template(template_path)
+    assert docx_template_service.get_compiled_template(template_path) is compiled
+    assert docx_template_service.get_template_cache_stats()["hits"] == 1
+
+    stat = template_path.stat()
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert docx_template_service.get_compiled_template(template_path) is not compiled
+
+
+def test_post_process_runs_on_filled_document(template_path, tmp_path):
+    def add_row(doc):
+        row = doc.tables[0].add_row()
+        row.cells[0].text = "extra"
+
+    path = docx_template_service.render_template(
+        template_path, {"{PART_NAME}": "Csapágy"}, tmp_path / "out.docx", post_process=add_row
+    )
+    _, cells = _texts(path)
+    assert cells[1] == "Csapágy - ${unknown.key}"
+    assert "extra" in cells
+
+    # The added row must not leak into the next render
+    path = docx_template_service.render_template(template_path, {}, tmp_path / "out2.docx")
+    _, cells = _texts(path)
+    assert "extra" not in cells
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_render_batch(template_path, tmp_path, max_workers):
+    jobs = [
+        (template_path, {"${worksheet.id}": i}, tmp_path / f"batch_{i}.docx")
+        for i in range(4)
+    ]
+    result = docx_template_service.render_batch(jobs, max_workers=max_workers)
+
+    assert result["total"] == 4
+    assert len(result["rendered"]) == 4
+    assert not result["failed"]
+    assert result["documents_per_second"] > 0
+    paragraphs, _ = _texts(tmp_path / "batch_3.docx")
+    assert paragraphs[0] == "Munkalap: 3"
+
+
+def test_generate_work_requests_batch(tmp_path):
+    from database.database import reset_database
+    from database.session_manager import SessionLocal
+    from database.models import WorkRequestPDF
+    from services import asset_service, pm_service
+    from services.pdf_service import generate_work_requests_batch
+
+    reset_database()
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line("PL-BATCH", session=session)
+        machine = asset_service.create_machine(pl.id, "Batch-Press", session=session)
+        task_ids = [
+            pm_service.create_pm_task(machine.id, f"Heti ellenőrzés {i}", 7, session=session).id
+            for i in range(3)
+        ]
+
+        result = generate_work_requests_batch(task_ids, output_dir=str(tmp_path), max_workers=2, session=session)
+
+        assert len(result["rendered"]) == 3
+        assert session.query(WorkRequestPDF).filter(WorkRequestPDF.pm_task_id.in_(task_ids)).count() == 3
+        paragraphs, cells = _texts(tmp_path / f"work_request_{task_ids[0]}.docx")
+        assert any("Heti ellenőrzés 0" in text for text in paragraphs + cells)
+    finally:
+        session.close()
@@ -0,0 +1,128 @@
+"""
+Készletérték pillanatkép tesztek (FIFO érték alkatrészenként, napi előzmény)
+"""
+
+import sys
+import random
+from datetime import date, datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from database.models import InventoryLevel, PartValuation, PartValuationHistory
+from services import inventory_service, inventory_valuation_service as valuation_service
+from services.inventory_audit_service import get_inventory_overview, get_value_change_report
+
+
+def _snapshot(session):
+    session.expire_all()
+    return {
+        row.part_id: (row.quantity_on_hand, pytest.approx(row.total_value), row.oldest_batch_date)
+        for row in session.query(PartValuation)
+    }
+
+
+def test_stock_movements_keep_snapshot_in_step(test_session):
+    """Bevételezés és FIFO kiadás ugyanabban a tranzakcióban frissíti a pillanatképet"""
+    bearing = inventory_service.create_part("VAL-001", "Csapágy", buy_price=4.0, session=test_session)
+    belt = inventory_service.create_part("VAL-002", "Szíj", buy_price=2.5, initial_quantity=3, session=test_session)
+    old = inventory_service.receive_stock(bearing.id, 5, unit_price=10.0, received_date=datetime(2026, 1, 5),
+                                          session=test_session)
+    inventory_service.receive_stock(bearing.id, 5, unit_price=20.0, received_date=datetime(2026, 2, 5),
+                                    session=test_session)
+
+    row = valuation_service.get_part_valuation(bearing.id, session=test_session)
+    assert (row.quantity_on_hand, row.total_value, row.average_cost) == (10, 150.0, 15.0)
+    assert row.oldest_batch_date == old.received_date
+
+    inventory_service.adjust_stock(bearing.id, -7, "issued", session=test_session)
+    row = valuation_service.get_part_valuation(bearing.id, session=test_session)
+    # The oldest batch is used up: 3 left at 20
+    assert (row.quantity_on_hand, row.total_value, row.oldest_batch_date) == (3, 60.0, datetime(2026, 2, 5))
+    assert inventory_service.get_fifo_cost(bearing.id, 3, session=test_session) == 20.0
+    # Without batches the buy price counts
+    assert valuation_service.get_part_valuation(belt.id, session=test_session).total_value == 7.5
+
+    assert valuation_service.get_total_inventory_value(session=test_session) == 67.5
+    assert get_inventory_overview(session=test_session)["total_stock_value"] == 67.5
+    history = test_session.query(PartValuationHistory).filter_by(part_id=bearing.id).all()
+    assert [(h.quantity_on_hand, h.total_value) for h in history] == [(3, 60.0)]
+
+    incremental = _snapshot(test_session)
+    assert valuation_service.rebuild_part_valuations(session=test_session) == 2
+    assert _snapshot(test_session) == incremental
+
+
+def test_vectorized_rebuild_matches_fifo_walk(test_session):
+    """A teljes újraszámítás minden alkatrészre a FIFO bejárással egyező értéket ad"""
+    rng = random.Random(5)
+    parts = [
+        inventory_service.create_part(f"REB-{i:03d}", f"Alkatrész {i}", buy_price=float(i), session=test_session)
+        for i in range(12)
+    ]
+    for part in parts[1:]:
+        for day in rng.sample(range(1, 28), rng.randint(1, 4)):
+            inventory_service.receive_stock(part.id, rng.randint(1, 9), unit_price=rng.choice([1.5, 3.0, 7.25]),
+                                            received_date=datetime(2026, 5, day), session=test_session)
+        on_hand = test_session.query(InventoryLevel).filter_by(part_id=part.id).one().quantity_on_hand
+        if rng.random() < 0.7:
+            inventory_service.adjust_stock(part.id, -rng.randint(1, on_hand), "issued", session=test_session)
+    # Drift the snapshot and make one level lag behind its batches, as a restore or manual SQL would
+    test_session.query(PartValuation).update({PartValuation.total_value: 0.0})
+    lagging = test_session.query(InventoryLevel).filter_by(part_id=parts[3].id).one()
+    lagging.quantity_on_hand = 1
+    test_session.commit()
+
+    assert valuation_service.rebuild_part_valuations(session=test_session) == len(parts)
+    for part in parts:
+        quantity = test_session.query(InventoryLevel).filter_by(part_id=part.id).one().quantity_on_hand
+        batches = [
+            (batch.quantity_remaining, batch.unit_price)
+            for batch in inventory_service.list_stock_batches(part.id, session=test_session)
+        ]
+        row = valuation_service.get_part_valuation(part.id, session=test_session)
+        assert row.quantity_on_hand == quantity
+        assert row.total_value == pytest.approx(valuation_service.fifo_value(quantity, batches, part.buy_price))
+        if quantity:
+            assert inventory_service.get_fifo_cost(part.id, quantity, session=test_session) == \
+                pytest.approx(row.total_value / quantity)
+    # The lagging part holds 1 unit: valued at the price of its oldest open batch
+    oldest = inventory_service.list_stock_batches(parts[3].id, session=test_session)[0]
+    assert valuation_service.get_part_valuation(parts[3].id, session=test_session).total_value == oldest.unit_price
+
+
+def test_value_change_report_reads_history_deltas(test_session):
+    """Az értékváltozás riport az időszak eleji és végi napi pillanatkép különbsége"""
+    bolt = inventory_service.create_part("HIS-001", "Csavar", session=test_session)
+    filter_part = inventory_service.create_part("HIS-002", "Szűrő", session=test_session)
+    inventory_service.receive_stock(bolt.id, 4, unit_price=5.0, session=test_session)
+    today = datetime.utcnow().date()
+    test_session.add_all([
+        PartValuationHistory(part_id=bolt.id, valuation_date=date(2026, 1, 10), quantity_on_hand=10, total_value=50.0),
+        PartValuationHistory(part_id=bolt.id, valuation_date=date(2026, 2, 20), quantity_on_hand=6, total_value=30.0),
+        PartValuationHistory(part_id=filter_part.id, valuation_date=date(2026, 2, 3), quantity_on_hand=2,
+                             total_value=16.0),
+    ])
+    test_session.commit()
+
+    february = get_value_change_report(
+        start_date=datetime(2026, 2, 1), end_date=datetime(2026, 2, 28, 23, 59), session=test_session
+    )
+    rows = {row["sku"]: row for row in february["parts"]}
+    assert (rows["HIS-001"]["initial_value"], rows["HIS-001"]["final_value"]) == (50.0, 30.0)
+    assert (rows["HIS-002"]["initial_quantity"], rows["HIS-002"]["final_value"]) == (0, 16.0)
+    assert february["summary"]["total_value_change"] == pytest.approx(-4.0)
+
+    # Up to today the end is the live snapshot written by receive_stock
+    current = get_value_change_report(
+        start_date=datetime(2026, 3, 1), end_date=datetime.combine(today, datetime.max.time()), session=test_session
+    )
+    rows = {row["sku"]: row for row in current["parts"]}
+    assert (rows["HIS-001"]["initial_value"], rows["HIS-001"]["final_value"]) == (30.0, 20.0)
+    assert rows["HIS-001"]["received_quantity"] == 4
+    assert valuation_service.get_valuation_changes(
+        datetime(2026, 1, 1), datetime(2026, 1, 31), session=test_session
+    ) == {bolt.id: {"initial_quantity": 0, "initial_value": 0.0, "final_quantity": 10, "final_value": 50.0}}
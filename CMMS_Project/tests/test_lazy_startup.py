@@ -0,0 +1,66 @@
+"""
+Lazy screen registry / deferred heavy import tesztek
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ui.screen_registry import ScreenRegistry
+
+HEAVY_LIBRARIES = ("matplotlib", "openpyxl", "pandas", "reportlab", "docx")
+
+
+def _imported_after(statement: str) -> set:
+    """Heavy libraries present in sys.modules after `statement` in a fresh interpreter"""
+    code = (
+        f"import sys; {statement}; "
+        f"print('LOADED:' + ','.join(name for name in {HEAVY_LIBRARIES!r} if name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    loaded = result.stdout.rsplit("LOADED:", 1)[1].strip()
+    return set(filter(None, loaded.split(",")))
+
+
+def test_document_services_import_heavy_libraries_on_demand():
+    assert _imported_after(
+        "import services.chart_service, services.excel_export_service, services.pdf_service"
+    ) == set()
+    assert _imported_after(
+        "from services import chart_service; chart_service._load_matplotlib()"
+    ) == {"matplotlib"}
+
+
+def test_screen_registry_imports_and_builds_on_first_use():
+    built = []
+
+    class FakePage:
+        pass
+
+    page = FakePage()
+    registry = ScreenRegistry(page)
+    registry.register(
+        "decimal",
+        "decimal:Decimal",
+        factory=lambda cls: built.append(cls) or cls("1.5"),
+        render=lambda screen, p: (screen, p),
+    )
+    registry.register("fresh", "fractions:Fraction", factory=lambda cls: cls(1, 3), cache=False)
+
+    views = registry.views()
+    assert list(views) == ["decimal", "fresh"]
+    assert built == [] and not registry.is_loaded("decimal")
+
+    first = views["decimal"](page)
+    second = views["decimal"](page)
+    assert first == second and first[1] is page
+    assert len(built) == 1 and registry.is_loaded("decimal")
+
+    # cache=False builds a new instance each time
+    assert registry.get("fresh") is not registry.get("fresh")
+    assert not registry.is_loaded("fresh")
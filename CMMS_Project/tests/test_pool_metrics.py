@@ -0,0 +1,94 @@
+"""
+Connection pool configuration / metrics tesztek
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from sqlalchemy import create_engine, exc, text
+
+import database.connection as connection
+from api.app import create_app
+from database.pool_metrics import TimedQueuePool, get_pool_status, instrument_engine
+from database.session_manager import SessionLocal
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.1,
+    )
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_pool_metrics_count_checkouts_overflow_timeouts_and_invalidations(pooled_engine):
+    first = pooled_engine.connect()
+    second = pooled_engine.connect()  # overflow connection
+    with pytest.raises(exc.TimeoutError):
+        pooled_engine.connect()
+
+    status = get_pool_status(pooled_engine)
+    assert status["checkouts"] == 2
+    assert status["checked_out"] == 2
+    assert status["peak_overflow"] == 1
+    assert status["timeouts"] == 1
+    assert status["wait_ms_max"] >= 100
+
+    second.invalidate()
+    second.close()
+    first.close()
+    # Metrics survive the pool being replaced by dispose()
+    pooled_engine.dispose()
+    with pooled_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    status = get_pool_status(pooled_engine)
+    assert status["invalidations"] == 1
+    assert status["checkouts"] == 3
+    assert status["checkins"] == 3
+    assert status["connects"] == 3
+
+
+def test_recreate_engine_swaps_cached_session_factory():
+    original_engine = connection.get_engine()
+    original_factory = connection.get_session_factory()
+    assert connection.get_session_factory() is original_factory
+
+    new_engine = connection.recreate_engine("production")
+    try:
+        assert new_engine is not original_engine
+        assert connection.get_session_factory() is not original_factory
+        session = SessionLocal()
+        try:
+            assert session.get_bind() is new_engine
+        finally:
+            session.close()
+    finally:
+        connection._swap_engine(original_engine, "production")
+        new_engine.dispose()
+
+
+def test_ready_endpoint_reports_pool_metrics():
+    async def run():
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/health/ready")
+
+    response = asyncio.run(run())
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ready"] is True
+    assert body["database_pool"]["pool_class"] == "TimedQueuePool"
+    assert "wait_ms_avg" in body["database_pool"]
@@ -0,0 +1,108 @@
+"""
+Query profiler tesztek (hívásonkénti lekérdezés statisztika, N+1 felismerés)
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from sqlalchemy import create_engine, text
+
+from api.app import create_app
+from api.security import create_access_token
+from database import query_profiler
+from database.query_profiler import get_query_profile, instrument_queries, profile_call, profiled
+
+
+@pytest.fixture
+def profiled_engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    instrument_queries(engine)
+    instrument_queries(engine)  # idempotent
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE parts (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO parts (id, name) VALUES (1, 'a'), (2, 'b')"))
+    monkeypatch.setattr(query_profiler.profiler, "n_plus_one_threshold", 3)
+    query_profiler.reset_query_profile()
+    yield engine
+    query_profiler.reset_query_profile()
+    engine.dispose()
+
+
+def test_queries_are_attributed_to_enclosing_calls(profiled_engine):
+    """A lekérdezések a belső és a külső hívásnál is megjelennek"""
+
+    @profiled
+    def load_parts(conn):
+        return conn.execute(text("SELECT id, name FROM parts")).fetchall()
+
+    with profiled_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))  # outside any call
+        with profile_call("ui.inventory.parts"):
+            assert len(load_parts(conn)) == 2
+            conn.execute(text("SELECT COUNT(*) FROM parts"))
+
+    profile = get_query_profile()
+    by_name = {entry["name"]: entry for entry in profile["top_by_query_count"]}
+    inner = f"{__name__}.test_queries_are_attributed_to_enclosing_calls.<locals>.load_parts"
+    assert by_name[inner]["queries"] == 1
+    assert by_name["ui.inventory.parts"]["queries"] == 2
+    assert profile["total_queries"] == 3
+    assert profile["unattributed_queries"] == 1
+    assert profile["n_plus_one"] == []
+
+
+def test_repeated_select_is_reported_as_n_plus_one(profiled_engine):
+    """Ugyanaz a SELECT a küszöbnél többször egy hívásban: N+1 gyanú"""
+    with profiled_engine.connect() as conn:
+        with profile_call("services.inventory_service.list_parts"):
+            for _ in range(3):
+                for part_id in (1, 2):
+                    conn.execute(text("SELECT name FROM parts WHERE id = :id"), {"id": part_id})
+        with profile_call("services.inventory_service.list_parts"):
+            conn.execute(text("SELECT name FROM parts WHERE id = :id"), {"id": 1})
+
+    profile = get_query_profile()
+    [entry] = profile["n_plus_one"]
+    assert entry["name"] == "services.inventory_service.list_parts"
+    assert entry["calls"] == 2 and entry["n_plus_one_calls"] == 1
+    assert entry["n_plus_one_repeats"] == 6
+    assert entry["n_plus_one_statement"] == "SELECT name FROM parts WHERE id = ?"
+    assert sorted(call["queries"] for call in profile["slowest_calls"]) == [1, 6]
+
+
+def _get_metrics(token=None):
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    async def run():
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/api/health/ready")
+            return await client.get("/api/health/metrics", params={"limit": 5}, headers=headers)
+
+    return asyncio.run(run())
+
+
+def test_metrics_endpoint_reports_query_profile():
+    query_profiler.reset_query_profile()
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+    response = _get_metrics(token)
+    assert response.status_code == 200
+    body = response.json()
+    assert "wait_ms_avg" in body["database_pool"]
+    names = [call["name"] for call in body["queries"]["slowest_calls"]]
+    assert "api GET /api/health/ready" in names
+    assert body["queries"]["n_plus_one_threshold"] == query_profiler.profiler.n_plus_one_threshold
+
+
+def test_metrics_endpoint_requires_admin():
+    """A metrika végpont SQL szöveget ad vissza: csak admin érheti el"""
+    assert _get_metrics().status_code == 401
+    assert _get_metrics("not-a-token").status_code == 401
+    technician = create_access_token(user_id=2, username="tech", role_name="technician").access_token
+    assert _get_metrics(technician).status_code == 403
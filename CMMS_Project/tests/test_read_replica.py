@@ -0,0 +1,110 @@
+"""
+Read replica routing tesztek (két SQLite fájl: primary + replica)
+"""
+
+import sys
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import database.connection as connection
+from database.connection import (
+    ReadOnlySessionError,
+    configure_read_replica,
+    get_engine,
+    get_read_session,
+    get_replica_engine,
+    read_only_session,
+    recreate_engine,
+)
+from database.models import Base, Machine, ProductionLine
+from services import search_service
+
+
+@pytest.fixture
+def replica_url(tmp_path):
+    """Replica database that only contains a machine the primary does not have"""
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    seed_engine = create_engine(url)
+    Base.metadata.create_all(seed_engine)
+    with Session(seed_engine) as session:
+        line = ProductionLine(name="Replica line")
+        session.add(line)
+        session.flush()
+        session.add(Machine(production_line_id=line.id, name="Replica only press", serial_number="REPL-1"))
+        session.commit()
+    seed_engine.dispose()
+    yield url
+    configure_read_replica(None)
+
+
+def test_reads_go_to_replica_and_writes_are_rejected(replica_url):
+    configure_read_replica(replica_url)
+
+    with read_only_session() as session:
+        assert session.get_bind() is get_replica_engine()
+        assert session.query(Machine).filter_by(serial_number="REPL-1").count() == 1
+        session.add(ProductionLine(name="Should not be written"))
+        with pytest.raises(ReadOnlySessionError):
+            session.flush()
+
+    # Report / search services are routed to the replica
+    results = search_service.global_search("replica only")
+    assert [m["name"] for m in results["machines"]] == ["Replica only press"]
+
+
+def test_stale_replica_falls_back_to_primary(replica_url, monkeypatch):
+    configure_read_replica(replica_url)
+    monkeypatch.setattr(connection, "_replica_lag_seconds", lambda conn: 120.0)
+
+    with read_only_session(max_staleness=30) as session:
+        assert session.get_bind() is get_engine()
+    with read_only_session(max_staleness=300) as session:
+        assert session.get_bind() is get_replica_engine()
+
+
+def test_unreachable_replica_falls_back_to_primary(tmp_path, monkeypatch):
+    configure_read_replica(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    try:
+        with read_only_session() as session:
+            assert session.get_bind() is get_engine()
+
+        # Marked down: the replica is not retried until DB_REPLICA_RETRY_SECONDS pass
+        def fail(max_staleness):
+            raise AssertionError("replica retried")
+        monkeypatch.setattr(connection, "_replica_state", (get_replica_engine(), fail))
+        with read_only_session() as session:
+            assert session.get_bind() is get_engine()
+    finally:
+        monkeypatch.undo()
+        configure_read_replica(None)
+
+
+def test_learning_mode_does_not_read_the_production_replica(replica_url, tmp_path, monkeypatch):
+    """Tanuló módban az olvasások a tanuló adatbázisra mennek, nem az éles replikára"""
+    original_engine = get_engine()
+    configure_read_replica(replica_url, "production")
+    monkeypatch.setattr(connection, "get_database_config",
+                        lambda mode: {"url": f"sqlite:///{tmp_path / (mode + '.db')}"})
+    try:
+        learning_engine = recreate_engine("learning")
+        session = get_read_session()
+        try:
+            assert session.get_bind() is learning_engine
+        finally:
+            session.close()
+        assert get_replica_engine() is None
+
+        # Back in production the production replica is used again
+        recreate_engine("production")
+        with read_only_session() as session:
+            assert session.get_bind() is get_replica_engine()
+            assert session.query(Machine).filter_by(serial_number="REPL-1").count() == 1
+    finally:
+        monkeypatch.undo()
+        connection._swap_engine(original_engine, "production").dispose()
@@ -0,0 +1,178 @@
+"""
+Streaming export service tesztek
+"""
+
+import sys
+import csv
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from openpyxl import load_workbook
+from sqlalchemy import event
+
+from database.connection import engine
+from database.database import reset_database
+from database.models import Machine, ProductionLine, Worksheet, WorksheetPart
+from database.session_manager import SessionLocal
+from services import inventory_service, streaming_export_service, worksheet_service
+from services.inventory_audit_service import get_stock_quantity_report
+
+
+@pytest.fixture(autouse=True)
+def _reset_db():
+    reset_database()
+    yield
+
+
+def _seed_parts(session, count=5):
+    supplier = inventory_service.create_supplier("Stream Supplier", session=session)
+    parts = []
+    for i in range(count):
+        part = inventory_service.create_part(
+            sku=f"STR-{i:03d}",
+            name=f"Alkatrész {i}",
+            supplier_id=supplier.id,
+            buy_price=10.0,
+            safety_stock=2,
+            session=session,
+        )
+        if i > 0:
+            inventory_service.receive_stock(part.id, 3 * i, unit_price=5.0, session=session)
+            inventory_service.receive_stock(part.id, i, unit_price=8.0, session=session)
+        parts.append(part)
+    inventory_service.adjust_stock(parts[1].id, -1, "issued", session=session)
+    return parts
+
+
+def test_full_inventory_rows_match_stock_quantity_report():
+    session = SessionLocal()
+    try:
+        _seed_parts(session)
+        expected = {row["part_id"]: row for row in get_stock_quantity_report(include_zero=True, session=session)}
+        rows = list(streaming_export_service.iter_full_inventory_rows(batch_size=2, session=session))
+
+        assert len(rows) == len(expected)
+        for row in rows:
+            ref = expected[row["part_id"]]
+            assert row["current_quantity"] == ref["current_quantity"]
+            assert row["status"] == ref["status"]
+            assert row["stock_value"] == pytest.approx(ref["stock_value"])
+            assert row["fifo_unit_cost"] == pytest.approx(ref["fifo_unit_cost"])
+            assert (row["last_issue_date"] is None) == (ref["last_issue_date"] is None)
+    finally:
+        session.close()
+
+
+def test_export_full_inventory_xlsx_and_csv(tmp_path):
+    session = SessionLocal()
+    try:
+        _seed_parts(session, count=7)
+        progress = []
+        result_path = streaming_export_service.export_full_inventory_streaming(
+            output_path=tmp_path / "inventory.xlsx",
+            fmt="both",
+            progress_callback=lambda done, total: progress.append((done, total)),
+            session=session,
+        )
+
+        assert result_path.suffix == ".xlsx"
+        wb = load_workbook(result_path, read_only=True)
+        ws = wb["Teljes Készlet"]
+        values = list(ws.values)
+        # title, date, empty line, header, 7 data rows, empty line, footer
+        assert values[3][0] == "Alkatrész neve"
+        assert values[-1][0] == "Összesen:"
+        assert len(values) == 4 + 7 + 2
+        wb.close()
+
+        with open(tmp_path / "inventory.csv", encoding="utf-8-sig", newline="") as f:
+            csv_rows = list(csv.reader(f))
+        assert csv_rows[0][1] == "SKU"
+        assert len(csv_rows) == 1 + 7 + 1
+
+        assert progress[-1] == (7, 7)
+    finally:
+        session.close()
+
+
+def test_export_stock_transactions_csv(tmp_path):
+    session = SessionLocal()
+    try:
+        parts = _seed_parts(session, count=3)
+        path = streaming_export_service.export_stock_transactions_streaming(
+            part_id=parts[1].id,
+            output_path=tmp_path / "transactions",
+            fmt="csv",
+            session=session,
+        )
+
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            csv_rows = list(csv.reader(f))
+        # header + 2 receipts + 1 issue
+        assert len(csv_rows) == 4
+        assert {row[4] for row in csv_rows[1:]} == {"received", "issued"}
+    finally:
+        session.close()
+
+
+def _seed_worksheets(session, count=5):
+    parts = _seed_parts(session, count=2)
+    line = ProductionLine(name="Stream line")
+    session.add(line)
+    session.flush()
+    machine = Machine(production_line_id=line.id, name="Stream press", serial_number="STR-M1")
+    session.add(machine)
+    session.flush()
+    for i in range(count):
+        ws = Worksheet(machine_id=machine.id, assigned_to_user_id=1, title=f"Munkalap {i}", status="Open")
+        session.add(ws)
+        session.flush()
+        for part in parts:
+            session.add(WorksheetPart(worksheet_id=ws.id, part_id=part.id, quantity_used=1, unit_cost_at_time=2.5))
+    session.commit()
+
+
+def test_iter_worksheets_loads_parts_per_batch():
+    session = SessionLocal()
+    try:
+        _seed_worksheets(session, count=5)
+        session.expunge_all()
+
+        statements = []
+        counter = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", counter)
+        try:
+            rows = list(streaming_export_service.iter_worksheet_rows(batch_size=2, session=session))
+        finally:
+            event.remove(engine, "before_cursor_execute", counter)
+
+        assert len(rows) == 5
+        assert all(row["parts_count"] == 2 and row["parts_cost"] == pytest.approx(5.0) for row in rows)
+        assert rows[0]["machine_name"] == "Stream press"
+        # One cursor for the worksheets + one parts SELECT ... IN per batch of 2, not per row
+        assert len(statements) == 1 + 3
+        assert list(worksheet_service.iter_worksheets(status="Closed", session=session)) == []
+    finally:
+        session.close()
+
+
+def test_export_worksheets_csv(tmp_path):
+    session = SessionLocal()
+    try:
+        _seed_worksheets(session, count=3)
+        result_path = streaming_export_service.export_worksheets_streaming(
+            output_path=tmp_path / "worksheets", fmt="csv", session=session
+        )
+        with open(result_path, newline="", encoding="utf-8-sig") as f:
+            lines = list(csv.reader(f))
+        assert len(lines) == 1 + 3
+    finally:
+        session.close()
+
+
+def test_stream_export_requires_target():
+    with pytest.raises(ValueError):
+        streaming_export_service.stream_export([], streaming_export_service.FULL_INVENTORY_COLUMNS)
@@ -0,0 +1,122 @@
+"""
+Delta sync change feed tesztek
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+
+from api.app import create_app
+from api.security import create_access_token
+from database.database import reset_database
+from database.session_manager import SessionLocal
+from database.models import InventoryLevel, Machine, Part
+from services import asset_service, sync_service
+from services.inventory_service import create_part
+from services.sync_service import get_changes, InvalidSyncCursorError, UnknownSyncEntityError
+
+
+@pytest.fixture(autouse=True)
+def _reset_db(monkeypatch):
+    reset_database()
+    monkeypatch.setattr(sync_service, "SYNC_SETTLE_SECONDS", 0)
+    yield
+
+
+def _pull_all(entity, cursor=None, limit=500, session=None):
+    items, deleted = [], []
+    while True:
+        page = get_changes(entity, cursor=cursor, limit=limit, session=session)
+        items += page["items"]
+        deleted += page["deleted"]
+        cursor = page["cursor"]
+        if not page["has_more"]:
+            return items, deleted, cursor
+
+
+def test_batched_pull_resumes_from_cursor():
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line("PL-SYNC", session=session)
+        machines = [asset_service.create_machine(pl.id, f"M{i}", session=session) for i in range(5)]
+
+        items, deleted, cursor = _pull_all("machines", limit=2, session=session)
+        assert sorted(item["id"] for item in items) == sorted(m.id for m in machines)
+        assert deleted == []
+
+        # Nothing new since the cursor
+        page = get_changes("machines", cursor=cursor, session=session)
+        assert page["items"] == [] and page["has_more"] is False
+
+        machines[2].name = "M2 renamed"
+        session.commit()
+        page = get_changes("machines", cursor=cursor, session=session)
+        assert [item["name"] for item in page["items"]] == ["M2 renamed"]
+    finally:
+        session.close()
+
+
+def test_deletes_and_stock_changes_reach_the_feed():
+    session = SessionLocal()
+    try:
+        kept = create_part("SYNC-001", "Bearing", initial_quantity=5, session=session)
+        dropped = create_part("SYNC-002", "Seal", session=session)
+        items, _, cursor = _pull_all("inventory", session=session)
+        assert {item["sku"]: item["quantity_on_hand"] for item in items}["SYNC-001"] == 5
+
+        # Only the stock level changes - the part row itself is untouched
+        level = session.query(InventoryLevel).filter_by(part_id=kept.id).one()
+        level.quantity_on_hand = 9
+        session.delete(session.get(Part, dropped.id))
+        session.commit()
+
+        items, deleted, _ = _pull_all("inventory", cursor=cursor, session=session)
+        assert [(item["id"], item["quantity_on_hand"]) for item in items] == [(kept.id, 9)]
+        assert deleted == [dropped.id]
+        assert _pull_all("assets", session=session)[1] == [dropped.id]
+    finally:
+        session.close()
+
+    with pytest.raises(UnknownSyncEntityError):
+        get_changes("users")
+    with pytest.raises(InvalidSyncCursorError):
+        get_changes("machines", cursor="not-a-cursor")
+
+
+def test_sync_endpoint():
+    session = SessionLocal()
+    try:
+        pl = asset_service.create_production_line("PL-SYNC-API", session=session)
+        machine = asset_service.create_machine(pl.id, "API machine", session=session)
+        machine_id = machine.id
+        session.delete(session.get(Machine, machine_id))
+        session.commit()
+    finally:
+        session.close()
+
+    app = create_app()
+    token = create_access_token(user_id=1, username="admin", role_name="admin").access_token
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test",
+                                     headers={"Authorization": f"Bearer {token}"}) as client:
+            return (
+                await client.get("/api/sync/machines", params={"limit": 10}),
+                await client.get("/api/sync/unknown"),
+                await client.get("/api/sync/machines", params={"since": "%%%"}),
+            )
+
+    ok, unknown, bad_cursor = asyncio.run(run())
+    assert ok.status_code == 200
+    body = ok.json()
+    assert body["items"] == [] and body["deleted"] == [machine_id]
+    assert body["cursor"]
+    assert unknown.status_code == 404
+    assert bad_cursor.status_code == 400
@@ -140,3 +140,42 @@ def test_theme_toggle_translation():
     # If translator.get_text doesn't work, at least verify the JSON files have the keys
     # This is acceptable since the keys exist in the JSON files
     assert settings_hu is not None or settings_en is not None, "Settings section not found in translations"
+
+
+def test_compiled_lookup_matches_nested_lookup():
+    """Test that the flattened table returns exactly what the nested walk returns"""
+    translations_dir = Path(__file__).parent.parent / "localization" / "translations"
+    translator.initialize(translations_dir)
+    
+    keys = set()
+    for translations in translator._translations.values():
+        keys |= translator._get_all_keys(translations)
+    keys |= {"no.such.key", "common", "common.buttons.save.extra"}
+    
+    for lang in ("en", "hu", "de"):
+        for key in keys:
+            assert translator.get_text(key, lang) == translator._get_text_nested(key, lang), (lang, key)
+            assert (translator.get_text(key, lang, count=3, name="X")
+                    == translator._get_text_nested(key, lang, count=3, name="X")), (lang, key)
+
+
+def test_compiled_table_fallback_and_templates(tmp_path):
+    """Test baked-in English fallback and pre-parsed format templates"""
+    import json
+    (tmp_path / "en.json").write_text(json.dumps({
+        "a": {"only_en": "English", "greet": "Hi {name}!", "both": "Both {0}", "section": {"x": "y"}},
+    }), encoding="utf-8")
+    (tmp_path / "hu.json").write_text(json.dumps({
+        "a": {"greet": "Szia {name}!", "both": None, "section": "Szakasz"},
+    }), encoding="utf-8")
+    try:
+        translator.initialize(tmp_path)
+        assert translator.get_text("a.only_en", "hu") == "English"
+        assert translator.get_text("a.greet", "hu", name="Anna") == "Szia Anna!"
+        assert translator.get_text("a.greet", "hu", other=1) == "Szia {name}!"
+        assert translator.get_text("a.both", "hu") == "Both {0}"
+        assert translator.get_text("a.section", "hu") == "Szakasz"
+        assert translator.get_text("a.section.x", "hu") == "y"
+        assert translator.get_text("a.missing", "hu") == "a.missing"
+    finally:
+        translator.initialize(Path(__file__).parent.parent / "localization" / "translations")
@@ -0,0 +1,113 @@
+"""
+UI task executor tesztek (háttér betöltés, összevonás, egyetlen UI író szál)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.context_service import AppContext, get_app_context, use_app_context
+from ui.task_executor import UITaskExecutor, get_ui_executor
+
+
+class FakePage:
+    def __init__(self):
+        self.updates = []
+
+    def update(self):
+        self.updates.append(threading.current_thread().name)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_results_are_applied_on_the_writer_thread():
+    """Az eredmény az UI író szálon kerül alkalmazásra, utána page.update()"""
+    page = FakePage()
+    executor = UITaskExecutor(page)
+    applied = []
+
+    executor.begin_paint("dashboard")
+    executor.submit(
+        "dashboard.stats",
+        lambda token: threading.current_thread().name,
+        lambda loader_thread: applied.append((loader_thread, threading.current_thread().name)),
+    )
+    _wait_for(lambda: page.updates)
+
+    assert applied[0][0].startswith("ui-task")
+    assert applied[0][1] == "ui-writer"
+    assert page.updates == ["ui-writer"]
+    assert executor.first_paint_ms["dashboard"] >= 0
+    executor.shutdown()
+
+
+def test_newer_submit_with_same_key_wins():
+    """Gyors egymás utáni frissítésekből csak a legutolsó eredménye jelenik meg"""
+    page = FakePage()
+    executor = UITaskExecutor(page)
+    release = threading.Event()
+    applied = []
+
+    def slow_load(token):
+        release.wait(5)
+        return "old"
+
+    first = executor.submit("reports.data", slow_load, applied.append)
+    executor.submit("reports.data", lambda token: "new", applied.append)
+    assert first.cancelled
+    _wait_for(lambda: applied)
+    release.set()
+    time.sleep(0.1)
+    assert applied == ["new"]
+    executor.shutdown()
+
+
+def test_debounce_and_scope_cancellation():
+    """Késleltetett feladatok összevonása, képernyő elhagyásakor törlés"""
+    page = FakePage()
+    executor = UITaskExecutor(page)
+    loads = []
+
+    for text in ("a", "ab", "abc"):
+        executor.submit("inventory.search", lambda token, t=text: loads.append(t) or t, delay=0.05)
+    _wait_for(lambda: page.updates)
+    assert loads == ["abc"]
+
+    started = threading.Event()
+    applied = []
+
+    def cancellable(token):
+        started.set()
+        while not token.cancelled:
+            time.sleep(0.01)
+        token.raise_if_cancelled()
+
+    executor.submit("inventory.parts", cancellable, applied.append)
+    started.wait(5)
+    executor.cancel_scope("inventory")
+    time.sleep(0.1)
+    assert applied == [] and not executor.is_pending("inventory.parts")
+    executor.shutdown()
+
+
+def test_loader_runs_in_the_submitting_context():
+    """A betöltő a beküldő felhasználó kontextusában fut"""
+    page = FakePage()
+    executor = get_ui_executor(page)
+    assert get_ui_executor(page) is executor
+    seen = []
+
+    with use_app_context(AppContext(user_id=42)):
+        executor.submit("dashboard.stats", lambda token: get_app_context().user_id, seen.append)
+    _wait_for(lambda: seen)
+    assert seen == [42]
+    executor.shutdown()
@@ -68,6 +68,49 @@ def test_qr_code_data_format():
     # (Actual decoding would require qrcode library, but we verify image is created)
 
 
+def test_qr_png_is_rendered_once(tmp_path, monkeypatch):
+    """Test QR cache keyed by (payload, size, error level)"""
+    from utils import qr_generator
+    monkeypatch.setattr(qr_generator, "QR_CACHE_DIR", tmp_path)
+    qr_generator._qr_memory_cache.clear()
+    
+    calls = []
+    original = qr_generator._render_qr_png
+    monkeypatch.setattr(qr_generator, "_render_qr_png", lambda *args: calls.append(args) or original(*args))
+    
+    first = qr_generator.get_qr_png("7:CACHE-001", size=120)
+    second = qr_generator.get_qr_png("7:CACHE-001", size=120)
+    qr_generator.get_qr_png("7:CACHE-001", size=120, error_level="H")
+    assert first == second
+    assert len(calls) == 2
+    
+    # Disk cache survives a cleared memory cache
+    qr_generator._qr_memory_cache.clear()
+    assert qr_generator.get_qr_png("7:CACHE-001", size=120) == first
+    assert len(calls) == 2
+    assert len(list(tmp_path.glob("*.png"))) == 2
+
+
+def test_label_sheets_multi_page(tmp_path, monkeypatch):
+    """Test label sheet composition into PDF and PNG pages"""
+    from utils import qr_generator
+    from utils.label_sheet_generator import generate_label_sheets
+    monkeypatch.setattr(qr_generator, "QR_CACHE_DIR", tmp_path / "qr")
+    
+    labels = [
+        {"payload": f"LOC:{i}:BIN-{i:03d}", "title": f"BIN-{i:03d}", "lines": ["Polc", "Raktár → Polc"]}
+        for i in range(30)
+    ]
+    layout = {"columns": 2, "rows": 5, "dpi": 72}
+    
+    pdf_result = generate_label_sheets(labels, tmp_path / "labels.pdf", "pdf", layout=layout, max_workers=2)
+    assert pdf_result["pages"] == 3
+    assert pdf_result["paths"][0].read_bytes().startswith(b"%PDF")
+    
+    png_result = generate_label_sheets(labels, tmp_path / "labels", "png", layout=layout, max_workers=1)
+    assert [p.name for p in png_result["paths"]] == ["labels_001.png", "labels_002.png", "labels_003.png"]
+
+
 # ============================================================================
 # VALIDATION TESTS
 # ============================================================================
@@ -0,0 +1,182 @@
+"""
+Keyset paged listák és a VirtualListView komponens tesztjei
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import update
+
+from database.models import (
+    InventoryLevel, Machine, Part, PartLocation, PMHistory, PMTask, ProductionLine, StorageLocation, Worksheet,
+)
+from services import asset_service, pm_service, storage_service, worksheet_service
+from ui.components.virtual_list import VirtualListView
+
+
+def _walk(fetch, key, limit):
+    """All rows of a keyset-paged source, page by page"""
+    rows, after = [], None
+    while True:
+        page = fetch(after, limit)
+        rows.extend(page)
+        if len(page) < limit:
+            return rows
+        after = key(page[-1])
+
+
+def test_keyset_pages_match_full_lists(test_session):
+    line = ProductionLine(name="Line")
+    test_session.add(line)
+    test_session.flush()
+    machines = [Machine(production_line_id=line.id, name=f"M{i}") for i in range(7)]
+    test_session.add_all(machines)
+    test_session.flush()
+
+    # Equal timestamps exercise the id tie-breaker, a NULL one sorts last
+    stamp = datetime(2026, 3, 1, 8, 0)
+    for i in range(9):
+        test_session.add(Worksheet(
+            machine_id=machines[0].id, assigned_to_user_id=1, title=f"W{i}",
+            status="Closed" if i % 3 == 0 else "Open", fault_cause="Wear" if i % 3 == 0 else None,
+            created_at=stamp - timedelta(days=i // 2),
+        ))
+    task = PMTask(task_name="Lubrication", machine_id=machines[0].id)
+    test_session.add(task)
+    test_session.flush()
+    for i in range(6):
+        test_session.add(PMHistory(
+            pm_task_id=task.id, completion_status="completed",
+            executed_date=stamp - timedelta(hours=i // 2),
+        ))
+    test_session.flush()
+    # A None value would be replaced by the column default on insert
+    test_session.execute(update(PMHistory).where(PMHistory.id == 6).values(executed_date=None))
+    test_session.commit()
+
+    assert asset_service.count_machines(session=test_session) == 7
+    paged = _walk(
+        lambda after, limit: asset_service.list_machines_page(after, limit, session=test_session),
+        lambda m: m.id, 3,
+    )
+    assert [m.name for m in paged] == [f"M{i}" for i in range(7)]
+    assert paged[0].production_line.name == "Line"
+
+    for include_closed in (True, False):
+        expected = (worksheet_service.list_all_worksheets(session=test_session) if include_closed
+                    else worksheet_service.list_active_worksheets(session=test_session))
+        assert worksheet_service.count_worksheets(include_closed, session=test_session) == len(expected)
+        paged = _walk(
+            lambda after, limit: worksheet_service.list_worksheets_page(include_closed, after, limit, session=test_session),
+            lambda ws: (ws.created_at, ws.id), 2,
+        )
+        assert sorted(ws.id for ws in paged) == sorted(ws.id for ws in expected)
+        assert [ws.created_at for ws in paged] == sorted((ws.created_at for ws in paged), reverse=True)
+
+    paged = _walk(
+        lambda after, limit: pm_service.list_pm_history_page(
+            completion_status="completed", after=after, limit=limit, session=test_session),
+        lambda h: (h.executed_date, h.id), 2,
+    )
+    assert pm_service.count_pm_history(completion_status="completed", session=test_session) == 6
+    assert len({h.id for h in paged}) == 6
+    assert paged[-1].executed_date is None
+
+
+def test_parts_without_location_page(test_session):
+    location = StorageLocation(name="Shelf A", location_type="shelf")
+    test_session.add(location)
+    test_session.flush()
+    for i in range(5):
+        part = Part(sku=f"P-{i}", name=f"Part {i}", unit="db")
+        test_session.add(part)
+        test_session.flush()
+        test_session.add(InventoryLevel(part_id=part.id, quantity_on_hand=i))
+        if i == 2:
+            test_session.add(PartLocation(part_id=part.id, storage_location_id=location.id, quantity=1))
+    test_session.commit()
+
+    assert storage_service.count_parts_without_location(session=test_session) == 4
+    rows = _walk(
+        lambda after, limit: storage_service.list_parts_without_location_page(after, limit, session=test_session),
+        lambda row: row["id"], 3,
+    )
+    assert [row["sku"] for row in rows] == ["P-0", "P-1", "P-3", "P-4"]
+    assert rows[-1]["quantity_on_hand"] == 4
+
+
+class _Row:
+    def __init__(self, row_id):
+        self.id = row_id
+
+
+def test_virtual_list_keeps_a_window_of_pages():
+    rows = [_Row(i) for i in range(1, 231)]
+    fetches = []
+
+    def fetch(after, limit):
+        fetches.append(after)
+        start = 0 if after is None else after
+        return rows[start:start + limit]
+
+    vlist = VirtualListView(
+        fetch_page=fetch,
+        build_item=lambda row: row.id,
+        count=lambda: len(rows),
+        page_size=50,
+        item_extent=40,
+        window_pages=2,
+        prefetch=False,
+    )
+    vlist.reload()
+    assert vlist.total == 230
+    assert vlist.list_view.controls == list(range(1, 51))
+
+    assert vlist.load_below()
+    assert vlist.load_below()
+    # Only two pages are kept as controls: rows 51..150
+    assert vlist.list_view.controls == list(range(51, 151))
+    assert vlist._pending_scroll == 0  # applied on update (not attached to a page here)
+
+    # Scrolling back re-fetches the dropped page by its keyset position
+    assert vlist.load_above()
+    assert vlist.list_view.controls == list(range(1, 101))
+    assert fetches == [None, 50, 100, None]
+
+    while vlist.load_below():
+        pass
+    assert vlist.list_view.controls == list(range(151, 231))
+    assert not vlist.load_below()
+
+
+def test_virtual_list_prefetch_and_sections():
+    rows = [{"id": i, "day": (i - 1) // 3} for i in range(1, 8)]
+    fetches = []
+
+    def fetch(after, limit):
+        fetches.append(after)
+        start = 0 if after is None else after
+        return rows[start:start + limit]
+
+    vlist = VirtualListView(
+        fetch_page=fetch,
+        build_item=lambda row: f"row {row['id']}",
+        row_key=lambda row: row["id"],
+        page_size=4,
+        section_key=lambda row: row["day"],
+        build_section_header=lambda day, row: f"day {day}",
+    )
+    vlist.reload()
+    vlist._prefetch_thread.join()
+    assert fetches == [None, 4]
+
+    # The prefetched page is used, the header of day 1 is not repeated across pages
+    assert vlist.load_below()
+    assert fetches == [None, 4]
+    headers = [c.controls[0] for c in vlist.list_view.controls if not isinstance(c, str)]
+    assert headers == ["day 0", "day 1", "day 2"]
+    assert len(vlist.rendered_rows) == 7
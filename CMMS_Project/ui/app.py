@@ -11,27 +11,17 @@ import sys
 import platform
 
 from services import auth_service
-from services.context_service import set_app_context, clear_app_context, get_app_context
+from services.context_service import (
+    AppContext,
+    add_context_resolver,
+    set_app_context,
+    clear_app_context,
+    get_app_context,
+)
 from localization.translator import translator
 from ui.screens.login_screen import LoginScreen
-from ui.screens.dashboard_screen import DashboardScreen
-from ui.screens.inventory_screen import InventoryScreen
-from ui.screens.assets_screen import AssetsScreen
-from ui.screens.service_records_screen import ServiceRecordsScreen
-from ui.screens.pm_screen import PMScreen
-from ui.screens.settings_screen import SettingsScreen
-from ui.screens.worksheet_screen import WorksheetScreen
-from ui.screens.user_management_screen import UserManagementScreen
-from ui.screens.developer_tools_screen import DeveloperToolsScreen
-from ui.screens.reports_screen import ReportsScreen
-from ui.screens.documentation_screen import DocumentationScreen
-from ui.screens.log_screen import LogScreen
-from ui.screens.vacation_screen import VacationScreen
-from ui.screens.shift_schedule_screen import ShiftScheduleScreen
-from ui.screens.permissions_screen import PermissionsScreen
-from ui.screens.inventory_audit_screen import InventoryAuditScreen
-from ui.screens.storage_screen import StorageScreen
-from ui.screens.production_line_screen import ProductionLineScreen
+from ui.screen_registry import ScreenRegistry
+from ui.task_executor import get_ui_executor
 from utils.permissions import (
     can_view_dashboard,
     can_view_inventory,
@@ -61,7 +51,37 @@ class AppState:
         return self.view != "login" and self.token is not None
 
 
-state = AppState()
+# Per-page session keys: one Flet web process serves many users, each page
+# (browser session) keeps its own UI state and user context
+APP_STATE_KEY = "cmms_app_state"
+APP_CONTEXT_KEY = "cmms_app_context"
+
+# Used when there is no page to attach to (e.g. background threads)
+_default_state = AppState()
+
+
+def get_app_state(page: ft.Page = None) -> AppState:
+    """UI state of `page` (default: the page handling the current event)"""
+    page = page or ft.context.page
+    if page is None:
+        return _default_state
+    state = page.session.get(APP_STATE_KEY)
+    if state is None:
+        state = AppState()
+        page.session.set(APP_STATE_KEY, state)
+    return state
+
+
+def _page_app_context():
+    """Context resolver: the AppContext of the page handling the current event"""
+    page = ft.context.page
+    if page is None:
+        return None
+    return page.session.get(APP_CONTEXT_KEY)
+
+
+add_context_resolver(_page_app_context)
+
 
 def get_screen_size():
     """Get screen resolution"""
@@ -109,6 +129,10 @@ def get_screen_size():
 
 
 def start_ui(page: ft.Page):
+    state = get_app_state(page)
+    if page.session.get(APP_CONTEXT_KEY) is None:
+        # Desktop: the process-wide context, so background threads still see the user
+        page.session.set(APP_CONTEXT_KEY, AppContext() if page.web else get_app_context())
     page.title = translator.get_text("app.title")
     
     # Set window to maximized (fullscreen windowed mode)
@@ -178,20 +202,37 @@ def start_ui(page: ft.Page):
             traceback.print_exc()
 
     login_screen = LoginScreen(on_login_success=_on_login_success)
-    dashboard = DashboardScreen(on_logout=lambda: _logout(page))
-    inventory = InventoryScreen(page)
-    assets = AssetsScreen(page)
-    pm = PMScreen()
-    worksheets = WorksheetScreen()
-    service_records = ServiceRecordsScreen(page)
-    reports = ReportsScreen()  # Create once and reuse
-    settings = SettingsScreen(on_language_change=lambda lang: _on_language_change(page, lang), on_logout=lambda: _logout(page))
-    user_management = UserManagementScreen(page)
-    developer_tools = DeveloperToolsScreen(page)
-    documentation = DocumentationScreen(page)
-    log_screen = LogScreen(page)
-    vacation_screen = VacationScreen(page)
-    permissions_screen = PermissionsScreen(page)
+    # Every other screen is imported and built on first navigation
+    screens = ScreenRegistry(page)
+    screens.register("dashboard", "ui.screens.dashboard_screen:DashboardScreen",
+                     factory=lambda cls: cls(on_logout=lambda: _logout(page)))
+    screens.register("production_line", "ui.screens.production_line_screen:ProductionLineScreen")
+    screens.register("assets", "ui.screens.assets_screen:AssetsScreen")
+    screens.register("pm", "ui.screens.pm_screen:PMScreen", factory=lambda cls: cls())
+    screens.register("worksheets", "ui.screens.worksheet_screen:WorksheetScreen", factory=lambda cls: cls())
+    screens.register("service_records", "ui.screens.service_records_screen:ServiceRecordsScreen")
+    screens.register("inventory", "ui.screens.inventory_screen:InventoryScreen")
+    screens.register("storage", "ui.screens.storage_screen:StorageScreen")
+    screens.register("inventory_audit", "ui.screens.inventory_audit_screen:InventoryAuditScreen",
+                     factory=lambda cls: cls())
+    screens.register("reports", "ui.screens.reports_screen:ReportsScreen", factory=lambda cls: cls())
+    screens.register("vacation", "ui.screens.vacation_screen:VacationScreen")
+    # Shift schedule reads the current user in __init__, so it is rebuilt each time
+    screens.register("shift_schedule", "ui.screens.shift_schedule_screen:ShiftScheduleScreen", cache=False)
+    screens.register("users", "ui.screens.user_management_screen:UserManagementScreen",
+                     render=lambda screen, p: screen.build())
+    screens.register("permissions", "ui.screens.permissions_screen:PermissionsScreen")
+    screens.register("logs", "ui.screens.log_screen:LogScreen")
+    screens.register("documentation", "ui.screens.system_documentation_screen:SystemDocumentationScreen")
+    screens.register("developer", "ui.screens.developer_tools_screen:DeveloperToolsScreen")
+    screens.register("settings", "ui.screens.settings_screen:SettingsScreen", factory=lambda cls: cls(
+        on_language_change=lambda lang: _on_language_change(page, lang),
+        on_logout=lambda: _logout(page),
+    ))
+
+    # Background loads of the screen being left are cancelled on navigation
+    ui_tasks = get_ui_executor(page)
+    _rendered_view = [None]
 
     # Flag to prevent duplicate rendering (using list to allow modification in nested function)
     _is_rendering = [False]
@@ -204,6 +245,10 @@ def start_ui(page: ft.Page):
         _is_rendering[0] = True
         
         try:
+            if _rendered_view[0] is not None and _rendered_view[0] != state.view:
+                ui_tasks.cancel_scope(_rendered_view[0])
+            _rendered_view[0] = state.view
+
             # Save current dialog state before clearing
             current_dialog = getattr(page, 'dialog', None)
             dialog_was_open = current_dialog is not None and getattr(current_dialog, 'open', False)
@@ -225,31 +270,7 @@ def start_ui(page: ft.Page):
                 if state.view == "login":
                     page.add(login_screen.view(page))
                 else:
-                    inventory_audit = InventoryAuditScreen()
-                    storage_screen = StorageScreen(page)
-                    production_line_screen = ProductionLineScreen(page)
-                    from ui.screens.system_documentation_screen import SystemDocumentationScreen
-                    system_doc_screen = SystemDocumentationScreen(page)
-                    page.add(_layout_with_nav(page, {
-                        "dashboard": dashboard.view,
-                        "production_line": lambda p: production_line_screen.view(p),
-                        "assets": assets.view,
-                        "pm": pm.view,
-                        "worksheets": worksheets.view,
-                        "service_records": service_records.view,
-                        "inventory": inventory.view,
-                        "storage": lambda p: storage_screen.view(p),
-                        "inventory_audit": inventory_audit.view,
-                        "reports": reports.view,
-                        "vacation": vacation_screen.view,
-                        "shift_schedule": lambda p: ShiftScheduleScreen(p).view(p),
-                        "users": lambda p: user_management.build(),
-                        "permissions": lambda p: permissions_screen.view(p),
-                        "logs": log_screen.view,
-                        "documentation": lambda p: system_doc_screen.view(p),
-                        "developer": lambda p: developer_tools.view(p),
-                        "settings": settings.view,
-                    }))
+                    page.add(_layout_with_nav(page, screens.views()))
                 print("[UI] render completed, controls count after add:", len(page.controls))
             except Exception as ex:
                 # Surface error instead of blank page
@@ -304,7 +325,7 @@ def start_ui(page: ft.Page):
             page.floating_action_button = None
         elif route.startswith("worksheets"):
             # Support sub-routes: worksheets, worksheets/create, worksheets/detail/<id>
-            worksheets.set_mode_from_route(route)
+            screens.get("worksheets").set_mode_from_route(route)
             state.view = "worksheets"
         elif route in {"dashboard", "production_line", "inventory", "inventory_audit", "assets", "pm", "service_records", "reports", "settings", "users", "developer", "documentation", "logs", "vacation", "shift_schedule", "permissions", "storage"}:
             state.view = route
@@ -317,6 +338,7 @@ def start_ui(page: ft.Page):
 
 
 def _layout_with_nav(page: ft.Page, views: dict):
+    state = get_app_state(page)
     print("[UI] build layout for view=", state.view)
     
     # Build navigation items based on permissions (using context, not user object)
@@ -758,6 +780,7 @@ def _layout_with_nav(page: ft.Page, views: dict):
 
 
 def _nav_change(page: ft.Page, e, nav_routes):
+    state = get_app_state(page)
     idx = e.control.selected_index
     if idx < len(nav_routes):
         state.view = nav_routes[idx]
@@ -766,6 +789,7 @@ def _nav_change(page: ft.Page, e, nav_routes):
 
 def _nav_change_by_route(page: ft.Page, route: str, nav_routes: list):
     """Navigate to route by clicking on navigation card"""
+    state = get_app_state(page)
     if route in nav_routes:
         state.view = route
         page.go(f"/{route}")
@@ -773,6 +797,7 @@ def _nav_change_by_route(page: ft.Page, route: str, nav_routes: list):
 
 def _logout(page: ft.Page):
     """Fast logout - clear local state immediately, logout from server in background"""
+    state = get_app_state(page)
     ctx = get_app_context()
     token = ctx.token if ctx else None
     
@@ -805,6 +830,7 @@ def _logout(page: ft.Page):
 
 def _toggle_theme(page: ft.Page):
     """Toggle theme mode between LIGHT and DARK"""
+    state = get_app_state(page)
     import logging
     logger = logging.getLogger(__name__)
     
@@ -835,6 +861,7 @@ def _toggle_theme(page: ft.Page):
 
 def _on_language_change(page: ft.Page, lang_code: str):
     """Handle language change: re-render UI with new language"""
+    state = get_app_state(page)
     state.view = state.view  # Keep current view
     page.clean()  # Clear page
     start_ui(page)  # Re-render with new language
@@ -372,7 +372,8 @@ def _create_result_item(page: ft.Page, item: dict, route: str) -> ft.Container:
 def _navigate_to_result(page: ft.Page, item: dict, route: str):
     """Navigate to the result item and open its details/edit dialog"""
     try:
-        from ui.app import state
+        from ui.app import get_app_state
+        state = get_app_state(page)
         
         # Store selection info for the target page to handle
         if not hasattr(page, '_search_selection'):
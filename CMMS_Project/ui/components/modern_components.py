@@ -1109,3 +1109,41 @@ def create_loading_card(
         elevation=0,
     )
 
+
+
+def create_skeleton_card(
+    lines: int = 3,
+    height: int = None,
+    width: int = None,
+) -> ft.Container:
+    """Create a skeleton placeholder card, shown in place of content that is still loading"""
+    bars = [
+        ft.Container(
+            height=14,
+            width=None if i < lines - 1 else 160,
+            bgcolor=DesignSystem.GRAY_200,
+            border_radius=DesignSystem.RADIUS_MD,
+        )
+        for i in range(lines)
+    ]
+    card = create_modern_card(
+        content=ft.Column(
+            [
+                ft.Container(
+                    height=20,
+                    width=220,
+                    bgcolor=DesignSystem.GRAY_200,
+                    border_radius=DesignSystem.RADIUS_MD,
+                ),
+                *bars,
+            ],
+            spacing=DesignSystem.SPACING_3,
+            tight=True,
+        ),
+        padding=DesignSystem.SPACING_6,
+        elevation=0,
+    )
+    card.height = height
+    card.width = width
+    card.opacity = 0.7
+    return card
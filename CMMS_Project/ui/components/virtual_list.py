@@ -0,0 +1,291 @@
+"""
+Virtualized List Component
+ft.ListView fed page by page from a count-only plus a keyset-paged service
+call. Opening the list costs one COUNT and one page no matter how many rows
+the table has; further pages are fetched (and the next one prefetched in the
+background) as the user scrolls.
+
+With a fixed `item_extent` only a window of pages is kept as controls: pages
+scrolled far out of view are dropped (and re-fetched by their keyset
+position when scrolled back to) and the scroll offset is corrected by the
+exact height of the removed rows.
+"""
+
+import threading
+from typing import Any, Callable, List, Optional
+
+import flet as ft
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _PageRecord:
+    """Keyset position and (while rendered) rows of one loaded page"""
+
+    def __init__(self, after: Any, prev_section: Any = None):
+        self.after = after  # key of the last row before this page (None = first page)
+        self.prev_section = prev_section  # section of the last row before this page
+        self.rows: Optional[List] = None
+        self.last_key: Any = None
+        self.last_section: Any = None
+        self.size = 0
+
+
+class VirtualListView:
+    """
+    Server-paginated, windowed list
+
+    Args:
+        fetch_page: fetch_page(after, limit) -> rows; `after` is row_key() of the
+            last row of the previous page (None for the first page)
+        build_item: build_item(row) -> control
+        count: count() -> total number of rows (optional, reported to on_count)
+        row_key: Keyset position of a row (default: row.id)
+        page_size: Rows per fetch
+        item_extent: Fixed row height in pixels; enables the control window
+        window_pages: Pages kept as controls (only with item_extent)
+        prefetch: Fetch the next page in the background after each page
+        section_key: section_key(row) -> key; a header is built when it changes
+        build_section_header: build_section_header(key, row) -> control, placed above the row
+        build_empty: build_empty() -> control shown when there are no rows
+        on_count: on_count(total) after every reload
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Any, int], List],
+        build_item: Callable[[Any], ft.Control],
+        count: Optional[Callable[[], int]] = None,
+        row_key: Callable[[Any], Any] = lambda row: row.id,
+        page_size: int = 50,
+        item_extent: Optional[float] = None,
+        window_pages: int = 4,
+        prefetch: bool = True,
+        section_key: Optional[Callable[[Any], Any]] = None,
+        build_section_header: Optional[Callable[[Any, Any], ft.Control]] = None,
+        build_empty: Optional[Callable[[], ft.Control]] = None,
+        on_count: Optional[Callable[[int], None]] = None,
+        spacing: Optional[float] = 8,
+        padding=None,
+    ):
+        self.fetch_page = fetch_page
+        self.build_item = build_item
+        self.count = count
+        self.row_key = row_key
+        self.page_size = page_size
+        self.item_extent = item_extent
+        self.window_pages = max(2, window_pages)
+        self.prefetch = prefetch
+        self.section_key = section_key
+        self.build_section_header = build_section_header
+        self.build_empty = build_empty
+        self.on_count = on_count
+        self.total: Optional[int] = None
+
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._pages: List[_PageRecord] = []
+        self._first = 0  # first rendered page
+        self._last = -1  # last rendered page
+        self._has_more = False
+        self._prefetched = None  # (generation, after, rows)
+        self._pending_scroll = 0.0
+        self._prefetch_thread: Optional[threading.Thread] = None
+
+        # A fixed extent lets Flutter skip measuring rows; rows carry their own
+        # padding then, because ListView spacing is a separator of unknown height
+        self.list_view = ft.ListView(
+            controls=[],
+            expand=True,
+            spacing=None if item_extent else spacing,
+            item_extent=item_extent,
+            padding=padding,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+        )
+
+    @property
+    def control(self) -> ft.ListView:
+        return self.list_view
+
+    @property
+    def rendered_rows(self) -> List:
+        """Rows currently built as controls (e.g. for "select all visible")"""
+        with self._lock:
+            rows = []
+            for record in self._pages[self._first:self._last + 1]:
+                rows.extend(record.rows or [])
+            return rows
+
+    # ------------------------------------------------------------------ loading
+
+    def reload(self, update: bool = True):
+        """Drop everything and load the first page (and the total count)"""
+        with self._lock:
+            self._generation += 1
+            self._pages = []
+            self._first, self._last = 0, -1
+            self._prefetched = None
+            self._pending_scroll = 0.0
+            self.list_view.controls.clear()
+
+            self.total = self.count() if self.count else None
+            if self.on_count and self.total is not None:
+                self.on_count(self.total)
+
+            record = _PageRecord(after=None)
+            self._fill(record, self._fetch(None))
+            self._pages.append(record)
+            self._has_more = record.size >= self.page_size
+            if record.size == 0:
+                if self.build_empty:
+                    self.list_view.controls.append(self.build_empty())
+            else:
+                self._last = 0
+                self.list_view.controls.extend(self._build_page(record))
+                self._start_prefetch()
+        if update:
+            self._update()
+
+    def rerender(self, update: bool = True):
+        """Rebuild the rendered rows from their loaded data (e.g. after a selection change)"""
+        with self._lock:
+            if self._last < self._first:
+                return
+            controls = []
+            for record in self._pages[self._first:self._last + 1]:
+                controls.extend(self._build_page(record))
+            self.list_view.controls[:] = controls
+        if update:
+            self._update()
+
+    def _fetch(self, after: Any) -> List:
+        prefetched = self._prefetched
+        if prefetched and prefetched[0] == self._generation and prefetched[1] == after:
+            self._prefetched = None
+            return prefetched[2]
+        return list(self.fetch_page(after, self.page_size))
+
+    def _fill(self, record: _PageRecord, rows: List):
+        record.rows = rows
+        record.size = len(rows)
+        if rows:
+            record.last_key = self.row_key(rows[-1])
+            record.last_section = self.section_key(rows[-1]) if self.section_key else None
+        else:
+            record.last_key = record.after
+            record.last_section = record.prev_section
+
+    def _build_page(self, record: _PageRecord) -> List[ft.Control]:
+        controls = []
+        section = record.prev_section
+        for row in record.rows or []:
+            item = self.build_item(row)
+            if self.section_key and self.build_section_header:
+                row_section = self.section_key(row)
+                if row_section != section:
+                    item = ft.Column([self.build_section_header(row_section, row), item], spacing=8, tight=True)
+                section = row_section
+            controls.append(item)
+        return controls
+
+    def _start_prefetch(self):
+        if not self.prefetch or not self._has_more:
+            return
+        after = self._pages[-1].last_key
+        generation = self._generation
+
+        def run():
+            try:
+                rows = list(self.fetch_page(after, self.page_size))
+            except Exception as e:
+                logger.warning(f"Prefetching the next page failed: {e}")
+                return
+            with self._lock:
+                if generation == self._generation:
+                    self._prefetched = (generation, after, rows)
+
+        self._prefetch_thread = threading.Thread(target=run, daemon=True)
+        self._prefetch_thread.start()
+
+    def load_below(self) -> bool:
+        """Render the page after the window; returns False at the end of the list"""
+        with self._lock:
+            if self._last < 0:
+                return False
+            if self._last + 1 < len(self._pages):
+                # Page was loaded before and dropped from the window
+                record = self._pages[self._last + 1]
+                self._fill(record, self._fetch(record.after))
+            elif self._has_more:
+                previous = self._pages[-1]
+                record = _PageRecord(after=previous.last_key, prev_section=previous.last_section)
+                self._pages.append(record)
+                self._fill(record, self._fetch(record.after))
+                self._has_more = record.size >= self.page_size
+                if record.size == 0:
+                    self._pages.pop()
+                    return False
+                self._start_prefetch()
+            else:
+                return False
+            self._last += 1
+            self.list_view.controls.extend(self._build_page(record))
+            if self.item_extent and self._last - self._first + 1 > self.window_pages:
+                self._drop_first()
+        self._update()
+        return True
+
+    def load_above(self) -> bool:
+        """Re-render the page before the window (only after it was dropped)"""
+        with self._lock:
+            if self._first == 0:
+                return False
+            record = self._pages[self._first - 1]
+            self._fill(record, self._fetch(record.after))
+            self._first -= 1
+            controls = self._build_page(record)
+            self.list_view.controls[0:0] = controls
+            self._scroll_by(len(controls) * self.item_extent)
+            if self._last - self._first + 1 > self.window_pages:
+                self._drop_last()
+        self._update()
+        return True
+
+    def _drop_first(self):
+        record = self._pages[self._first]
+        del self.list_view.controls[:record.size]
+        record.rows = None
+        self._first += 1
+        self._scroll_by(-record.size * self.item_extent)
+
+    def _drop_last(self):
+        record = self._pages[self._last]
+        if record.size:
+            del self.list_view.controls[-record.size:]
+        record.rows = None
+        self._last -= 1
+
+    # ------------------------------------------------------------------ events
+
+    def _on_scroll(self, e):
+        try:
+            threshold = max(e.viewport_dimension or 0, (self.item_extent or 0) * 5)
+            if e.max_scroll_extent - e.pixels <= threshold:
+                self.load_below()
+            elif self.item_extent and e.pixels <= threshold:
+                self.load_above()
+        except Exception as ex:
+            logger.error(f"Error loading list page: {ex}", exc_info=True)
+
+    def _scroll_by(self, delta: float):
+        # Applied after the controls were updated, see _update()
+        self._pending_scroll += delta
+
+    def _update(self):
+        delta, self._pending_scroll = self._pending_scroll, 0.0
+        if self.list_view.page:
+            self.list_view.update()
+            if delta:
+                self.list_view.scroll_to(delta=delta, duration=0)
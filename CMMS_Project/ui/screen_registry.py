@@ -0,0 +1,101 @@
+"""
+Lazy Screen Registry
+Screens are registered by import path and only imported and constructed on
+first navigation, so startup to the login screen does not pay for 20 screen
+modules and the services (and libraries) they pull in.
+"""
+
+import importlib
+import threading
+from typing import Callable, Dict, Optional
+
+
+class ScreenSpec:
+    """How to import, build and render one screen"""
+
+    def __init__(
+        self,
+        target: str,
+        factory: Optional[Callable] = None,
+        render: Optional[Callable] = None,
+        cache: bool = True,
+    ):
+        module_path, _, class_name = target.partition(":")
+        if not class_name:
+            raise ValueError(f"Screen target must be 'module:ClassName', got {target!r}")
+        self.module_path = module_path
+        self.class_name = class_name
+        self.factory = factory
+        self.render = render
+        self.cache = cache
+
+    def load_class(self):
+        return getattr(importlib.import_module(self.module_path), self.class_name)
+
+
+class ScreenRegistry:
+    """Screens of one page, built on first use and reused afterwards"""
+
+    def __init__(self, page=None):
+        self.page = page
+        self._specs: Dict[str, ScreenSpec] = {}
+        self._instances: Dict[str, object] = {}
+        # render() may run on the login background thread and on event threads
+        self._lock = threading.RLock()
+
+    def register(
+        self,
+        name: str,
+        target: str,
+        factory: Optional[Callable] = None,
+        render: Optional[Callable] = None,
+        cache: bool = True,
+    ):
+        """
+        Register a screen
+
+        Args:
+            name: View name (state.view / route)
+            target: "package.module:ClassName", imported on first use
+            factory: factory(cls) -> screen (default: cls(page))
+            render: render(screen, page) -> control (default: screen.view(page))
+            cache: False builds a new screen on every render
+        """
+        with self._lock:
+            self._specs[name] = ScreenSpec(target, factory, render, cache)
+            self._instances.pop(name, None)
+
+    def get(self, name: str):
+        """Screen instance of `name`, importing and constructing it if needed"""
+        with self._lock:
+            screen = self._instances.get(name)
+            if screen is not None:
+                return screen
+            spec = self._specs[name]
+            cls = spec.load_class()
+            screen = spec.factory(cls) if spec.factory else cls(self.page)
+            if spec.cache:
+                self._instances[name] = screen
+            return screen
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def clear(self):
+        """Drop the built screens (they are rebuilt on next navigation)"""
+        with self._lock:
+            self._instances.clear()
+
+    def renderer(self, name: str) -> Callable:
+        """view(page) callable that builds the screen only when called"""
+        def render(page):
+            spec = self._specs[name]
+            screen = self.get(name)
+            if spec.render:
+                return spec.render(screen, page)
+            return screen.view(page)
+        return render
+
+    def views(self) -> Dict[str, Callable]:
+        """{name: renderer} for every registered screen, in registration order"""
+        return {name: self.renderer(name) for name in self._specs}
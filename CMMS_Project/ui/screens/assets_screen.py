@@ -10,7 +10,8 @@ from localization.translator import translator
 from utils.currency import format_price
 from datetime import datetime, timedelta
 from pathlib import Path
-from ui.components.pagination import PaginationController, create_pagination_controls, create_items_per_page_selector
+from ui.components.virtual_list import VirtualListView
+from ui.task_executor import get_ui_executor
 from ui.components.batch_actions_bar import create_batch_actions_bar
 from utils.debug_helper import (
     debug_entry, debug_exit, debug_step, debug_variable, debug_call, 
@@ -41,24 +42,11 @@ class AssetsScreen:
         if not hasattr(self, 'page') or self.page is None:
             self.page = page
         
-        # Pagination settings
-        ITEMS_PER_PAGE = 25
-        
-        # Get total count for pagination
-        machines = asset_service.list_machines()
-        total_machines_count = len(machines)
-        
-        # Initialize PaginationController
-        pagination_controller = PaginationController(
-            total_items=total_machines_count,
-            items_per_page=ITEMS_PER_PAGE,
-            on_page_change=None,  # Will be set after refresh function is defined
-        )
+        # Machines are fetched page by page (keyset) while scrolling
+        ITEMS_PER_PAGE = 50
         
         # Selected items for batch operations
         selected_machine_ids = set()
-        
-        machines_list = ft.Column([], spacing=8, scroll=ft.ScrollMode.AUTO, expand=True)
 
         def open_correct_operating_hours_dialog(machine):
             """Open operating hours correction dialog with history and confirmation"""
@@ -545,12 +533,210 @@ class AssetsScreen:
                 debug_exit(module_name, function_name, {"success": False, "error": str(e)})
                 raise
 
-        def refresh_list(update_page=True, page_num=None):
-            # Update pagination controller if page_num is provided
-            if page_num is not None:
-                # Convert 0-based to 1-based for PaginationController
-                pagination_controller.go_to_page(page_num + 1)
-            
+        def build_machine_card(machine):
+            """Card of one machine row (built when its page is rendered)"""
+            # Create wrapper functions to avoid lambda closure issues in PyInstaller
+            def create_machine_handlers(m):
+                def handle_add_service(e):
+                    open_add_service_dialog(m)
+
+                def handle_edit(e):
+                    open_edit_machine_dialog(m)
+
+                def handle_correct_hours(e):
+                    open_correct_operating_hours_dialog(m)
+
+                def handle_delete(e):
+                    open_delete_machine_dialog(m)
+
+                return handle_add_service, handle_edit, handle_correct_hours, handle_delete
+
+            handle_add_service, handle_edit, handle_correct_hours, handle_delete = create_machine_handlers(machine)
+
+            # Create checkbox for multi-select
+            machine_checkbox = ft.Checkbox(
+                value=machine.id in selected_machine_ids,
+                on_change=lambda e, m_id=machine.id: _on_machine_selection_change(m_id, e),
+                tooltip=translator.get_text("common.select") if hasattr(translator, 'get_text') else "Select",
+            )
+
+            # Get compatible parts
+            compatible_parts = machine.id_compatible_parts if hasattr(machine, 'id_compatible_parts') else []
+            parts_text = ", ".join([p.name for p in compatible_parts[:3]])
+            if len(compatible_parts) > 3:
+                parts_text += f" +{len(compatible_parts) - 3} további"
+
+            # Production line name
+            prod_line_name = machine.production_line.name if hasattr(machine, 'production_line') and machine.production_line else f"ID: {machine.production_line_id}"
+
+            # Create Tailwind CSS card for each machine
+            status_color_map = {
+                "Active": (DesignSystem.EMERALD_500, "emerald"),
+                "Stopped": (DesignSystem.ORANGE_500, "orange"),
+                "Scrapped": (DesignSystem.RED_500, "red"),
+            }
+            status_color, status_variant = status_color_map.get(machine.status, (DesignSystem.GRAY_500, None))
+
+            card_content_items = [
+                        ft.Row([
+                            machine_checkbox,
+                            ft.Container(width=8),  # Spacing between checkbox and content
+                    ft.Container(
+                        content=ft.Icon(ft.Icons.PRECISION_MANUFACTURING, color=DesignSystem.PURPLE_500, size=24),
+                        padding=ft.padding.all(DesignSystem.SPACING_2),
+                        bgcolor=DesignSystem.PURPLE_100,
+                        border_radius=DesignSystem.RADIUS_LG,
+                    ),
+                            ft.Column([
+                                    ft.Text(
+                                        machine.name,
+                            size=18,
+                            weight=ft.FontWeight.W_600,
+                            color=DesignSystem.TEXT_PRIMARY,
+                                    ),
+                        ft.Container(height=DesignSystem.SPACING_1),
+                                ft.Row([
+                            ft.Text(
+                                f"{translator.get_text('assets.production_line')}: {prod_line_name}",
+                                size=13,
+                                color=DesignSystem.TEXT_SECONDARY,
+                            ),
+                            ft.Container(width=DesignSystem.SPACING_4),
+                            ft.Text(
+                                f"{translator.get_text('assets.serial_number')}: {machine.serial_number or '-'}",
+                                size=13,
+                                color=DesignSystem.TEXT_SECONDARY,
+                            ),
+                        ], spacing=DesignSystem.SPACING_2),
+                        ft.Container(height=DesignSystem.SPACING_1),
+                                ft.Row([
+                            ft.Text(
+                                f"{translator.get_text('assets.model')}: {machine.model or '-'}",
+                                size=13,
+                                color=DesignSystem.TEXT_SECONDARY,
+                            ),
+                            ft.Container(width=DesignSystem.SPACING_4),
+                            create_vibrant_badge(
+                                text=machine.status,
+                                variant=status_variant or "blue",
+                                size=11,
+                            ) if status_variant else ft.Text(
+                                f"{translator.get_text('assets.status')}: {machine.status}",
+                                size=13,
+                                color=DesignSystem.TEXT_SECONDARY,
+                            ),
+                        ], spacing=DesignSystem.SPACING_2),
+                    ], expand=True, spacing=0),
+                ], spacing=DesignSystem.SPACING_3),
+            ]
+
+            if compatible_parts:
+                card_content_items.append(
+                                ft.Container(
+                                    content=ft.Column([
+                                        ft.Text(
+                                            translator.get_text("assets.compatible_parts"),
+                                size=12,
+                                weight=ft.FontWeight.W_600,
+                                color=DesignSystem.TEXT_SECONDARY,
+                                        ),
+                                        ft.Text(
+                                            parts_text or translator.get_text("empty_states.no_parts"),
+                                size=12,
+                                color=DesignSystem.TEXT_TERTIARY,
+                                            italic=True,
+                                        ),
+                        ], spacing=DesignSystem.SPACING_1, tight=True),
+                        bgcolor=DesignSystem.GRAY_50,
+                        padding=DesignSystem.SPACING_2,
+                        border_radius=DesignSystem.RADIUS_MD,
+                    )
+                )
+
+                                # Version and audit info
+            if hasattr(machine, 'updated_by_user') or hasattr(machine, 'version'):
+                card_content_items.append(
+                                ft.Container(
+                                    content=ft.Row([
+                            ft.Icon(ft.Icons.HISTORY, size=12, color=DesignSystem.TEXT_TERTIARY),
+                                        ft.Text(
+                                            f"Verzió: {machine.version if hasattr(machine, 'version') else 1}",
+                                size=11,
+                                color=DesignSystem.TEXT_TERTIARY,
+                                        ),
+                            ft.Container(width=DesignSystem.SPACING_2),
+                            ft.Icon(ft.Icons.PERSON, size=12, color=DesignSystem.TEXT_TERTIARY),
+                                        ft.Text(
+                                            f"Utolsó módosítás: {machine.updated_by_user.full_name if hasattr(machine, 'updated_by_user') and machine.updated_by_user else 'Ismeretlen'} ({machine.updated_at.strftime('%Y-%m-%d %H:%M') if hasattr(machine, 'updated_at') and machine.updated_at else '-'})",
+                                size=11,
+                                color=DesignSystem.TEXT_TERTIARY,
+                                        ),
+                        ], spacing=DesignSystem.SPACING_1, tight=True),
+                        padding=ft.padding.only(top=DesignSystem.SPACING_2),
+                    )
+                )
+
+            card_content_items.append(
+                            ft.Row([
+                    create_modern_icon_button(
+                                    icon=ft.Icons.BUILD_CIRCLE,
+                                    tooltip="Szervizelés hozzáadása",
+                                    on_click=handle_add_service,
+                        color=DesignSystem.EMERALD_500,
+                        vibrant=True,
+                        variant="emerald",
+                                ),
+                    create_modern_icon_button(
+                                    icon=ft.Icons.EDIT,
+                                    tooltip=translator.get_text("common.buttons.edit"),
+                                    on_click=handle_edit,
+                        color=DesignSystem.BLUE_500,
+                        vibrant=True,
+                        variant="blue",
+                                ),
+                    create_modern_icon_button(
+                                    icon=ft.Icons.ACCESS_TIME,
+                                    tooltip=translator.get_text("assets.correct_operating_hours"),
+                                    on_click=handle_correct_hours,
+                        color=DesignSystem.ORANGE_500,
+                        vibrant=True,
+                        variant="orange",
+                    ),
+                    create_modern_icon_button(
+                                    icon=ft.Icons.DELETE,
+                                    tooltip=translator.get_text("common.buttons.delete"),
+                                    on_click=handle_delete,
+                        color=DesignSystem.RED_500,
+                        vibrant=True,
+                        variant="red",
+                    ),
+                ], spacing=DesignSystem.SPACING_2),
+            )
+
+            card_content = ft.Column(card_content_items, spacing=DesignSystem.SPACING_2)
+            card_content.controls = [c for c in card_content.controls if c is not None]
+
+            card = create_tailwind_card(
+                content=card_content,
+                padding=DesignSystem.SPACING_4,
+                elevation=1,
+                accent_color=DesignSystem.PURPLE_500,
+            )
+            return card
+
+        machines_vlist = VirtualListView(
+            fetch_page=lambda after_id, limit: asset_service.list_machines_page(after_id=after_id, limit=limit),
+            build_item=build_machine_card,
+            count=asset_service.count_machines,
+            page_size=ITEMS_PER_PAGE,
+            build_empty=lambda: create_empty_state_card(
+                icon=ft.Icons.FACTORY,
+                title=translator.get_text("empty_states.no_machines"),
+                icon_color=DesignSystem.GRAY_400,
+            ),
+        )
+
+        def refresh_list(update_page=True):
             # Don't update if dialog is open
             page_ref = self.page if hasattr(self, 'page') and self.page else page
             if hasattr(page_ref, 'dialog') and page_ref.dialog is not None:
@@ -563,243 +749,26 @@ class AssetsScreen:
             if hasattr(page_ref, '_open_machine_dialog_id') and page_ref._open_machine_dialog_id:
                 machine_id = page_ref._open_machine_dialog_id
                 page_ref._open_machine_dialog_id = None  # Clear flag
-                try:
-                    machine = asset_service.get_machine(machine_id)
-                    if machine:
-                        # Open edit dialog after a small delay to ensure list is rendered
-                        import threading
-                        def open_dialog():
-                            import time
-                            time.sleep(0.2)
-                            try:
-                                open_edit_machine_dialog(machine)
-                            except Exception as e:
-                                print(f"[ASSETS] Error opening machine dialog from search: {e}")
-                        threading.Thread(target=open_dialog, daemon=True).start()
-                except Exception as e:
-                    print(f"[ASSETS] Error loading machine for search: {e}")
-            
-            # Get all machines
-            all_machines = asset_service.list_machines()
-            
-            # Update total count
-            total_machines_count = len(all_machines)
-            pagination_controller.update_total_items(total_machines_count)
-            
-            # Get paginated machines
-            offset = pagination_controller.start_index
-            limit = pagination_controller.items_per_page
-            machines = all_machines[offset:offset + limit]
-            
-            machines_list.controls.clear()
-            
-            # Load machines with history for version display
-            machines_with_history = []
-            for machine in machines:
-                machine_full = asset_service.get_machine_with_history(machine.id)
-                machines_with_history.append(machine_full if machine_full else machine)
-            
-            if not machines_with_history:
-                machines_list.controls.append(
-                    create_empty_state_card(
-                        icon=ft.Icons.FACTORY,
-                        title=translator.get_text("empty_states.no_machines"),
-                        icon_color=DesignSystem.GRAY_400,
-                    )
+                
+                def open_dialog(machine):
+                    if not machine:
+                        return
+                    try:
+                        open_edit_machine_dialog(machine)
+                    except Exception as e:
+                        print(f"[ASSETS] Error opening machine dialog from search: {e}")
+                
+                # Load the machine in the background and open its edit dialog from the
+                # UI writer, after a small delay to ensure the list is rendered
+                get_ui_executor(page_ref).submit(
+                    "assets.search_result",
+                    lambda token: asset_service.get_machine(machine_id),
+                    open_dialog,
+                    on_error=lambda e: print(f"[ASSETS] Error loading machine for search: {e}"),
+                    delay=0.2,
                 )
-            else:
-                for machine in machines_with_history:
-                    # Create wrapper functions to avoid lambda closure issues in PyInstaller
-                    def create_machine_handlers(m):
-                        def handle_add_service(e):
-                            open_add_service_dialog(m)
-                        
-                        def handle_edit(e):
-                            open_edit_machine_dialog(m)
-                        
-                        def handle_correct_hours(e):
-                            open_correct_operating_hours_dialog(m)
-                        
-                        def handle_delete(e):
-                            open_delete_machine_dialog(m)
-                        
-                        return handle_add_service, handle_edit, handle_correct_hours, handle_delete
-                    
-                    handle_add_service, handle_edit, handle_correct_hours, handle_delete = create_machine_handlers(machine)
-                    
-                    # Create checkbox for multi-select
-                    machine_checkbox = ft.Checkbox(
-                        value=machine.id in selected_machine_ids,
-                        on_change=lambda e, m_id=machine.id: _on_machine_selection_change(m_id, e),
-                        tooltip=translator.get_text("common.select") if hasattr(translator, 'get_text') else "Select",
-                    )
-                    
-                    # Get compatible parts
-                    compatible_parts = machine.id_compatible_parts if hasattr(machine, 'id_compatible_parts') else []
-                    parts_text = ", ".join([p.name for p in compatible_parts[:3]])
-                    if len(compatible_parts) > 3:
-                        parts_text += f" +{len(compatible_parts) - 3} további"
-                    
-                    # Production line name
-                    prod_line_name = machine.production_line.name if hasattr(machine, 'production_line') and machine.production_line else f"ID: {machine.production_line_id}"
-                    
-                    # Create Tailwind CSS card for each machine
-                    status_color_map = {
-                        "Active": (DesignSystem.EMERALD_500, "emerald"),
-                        "Stopped": (DesignSystem.ORANGE_500, "orange"),
-                        "Scrapped": (DesignSystem.RED_500, "red"),
-                    }
-                    status_color, status_variant = status_color_map.get(machine.status, (DesignSystem.GRAY_500, None))
-                    
-                    card_content_items = [
-                                ft.Row([
-                                    machine_checkbox,
-                                    ft.Container(width=8),  # Spacing between checkbox and content
-                            ft.Container(
-                                content=ft.Icon(ft.Icons.PRECISION_MANUFACTURING, color=DesignSystem.PURPLE_500, size=24),
-                                padding=ft.padding.all(DesignSystem.SPACING_2),
-                                bgcolor=DesignSystem.PURPLE_100,
-                                border_radius=DesignSystem.RADIUS_LG,
-                            ),
-                                    ft.Column([
-                                            ft.Text(
-                                                machine.name,
-                                    size=18,
-                                    weight=ft.FontWeight.W_600,
-                                    color=DesignSystem.TEXT_PRIMARY,
-                                            ),
-                                ft.Container(height=DesignSystem.SPACING_1),
-                                        ft.Row([
-                                    ft.Text(
-                                        f"{translator.get_text('assets.production_line')}: {prod_line_name}",
-                                        size=13,
-                                        color=DesignSystem.TEXT_SECONDARY,
-                                    ),
-                                    ft.Container(width=DesignSystem.SPACING_4),
-                                    ft.Text(
-                                        f"{translator.get_text('assets.serial_number')}: {machine.serial_number or '-'}",
-                                        size=13,
-                                        color=DesignSystem.TEXT_SECONDARY,
-                                    ),
-                                ], spacing=DesignSystem.SPACING_2),
-                                ft.Container(height=DesignSystem.SPACING_1),
-                                        ft.Row([
-                                    ft.Text(
-                                        f"{translator.get_text('assets.model')}: {machine.model or '-'}",
-                                        size=13,
-                                        color=DesignSystem.TEXT_SECONDARY,
-                                    ),
-                                    ft.Container(width=DesignSystem.SPACING_4),
-                                    create_vibrant_badge(
-                                        text=machine.status,
-                                        variant=status_variant or "blue",
-                                        size=11,
-                                    ) if status_variant else ft.Text(
-                                        f"{translator.get_text('assets.status')}: {machine.status}",
-                                        size=13,
-                                        color=DesignSystem.TEXT_SECONDARY,
-                                    ),
-                                ], spacing=DesignSystem.SPACING_2),
-                            ], expand=True, spacing=0),
-                        ], spacing=DesignSystem.SPACING_3),
-                    ]
-                    
-                    if compatible_parts:
-                        card_content_items.append(
-                                        ft.Container(
-                                            content=ft.Column([
-                                                ft.Text(
-                                                    translator.get_text("assets.compatible_parts"),
-                                        size=12,
-                                        weight=ft.FontWeight.W_600,
-                                        color=DesignSystem.TEXT_SECONDARY,
-                                                ),
-                                                ft.Text(
-                                                    parts_text or translator.get_text("empty_states.no_parts"),
-                                        size=12,
-                                        color=DesignSystem.TEXT_TERTIARY,
-                                                    italic=True,
-                                                ),
-                                ], spacing=DesignSystem.SPACING_1, tight=True),
-                                bgcolor=DesignSystem.GRAY_50,
-                                padding=DesignSystem.SPACING_2,
-                                border_radius=DesignSystem.RADIUS_MD,
-                            )
-                        )
-                    
-                                        # Version and audit info
-                    if hasattr(machine, 'updated_by_user') or hasattr(machine, 'version'):
-                        card_content_items.append(
-                                        ft.Container(
-                                            content=ft.Row([
-                                    ft.Icon(ft.Icons.HISTORY, size=12, color=DesignSystem.TEXT_TERTIARY),
-                                                ft.Text(
-                                                    f"Verzió: {machine.version if hasattr(machine, 'version') else 1}",
-                                        size=11,
-                                        color=DesignSystem.TEXT_TERTIARY,
-                                                ),
-                                    ft.Container(width=DesignSystem.SPACING_2),
-                                    ft.Icon(ft.Icons.PERSON, size=12, color=DesignSystem.TEXT_TERTIARY),
-                                                ft.Text(
-                                                    f"Utolsó módosítás: {machine.updated_by_user.full_name if hasattr(machine, 'updated_by_user') and machine.updated_by_user else 'Ismeretlen'} ({machine.updated_at.strftime('%Y-%m-%d %H:%M') if hasattr(machine, 'updated_at') and machine.updated_at else '-'})",
-                                        size=11,
-                                        color=DesignSystem.TEXT_TERTIARY,
-                                                ),
-                                ], spacing=DesignSystem.SPACING_1, tight=True),
-                                padding=ft.padding.only(top=DesignSystem.SPACING_2),
-                            )
-                        )
-                    
-                    card_content_items.append(
-                                    ft.Row([
-                            create_modern_icon_button(
-                                            icon=ft.Icons.BUILD_CIRCLE,
-                                            tooltip="Szervizelés hozzáadása",
-                                            on_click=handle_add_service,
-                                color=DesignSystem.EMERALD_500,
-                                vibrant=True,
-                                variant="emerald",
-                                        ),
-                            create_modern_icon_button(
-                                            icon=ft.Icons.EDIT,
-                                            tooltip=translator.get_text("common.buttons.edit"),
-                                            on_click=handle_edit,
-                                color=DesignSystem.BLUE_500,
-                                vibrant=True,
-                                variant="blue",
-                                        ),
-                            create_modern_icon_button(
-                                            icon=ft.Icons.ACCESS_TIME,
-                                            tooltip=translator.get_text("assets.correct_operating_hours"),
-                                            on_click=handle_correct_hours,
-                                color=DesignSystem.ORANGE_500,
-                                vibrant=True,
-                                variant="orange",
-                            ),
-                            create_modern_icon_button(
-                                            icon=ft.Icons.DELETE,
-                                            tooltip=translator.get_text("common.buttons.delete"),
-                                            on_click=handle_delete,
-                                color=DesignSystem.RED_500,
-                                vibrant=True,
-                                variant="red",
-                            ),
-                        ], spacing=DesignSystem.SPACING_2),
-                    )
-                    
-                    card_content = ft.Column(card_content_items, spacing=DesignSystem.SPACING_2)
-                    card_content.controls = [c for c in card_content.controls if c is not None]
-                    
-                    card = create_tailwind_card(
-                        content=card_content,
-                        padding=DesignSystem.SPACING_4,
-                        elevation=1,
-                        accent_color=DesignSystem.PURPLE_500,
-                    )
-                    machines_list.controls.append(card)
             
-            if update_page:
-                page.update()
+            machines_vlist.reload(update=update_page)
 
         def open_add_dialog(e):
             print(f"[ASSETS] open_add_dialog called, event: {e}")
@@ -1876,20 +1845,15 @@ class AssetsScreen:
         def _clear_selection():
             """Clear all selections"""
             selected_machine_ids.clear()
-            refresh_list(update_page=True)
+            machines_vlist.rerender()
             _update_batch_actions_bar()
             page.update()
         
         def _select_all():
-            """Select all machines on current page"""
-            # Get current page machines
-            all_machines = asset_service.list_machines()
-            offset = pagination_controller.start_index
-            limit = pagination_controller.items_per_page
-            current_machines = all_machines[offset:offset + limit]
-            for machine in current_machines:
+            """Select all machines loaded in the list"""
+            for machine in machines_vlist.rendered_rows:
                 selected_machine_ids.add(machine.id)
-            refresh_list(update_page=True)
+            machines_vlist.rerender()
             _update_batch_actions_bar()
             page.update()
         
@@ -2035,16 +1999,7 @@ class AssetsScreen:
         )
         batch_actions_bar_ref["value"] = batch_actions_bar_container
         
-        # Set up pagination controller callback
-        def on_page_change(page_num):
-            # page_num is 1-based from PaginationController
-            # Convert to 0-based for refresh_list
-            refresh_list(update_page=True, page_num=page_num - 1)
-            page.update()
-        
-        pagination_controller.on_page_change = on_page_change
-        
-        refresh_list()
+        refresh_list(update_page=False)
 
         # Create add button
         def open_add_service_dialog(machine):
@@ -2532,26 +2487,6 @@ class AssetsScreen:
             height=40,
         )
 
-        # Create pagination controls
-        pagination_controls = create_pagination_controls(
-            controller=pagination_controller,
-            show_page_numbers=True,
-            max_page_buttons=7,
-        )
-        
-        # Create items per page selector
-        items_per_page_selector = create_items_per_page_selector(
-            controller=pagination_controller,
-            options=[10, 25, 50, 100],
-        )
-        
-        # Wrap pagination controls in a container
-        pagination_row = ft.Row([
-            pagination_controls,
-            ft.Container(width=DesignSystem.SPACING_4),
-            items_per_page_selector,
-        ], alignment=ft.MainAxisAlignment.CENTER, spacing=DesignSystem.SPACING_2) if pagination_controller.total_pages > 1 else ft.Container()
-        
         # Select all checkbox
         select_all_checkbox = ft.Checkbox(
             value=False,
@@ -2569,7 +2504,5 @@ class AssetsScreen:
                 add_btn,
             ], vertical_alignment=ft.CrossAxisAlignment.CENTER),
             batch_actions_bar_container,
-            pagination_row,
-            machines_list,
-            pagination_row,
+            machines_vlist.control,
         ], spacing=12, expand=True)
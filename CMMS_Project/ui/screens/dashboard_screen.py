@@ -8,17 +8,17 @@ if not hasattr(ft, 'Icons'):
     from utils.flet_icons import Icons
     ft.Icons = Icons
 from services.context_service import get_app_context
-from services.reports_service import get_all_statistics
-from services.reports_service_extended import get_trend_statistics, get_average_statistics
-from services import worksheet_service, pm_service, asset_service
+from services import dashboard_service
 from localization.translator import translator
 from utils.currency import format_price
 from ui.components.compliance_badges import create_compliance_badges_corner
+from ui.task_executor import get_ui_executor
 from ui.components.modern_components import (
     create_modern_button,
     create_modern_card,
     create_modern_badge,
     create_vibrant_badge,
+    create_skeleton_card,
     DesignSystem,
 )
 from ui.components.modern_card import (
@@ -27,7 +27,6 @@ from ui.components.modern_card import (
     create_info_card,
 )
 from database.connection import recreate_engine
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,7 +40,8 @@ class DashboardScreen:
     def _build_mode_selector(self):
         """Build database mode selector component"""
         # Lazy import to avoid circular dependency
-        from ui.app import state
+        from ui.app import get_app_state
+        state = get_app_state()
         
         # Create RadioGroup first
         mode_radio_group = ft.RadioGroup(
@@ -79,7 +79,8 @@ class DashboardScreen:
         def on_mode_change(e):
             """Handle mode change"""
             # Lazy import to avoid circular dependency
-            from ui.app import state
+            from ui.app import get_app_state
+            state = get_app_state()
             new_mode = e.control.value
             old_mode = state.database_mode
             
@@ -90,6 +91,7 @@ class DashboardScreen:
                     
                     # Recreate engine with new mode
                     recreate_engine(new_mode)
+                    dashboard_service.invalidate_dashboard_snapshots()
                     
                     # Update UI elements
                     mode_text = translator.get_text("dashboard.mode.production") if new_mode == "production" else translator.get_text("dashboard.mode.learning")
@@ -160,87 +162,44 @@ class DashboardScreen:
             padding=15,
         )
 
-    def view(self, page: ft.Page):
-        self.page = page
+    def _load_statistics(self, token) -> dict:
+        """Dashboard figures (runs on the UI task pool, not on the UI thread)"""
         ctx = get_app_context()
-        # Use full_name if available, otherwise use username
-        display_name = (ctx.full_name if ctx.full_name and ctx.full_name.strip() else ctx.username) or translator.get_text("common.labels.user")
-        greeting = translator.get_text("dashboard.greeting", name=display_name)
-
-        logout_btn = create_modern_button(
-            text=translator.get_text("common.buttons.logout"),
-            icon=ft.Icons.EXIT_TO_APP if hasattr(ft.Icons, 'EXIT_TO_APP') else ft.Icons.LOGOUT,
-            on_click=lambda e: self.on_logout(),
-            bgcolor=DesignSystem.ERROR,
-            height=40,
-        )
-        
-        def close_app(_):
-            """Close the application"""
-            page.window.close()
-        
-        close_app_btn = create_modern_button(
-            text=translator.get_text("common.buttons.close_app"),
-            icon=ft.Icons.CLOSE,
-            on_click=close_app,
-            bgcolor=DesignSystem.TEXT_SECONDARY,
-            height=40,
-        )
-
-        # Get quick statistics (optimized with caching)
         try:
-            ctx = get_app_context()
-            user_id = ctx.user_id if ctx else None
-            
-            # Get current month statistics (cached for 5 minutes)
-            stats = get_all_statistics("month", user_id)
-            
-            # Use count queries instead of loading all records (much faster)
-            from database.session_manager import SessionLocal
-            from database.models import Worksheet, PMTask, Machine
-            from sqlalchemy import func
-            
-            session = SessionLocal()
-            try:
-                # Count worksheets (optimized - no need to load all)
-                worksheet_count = session.query(func.count(Worksheet.id)).scalar() or 0
-                active_worksheets = session.query(func.count(Worksheet.id)).filter(
-                    Worksheet.status == "Open"
-                ).scalar() or 0
-                
-                # Count PM tasks (optimized)
-                pm_count = session.query(func.count(PMTask.id)).filter(
-                    PMTask.next_due_date <= datetime.utcnow()
-                ).scalar() or 0
-                
-                # Count machines (optimized)
-                machine_count = session.query(func.count(Machine.id)).scalar() or 0
-            finally:
-                session.close()
-            
-            # Get cost and time stats from cached statistics
-            total_cost = stats.get('cost', {}).get('total_cost', 0)
-            total_time = stats.get('time', {}).get('total_time_hours', 0)
-            total_tasks = stats.get('tasks', {}).get('total_tasks', 0)
-            
-            # Get trend analysis (cached)
-            try:
-                trend_stats = get_trend_statistics(["month", "week"], user_id)
-                trend_comparison = trend_stats.get('_comparison', {})
-            except Exception as e:
-                logger.error(f"Error getting trend stats: {e}")
-                trend_comparison = {}
-            
+            # Widgets are queried in parallel; unchanged ones come from the snapshot cache
+            snapshot = dashboard_service.get_dashboard_snapshot(ctx.user_id, ctx.role)
         except Exception as e:
             logger.error(f"Error loading dashboard statistics: {e}")
-            worksheet_count = 0
-            active_worksheets = 0
-            pm_count = 0
-            machine_count = 0
-            total_cost = 0
-            total_time = 0
-            total_tasks = 0
-            trend_comparison = {}
+            snapshot = {}
+        return self._statistics_from_snapshot(snapshot)
+
+    def _statistics_from_snapshot(self, snapshot: dict) -> dict:
+        """Flatten a dashboard_service snapshot into the figures shown on the cards"""
+        counts = snapshot.get("counts", {})
+        month = snapshot.get("month", {})
+        return {
+            "worksheet_count": counts.get("worksheet_count", 0),
+            "active_worksheets": counts.get("active_worksheets", 0),
+            "pm_count": counts.get("pm_count", 0),
+            "machine_count": counts.get("machine_count", 0),
+            "total_stock_value": snapshot.get("inventory", {}).get("total_stock_value", 0.0),
+            "total_cost": month.get("cost", {}).get("total_cost", 0),
+            "total_time": month.get("time", {}).get("total_time_hours", 0),
+            "total_tasks": month.get("tasks", {}).get("total_tasks", 0),
+            "trend_comparison": snapshot.get("trend_comparison", {}),
+        }
+
+    def _build_statistics_controls(self, data: dict) -> list:
+        """Metric cards, quick statistics and alerts from _load_statistics()"""
+        worksheet_count = data["worksheet_count"]
+        active_worksheets = data["active_worksheets"]
+        pm_count = data["pm_count"]
+        machine_count = data["machine_count"]
+        total_cost = data["total_cost"]
+        total_stock_value = data["total_stock_value"]
+        total_time = data["total_time"]
+        total_tasks = data["total_tasks"]
+        trend_comparison = data["trend_comparison"]
         
         # Modern metric cards with Tailwind CSS vibrant colors
         cards = ft.Row(
@@ -277,6 +236,14 @@ class DashboardScreen:
                     use_gradient=True,
                     gradient_colors=[DesignSystem.CYAN_400, DesignSystem.CYAN_600],
                 ),
+                create_metric_card(
+                    value=format_price(total_stock_value),
+                    label=translator.get_text("inventory_audit.total_stock_value"),
+                    icon=ft.Icons.INVENTORY_2,
+                    color=DesignSystem.BLUE_500,
+                    use_gradient=True,
+                    gradient_colors=[DesignSystem.BLUE_400, DesignSystem.BLUE_600],
+                ),
             ],
             wrap=True,
             spacing=DesignSystem.SPACING_4,
@@ -291,6 +258,72 @@ class DashboardScreen:
         alerts_section = _build_alerts_section(
             active_worksheets, pm_count, total_cost, trend_comparison
         )
+        
+        return [
+            cards,
+            ft.Container(height=24),
+            quick_stats_section,
+            ft.Container(height=24),
+            alerts_section,
+        ]
+
+    def view(self, page: ft.Page):
+        self.page = page
+        ctx = get_app_context()
+        # Use full_name if available, otherwise use username
+        display_name = (ctx.full_name if ctx.full_name and ctx.full_name.strip() else ctx.username) or translator.get_text("common.labels.user")
+        greeting = translator.get_text("dashboard.greeting", name=display_name)
+
+        logout_btn = create_modern_button(
+            text=translator.get_text("common.buttons.logout"),
+            icon=ft.Icons.EXIT_TO_APP if hasattr(ft.Icons, 'EXIT_TO_APP') else ft.Icons.LOGOUT,
+            on_click=lambda e: self.on_logout(),
+            bgcolor=DesignSystem.ERROR,
+            height=40,
+        )
+        
+        def close_app(_):
+            """Close the application"""
+            page.window.close()
+        
+        close_app_btn = create_modern_button(
+            text=translator.get_text("common.buttons.close_app"),
+            icon=ft.Icons.CLOSE,
+            on_click=close_app,
+            bgcolor=DesignSystem.TEXT_SECONDARY,
+            height=40,
+        )
+
+        # Statistics are loaded in the background; skeletons hold their place until then
+        statistics_area = ft.Column(
+            controls=[
+                ft.Row(
+                    [create_skeleton_card(lines=1, width=240) for _ in range(4)],
+                    wrap=True,
+                    spacing=DesignSystem.SPACING_4,
+                ),
+                ft.Container(height=24),
+                create_skeleton_card(lines=2),
+            ],
+            spacing=0,
+        )
+
+        # Reopening the dashboard paints the last snapshot at once; the background
+        # load then only re-queries widgets whose tables changed
+        shown = {"data": None}
+        cached = dashboard_service.get_cached_snapshot(ctx.user_id, ctx.role)
+        if cached is not None:
+            shown["data"] = self._statistics_from_snapshot(cached)
+            statistics_area.controls = self._build_statistics_controls(shown["data"])
+
+        def apply_statistics(data):
+            if data != shown["data"]:
+                shown["data"] = data
+                statistics_area.controls = self._build_statistics_controls(data)
+
+        ui_tasks = get_ui_executor(page)
+        ui_tasks.begin_paint("dashboard")
+        ui_tasks.submit("dashboard.statistics", self._load_statistics, apply_statistics)
 
         # Welcome header with icon - Tailwind CSS design
         welcome_header = create_tailwind_card(
@@ -331,11 +364,7 @@ class DashboardScreen:
                 ft.Container(height=16),
                 mode_selector,
                 ft.Container(height=16),
-                cards,
-                ft.Container(height=24),
-                quick_stats_section,
-                ft.Container(height=24),
-                alerts_section,
+                statistics_area,
             ],
             spacing=0,
             scroll=ft.ScrollMode.AUTO,
@@ -9,7 +9,8 @@ if not hasattr(ft, 'Icons'):
     ft.Icons = Icons
 from services import context_service
 from utils.permissions import can_view_developer_tools
-from database.connection import engine
+from database.connection import get_engine, get_engine_pool_status
+from database.query_profiler import get_query_profile, reset_query_profile
 from sqlalchemy import inspect
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
@@ -35,6 +36,9 @@ class DeveloperToolsScreen:
         # Database info
         self.db_info_text = ft.Text("", selectable=True)
         
+        # Query profile (top offenders of the recent service calls)
+        self.query_profile_text = ft.Text("", selectable=True, size=12, font_family="monospace")
+        
         # .env file path
         self.env_file_path = PROJECT_ROOT / ".env"
         
@@ -114,6 +118,7 @@ class DeveloperToolsScreen:
     def _load_db_info(self):
         """Load database information"""
         try:
+            engine = get_engine()
             inspector = inspect(engine)
             tables = inspector.get_table_names()
             
@@ -121,6 +126,10 @@ class DeveloperToolsScreen:
             info += f"Engine: {engine.url}\n"
             info += f"Driver: {engine.driver}\n"
             info += f"Database: {engine.url.database}\n\n"
+            info += "Kapcsolat pool / Connection pool:\n"
+            for key, value in get_engine_pool_status().items():
+                info += f"     - {key}: {value}\n"
+            info += "\n"
             info += f"Táblák / Tables ({len(tables)}):\n"
             
             for table_name in tables:
@@ -140,7 +149,7 @@ class DeveloperToolsScreen:
             from datetime import datetime
             
             # Get database path
-            db_path = str(engine.url.database)
+            db_path = str(get_engine().url.database)
             
             # Create backup filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -168,6 +177,60 @@ class DeveloperToolsScreen:
         self._load_db_info()
         self.page.update()
     
+    def _load_query_profile(self):
+        """Load the query profile (see database.query_profiler)"""
+        try:
+            profile = get_query_profile(limit=10)
+            if not profile["enabled"]:
+                self.query_profile_text.value = "Lekérdezés profilozás kikapcsolva / Query profiling disabled (QUERY_PROFILING=0)"
+                return
+            
+            info = (
+                f"Hívások / Calls: {profile['window_calls']} (max {profile['buffer_size']}), "
+                f"lekérdezések / queries: {profile['total_queries']}, "
+                f"{profile['total_query_ms']:.0f} ms, "
+                f"hozzá nem rendelt / unattributed: {profile['unattributed_queries']}\n"
+            )
+            
+            info += "\n=== Legtöbb adatbázis idő / Most database time ===\n"
+            for entry in profile["top_by_query_time"]:
+                info += (
+                    f"  {entry['query_ms']:>9.1f} ms  {entry['queries']:>6} q  "
+                    f"{entry['calls']:>4} x  avg {entry['avg_ms']:.1f} ms  {entry['name']}\n"
+                )
+            
+            info += "\n=== Legtöbb lekérdezés hívásonként / Most queries per call ===\n"
+            for entry in sorted(profile["top_by_query_count"], key=lambda e: e["queries_per_call"], reverse=True):
+                info += f"  {entry['queries_per_call']:>9.1f} q/call  {entry['name']}\n"
+            
+            info += f"\n=== N+1 gyanú / Suspected N+1 (> {profile['n_plus_one_threshold']} ismétlés / repeats) ===\n"
+            if not profile["n_plus_one"]:
+                info += "  -\n"
+            for entry in profile["n_plus_one"]:
+                info += (
+                    f"  {entry['n_plus_one_repeats']:>5} x  {entry['name']} "
+                    f"({entry['n_plus_one_calls']} hívás / calls)\n"
+                    f"         {entry['n_plus_one_statement']}\n"
+                )
+            
+            info += "\n=== Leglassabb hívások / Slowest calls ===\n"
+            for call in profile["slowest_calls"]:
+                info += f"  {call['ms']:>9.1f} ms  {call['queries']:>6} q  {call['name']}\n"
+            
+            self.query_profile_text.value = info
+        except Exception as ex:
+            self.query_profile_text.value = f"Hiba a profil betöltésekor / Error loading query profile: {str(ex)}"
+    
+    def _refresh_query_profile(self, e):
+        """Refresh the query profile"""
+        self._load_query_profile()
+        self.page.update()
+    
+    def _reset_query_profile(self, e):
+        """Clear the collected query profile"""
+        reset_query_profile()
+        self._refresh_query_profile(e)
+    
     def _build_mysql_url(self, mode="production"):
         """Build MySQL connection string from fields"""
         if mode == "production":
@@ -496,6 +559,7 @@ class DeveloperToolsScreen:
         
         # Load data when view is called
         self._load_db_info()
+        self._load_query_profile()
         self._load_env_settings()
         
         return self.build()
@@ -707,6 +771,54 @@ class DeveloperToolsScreen:
                     padding=DesignSystem.SPACING_6,
                 ),
                 
+                # Query profile section
+                create_tailwind_card(
+                    content=ft.Column(
+                        controls=[
+                            ft.Row([
+                                ft.Icon(
+                                    ft.Icons.SPEED if hasattr(ft.Icons, 'SPEED') else ft.Icons.ANALYTICS,
+                                    size=32,
+                                    color=DesignSystem.ORANGE_500,
+                                ),
+                                ft.Text("Lekérdezés profil / Query Profile", size=20, weight=ft.FontWeight.W_700),
+                            ], spacing=DesignSystem.SPACING_3),
+                            ft.Divider(height=1),
+                            ft.Row(
+                                controls=[
+                                    create_modern_button(
+                                        text="Frissítés / Refresh",
+                                        icon=ft.Icons.REFRESH if hasattr(ft.Icons, 'REFRESH') else ft.Icons.REFRESH,
+                                        on_click=self._refresh_query_profile,
+                                        variant="outlined",
+                                    ),
+                                    create_modern_button(
+                                        text="Nullázás / Reset",
+                                        icon=ft.Icons.DELETE_OUTLINE if hasattr(ft.Icons, 'DELETE_OUTLINE') else ft.Icons.DELETE,
+                                        on_click=self._reset_query_profile,
+                                        variant="outlined",
+                                    ),
+                                ],
+                                spacing=DesignSystem.SPACING_3,
+                            ),
+                            ft.Container(
+                                content=ft.Column(
+                                    controls=[
+                                        self.query_profile_text,
+                                    ],
+                                    scroll=ft.ScrollMode.AUTO,
+                                ),
+                                bgcolor=DesignSystem.BG_SECONDARY,
+                                padding=DesignSystem.SPACING_4,
+                                border_radius=DesignSystem.RADIUS_MD,
+                                height=300,
+                            ),
+                        ],
+                        spacing=DesignSystem.SPACING_4,
+                    ),
+                    padding=DesignSystem.SPACING_6,
+                ),
+                
                 # Environment section
                 create_tailwind_card(
                     content=ft.Column(
@@ -1579,6 +1579,19 @@ class InventoryAuditScreen:
     
     def _on_export_excel(self, e, page: ft.Page):
         """Handle Excel export for current tab"""
+        def report_progress(done, total):
+            # Streaming exports report progress every few hundred rows
+            page.snack_bar = ft.SnackBar(
+                content=ft.Text(translator.get_text(
+                    "inventory_audit.export_progress",
+                    done=done,
+                    total=total if total is not None else "?",
+                )),
+                bgcolor=DesignSystem.TEXT_SECONDARY,
+            )
+            page.snack_bar.open = True
+            page.update()
+        
         export_funcs = {
             0: lambda: export_inventory_overview_to_excel(
                 period=self.current_period,
@@ -1614,7 +1627,7 @@ class InventoryAuditScreen:
                 period=self.current_period,
                 breakdown="monthly" if self.current_period == "yearly" else self.current_period,
             ),
-            7: lambda: export_full_inventory_to_excel(),  # Thresholds tab - export full inventory
+            7: lambda: export_full_inventory_to_excel(progress_callback=report_progress),  # Thresholds tab - export full inventory
         }
         
         def on_save_result(e: ft.FilePickerResultEvent):
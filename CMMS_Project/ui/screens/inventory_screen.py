@@ -16,6 +16,7 @@ from ui.components.modern_components import (
     create_vibrant_badge,
     create_modern_icon_button,
     create_empty_state_card,
+    create_skeleton_card,
     DesignSystem,
 )
 from ui.components.modern_card import (
@@ -25,6 +26,7 @@ from ui.components.pagination import PaginationController, create_pagination_con
 from ui.components.selectable_list import SelectableList
 from ui.components.batch_actions_bar import create_batch_actions_bar
 from ui.components.bulk_edit_dialog import create_bulk_edit_dialog
+from ui.task_executor import get_ui_executor
 
 
 class InventoryScreen:
@@ -36,6 +38,10 @@ class InventoryScreen:
         if not hasattr(self, 'page') or self.page is None:
             self.page = page
         
+        # Part cards are loaded on the shared UI task pool, the screen paints right away
+        ui_tasks = get_ui_executor(page)
+        ui_tasks.begin_paint("inventory")
+        
         # Pagination settings
         ITEMS_PER_PAGE = 50  # Show 50 items per page for better performance
         
@@ -52,8 +58,13 @@ class InventoryScreen:
         # Selected items for batch operations
         selected_part_ids = set()
         
-        # Parts list container
-        parts_list = ft.Column([], spacing=8, scroll=ft.ScrollMode.AUTO, expand=True)
+        # Parts list container (skeletons until the first load is applied)
+        parts_list = ft.Column(
+            [create_skeleton_card(lines=2) for _ in range(3)],
+            spacing=8,
+            scroll=ft.ScrollMode.AUTO,
+            expand=True,
+        )
         
         # Group by selection (default: "all" - no grouping)
         group_by_ref = {"value": "all"}  # "all", "production_line", "machine"
@@ -488,283 +499,291 @@ class InventoryScreen:
                     return
             
             # Check if we need to open a part dialog from search
+            open_part_id = None
             if hasattr(page_ref, '_open_part_dialog_id') and page_ref._open_part_dialog_id:
-                part_id = page_ref._open_part_dialog_id
+                open_part_id = page_ref._open_part_dialog_id
                 page_ref._open_part_dialog_id = None  # Clear flag
-                try:
-                    part = inventory_service.get_part(part_id)
-                    if part:
-                        # Open edit dialog after a small delay to ensure list is rendered
-                        import threading
-                        def open_dialog():
-                            import time
-                            time.sleep(0.2)
-                            try:
-                                open_edit_part_dialog(part)
-                            except Exception as e:
-                                print(f"[INVENTORY] Error opening part dialog from search: {e}")
-                        threading.Thread(target=open_dialog, daemon=True).start()
-                except Exception as e:
-                    print(f"[INVENTORY] Error loading part for search: {e}")
-            
-            # Clear parts list
-            parts_list.controls.clear()
-            
-            # Update total count
-            total_parts_count = inventory_service.count_parts()
-            pagination_controller.update_total_items(total_parts_count)
             
             group_by_mode = group_by_ref["value"]
             
-            # Handle grouping by production line or machine
-            if group_by_mode == "production_line" or group_by_mode == "machine":
-                # Load all parts (no pagination when grouping)
-                from database.session_manager import SessionLocal
-                from database.models import ProductionLine, Machine
-                from sqlalchemy.orm import joinedload
+            def load_parts(token):
+                """Query the parts and build their cards (runs on the UI task pool)"""
+                controls = []
                 
-                session = SessionLocal()
-                try:
-                    # Load all parts with compatible machines and their production lines
-                    from database.models import Part
-                    parts = session.query(Part).options(
-                        joinedload(Part.compatible_machines).joinedload(Machine.production_line),
-                        joinedload(Part.inventory_level)
-                    ).all()
+                # Update total count
+                total_parts_count = inventory_service.count_parts()
+                token.raise_if_cancelled()
+                
+                # Handle grouping by production line or machine
+                if group_by_mode == "production_line" or group_by_mode == "machine":
+                    # Load all parts (no pagination when grouping)
+                    from database.session_manager import SessionLocal
+                    from database.models import ProductionLine, Machine
+                    from sqlalchemy.orm import joinedload
+                
+                    session = SessionLocal()
+                    try:
+                        # Load all parts with compatible machines and their production lines
+                        from database.models import Part
+                        parts = session.query(Part).options(
+                            joinedload(Part.compatible_machines).joinedload(Machine.production_line),
+                            joinedload(Part.inventory_level)
+                        ).all()
                     
-                    # Batch load inventory levels
-                    part_ids = [p.id for p in parts]
-                    inv_levels_dict = inventory_service.get_inventory_levels_batch(part_ids)
+                        # Batch load inventory levels
+                        part_ids = [p.id for p in parts]
+                        inv_levels_dict = inventory_service.get_inventory_levels_batch(part_ids)
                     
-                    if group_by_mode == "production_line":
-                        # Group by production line
-                        prod_line_parts = {}  # {production_line_id: {machine_id: {part_id: part}}}
-                        no_prod_line_parts = set()  # Parts with no production line association
+                        if group_by_mode == "production_line":
+                            # Group by production line
+                            prod_line_parts = {}  # {production_line_id: {machine_id: {part_id: part}}}
+                            no_prod_line_parts = set()  # Parts with no production line association
                         
-                        for part in parts:
-                            compatible_machines = part.compatible_machines if hasattr(part, 'compatible_machines') else []
-                            if not compatible_machines:
-                                no_prod_line_parts.add(part.id)
-                            else:
-                                # Use set to track which machines this part is already added to per production line
-                                for machine in compatible_machines:
-                                    prod_line = machine.production_line if hasattr(machine, 'production_line') and machine.production_line else None
-                                    prod_line_id = prod_line.id if prod_line else None
+                            for part in parts:
+                                compatible_machines = part.compatible_machines if hasattr(part, 'compatible_machines') else []
+                                if not compatible_machines:
+                                    no_prod_line_parts.add(part.id)
+                                else:
+                                    # Use set to track which machines this part is already added to per production line
+                                    for machine in compatible_machines:
+                                        prod_line = machine.production_line if hasattr(machine, 'production_line') and machine.production_line else None
+                                        prod_line_id = prod_line.id if prod_line else None
                                     
-                                    if prod_line_id not in prod_line_parts:
-                                        prod_line_parts[prod_line_id] = {}
-                                    if machine.id not in prod_line_parts[prod_line_id]:
-                                        prod_line_parts[prod_line_id][machine.id] = {}
-                                    # Only add part once per machine (even if it appears multiple times)
-                                    prod_line_parts[prod_line_id][machine.id][part.id] = part
+                                        if prod_line_id not in prod_line_parts:
+                                            prod_line_parts[prod_line_id] = {}
+                                        if machine.id not in prod_line_parts[prod_line_id]:
+                                            prod_line_parts[prod_line_id][machine.id] = {}
+                                        # Only add part once per machine (even if it appears multiple times)
+                                        prod_line_parts[prod_line_id][machine.id][part.id] = part
                         
-                        # Create accordion structure: Production Line -> Machine -> Parts
-                        # Need to get machine info - load machines
-                        from database.models import Machine
-                        machines_info = {}
-                        for prod_line_id in prod_line_parts.keys():
-                            for machine_id in prod_line_parts[prod_line_id].keys():
-                                if machine_id not in machines_info:
-                                    machine_obj = session.query(Machine).filter_by(id=machine_id).first()
-                                    if machine_obj:
-                                        machines_info[machine_id] = machine_obj
+                            # Create accordion structure: Production Line -> Machine -> Parts
+                            # Need to get machine info - load machines
+                            from database.models import Machine
+                            machines_info = {}
+                            for prod_line_id in prod_line_parts.keys():
+                                for machine_id in prod_line_parts[prod_line_id].keys():
+                                    if machine_id not in machines_info:
+                                        machine_obj = session.query(Machine).filter_by(id=machine_id).first()
+                                        if machine_obj:
+                                            machines_info[machine_id] = machine_obj
                         
-                        for prod_line_id in sorted(prod_line_parts.keys(), key=lambda x: (x is None, x)):
-                            machines_dict = prod_line_parts[prod_line_id]
-                            prod_line_name = None
-                            if prod_line_id:
-                                # Get production line name from first machine
-                                for machine_id in machines_dict:
+                            for prod_line_id in sorted(prod_line_parts.keys(), key=lambda x: (x is None, x)):
+                                machines_dict = prod_line_parts[prod_line_id]
+                                prod_line_name = None
+                                if prod_line_id:
+                                    # Get production line name from first machine
+                                    for machine_id in machines_dict:
+                                        machine = machines_info.get(machine_id)
+                                        if machine and hasattr(machine, 'production_line') and machine.production_line:
+                                            prod_line_name = machine.production_line.name
+                                            break
+                            
+                                if not prod_line_name:
+                                    prod_line_name = translator.get_text("inventory.no_production_line") if translator.get_text("inventory.no_production_line") != "inventory.no_production_line" else "Nincs termelési sor"
+                            
+                                # Production line header
+                                machine_items = []
+                            
+                                for machine_id in sorted(machines_dict.keys()):
+                                    parts_dict_for_machine = machines_dict[machine_id]
                                     machine = machines_info.get(machine_id)
-                                    if machine and hasattr(machine, 'production_line') and machine.production_line:
-                                        prod_line_name = machine.production_line.name
-                                        break
+                                    machine_name = machine.name if machine else f"Gép ID: {machine_id}"
+                                
+                                    # Machine parts
+                                    machine_parts_cards = []
+                                    for part_id, part in parts_dict_for_machine.items():
+                                        inv_level = inv_levels_dict.get(part.id)
+                                        card = create_part_card(part, inv_level)
+                                        machine_parts_cards.append(card)
+                                
+                                    # Machine section (collapsible)
+                                    machine_section = ft.ExpansionTile(
+                                        title=ft.Text(f"{machine_name} ({len(machine_parts_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'})", 
+                                                     size=14, weight=ft.FontWeight.W_600),
+                                        subtitle=ft.Text(f"{len(machine_parts_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
+                                                         size=12, color=DesignSystem.TEXT_SECONDARY),
+                                        leading=ft.Icon(ft.Icons.PRECISION_MANUFACTURING if hasattr(ft.Icons, 'PRECISION_MANUFACTURING') else ft.Icons.FACTORY, 
+                                                       size=20, color=DesignSystem.BLUE_500),
+                                        controls=[ft.Container(
+                                            content=ft.Column(machine_parts_cards, spacing=8),
+                                            padding=ft.padding.only(left=20, top=8, bottom=8),
+                                        )],
+                                        initially_expanded=True,
+                                    )
+                                    machine_items.append(machine_section)
                             
-                            if not prod_line_name:
-                                prod_line_name = translator.get_text("inventory.no_production_line") if translator.get_text("inventory.no_production_line") != "inventory.no_production_line" else "Nincs termelési sor"
+                                # Production line section
+                                if machine_items:
+                                    prod_line_section = ft.ExpansionTile(
+                                        title=ft.Text(prod_line_name, size=16, weight=ft.FontWeight.BOLD),
+                                        subtitle=ft.Text(f"{sum(len(machines_dict[m_id]) for m_id in machines_dict)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
+                                                         size=13, color=DesignSystem.TEXT_SECONDARY),
+                                        leading=ft.Icon(ft.Icons.SETTINGS_APPLICATIONS if hasattr(ft.Icons, 'SETTINGS_APPLICATIONS') else ft.Icons.TUNE, 
+                                                       size=24, color=DesignSystem.PURPLE_500),
+                                        controls=[ft.Container(
+                                            content=ft.Column(machine_items, spacing=4),
+                                            padding=ft.padding.only(left=20, top=8, bottom=8),
+                                        )],
+                                        initially_expanded=True,
+                                    )
+                                    controls.append(prod_line_section)
                             
-                            # Production line header
-                            machine_items = []
+                            # Parts with no production line association
+                            if no_prod_line_parts:
+                                no_prod_line_cards = []
+                                for part in parts:
+                                    if part.id in no_prod_line_parts:
+                                        inv_level = inv_levels_dict.get(part.id)
+                                        card = create_part_card(part, inv_level)
+                                        no_prod_line_cards.append(card)
                             
-                            for machine_id in sorted(machines_dict.keys()):
-                                parts_dict_for_machine = machines_dict[machine_id]
+                                no_prod_line_section = ft.ExpansionTile(
+                                    title=ft.Text(translator.get_text("inventory.no_production_line") if translator.get_text("inventory.no_production_line") != "inventory.no_production_line" else "Nincs termelési sor", 
+                                                 size=16, weight=ft.FontWeight.BOLD),
+                                    subtitle=ft.Text(f"{len(no_prod_line_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
+                                                     size=13, color=DesignSystem.TEXT_SECONDARY),
+                                    leading=ft.Icon(ft.Icons.INVENTORY_2, size=24, color=DesignSystem.GRAY_500),
+                                    controls=[ft.Container(
+                                        content=ft.Column(no_prod_line_cards, spacing=8),
+                                        padding=ft.padding.only(left=20, top=8, bottom=8),
+                                    )],
+                                    initially_expanded=True,
+                                )
+                                controls.append(no_prod_line_section)
+                    
+                        elif group_by_mode == "machine":
+                            # Group by machine (no production line grouping)
+                            machine_parts_dict = {}  # {machine_id: {part_id: part}}
+                            no_machine_parts = set()  # Parts with no machine association
+                        
+                            # Load machine info
+                            from database.models import Machine
+                            machines_info = {}
+                        
+                            for part in parts:
+                                compatible_machines = part.compatible_machines if hasattr(part, 'compatible_machines') else []
+                                if not compatible_machines:
+                                    no_machine_parts.add(part.id)
+                                else:
+                                    for machine in compatible_machines:
+                                        if machine.id not in machine_parts_dict:
+                                            machine_parts_dict[machine.id] = {}
+                                        # Only add part once per machine
+                                        machine_parts_dict[machine.id][part.id] = part
+                                        if machine.id not in machines_info:
+                                            machines_info[machine.id] = machine
+                        
+                            # Create accordion structure: Machine -> Parts
+                            for machine_id in sorted(machine_parts_dict.keys()):
+                                parts_dict_for_machine = machine_parts_dict[machine_id]
                                 machine = machines_info.get(machine_id)
                                 machine_name = machine.name if machine else f"Gép ID: {machine_id}"
-                                
-                                # Machine parts
+                            
                                 machine_parts_cards = []
                                 for part_id, part in parts_dict_for_machine.items():
                                     inv_level = inv_levels_dict.get(part.id)
                                     card = create_part_card(part, inv_level)
                                     machine_parts_cards.append(card)
-                                
-                                # Machine section (collapsible)
+                            
                                 machine_section = ft.ExpansionTile(
-                                    title=ft.Text(f"{machine_name} ({len(machine_parts_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'})", 
-                                                 size=14, weight=ft.FontWeight.W_600),
+                                    title=ft.Text(machine_name, size=16, weight=ft.FontWeight.W_600),
                                     subtitle=ft.Text(f"{len(machine_parts_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
-                                                     size=12, color=DesignSystem.TEXT_SECONDARY),
+                                                     size=13, color=DesignSystem.TEXT_SECONDARY),
                                     leading=ft.Icon(ft.Icons.PRECISION_MANUFACTURING if hasattr(ft.Icons, 'PRECISION_MANUFACTURING') else ft.Icons.FACTORY, 
-                                                   size=20, color=DesignSystem.BLUE_500),
+                                                   size=24, color=DesignSystem.BLUE_500),
                                     controls=[ft.Container(
                                         content=ft.Column(machine_parts_cards, spacing=8),
                                         padding=ft.padding.only(left=20, top=8, bottom=8),
                                     )],
                                     initially_expanded=True,
                                 )
-                                machine_items.append(machine_section)
+                                controls.append(machine_section)
+                        
+                            # Parts with no machine association
+                            if no_machine_parts:
+                                no_machine_cards = []
+                                for part in parts:
+                                    if part.id in no_machine_parts:
+                                        inv_level = inv_levels_dict.get(part.id)
+                                        card = create_part_card(part, inv_level)
+                                        no_machine_cards.append(card)
                             
-                            # Production line section
-                            if machine_items:
-                                prod_line_section = ft.ExpansionTile(
-                                    title=ft.Text(prod_line_name, size=16, weight=ft.FontWeight.BOLD),
-                                    subtitle=ft.Text(f"{sum(len(machines_dict[m_id]) for m_id in machines_dict)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
+                                no_machine_section = ft.ExpansionTile(
+                                    title=ft.Text(translator.get_text("inventory.no_machine") if translator.get_text("inventory.no_machine") != "inventory.no_machine" else "Nincs gép", 
+                                                 size=16, weight=ft.FontWeight.BOLD),
+                                    subtitle=ft.Text(f"{len(no_machine_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
                                                      size=13, color=DesignSystem.TEXT_SECONDARY),
-                                    leading=ft.Icon(ft.Icons.SETTINGS_APPLICATIONS if hasattr(ft.Icons, 'SETTINGS_APPLICATIONS') else ft.Icons.TUNE, 
-                                                   size=24, color=DesignSystem.PURPLE_500),
+                                    leading=ft.Icon(ft.Icons.INVENTORY_2, size=24, color=DesignSystem.GRAY_500),
                                     controls=[ft.Container(
-                                        content=ft.Column(machine_items, spacing=4),
+                                        content=ft.Column(no_machine_cards, spacing=8),
                                         padding=ft.padding.only(left=20, top=8, bottom=8),
                                     )],
                                     initially_expanded=True,
                                 )
-                                parts_list.controls.append(prod_line_section)
-                            
-                        # Parts with no production line association
-                        if no_prod_line_parts:
-                            no_prod_line_cards = []
-                            for part in parts:
-                                if part.id in no_prod_line_parts:
-                                    inv_level = inv_levels_dict.get(part.id)
-                                    card = create_part_card(part, inv_level)
-                                    no_prod_line_cards.append(card)
-                            
-                            no_prod_line_section = ft.ExpansionTile(
-                                title=ft.Text(translator.get_text("inventory.no_production_line") if translator.get_text("inventory.no_production_line") != "inventory.no_production_line" else "Nincs termelési sor", 
-                                             size=16, weight=ft.FontWeight.BOLD),
-                                subtitle=ft.Text(f"{len(no_prod_line_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
-                                                 size=13, color=DesignSystem.TEXT_SECONDARY),
-                                leading=ft.Icon(ft.Icons.INVENTORY_2, size=24, color=DesignSystem.GRAY_500),
-                                controls=[ft.Container(
-                                    content=ft.Column(no_prod_line_cards, spacing=8),
-                                    padding=ft.padding.only(left=20, top=8, bottom=8),
-                                )],
-                                initially_expanded=True,
-                            )
-                            parts_list.controls.append(no_prod_line_section)
+                                controls.append(no_machine_section)
                     
-                    elif group_by_mode == "machine":
-                        # Group by machine (no production line grouping)
-                        machine_parts_dict = {}  # {machine_id: {part_id: part}}
-                        no_machine_parts = set()  # Parts with no machine association
-                        
-                        # Load machine info
-                        from database.models import Machine
-                        machines_info = {}
-                        
-                        for part in parts:
-                            compatible_machines = part.compatible_machines if hasattr(part, 'compatible_machines') else []
-                            if not compatible_machines:
-                                no_machine_parts.add(part.id)
-                            else:
-                                for machine in compatible_machines:
-                                    if machine.id not in machine_parts_dict:
-                                        machine_parts_dict[machine.id] = {}
-                                    # Only add part once per machine
-                                    machine_parts_dict[machine.id][part.id] = part
-                                    if machine.id not in machines_info:
-                                        machines_info[machine.id] = machine
-                        
-                        # Create accordion structure: Machine -> Parts
-                        for machine_id in sorted(machine_parts_dict.keys()):
-                            parts_dict_for_machine = machine_parts_dict[machine_id]
-                            machine = machines_info.get(machine_id)
-                            machine_name = machine.name if machine else f"Gép ID: {machine_id}"
-                            
-                            machine_parts_cards = []
-                            for part_id, part in parts_dict_for_machine.items():
-                                inv_level = inv_levels_dict.get(part.id)
-                                card = create_part_card(part, inv_level)
-                                machine_parts_cards.append(card)
-                            
-                            machine_section = ft.ExpansionTile(
-                                title=ft.Text(machine_name, size=16, weight=ft.FontWeight.W_600),
-                                subtitle=ft.Text(f"{len(machine_parts_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
-                                                 size=13, color=DesignSystem.TEXT_SECONDARY),
-                                leading=ft.Icon(ft.Icons.PRECISION_MANUFACTURING if hasattr(ft.Icons, 'PRECISION_MANUFACTURING') else ft.Icons.FACTORY, 
-                                               size=24, color=DesignSystem.BLUE_500),
-                                controls=[ft.Container(
-                                    content=ft.Column(machine_parts_cards, spacing=8),
-                                    padding=ft.padding.only(left=20, top=8, bottom=8),
-                                )],
-                                initially_expanded=True,
-                            )
-                            parts_list.controls.append(machine_section)
-                        
-                        # Parts with no machine association
-                        if no_machine_parts:
-                            no_machine_cards = []
-                            for part in parts:
-                                if part.id in no_machine_parts:
-                                    inv_level = inv_levels_dict.get(part.id)
-                                    card = create_part_card(part, inv_level)
-                                    no_machine_cards.append(card)
-                            
-                            no_machine_section = ft.ExpansionTile(
-                                title=ft.Text(translator.get_text("inventory.no_machine") if translator.get_text("inventory.no_machine") != "inventory.no_machine" else "Nincs gép", 
-                                             size=16, weight=ft.FontWeight.BOLD),
-                                subtitle=ft.Text(f"{len(no_machine_cards)} {translator.get_text('inventory.parts') if translator.get_text('inventory.parts') != 'inventory.parts' else 'alkatrész'}", 
-                                                 size=13, color=DesignSystem.TEXT_SECONDARY),
-                                leading=ft.Icon(ft.Icons.INVENTORY_2, size=24, color=DesignSystem.GRAY_500),
-                                controls=[ft.Container(
-                                    content=ft.Column(no_machine_cards, spacing=8),
-                                    padding=ft.padding.only(left=20, top=8, bottom=8),
-                                )],
-                                initially_expanded=True,
+                        if not controls:
+                            controls.append(
+                                create_empty_state_card(
+                                    icon=ft.Icons.INVENTORY_2,
+                                    title=translator.get_text("empty_states.no_inventory"),
+                                    icon_color=DesignSystem.GRAY_400,
+                                )
                             )
-                            parts_list.controls.append(no_machine_section)
                     
-                    if not parts_list.controls:
-                        parts_list.controls.append(
+                        # No pagination info update needed when grouping (all parts shown)
+                    
+                    finally:
+                        session.close()
+            
+                else:
+                    # Original behavior: no grouping, with pagination
+                    # Use PaginationController for pagination
+                    offset = pagination_controller.start_index
+                    limit = pagination_controller.items_per_page
+                    parts = inventory_service.list_parts(limit=limit, offset=offset)
+                
+                    if not parts:
+                        controls.append(
                             create_empty_state_card(
                                 icon=ft.Icons.INVENTORY_2,
                                 title=translator.get_text("empty_states.no_inventory"),
                                 icon_color=DesignSystem.GRAY_400,
                             )
                         )
+                    else:
+                        # Batch load all inventory levels in one query (optimized)
+                        part_ids = [p.id for p in parts]
+                        inv_levels_dict = inventory_service.get_inventory_levels_batch(part_ids)
                     
-                    # No pagination info update needed when grouping (all parts shown)
-                    
-                finally:
-                    session.close()
-            
-            else:
-                # Original behavior: no grouping, with pagination
-                # Use PaginationController for pagination
-                offset = pagination_controller.start_index
-                limit = pagination_controller.items_per_page
-                parts = inventory_service.list_parts(limit=limit, offset=offset)
+                        for part in parts:
+                            inv_level = inv_levels_dict.get(part.id)
+                            card = create_part_card(part, inv_level)
+                            controls.append(card)
                 
-                if not parts:
-                    parts_list.controls.append(
-                        create_empty_state_card(
-                            icon=ft.Icons.INVENTORY_2,
-                            title=translator.get_text("empty_states.no_inventory"),
-                            icon_color=DesignSystem.GRAY_400,
-                        )
-                    )
-                else:
-                    # Batch load all inventory levels in one query (optimized)
-                    part_ids = [p.id for p in parts]
-                    inv_levels_dict = inventory_service.get_inventory_levels_batch(part_ids)
-                    
-                    for part in parts:
-                        inv_level = inv_levels_dict.get(part.id)
-                        card = create_part_card(part, inv_level)
-                        parts_list.controls.append(card)
+                open_part = None
+                if open_part_id:
+                    try:
+                        open_part = inventory_service.get_part(open_part_id)
+                    except Exception as e:
+                        print(f"[INVENTORY] Error loading part for search: {e}")
+                return controls, total_parts_count, open_part
             
-            if update_page:
-                page.update()
+            def apply_parts(result):
+                controls, total_parts_count, open_part = result
+                parts_list.controls = controls
+                pagination_controller.update_total_items(total_parts_count)
+                if open_part:
+                    # Open edit dialog once the list has been painted
+                    def open_dialog():
+                        try:
+                            open_edit_part_dialog(open_part)
+                        except Exception as e:
+                            print(f"[INVENTORY] Error opening part dialog from search: {e}")
+                    ui_tasks.call_soon(open_dialog)
+            
+            # Rapid refreshes (filter changes, saves) coalesce: only the newest load is applied
+            ui_tasks.submit("inventory.parts", load_parts, apply_parts)
 
         def open_add_part_dialog(e):
             print(f"[INVENTORY] open_add_part_dialog called, event: {e}")
@@ -30,6 +30,7 @@ from ui.components.modern_components import (
     create_empty_state_card,
     DesignSystem,
 )
+from ui.components.virtual_list import VirtualListView
 from ui.components.modern_card import (
     create_tailwind_card,
     create_info_card,
@@ -2416,10 +2417,10 @@ class PMScreen:
             from datetime import timezone as tz
             dialog_page = self.page if self.page else page
             
-            # Get all PM history records
-            all_history = pm_service.list_pm_history(user_id=current_user_id, completion_status="completed")
+            # Only the count up front; the records are loaded page by page while scrolling
+            total_count = pm_service.count_pm_history(user_id=current_user_id, completion_status="completed")
             
-            if not all_history:
+            if not total_count:
                 empty_dialog = ft.AlertDialog(
                     modal=True,
                     title=ft.Row([
@@ -2445,9 +2446,6 @@ class PMScreen:
                     dialog_page.update()
                 return
             
-            # Group history by year/month/day
-            grouped_history = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-            
             # Hungarian month names
             month_names = {
                 1: "január", 2: "február", 3: "március", 4: "április",
@@ -2455,238 +2453,200 @@ class PMScreen:
                 9: "szeptember", 10: "október", 11: "november", 12: "december"
             }
             
-            for history in all_history:
-                if history.executed_date:
-                    exec_date = history.executed_date
-                    if exec_date.tzinfo is None:
-                        exec_date = exec_date.replace(tzinfo=tz.utc)
+            def view_work_request_pdf(h):
+                """Open work request DOCX"""
+                try:
+                    from services import pdf_service
+                    from database.models import WorkRequestPDF
+                    from database.session_manager import SessionLocal
+                    from pathlib import Path
+                    import os
                     
-                    year = exec_date.year
-                    month = exec_date.month
-                    day = exec_date.day
+                    session = SessionLocal()
+                    pdf_record = session.query(WorkRequestPDF).filter_by(pm_task_id=h.pm_task_id).first()
+                    session.close()
                     
-                    # Get task and machine info
-                    task = history.pm_task if hasattr(history, 'pm_task') and history.pm_task else None
-                    if task:
-                        if task.machine_id:
-                            machine_name = task.machine.name if hasattr(task, 'machine') and task.machine else f"Gép ID: {task.machine_id}"
-                        else:
-                            machine_name = f"{translator.get_text('preventive_maintenance.other')}: {task.location or '-'}"
+                    if pdf_record and Path(pdf_record.pdf_path).exists():
+                        os.startfile(pdf_record.pdf_path)
                     else:
-                        machine_name = "Ismeretlen"
-                    
-                    grouped_history[year][month][day].append((history, task, machine_name))
+                        page.snack_bar = ft.SnackBar(content=ft.Text(translator.get_text("preventive_maintenance.document_not_found")), bgcolor=DesignSystem.ERROR)
+                        page.snack_bar.open = True
+                        page.update()
+                except Exception as ex:
+                    page.snack_bar = ft.SnackBar(content=ft.Text(f"{translator.get_text('common.messages.error_occurred')}: {ex}"), bgcolor=DesignSystem.ERROR)
+                    page.snack_bar.open = True
+                    page.update()
             
-            # Build UI with expandable sections
-            history_list = ft.Column([], spacing=8, scroll=ft.ScrollMode.AUTO)
-            
-            # Sort years descending
-            sorted_years = sorted(grouped_history.keys(), reverse=True)
+            def view_pm_worksheet_pdf(h):
+                """Open PM worksheet DOCX"""
+                try:
+                    from services import pdf_service
+                    from database.models import PMWorksheetPDF
+                    from database.session_manager import SessionLocal
+                    from pathlib import Path
+                    import os
+                    
+                    session = SessionLocal()
+                    pdf_record = session.query(PMWorksheetPDF).filter_by(pm_history_id=h.id).first()
+                    session.close()
+                    
+                    if pdf_record and Path(pdf_record.pdf_path).exists():
+                        os.startfile(pdf_record.pdf_path)
+                    else:
+                        page.snack_bar = ft.SnackBar(content=ft.Text(translator.get_text("preventive_maintenance.document_not_found")), bgcolor=DesignSystem.ERROR)
+                        page.snack_bar.open = True
+                        page.update()
+                except Exception as ex:
+                    page.snack_bar = ft.SnackBar(content=ft.Text(f"{translator.get_text('common.messages.error_occurred')}: {ex}"), bgcolor=DesignSystem.ERROR)
+                    page.snack_bar.open = True
+                    page.update()
             
-            for year in sorted_years:
-                year_expansion = ft.ExpansionTile(
-                    title=ft.Text(f"{year}. {translator.get_text('common.time.year')}", size=14, weight=ft.FontWeight.BOLD, color="#1F2937"),
-                    leading=ft.Icon(ft.Icons.CALENDAR_MONTH, color="#6366F1"),
-                    initially_expanded=False,
-                )
-                year_content = ft.Column([], spacing=4)
-                
-                # Sort months descending
-                sorted_months = sorted(grouped_history[year].keys(), reverse=True)
-                
-                for month in sorted_months:
-                    month_expansion = ft.ExpansionTile(
-                        title=ft.Text(f"{month_names[month]}", size=13, weight=ft.FontWeight.BOLD, color="#374151"),
-                        leading=ft.Icon(ft.Icons.CALENDAR_VIEW_MONTH, color="#8B5CF6"),
-                        initially_expanded=False,
-                    )
-                    month_content = ft.Column([], spacing=4)
+            def download_combined_pdf(h):
+                """Download combined documents (work request + worksheet)"""
+                try:
+                    from database.models import WorkRequestPDF, PMWorksheetPDF
+                    from database.session_manager import SessionLocal
+                    from pathlib import Path
+                    import os
+                    import shutil
                     
-                    # Sort days descending
-                    sorted_days = sorted(grouped_history[year][month].keys(), reverse=True)
+                    session = SessionLocal()
+                    work_request_doc = session.query(WorkRequestPDF).filter_by(pm_task_id=h.pm_task_id).first()
+                    pm_worksheet_doc = session.query(PMWorksheetPDF).filter_by(pm_history_id=h.id).first()
+                    session.close()
                     
-                    for day in sorted_days:
-                        day_expansion = ft.ExpansionTile(
-                            title=ft.Text(f"{day}. {translator.get_text('common.time.day')}", size=12, weight=ft.FontWeight.BOLD, color="#6B7280"),
-                            leading=ft.Icon(ft.Icons.CALENDAR_TODAY, color="#10B981"),
-                            initially_expanded=True,
-                        )
-                        day_content = ft.Column([], spacing=6)
-                        
-                        for history, task, machine_name in grouped_history[year][month][day]:
-                            exec_date = history.executed_date
-                            if exec_date.tzinfo is None:
-                                exec_date = exec_date.replace(tzinfo=tz.utc)
-                            
-                            card = ft.Card(
-                                elevation=1,
-                                content=ft.Container(
-                                    content=ft.Column([
-                                        ft.Row([
-                                            ft.Column([
-                                                ft.Text(
-                                                    task.task_name if task else "Ismeretlen feladat",
-                                                    size=13,
-                                                    weight=ft.FontWeight.BOLD,
-                                                    color="#1F2937",
-                                                ),
-                                                ft.Text(f"Gép/Helyszín: {machine_name}", size=11, color="#6B7280"),
-                                            ], expand=True),
-                                            ft.Text(
-                                                exec_date.strftime("%H:%M"),
-                                                size=12,
-                                                color="#9CA3AF",
-                                            ),
-                                        ], spacing=8),
-                                        ft.Divider(height=1, color="#E5E7EB"),
-                                        ft.Row([
-                                            ft.Text(f"{translator.get_text('preventive_maintenance.executed_by')}: {history.completed_user.full_name if history.completed_user else '-'}", size=11, color="#6B7280"),
-                                            ft.Container(width=20),
-                                            ft.Text(f"{translator.get_text('preventive_maintenance.duration_minutes')}: {history.duration_minutes or 0} {translator.get_text('common.time.minutes')}", size=11, color="#6B7280"),
-                                        ]),
-                                        ft.Text(f"Megjegyzés: {history.notes or '-'}", size=11, color="#9CA3AF", italic=True) if history.notes else ft.Container(),
-                                        ft.Divider(height=1, color="#E5E7EB"),
-                                        # Document buttons
-                                        ft.Row([
-                                            ft.ElevatedButton(
-                                                translator.get_text("preventive_maintenance.work_request"),
-                                                icon=ft.Icons.PICTURE_AS_PDF,
-                                                on_click=lambda _, h=history: view_work_request_pdf(h),
-                                                bgcolor=DesignSystem.ERROR,
-                                                color="#FFFFFF",
-                                                height=32,
-                                                tooltip="Munkaigénylő lap megtekintése / View work request",
-                                            ),
-                                            ft.ElevatedButton(
-                                                translator.get_text("preventive_maintenance.worksheet"),
-                                                icon=ft.Icons.DESCRIPTION,
-                                                on_click=lambda _, h=history: view_pm_worksheet_pdf(h),
-                                                bgcolor=DesignSystem.SUCCESS,
-                                                color="#FFFFFF",
-                                                height=32,
-                                                tooltip="Munkalap megtekintése / View worksheet",
-                                            ),
-                                            ft.ElevatedButton(
-                                                translator.get_text("common.buttons.download"),
-                                                icon=ft.Icons.DOWNLOAD,
-                                                on_click=lambda _, h=history: download_combined_pdf(h),
-                                                bgcolor="#6366F1",
-                                                color="#FFFFFF",
-                                                height=32,
-                                                tooltip="Dokumentumok letöltése / Download documents",
-                                            ),
-                                        ], spacing=8),
-                                    ], spacing=4, tight=True),
-                                    padding=12,
-                                ),
-                            )
-                            
-                            def view_work_request_pdf(h):
-                                """Open work request DOCX"""
-                                try:
-                                    from services import pdf_service
-                                    from database.models import WorkRequestPDF
-                                    from database.session_manager import SessionLocal
-                                    from pathlib import Path
-                                    import os
-                                    
-                                    session = SessionLocal()
-                                    pdf_record = session.query(WorkRequestPDF).filter_by(pm_task_id=h.pm_task_id).first()
-                                    session.close()
-                                    
-                                    if pdf_record and Path(pdf_record.pdf_path).exists():
-                                        os.startfile(pdf_record.pdf_path)
-                                    else:
-                                        page.snack_bar = ft.SnackBar(content=ft.Text(translator.get_text("preventive_maintenance.document_not_found")), bgcolor=DesignSystem.ERROR)
-                                        page.snack_bar.open = True
-                                        page.update()
-                                except Exception as ex:
-                                    page.snack_bar = ft.SnackBar(content=ft.Text(f"{translator.get_text('common.messages.error_occurred')}: {ex}"), bgcolor=DesignSystem.ERROR)
-                                    page.snack_bar.open = True
-                                    page.update()
-                            
-                            def view_pm_worksheet_pdf(h):
-                                """Open PM worksheet DOCX"""
-                                try:
-                                    from services import pdf_service
-                                    from database.models import PMWorksheetPDF
-                                    from database.session_manager import SessionLocal
-                                    from pathlib import Path
-                                    import os
-                                    
-                                    session = SessionLocal()
-                                    pdf_record = session.query(PMWorksheetPDF).filter_by(pm_history_id=h.id).first()
-                                    session.close()
-                                    
-                                    if pdf_record and Path(pdf_record.pdf_path).exists():
-                                        os.startfile(pdf_record.pdf_path)
-                                    else:
-                                        page.snack_bar = ft.SnackBar(content=ft.Text(translator.get_text("preventive_maintenance.document_not_found")), bgcolor=DesignSystem.ERROR)
-                                        page.snack_bar.open = True
-                                        page.update()
-                                except Exception as ex:
-                                    page.snack_bar = ft.SnackBar(content=ft.Text(f"{translator.get_text('common.messages.error_occurred')}: {ex}"), bgcolor=DesignSystem.ERROR)
-                                    page.snack_bar.open = True
-                                    page.update()
-                            
-                            def download_combined_pdf(h):
-                                """Download combined documents (work request + worksheet)"""
-                                try:
-                                    from database.models import WorkRequestPDF, PMWorksheetPDF
-                                    from database.session_manager import SessionLocal
-                                    from pathlib import Path
-                                    import os
-                                    import shutil
-                                    
-                                    session = SessionLocal()
-                                    work_request_doc = session.query(WorkRequestPDF).filter_by(pm_task_id=h.pm_task_id).first()
-                                    pm_worksheet_doc = session.query(PMWorksheetPDF).filter_by(pm_history_id=h.id).first()
-                                    session.close()
-                                    
-                                    doc_paths = []
-                                    if work_request_doc and Path(work_request_doc.pdf_path).exists():
-                                        doc_paths.append(work_request_doc.pdf_path)
-                                    if pm_worksheet_doc and Path(pm_worksheet_doc.pdf_path).exists():
-                                        doc_paths.append(pm_worksheet_doc.pdf_path)
-                                    
-                                    if not doc_paths:
-                                        page.snack_bar = ft.SnackBar(content=ft.Text(translator.get_text("preventive_maintenance.no_documents_available")), bgcolor=DesignSystem.ERROR)
-                                        page.snack_bar.open = True
-                                        page.update()
-                                        return
-                                    
-                                    # Create a folder with both documents
-                                    output_dir = Path("generated_pdfs") / f"pm_combined_{h.id}"
-                                    output_dir.mkdir(parents=True, exist_ok=True)
-                                    
-                                    # Copy documents to folder
-                                    for doc_path in doc_paths:
-                                        shutil.copy2(doc_path, output_dir / Path(doc_path).name)
-                                    
-                                    # Open folder
-                                    os.startfile(output_dir)
-                                    
-                                    page.snack_bar = ft.SnackBar(content=ft.Text(translator.get_text("preventive_maintenance.documents_copied")), bgcolor=DesignSystem.SUCCESS)
-                                    page.snack_bar.open = True
-                                    page.update()
-                                except Exception as ex:
-                                    page.snack_bar = ft.SnackBar(content=ft.Text(f"{translator.get_text('common.messages.error_occurred')}: {ex}"), bgcolor=DesignSystem.ERROR)
-                                    page.snack_bar.open = True
-                                    page.update()
-                            
-                            day_content.controls.append(card)
-                        
-                        day_expansion.controls = [day_content]
-                        month_content.controls.append(day_expansion)
+                    doc_paths = []
+                    if work_request_doc and Path(work_request_doc.pdf_path).exists():
+                        doc_paths.append(work_request_doc.pdf_path)
+                    if pm_worksheet_doc and Path(pm_worksheet_doc.pdf_path).exists():
+                        doc_paths.append(pm_worksheet_doc.pdf_path)
+                    
+                    if not doc_paths:
+                        page.snack_bar = ft.SnackBar(content=ft.Text(translator.get_text("preventive_maintenance.no_documents_available")), bgcolor=DesignSystem.ERROR)
+                        page.snack_bar.open = True
+                        page.update()
+                        return
+                    
+                    # Create a folder with both documents
+                    output_dir = Path("generated_pdfs") / f"pm_combined_{h.id}"
+                    output_dir.mkdir(parents=True, exist_ok=True)
                     
-                    month_expansion.controls = [month_content]
-                    year_content.controls.append(month_expansion)
+                    # Copy documents to folder
+                    for doc_path in doc_paths:
+                        shutil.copy2(doc_path, output_dir / Path(doc_path).name)
+                    
+                    # Open folder
+                    os.startfile(output_dir)
+                    
+                    page.snack_bar = ft.SnackBar(content=ft.Text(translator.get_text("preventive_maintenance.documents_copied")), bgcolor=DesignSystem.SUCCESS)
+                    page.snack_bar.open = True
+                    page.update()
+                except Exception as ex:
+                    page.snack_bar = ft.SnackBar(content=ft.Text(f"{translator.get_text('common.messages.error_occurred')}: {ex}"), bgcolor=DesignSystem.ERROR)
+                    page.snack_bar.open = True
+                    page.update()
+            
+            def build_history_card(history):
+                """Card of one executed PM task (task, machine and user are eager loaded by the page query)"""
+                task = history.pm_task
+                if task:
+                    if task.machine_id:
+                        machine_name = task.machine.name if task.machine else f"Gép ID: {task.machine_id}"
+                    else:
+                        machine_name = f"{translator.get_text('preventive_maintenance.other')}: {task.location or '-'}"
+                else:
+                    machine_name = "Ismeretlen"
+                exec_date = history.executed_date
+                if exec_date and exec_date.tzinfo is None:
+                    exec_date = exec_date.replace(tzinfo=tz.utc)
                 
-                year_expansion.controls = [year_content]
-                history_list.controls.append(year_expansion)
+                return ft.Card(
+                    elevation=1,
+                    content=ft.Container(
+                        content=ft.Column([
+                            ft.Row([
+                                ft.Column([
+                                    ft.Text(
+                                        task.task_name if task else "Ismeretlen feladat",
+                                        size=13,
+                                        weight=ft.FontWeight.BOLD,
+                                        color="#1F2937",
+                                    ),
+                                    ft.Text(f"Gép/Helyszín: {machine_name}", size=11, color="#6B7280"),
+                                ], expand=True),
+                                ft.Text(
+                                    exec_date.strftime("%H:%M") if exec_date else "-",
+                                    size=12,
+                                    color="#9CA3AF",
+                                ),
+                            ], spacing=8),
+                            ft.Divider(height=1, color="#E5E7EB"),
+                            ft.Row([
+                                ft.Text(f"{translator.get_text('preventive_maintenance.executed_by')}: {history.completed_user.full_name if history.completed_user else '-'}", size=11, color="#6B7280"),
+                                ft.Container(width=20),
+                                ft.Text(f"{translator.get_text('preventive_maintenance.duration_minutes')}: {history.duration_minutes or 0} {translator.get_text('common.time.minutes')}", size=11, color="#6B7280"),
+                            ]),
+                            ft.Text(f"Megjegyzés: {history.notes or '-'}", size=11, color="#9CA3AF", italic=True) if history.notes else ft.Container(),
+                            ft.Divider(height=1, color="#E5E7EB"),
+                            # Document buttons
+                            ft.Row([
+                                ft.ElevatedButton(
+                                    translator.get_text("preventive_maintenance.work_request"),
+                                    icon=ft.Icons.PICTURE_AS_PDF,
+                                    on_click=lambda _, h=history: view_work_request_pdf(h),
+                                    bgcolor=DesignSystem.ERROR,
+                                    color="#FFFFFF",
+                                    height=32,
+                                    tooltip="Munkaigénylő lap megtekintése / View work request",
+                                ),
+                                ft.ElevatedButton(
+                                    translator.get_text("preventive_maintenance.worksheet"),
+                                    icon=ft.Icons.DESCRIPTION,
+                                    on_click=lambda _, h=history: view_pm_worksheet_pdf(h),
+                                    bgcolor=DesignSystem.SUCCESS,
+                                    color="#FFFFFF",
+                                    height=32,
+                                    tooltip="Munkalap megtekintése / View worksheet",
+                                ),
+                                ft.ElevatedButton(
+                                    translator.get_text("common.buttons.download"),
+                                    icon=ft.Icons.DOWNLOAD,
+                                    on_click=lambda _, h=history: download_combined_pdf(h),
+                                    bgcolor="#6366F1",
+                                    color="#FFFFFF",
+                                    height=32,
+                                    tooltip="Dokumentumok letöltése / Download documents",
+                                ),
+                            ], spacing=8),
+                        ], spacing=4, tight=True),
+                        padding=12,
+                    ),
+                )
             
-            # Total count
-            total_count = len(all_history)
+            def build_day_header(day, history):
+                """Date header above the first record of each day (records are ordered by execution date)"""
+                return ft.Row([
+                    ft.Icon(ft.Icons.CALENDAR_TODAY, color="#10B981", size=18),
+                    ft.Text(
+                        f"{day.year}. {month_names[day.month]} {day.day}." if day else "-",
+                        size=13,
+                        weight=ft.FontWeight.BOLD,
+                        color="#374151",
+                    ),
+                ], spacing=8)
+            
+            history_vlist = VirtualListView(
+                fetch_page=lambda after, limit: pm_service.list_pm_history_page(
+                    user_id=current_user_id, completion_status="completed", after=after, limit=limit,
+                ),
+                build_item=build_history_card,
+                row_key=lambda h: (h.executed_date, h.id),
+                page_size=50,
+                section_key=lambda h: h.executed_date.date() if h.executed_date else None,
+                build_section_header=build_day_header,
+                spacing=6,
+            )
+            history_vlist.reload(update=False)
             
             dialog = ft.AlertDialog(
                 modal=True,
@@ -2703,8 +2663,8 @@ class PMScreen:
                             padding=ft.padding.only(bottom=8),
                         ),
                         ft.Divider(height=1, color="#E5E7EB"),
-                        history_list,
-                    ], spacing=8, tight=False, scroll=ft.ScrollMode.AUTO),
+                        history_vlist.control,
+                    ], spacing=8, tight=False),
                     width=900,
                     height=700,
                     padding=15,
@@ -2077,7 +2077,8 @@ class ProductionLineScreen:
         
         def navigate_to_assets(production_line_id: int):
             """Navigate to assets screen filtered by production line"""
-            from ui.app import state
+            from ui.app import get_app_state
+            state = get_app_state()
             state.view = "assets"
             state._production_line_filter = production_line_id
             page_ref = self.page if hasattr(self, 'page') and self.page else page
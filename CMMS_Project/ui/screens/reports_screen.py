@@ -16,7 +16,7 @@ import threading
 from services.reports_service import get_all_statistics, get_period_comparison, get_technician_statistics
 from services.reports_service_extended import get_trend_statistics, get_average_statistics, get_machine_statistics
 from services.excel_export_service import export_reports_to_excel
-from services.chart_service import generate_cost_chart, generate_time_chart, generate_tasks_chart, generate_tasks_pie_chart
+from services.chart_service import submit_chart
 from services.context_service import get_app_context
 from services import asset_service
 from localization.translator import translator
@@ -26,8 +26,10 @@ from ui.components.modern_components import (
     create_modern_card,
     create_vibrant_badge,
     create_empty_state_card,
+    create_skeleton_card,
     DesignSystem,
 )
+from ui.task_executor import get_ui_executor
 from ui.components.modern_card import (
     create_tailwind_card,
     create_info_card,
@@ -99,28 +101,23 @@ class ReportsScreen:
         # Filters section
         filters_section = self._build_filters_section(page)
         
-        # Get statistics with filters
-        # Log filter values to verify they are being used
-        logger.info(f"Getting statistics - period: {self.current_period}, user_id: {user_id}, machine_id: {self.filter_machine_id}, status: {self.filter_status}, priority: {self.filter_priority}")
-        stats = get_all_statistics(
-            self.current_period, 
-            user_id,
-            self.filter_machine_id,
-            self.filter_status,
-            self.filter_priority
+        # Statistics, charts and tables are loaded in the background; the header
+        # and filters show immediately with skeletons in place of the data
+        data_section = ft.Column(
+            [create_skeleton_card(lines=2), create_skeleton_card(lines=4)],
+            spacing=16,
         )
         
-        # Get extended statistics
-        try:
-            from services.reports_service_extended import get_trend_statistics as get_ext_trends
-            trend_stats = get_ext_trends(self.periods, user_id)
-            avg_stats = get_average_statistics(self.current_period, user_id)
-            machine_stats = get_machine_statistics(self.current_period, self.filter_machine_id)
-        except Exception as e:
-            logger.error(f"Error getting extended statistics: {e}")
-            trend_stats = {}
-            avg_stats = {}
-            machine_stats = []
+        def apply_data_section(controls):
+            data_section.controls = controls
+        
+        ui_tasks = get_ui_executor(page)
+        ui_tasks.begin_paint("reports")
+        ui_tasks.submit(
+            "reports.data",
+            lambda token: self._build_data_section(page, user_id, token),
+            apply_data_section,
+        )
         
         # Build content
         content = ft.Column([
@@ -143,6 +140,40 @@ class ReportsScreen:
             
             ft.Divider(height=1),
             
+            data_section,
+            
+        ], spacing=16, scroll=ft.ScrollMode.AUTO, expand=True)
+        
+        return content
+    
+    def _build_data_section(self, page: ft.Page, user_id, token) -> list:
+        """Statistics, charts and tables for the current filters (runs on the UI task pool)"""
+        # Get statistics with filters
+        # Log filter values to verify they are being used
+        logger.info(f"Getting statistics - period: {self.current_period}, user_id: {user_id}, machine_id: {self.filter_machine_id}, status: {self.filter_status}, priority: {self.filter_priority}")
+        stats = get_all_statistics(
+            self.current_period, 
+            user_id,
+            self.filter_machine_id,
+            self.filter_status,
+            self.filter_priority
+        )
+        token.raise_if_cancelled()
+        
+        # Get extended statistics
+        try:
+            from services.reports_service_extended import get_trend_statistics as get_ext_trends
+            trend_stats = get_ext_trends(self.periods, user_id)
+            avg_stats = get_average_statistics(self.current_period, user_id)
+            machine_stats = get_machine_statistics(self.current_period, self.filter_machine_id)
+        except Exception as e:
+            logger.error(f"Error getting extended statistics: {e}")
+            trend_stats = {}
+            avg_stats = {}
+            machine_stats = []
+        token.raise_if_cancelled()
+        
+        return [
             # Extended statistics (trends, averages)
             self._build_extended_statistics_section(trend_stats, avg_stats),
             
@@ -156,10 +187,7 @@ class ReportsScreen:
             
             # Charts section
             self._build_charts_section(stats, page),
-            
-        ], spacing=16, scroll=ft.ScrollMode.AUTO, expand=True)
-        
-        return content
+        ]
     
     def _on_period_change(self, e, page: ft.Page):
         self.current_period = e.control.value
@@ -392,30 +420,25 @@ class ReportsScreen:
             self.filter_priority
         )
         
-        # Generate charts (with error handling)
-        try:
-            cost_chart_path = generate_cost_chart(all_periods_stats)
-        except Exception as ex:
-            logger.error(f"Error generating cost chart: {ex}")
-            cost_chart_path = None
-        
-        try:
-            time_chart_path = generate_time_chart(all_periods_stats)
-        except Exception as ex:
-            logger.error(f"Error generating time chart: {ex}")
-            time_chart_path = None
-        
-        try:
-            tasks_chart_path = generate_tasks_chart(all_periods_stats)
-        except Exception as ex:
-            logger.error(f"Error generating tasks chart: {ex}")
-            tasks_chart_path = None
-        
-        try:
-            tasks_pie_chart_path = generate_tasks_pie_chart(all_periods_stats, "year")
-        except Exception as ex:
-            logger.error(f"Error generating tasks pie chart: {ex}")
-            tasks_pie_chart_path = None
+        # Charts render in parallel in the chart worker processes (served from the
+        # chart cache when the statistics did not change)
+        chart_futures = {
+            "cost": submit_chart("cost", all_periods_stats),
+            "time": submit_chart("time", all_periods_stats),
+            "tasks": submit_chart("tasks", all_periods_stats),
+            "tasks_pie": submit_chart("tasks_pie", all_periods_stats, period="year"),
+        }
+        chart_paths = {}
+        for chart_type, future in chart_futures.items():
+            try:
+                chart_paths[chart_type] = future.result()
+            except Exception as ex:
+                logger.error(f"Error generating {chart_type} chart: {ex}")
+                chart_paths[chart_type] = None
+        cost_chart_path = chart_paths["cost"]
+        time_chart_path = chart_paths["time"]
+        tasks_chart_path = chart_paths["tasks"]
+        tasks_pie_chart_path = chart_paths["tasks_pie"]
         
         charts_column = ft.Column([
             ft.Text(
@@ -17,6 +17,7 @@ from services.storage_service import (
     get_fifo_recommendation,
     get_all_storage_locations_flat,
     get_storage_location_tree,
+    list_parts_without_location_page,
 )
 from services.inventory_service import list_parts, validate_inventory_levels, fix_inventory_level_discrepancy
 from database.session_manager import SessionLocal
@@ -32,6 +33,7 @@ from ui.components.modern_components import (
     create_modern_icon_button,
     DesignSystem,
 )
+from ui.components.virtual_list import VirtualListView
 from utils.currency import format_price
 from datetime import datetime
 import logging
@@ -1593,132 +1595,117 @@ class StorageScreen:
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
         
-        # Parts without storage location section
-        parts_without_location_list = ft.Column([], spacing=8, scroll=ft.ScrollMode.AUTO)
+        # Parts without storage location section: paged over the part id keyset,
+        # stock quantity comes with the page (no per-part inventory query)
+        def create_assign_button_click_handler(part_id):
+            """Create a click handler for the assign button with proper closure"""
+            def button_click_handler(e):
+                print(f"[STORAGE] ====== ASSIGN BUTTON CLICKED ======")
+                print(f"[STORAGE] Event: {e}")
+                print(f"[STORAGE] Event type: {type(e)}")
+                print(f"[STORAGE] Event control: {e.control if hasattr(e, 'control') else 'N/A'}")
+                print(f"[STORAGE] part_id from closure: {part_id}")
+                print(f"[STORAGE] part_id type: {type(part_id)}")
+                try:
+                    print(f"[STORAGE] Calling open_assign_part_dialog_for_part({part_id})...")
+                    open_assign_part_dialog_for_part(part_id)
+                    print(f"[STORAGE] open_assign_part_dialog_for_part returned")
+                except Exception as btn_exc:
+                    print(f"[STORAGE] ERROR in button click handler: {btn_exc}")
+                    import traceback
+                    traceback.print_exc()
+                    if hasattr(self, 'page') and self.page:
+                        self.page.snack_bar = ft.SnackBar(
+                            content=ft.Text(f"Hiba a gomb kattintásnál: {str(btn_exc)}"),
+                            bgcolor=DesignSystem.ERROR,
+                        )
+                        self.page.snack_bar.open = True
+                        self.page.update()
+            return button_click_handler
+        
+        def build_part_without_location_row(part):
+            """Row of one part (dict from list_parts_without_location_page) with its assign button"""
+            stock_qty = part["quantity_on_hand"] or 0
+            
+            # Build row controls, filtering out None values
+            row_controls = [
+                ft.Text(
+                    part["name"],
+                    size=14,
+                    weight=ft.FontWeight.W_600,
+                    color=DesignSystem.TEXT_PRIMARY,
+                ),
+            ]
+            if part["sku"]:
+                row_controls.append(create_vibrant_badge(
+                    text=part["sku"] or "-",
+                    variant="blue",
+                    size=11,
+                ))
+            if stock_qty > 0:
+                row_controls.append(create_vibrant_badge(
+                    text=f"{stock_qty} {part['unit']}",
+                    variant="emerald",
+                    size=11,
+                ))
+            
+            # Build column controls, filtering out None values
+            column_controls = [
+                ft.Row(row_controls, spacing=8),
+            ]
+            if part["category"]:
+                column_controls.append(ft.Text(
+                    part["category"] or "-",
+                    size=12,
+                    color=DesignSystem.TEXT_SECONDARY,
+                ))
+            
+            assign_button = create_modern_button(
+                text=translator.get_text("storage.assign_to_location") if translator.get_text("storage.assign_to_location") != "storage.assign_to_location" else "Tárhelyhez rendelés",
+                icon=ft.Icons.ASSIGNMENT if hasattr(ft.Icons, 'ASSIGNMENT') else ft.Icons.ADD,
+                on_click=create_assign_button_click_handler(part["id"]),
+                bgcolor=DesignSystem.ORANGE_500,
+                color=DesignSystem.WHITE,
+                height=48,  # Taller button for better spacing
+            )
+            
+            return ft.Container(
+                content=ft.Row([
+                    ft.Column(column_controls, spacing=4, expand=True),
+                    assign_button,
+                ], spacing=12, vertical_alignment=ft.CrossAxisAlignment.CENTER),
+                padding=ft.padding.symmetric(horizontal=DesignSystem.SPACING_4, vertical=DesignSystem.SPACING_4),
+                border=ft.border.all(1, DesignSystem.BORDER_COLOR),
+                border_radius=DesignSystem.RADIUS_MD,
+                bgcolor=DesignSystem.BG_SECONDARY,
+            )
+        
+        def build_no_parts_without_location():
+            return ft.Container(
+                content=ft.Text(
+                    translator.get_text("storage.no_parts_without_location") if translator.get_text("storage.no_parts_without_location") != "storage.no_parts_without_location" else "Nincs tárhely nélküli alkatrész",
+                    size=14,
+                    color=DesignSystem.TEXT_SECONDARY,
+                    italic=True,
+                ),
+                padding=20,
+                alignment=ft.alignment.center,
+            )
+        
+        parts_without_location_vlist = VirtualListView(
+            fetch_page=lambda after, limit: list_parts_without_location_page(after_id=after, limit=limit),
+            build_item=build_part_without_location_row,
+            row_key=lambda part: part["id"],
+            page_size=50,
+            build_empty=build_no_parts_without_location,
+        )
         
         def refresh_parts_without_location():
             """Refresh the list of parts without storage location"""
-            session = SessionLocal()
             try:
-                # Get all parts that have inventory level (even if quantity is 0)
-                # Filter out parts that have PartLocation
-                parts_with_location_ids = session.query(PartLocation.part_id).distinct().all()
-                parts_with_location_ids_set = {pl[0] for pl in parts_with_location_ids}
-                
-                # Get all parts that have an inventory level, but no PartLocation
-                parts_with_inventory = session.query(Part).join(
-                    InventoryLevel, Part.id == InventoryLevel.part_id
-                ).all()
-                
-                parts_without_location = [p for p in parts_with_inventory if p.id not in parts_with_location_ids_set]
-                
-                parts_without_location_list.controls.clear()
-                
-                if not parts_without_location:
-                    parts_without_location_list.controls.append(
-                        ft.Container(
-                            content=ft.Text(
-                                translator.get_text("storage.no_parts_without_location") if translator.get_text("storage.no_parts_without_location") != "storage.no_parts_without_location" else "Nincs tárhely nélküli alkatrész",
-                                size=14,
-                                color=DesignSystem.TEXT_SECONDARY,
-                                italic=True,
-                            ),
-                            padding=20,
-                            alignment=ft.alignment.center,
-                        )
-                    )
-                else:
-                    for part in parts_without_location:
-                        inv_level = session.query(InventoryLevel).filter_by(part_id=part.id).first()
-                        stock_qty = inv_level.quantity_on_hand if inv_level else 0
-                        
-                        # Build row controls, filtering out None values
-                        row_controls = [
-                            ft.Text(
-                                part.name,
-                                size=14,
-                                weight=ft.FontWeight.W_600,
-                                color=DesignSystem.TEXT_PRIMARY,
-                            ),
-                        ]
-                        if part.sku:
-                            row_controls.append(create_vibrant_badge(
-                                text=part.sku or "-",
-                                variant="blue",
-                                size=11,
-                            ))
-                        if stock_qty > 0:
-                            row_controls.append(create_vibrant_badge(
-                                text=f"{stock_qty} {part.unit}",
-                                variant="emerald",
-                                size=11,
-                            ))
-                        
-                        # Build column controls, filtering out None values
-                        column_controls = [
-                            ft.Row(row_controls, spacing=8),
-                        ]
-                        if part.category:
-                            column_controls.append(ft.Text(
-                                part.category or "-",
-                                size=12,
-                                color=DesignSystem.TEXT_SECONDARY,
-                            ))
-                        
-                        def create_assign_button_click_handler(part_id):
-                            """Create a click handler for the assign button with proper closure"""
-                            def button_click_handler(e):
-                                print(f"[STORAGE] ====== ASSIGN BUTTON CLICKED ======")
-                                print(f"[STORAGE] Event: {e}")
-                                print(f"[STORAGE] Event type: {type(e)}")
-                                print(f"[STORAGE] Event control: {e.control if hasattr(e, 'control') else 'N/A'}")
-                                print(f"[STORAGE] part_id from closure: {part_id}")
-                                print(f"[STORAGE] part_id type: {type(part_id)}")
-                                try:
-                                    print(f"[STORAGE] Calling open_assign_part_dialog_for_part({part_id})...")
-                                    open_assign_part_dialog_for_part(part_id)
-                                    print(f"[STORAGE] open_assign_part_dialog_for_part returned")
-                                except Exception as btn_exc:
-                                    print(f"[STORAGE] ERROR in button click handler: {btn_exc}")
-                                    import traceback
-                                    traceback.print_exc()
-                                    if hasattr(self, 'page') and self.page:
-                                        self.page.snack_bar = ft.SnackBar(
-                                            content=ft.Text(f"Hiba a gomb kattintásnál: {str(btn_exc)}"),
-                                            bgcolor=DesignSystem.ERROR,
-                                        )
-                                        self.page.snack_bar.open = True
-                                        self.page.update()
-                            return button_click_handler
-                        
-                        assign_button = create_modern_button(
-                            text=translator.get_text("storage.assign_to_location") if translator.get_text("storage.assign_to_location") != "storage.assign_to_location" else "Tárhelyhez rendelés",
-                            icon=ft.Icons.ASSIGNMENT if hasattr(ft.Icons, 'ASSIGNMENT') else ft.Icons.ADD,
-                            on_click=create_assign_button_click_handler(part.id),
-                            bgcolor=DesignSystem.ORANGE_500,
-                            color=DesignSystem.WHITE,
-                            height=48,  # Taller button for better spacing
-                        )
-                        print(f"[STORAGE] Assign button created for part.id={part.id}")
-                        
-                        part_card = ft.Container(
-                            content=ft.Row([
-                                ft.Column(column_controls, spacing=4, expand=True),
-                                assign_button,
-                            ], spacing=12, vertical_alignment=ft.CrossAxisAlignment.CENTER),
-                            padding=ft.padding.symmetric(horizontal=DesignSystem.SPACING_4, vertical=DesignSystem.SPACING_4),
-                            border=ft.border.all(1, DesignSystem.BORDER_COLOR),
-                            border_radius=DesignSystem.RADIUS_MD,
-                            bgcolor=DesignSystem.BG_SECONDARY,
-                        )
-                        parts_without_location_list.controls.append(part_card)
-                    
-                    if self.page:
-                        self.page.update()
+                parts_without_location_vlist.reload()
             except Exception as e:
                 logger.error(f"Error refreshing parts without location: {e}", exc_info=True)
-            finally:
-                session.close()
         
         def open_assign_part_dialog_for_part(part_id_param):
             """Open assign part dialog with pre-selected part (for parts without location list)"""
@@ -1847,8 +1834,9 @@ class StorageScreen:
             ),
             controls=[
                 ft.Container(
-                    content=parts_without_location_list,
+                    content=parts_without_location_vlist.control,
                     padding=DesignSystem.SPACING_3,
+                    height=420,  # ListView needs a bounded height inside the tile
                 ),
             ],
             initially_expanded=False,
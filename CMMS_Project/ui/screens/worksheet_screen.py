@@ -9,7 +9,6 @@ if not hasattr(ft, 'Icons'):
     from utils.flet_icons import Icons
     ft.Icons = Icons
 from datetime import datetime
-from collections import defaultdict
 from pathlib import Path
 from services import worksheet_service, asset_service, inventory_service, pdf_service
 from services.context_service import get_app_context, get_current_user_id
@@ -21,7 +20,7 @@ import threading
 
 logger = logging.getLogger(__name__)
 from localization.translator import translator
-from ui.components.pagination import PaginationController, create_pagination_controls, create_items_per_page_selector
+from ui.components.virtual_list import VirtualListView
 from ui.components.batch_actions_bar import create_batch_actions_bar
 from ui.components.modern_components import (
     create_modern_button,
@@ -923,94 +922,34 @@ class WorksheetScreen:
             ),
         )
 
-    def _build_grouped_worksheet_list(self, worksheets, on_worksheet_selected, page, selected_worksheet_ids=None, on_selection_change=None):
-        """Build a modern grouped list of worksheets"""
-        list_items = []
-        
-        if not worksheets:
-            list_items.append(
-                ft.Container(
-                    content=ft.Column([
-                        ft.Icon(name=ft.Icons.ASSIGNMENT if hasattr(ft.Icons, 'ASSIGNMENT') else ft.Icons.DESCRIPTION, size=64, color="#94A3B8"),
-                        ft.Text(
-                            translator.get_text("empty_states.no_worksheets"),
-                            size=16,
-                            color=DesignSystem.TEXT_SECONDARY,
-                        ),
-                    ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=12),
-                    padding=40,
-                    expand=True,
-                )
-            )
-            return list_items
-        
-        # Group worksheets by date
-        grouped = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-        for ws in worksheets:
-            ref_date = ws.breakdown_time or ws.created_at or datetime.now()
-            year = ref_date.strftime("%Y")
-            month = ref_date.strftime("%m")
-            day = ref_date.strftime("%d")
-            grouped[year][month][day].append(ws)
-        
-        # Render grouped structure
-        for year in sorted(grouped.keys(), reverse=True):
-            month_items = []
-            
-            for month in sorted(grouped[year].keys(), reverse=True):
-                month_name = datetime.strptime(month, "%m").strftime("%B")
-                day_items = []
-                
-                for day in sorted(grouped[year][month].keys(), reverse=True):
-                    day_worksheets = grouped[year][month][day]
-                    worksheet_cards = [
-                        self._build_worksheet_card(ws, on_worksheet_selected, page, selected_worksheet_ids, on_selection_change)
-                        for ws in day_worksheets
-                    ]
-                    
-                    day_items.append(
-                        ft.ExpansionTile(
-                            title=ft.Text(
-                                f"{day}. ({len(day_worksheets)} munkalap)",
-                                size=13,
-                                weight=ft.FontWeight.W_600,
-                                color="#475569",
-                            ),
-                            bgcolor="#F8FAFC",
-                            controls=worksheet_cards,
-                            initially_expanded=False,
-                        )
-                    )
-                
-                month_items.append(
-                    ft.ExpansionTile(
-                        title=ft.Text(
-                            month_name,
-                            size=15,
-                            weight=ft.FontWeight.W_600,
-                            color="#334155",
-                        ),
-                        bgcolor="#F1F5F9",
-                        controls=day_items,
-                        initially_expanded=False,
-                    )
-                )
-            
-            list_items.append(
-                ft.ExpansionTile(
-                    title=ft.Text(
-                        year,
-                        size=18,
-                        weight=ft.FontWeight.BOLD,
-                        color=DesignSystem.TEXT_PRIMARY,
-                    ),
-                    bgcolor="#E2E8F0",
-                    controls=month_items,
-                    initially_expanded=len(grouped) == 1,
-                )
-            )
-        
-        return list_items
+    def _build_worksheet_empty_state(self):
+        """Shown when there are no worksheets for the current filter"""
+        return ft.Container(
+            content=ft.Column([
+                ft.Icon(name=ft.Icons.ASSIGNMENT if hasattr(ft.Icons, 'ASSIGNMENT') else ft.Icons.DESCRIPTION, size=64, color="#94A3B8"),
+                ft.Text(
+                    translator.get_text("empty_states.no_worksheets"),
+                    size=16,
+                    color=DesignSystem.TEXT_SECONDARY,
+                ),
+            ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=12),
+            padding=40,
+            expand=True,
+        )
+
+    def _build_worksheet_day_header(self, day):
+        """Date header above the first worksheet of each day (list is ordered by created_at)"""
+        return ft.Container(
+            content=ft.Text(
+                day.strftime("%Y. %B %d.") if day else "-",
+                size=15,
+                weight=ft.FontWeight.W_600,
+                color="#334155",
+            ),
+            bgcolor="#F1F5F9",
+            padding=ft.padding.symmetric(horizontal=12, vertical=8),
+            border_radius=8,
+        )
 
     def view(self, page: ft.Page):
         ctx = get_app_context()
@@ -1027,32 +966,11 @@ class WorksheetScreen:
                 self.mode = "list"
                 # Continue to render list view below
 
-        # Otherwise render list
-        def get_worksheets():
-            """Helper function to get worksheets based on current filter"""
-            return worksheet_service.list_all_worksheets() if self.show_closed else worksheet_service.list_active_worksheets()
-        
-        # Pagination settings
-        ITEMS_PER_PAGE = 25
-        
-        # Get all worksheets
-        all_worksheets = get_worksheets()
-        total_worksheets_count = len(all_worksheets)
-        
-        # Initialize PaginationController
-        pagination_controller = PaginationController(
-            total_items=total_worksheets_count,
-            items_per_page=ITEMS_PER_PAGE,
-            on_page_change=None,  # Will be set after refresh function is defined
-        )
+        # Otherwise render list: worksheets are fetched page by page (keyset) while scrolling
+        ITEMS_PER_PAGE = 50
         
         # Selected items for batch operations
         selected_worksheet_ids = set()
-        
-        # Get paginated worksheets
-        offset = pagination_controller.start_index
-        limit = pagination_controller.items_per_page
-        worksheets = all_worksheets[offset:offset + limit]
 
         def on_worksheet_selected(ws):
             try:
@@ -1098,21 +1016,15 @@ class WorksheetScreen:
         def _clear_selection():
             """Clear all selections"""
             selected_worksheet_ids.clear()
-            # Rebuild list
-            ws_list_items = self._build_grouped_worksheet_list(worksheets, on_worksheet_selected, page, selected_worksheet_ids, _on_worksheet_selection_change)
-            ws_list.controls.clear()
-            ws_list.controls.extend(ws_list_items)
+            ws_vlist.rerender()
             _update_batch_actions_bar()
             page.update()
         
         def _select_all():
-            """Select all worksheets on current page"""
-            for ws in worksheets:
+            """Select all worksheets loaded in the list"""
+            for ws in ws_vlist.rendered_rows:
                 selected_worksheet_ids.add(ws.id)
-            # Rebuild list
-            ws_list_items = self._build_grouped_worksheet_list(worksheets, on_worksheet_selected, page, selected_worksheet_ids, _on_worksheet_selection_change)
-            ws_list.controls.clear()
-            ws_list.controls.extend(ws_list_items)
+            ws_vlist.rerender()
             _update_batch_actions_bar()
             page.update()
         
@@ -1150,16 +1062,8 @@ class WorksheetScreen:
                         
                         selected_worksheet_ids.clear()
                         # Reload worksheets
-                        all_worksheets = get_worksheets()
-                        pagination_controller.update_total_items(len(all_worksheets))
-                        offset = pagination_controller.start_index
-                        limit = pagination_controller.items_per_page
-                        worksheets = all_worksheets[offset:offset + limit]
-                        ws_list_items = self._build_grouped_worksheet_list(worksheets, on_worksheet_selected, page, selected_worksheet_ids, _on_worksheet_selection_change)
-                        ws_list.controls.clear()
-                        ws_list.controls.extend(ws_list_items)
+                        ws_vlist.reload(update=False)
                         _update_batch_actions_bar()
-                        header_text.value = f"{len(worksheets)} munkalap"
                         page.snack_bar = ft.SnackBar(
                             content=ft.Text(f"{deleted_count} {translator.get_text('worksheets.worksheet')} törölve"),
                             bgcolor=DesignSystem.SUCCESS,
@@ -1267,53 +1171,41 @@ class WorksheetScreen:
         )
         batch_actions_bar_ref["value"] = batch_actions_bar_container
         
-        # Set up pagination controller callback
-        def on_page_change(page_num):
-            # page_num is 1-based from PaginationController
-            # Convert to 0-based
-            offset = (page_num - 1) * pagination_controller.items_per_page
-            limit = pagination_controller.items_per_page
-            worksheets = all_worksheets[offset:offset + limit]
-            
-            # Rebuild list
-            ws_list_items = self._build_grouped_worksheet_list(worksheets, on_worksheet_selected, page, selected_worksheet_ids, _on_worksheet_selection_change)
-            ws_list.controls.clear()
-            ws_list.controls.extend(ws_list_items)
-            header_text.value = f"{len(worksheets)} munkalap"
-            page.update()
-        
-        pagination_controller.on_page_change = on_page_change
-
-        # Build grouped list
-        ws_list_items = self._build_grouped_worksheet_list(worksheets, on_worksheet_selected, page, selected_worksheet_ids, _on_worksheet_selection_change)
-        ws_list = ft.ListView(ws_list_items, expand=True, spacing=12)
-        
         # Header text (must be defined before callback)
         header_text = ft.Text(
-            f"{len(worksheets)} munkalap",
+            "",
             size=13,
             color="#64748B",
         )
 
+        def _set_count(total):
+            header_text.value = f"{total} munkalap"
+
+        ws_vlist = VirtualListView(
+            fetch_page=lambda after, limit: worksheet_service.list_worksheets_page(
+                include_closed=self.show_closed, after=after, limit=limit,
+            ),
+            build_item=lambda ws: self._build_worksheet_card(
+                ws, on_worksheet_selected, page, selected_worksheet_ids, _on_worksheet_selection_change,
+            ),
+            count=lambda: worksheet_service.count_worksheets(include_closed=self.show_closed),
+            row_key=lambda ws: (ws.created_at, ws.id),
+            page_size=ITEMS_PER_PAGE,
+            section_key=lambda ws: ws.created_at.date() if ws.created_at else None,
+            build_section_header=lambda day, ws: self._build_worksheet_day_header(day),
+            build_empty=self._build_worksheet_empty_state,
+            on_count=_set_count,
+            spacing=12,
+        )
+        ws_vlist.reload(update=False)
+
         def on_toggle_closed(e):
             try:
                 self.show_closed = e.control.value
                 print(f"[UI] Toggle closed: {self.show_closed}")
-                # Reload worksheets based on filter
-                all_worksheets = get_worksheets()
-                pagination_controller.update_total_items(len(all_worksheets))
-                offset = pagination_controller.start_index
-                limit = pagination_controller.items_per_page
-                worksheets = all_worksheets[offset:offset + limit]
-                print(f"[UI] Loaded {len(worksheets)} worksheets (show_closed={self.show_closed})")
-                # Rebuild list items
-                new_list_items = self._build_grouped_worksheet_list(worksheets, on_worksheet_selected, page, selected_worksheet_ids, _on_worksheet_selection_change)
-                # Update ListView controls
-                ws_list.controls.clear()
-                ws_list.controls.extend(new_list_items)
-                # Update header count
-                header_text.value = f"{len(worksheets)} munkalap"
-                print(f"[UI] Updated list with {len(new_list_items)} items")
+                # Reload worksheets based on filter (count + first page)
+                ws_vlist.reload(update=False)
+                print(f"[UI] Loaded {ws_vlist.total} worksheets (show_closed={self.show_closed})")
                 page.update()
             except Exception as ex:
                 print(f"[UI] Error toggling closed filter: {ex}")
@@ -1323,26 +1215,6 @@ class WorksheetScreen:
                 page.snack_bar.open = True
                 page.update()
         
-        # Create pagination controls
-        pagination_controls = create_pagination_controls(
-            controller=pagination_controller,
-            show_page_numbers=True,
-            max_page_buttons=7,
-        )
-        
-        # Create items per page selector
-        items_per_page_selector = create_items_per_page_selector(
-            controller=pagination_controller,
-            options=[10, 25, 50, 100],
-        )
-        
-        # Wrap pagination controls in a container
-        pagination_row = ft.Row([
-            pagination_controls,
-            ft.Container(width=DesignSystem.SPACING_4),
-            items_per_page_selector,
-        ], alignment=ft.MainAxisAlignment.CENTER, spacing=DesignSystem.SPACING_2) if pagination_controller.total_pages > 1 else ft.Container()
-        
         # Select all checkbox
         select_all_checkbox = ft.Checkbox(
             value=False,
@@ -1399,10 +1271,8 @@ class WorksheetScreen:
             header,
             batch_actions_bar_container,
             ft.Container(height=16),
-            pagination_row,
-            ws_list,
-            pagination_row,
-        ], spacing=0, expand=True, scroll=ft.ScrollMode.AUTO)
+            ws_vlist.control,
+        ], spacing=0, expand=True)
 
     def _worksheet_detail_view(self, page: ft.Page):
         """Modern detail view of a single worksheet"""
@@ -0,0 +1,272 @@
+"""
+UI Task Executor
+Screens load their data on a small shared thread pool instead of inside
+view() and event handlers, and hand the result back to a single UI writer
+thread. The writer applies results to the controls and calls page.update()
+once per batch, so a slow query no longer freezes the window and updates
+from several loaders never run concurrently.
+
+Tasks are keyed: submitting the same key again cancels the previous task
+(rapid refreshes coalesce into one load) and only the newest result is
+applied. Tasks belong to a scope (usually the screen name) that is
+cancelled when the user navigates away.
+
+Loaders and callbacks run in a copy of the submitting thread's context, so
+ft.context.page and get_app_context() resolve to the submitting user's page.
+"""
+
+import contextvars
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from database.query_profiler import profile_call
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+_executor_lock = threading.Lock()
+
+
+class TaskCancelled(Exception):
+    """Raised by CancellationToken.raise_if_cancelled() to abort a load early"""
+
+
+class CancellationToken:
+    """Cancellation flag passed to every load function"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+
+    def raise_if_cancelled(self):
+        """Call between steps of a long load to stop work nobody will see"""
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+def _profiled_load(key: str, load, token: CancellationToken):
+    # Statements of a screen load are attributed to its task key
+    with profile_call(f"ui.{key}"):
+        return load(token)
+
+
+class _Task:
+    def __init__(self, key: str, scope: str, token: CancellationToken):
+        self.key = key
+        self.scope = scope
+        self.token = token
+        self.context = contextvars.copy_context()
+
+
+class UITaskExecutor:
+    """Bounded loader pool plus the single writer that touches the page"""
+
+    def __init__(self, page=None, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.page = page
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-task")
+        self._lock = threading.Lock()
+        self._tasks: Dict[str, _Task] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._ui_queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._paint_started: Dict[str, float] = {}
+        self.first_paint_ms: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------ loading
+
+    def submit(
+        self,
+        key: str,
+        load: Callable[[CancellationToken], Any],
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        scope: Optional[str] = None,
+        delay: float = 0.0,
+        update: bool = True,
+    ) -> CancellationToken:
+        """
+        Run load(token) on the pool and on_done(result) on the UI writer thread
+
+        Args:
+            key: Task identity; a newer submit with the same key cancels this one
+            load: Loader, runs off the UI thread (no page.update() here)
+            on_done: Applies the result to controls, runs on the writer thread
+            on_error: Called on the writer thread if load raises
+            scope: Screen the task belongs to (default: key up to the first ".")
+            delay: Seconds to wait before loading; restarted by every submit
+                with the same key (debounce, e.g. for search fields)
+            update: Call page.update() after on_done
+
+        Returns:
+            The task's CancellationToken
+        """
+        token = CancellationToken()
+        task = _Task(key, scope or key.split(".", 1)[0], token)
+        with self._lock:
+            previous = self._tasks.get(key)
+            if previous is not None:
+                previous.token.cancel()
+            timer = self._timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            self._tasks[key] = task
+
+            if delay > 0:
+                timer = threading.Timer(delay, self._start, args=(task, load, on_done, on_error, update))
+                timer.daemon = True
+                self._timers[key] = timer
+                timer.start()
+                return token
+        self._start(task, load, on_done, on_error, update)
+        return token
+
+    def _start(self, task: _Task, load, on_done, on_error, update: bool):
+        with self._lock:
+            if self._tasks.get(task.key) is task:
+                self._timers.pop(task.key, None)
+        if task.token.cancelled:
+            return
+        self._pool.submit(self._run, task, load, on_done, on_error, update)
+
+    def _run(self, task: _Task, load, on_done, on_error, update: bool):
+        if task.token.cancelled:
+            return
+        started = time.perf_counter()
+        try:
+            result = task.context.run(_profiled_load, task.key, load, task.token)
+        except TaskCancelled:
+            return
+        except Exception as e:
+            logger.error(f"UI task {task.key} failed: {e}", exc_info=True)
+            if on_error is not None:
+                self._enqueue(lambda: task.context.run(on_error, e), task, update)
+            return
+        logger.debug(f"UI task {task.key} loaded in {(time.perf_counter() - started) * 1000:.0f} ms")
+        self._enqueue((lambda: task.context.run(on_done, result)) if on_done else None, task, update)
+
+    def cancel(self, key: str):
+        """Cancel the pending task of `key`, if any"""
+        with self._lock:
+            task = self._tasks.pop(key, None)
+            timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        if task is not None:
+            task.token.cancel()
+
+    def cancel_scope(self, scope: str):
+        """Cancel every task of a screen (e.g. when navigating away from it)"""
+        with self._lock:
+            keys = [key for key, task in self._tasks.items() if task.scope == scope]
+            self._paint_started.pop(scope, None)
+        for key in keys:
+            self.cancel(key)
+
+    def is_pending(self, key: str) -> bool:
+        with self._lock:
+            task = self._tasks.get(key)
+            return task is not None and not task.token.cancelled
+
+    # ------------------------------------------------------------------ UI writer
+
+    def call_soon(self, callback: Optional[Callable[[], None]] = None, update: bool = True):
+        """Run `callback` on the UI writer thread (and update the page afterwards)"""
+        if callback is not None:
+            context = contextvars.copy_context()
+            self._enqueue(lambda: context.run(callback), None, update)
+        else:
+            self._enqueue(None, None, update)
+
+    def request_update(self):
+        """page.update() from the writer thread; requests arriving together are merged"""
+        self._enqueue(None, None, True)
+
+    def _enqueue(self, callback, task: Optional[_Task], update: bool):
+        self._ui_queue.put((callback, task, update))
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="ui-writer", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            batch = [self._ui_queue.get()]
+            while True:
+                try:
+                    batch.append(self._ui_queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._apply(batch)
+
+    def _apply(self, batch):
+        needs_update = False
+        painted = []
+        for callback, task, update in batch:
+            if task is not None:
+                with self._lock:
+                    if task.token.cancelled or self._tasks.get(task.key) is not task:
+                        continue
+                    self._tasks.pop(task.key, None)
+                painted.append(task.scope)
+            if callback is not None:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"UI callback failed: {e}", exc_info=True)
+            needs_update = needs_update or update
+        if needs_update and self.page is not None:
+            try:
+                self.page.update()
+            except Exception as e:
+                logger.error(f"page.update() failed: {e}", exc_info=True)
+        for scope in painted:
+            self._record_paint(scope)
+
+    # ------------------------------------------------------------------ metrics
+
+    def begin_paint(self, scope: str):
+        """Mark the moment a screen's view() started (time-to-first-paint reference)"""
+        with self._lock:
+            self._paint_started[scope] = time.perf_counter()
+
+    def _record_paint(self, scope: str):
+        with self._lock:
+            started = self._paint_started.pop(scope, None)
+            if started is None:
+                return
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.first_paint_ms[scope] = elapsed_ms
+        logger.info(f"[UI] {scope}: first paint with data after {elapsed_ms:.0f} ms")
+
+    def shutdown(self):
+        with self._lock:
+            tasks = list(self._tasks.values())
+            timers = list(self._timers.values())
+            self._tasks.clear()
+            self._timers.clear()
+        for timer in timers:
+            timer.cancel()
+        for task in tasks:
+            task.token.cancel()
+        self._pool.shutdown(wait=False)
+
+
+def get_ui_executor(page) -> UITaskExecutor:
+    """Executor of `page`, created on first use"""
+    with _executor_lock:
+        executor = getattr(page, "_ui_executor", None)
+        if executor is None:
+            executor = UITaskExecutor(page)
+            page._ui_executor = executor
+        return executor
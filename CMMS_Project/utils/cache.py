@@ -4,10 +4,21 @@ Ultra-fast caching for frequently accessed data
 """
 
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
+import threading
 import time
+import logging
 from collections import OrderedDict
 
+try:
+    import redis
+except ImportError:
+    redis = None
+
+from config.app_config import CACHE_DEFAULT_TTL, REDIS_URL
+
+logger = logging.getLogger(__name__)
+
 # Global cache storage
 _cache: dict = {}
 _cache_timestamps: dict = {}
@@ -135,3 +146,96 @@ def clear_all_caches():
     _role_cache.clear()
     _user_cache.clear()
     _settings_cache.clear()
+
+
+# ============================================================================
+# Pluggable key/value backends (API response cache)
+# ============================================================================
+
+class CacheBackend:
+    """Bytes key/value store with counters; `shared` backends are visible to every process"""
+    shared = False
+    
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+    
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None):
+        raise NotImplementedError
+    
+    def get_counters(self, keys: Iterable[str]) -> Dict[str, int]:
+        raise NotImplementedError
+    
+    def incr_counters(self, keys: Iterable[str]):
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local backend on top of LRUCache"""
+    
+    def __init__(self, max_size: int = 500, default_ttl: int = CACHE_DEFAULT_TTL):
+        self._cache = LRUCache(max_size=max_size, default_ttl=default_ttl)
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._cache.get(key)
+    
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None):
+        with self._lock:
+            self._cache.set(key, value, ttl=ttl)
+    
+    def get_counters(self, keys: Iterable[str]) -> Dict[str, int]:
+        with self._lock:
+            return {key: self._counters.get(key, 0) for key in keys}
+    
+    def incr_counters(self, keys: Iterable[str]):
+        with self._lock:
+            for key in keys:
+                self._counters[key] = self._counters.get(key, 0) + 1
+    
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._counters.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis backend shared by all API workers"""
+    shared = True
+    
+    def __init__(self, url: str, prefix: str = "cmms:", default_ttl: int = CACHE_DEFAULT_TTL):
+        if redis is None:
+            raise RuntimeError("redis package is not installed")
+        self._client = redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+        self._prefix = prefix
+        self.default_ttl = default_ttl
+    
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._prefix + key)
+    
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None):
+        self._client.set(self._prefix + key, value, ex=ttl or self.default_ttl)
+    
+    def get_counters(self, keys: Iterable[str]) -> Dict[str, int]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = self._client.mget([self._prefix + key for key in keys])
+        return {key: int(value or 0) for key, value in zip(keys, values)}
+    
+    def incr_counters(self, keys: Iterable[str]):
+        pipeline = self._client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.incr(self._prefix + key)
+        pipeline.execute()
+
+
+def get_cache_backend() -> CacheBackend:
+    """Redis backend when REDIS_URL is configured, otherwise in-memory"""
+    if REDIS_URL and redis is not None:
+        try:
+            return RedisCacheBackend(REDIS_URL)
+        except Exception as e:
+            logger.warning(f"Redis cache unavailable ({e}), falling back to in-memory cache")
+    return InMemoryCacheBackend()
@@ -127,6 +127,12 @@ def create_default_templates():
     wb.save(str(template_path))
     logger.info(f"Created template: {template_path}")
     
+    # Import templates: header rows accepted by services.bulk_import_service
+    from services.bulk_import_service import IMPORT_COLUMNS, create_import_template
+    for entity in IMPORT_COLUMNS:
+        template_path = create_import_template(entity, excel_dir / f"{entity}_import_template.xlsx")
+        logger.info(f"Created template: {template_path}")
+    
     logger.info(f"Default Excel templates created in {excel_dir}")
 
 
@@ -0,0 +1,326 @@
+"""
+Label Sheet Generator
+Composes QR labels for a bulk selection of parts or storage locations into
+multi-page PDF or PNG sheets in one pass
+"""
+
+from pathlib import Path
+from typing import List, Dict, Optional, Callable
+from io import BytesIO
+from datetime import datetime
+import os
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+from sqlalchemy.orm import Session
+
+from database.models import Part, StorageLocation, QRCodeData
+from database.session_manager import SessionLocal
+from utils.qr_generator import get_qr_png, prerender_qr_codes, part_qr_payload
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+MM_PER_INCH = 25.4
+
+# Default layout: A4 sheet, 3 x 8 labels (70 x 37 mm), 200 dpi
+DEFAULT_LAYOUT = {
+    "page_width_mm": 210.0,
+    "page_height_mm": 297.0,
+    "margin_mm": 8.0,
+    "columns": 3,
+    "rows": 8,
+    "dpi": 200,
+}
+
+
+def storage_location_qr_payload(location_id: int, code: Optional[str]) -> str:
+    """QR data for a storage location: LOC:id:code format"""
+    return f"LOC:{location_id}:{code or ''}"
+
+
+def _px(mm: float, dpi: int) -> int:
+    return int(round(mm / MM_PER_INCH * dpi))
+
+
+def _load_font(size: int):
+    for name in ("arial.ttf", "DejaVuSans.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _fit_text(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> str:
+    """Truncate text with an ellipsis so it fits into max_width pixels"""
+    if draw.textlength(text, font=font) <= max_width:
+        return text
+    while text and draw.textlength(text + "…", font=font) > max_width:
+        text = text[:-1]
+    return text + "…"
+
+
+def _compose_page(labels: List[Dict], layout: Dict) -> bytes:
+    """
+    Render one sheet of labels to PNG bytes.
+
+    Runs in pool workers: QR codes come from the shared on-disk cache.
+    """
+    dpi = layout["dpi"]
+    page_w = _px(layout["page_width_mm"], dpi)
+    page_h = _px(layout["page_height_mm"], dpi)
+    margin = _px(layout["margin_mm"], dpi)
+    cell_w = (page_w - 2 * margin) // layout["columns"]
+    cell_h = (page_h - 2 * margin) // layout["rows"]
+    padding = max(4, cell_h // 12)
+    qr_size = cell_h - 2 * padding
+
+    # Bilevel page: labels are black on white, and 1-bit pages encode losslessly
+    # and fast both as PNG and as CCITT G4 inside the PDF
+    page = Image.new("1", (page_w, page_h), 1)
+    draw = ImageDraw.Draw(page)
+    title_font = _load_font(max(10, cell_h // 7))
+    text_font = _load_font(max(8, cell_h // 10))
+
+    for index, label in enumerate(labels):
+        col = index % layout["columns"]
+        row = index // layout["columns"]
+        x = margin + col * cell_w
+        y = margin + row * cell_h
+
+        draw.rectangle([x, y, x + cell_w - 1, y + cell_h - 1], outline=0)
+
+        qr_img = Image.open(BytesIO(get_qr_png(label["payload"], size=qr_size)))
+        page.paste(qr_img.convert("1"), (x + padding, y + padding))
+
+        text_x = x + qr_size + 2 * padding
+        text_width = cell_w - qr_size - 3 * padding
+        text_y = y + padding
+        draw.text((text_x, text_y), _fit_text(draw, label["title"], title_font, text_width),
+                  fill=0, font=title_font)
+        text_y += int(title_font.size * 1.3) if hasattr(title_font, "size") else 14
+        for line in label.get("lines", []):
+            if not line:
+                continue
+            if text_y + padding > y + cell_h:
+                break
+            draw.text((text_x, text_y), _fit_text(draw, line, text_font, text_width),
+                      fill=0, font=text_font)
+            text_y += int(text_font.size * 1.25) if hasattr(text_font, "size") else 12
+
+    buffer = BytesIO()
+    page.save(buffer, format="PNG", optimize=False)
+    return buffer.getvalue()
+
+
+def _compose_page_job(args):
+    labels, layout = args
+    return _compose_page(labels, layout)
+
+
+def generate_label_sheets(
+    labels: List[Dict],
+    output_path: Path,
+    output_format: str = "pdf",
+    layout: Optional[Dict] = None,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> Dict:
+    """
+    Compose labels into sheets in one pass.
+
+    Args:
+        labels: List of {"payload": QR data, "title": str, "lines": [str, ...]}
+        output_path: Target PDF file, or base path for PNG pages (name_001.png, ...)
+        output_format: 'pdf' (multi-page) or 'png' (one file per page)
+        layout: Overrides for DEFAULT_LAYOUT
+        max_workers: Process pool size for page composition (defaults to CPU count)
+        progress_callback: Called as callback(pages_done, total_pages)
+
+    Returns:
+        Dict with output paths, label/page counts and elapsed time
+    """
+    if output_format not in ("pdf", "png"):
+        raise ValueError(f"Unsupported label sheet format: {output_format}")
+
+    layout = {**DEFAULT_LAYOUT, **(layout or {})}
+    per_page = layout["columns"] * layout["rows"]
+    pages = [labels[i:i + per_page] for i in range(0, len(labels), per_page)]
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    if max_workers is None:
+        max_workers = min(len(pages), os.cpu_count() or 1) or 1
+
+    # Every label on a sheet uses the same QR size - render misses in parallel first
+    cell_h = (_px(layout["page_height_mm"], layout["dpi"]) - 2 * _px(layout["margin_mm"], layout["dpi"])) // layout["rows"]
+    qr_size = cell_h - 2 * max(4, cell_h // 12)
+    prerender_qr_codes([label["payload"] for label in labels], size=qr_size, max_workers=max_workers)
+
+    def page_images():
+        jobs = [(page_labels, layout) for page_labels in pages]
+        if max_workers <= 1 or len(pages) <= 1:
+            for job in jobs:
+                yield _compose_page_job(job)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() keeps page order while workers compose pages concurrently
+                yield from executor.map(_compose_page_job, jobs)
+
+    written: List[Path] = []
+    if output_format == "pdf":
+        pdf_path = output_path.with_suffix(".pdf")
+        # Pages are appended one by one, so only one page is in memory at a time
+        for index, png in enumerate(page_images(), 1):
+            Image.open(BytesIO(png)).save(
+                pdf_path, format="PDF", resolution=layout["dpi"], append=index > 1
+            )
+            if progress_callback:
+                progress_callback(index, len(pages))
+        written.append(pdf_path)
+    else:
+        for index, png in enumerate(page_images(), 1):
+            page_path = output_path.with_name(f"{output_path.stem}_{index:03d}.png")
+            page_path.write_bytes(png)
+            written.append(page_path)
+            if progress_callback:
+                progress_callback(index, len(pages))
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Generated {len(labels)} labels on {len(pages)} sheets in {elapsed:.2f}s")
+    return {
+        "paths": written,
+        "labels": len(labels),
+        "pages": len(pages),
+        "elapsed_seconds": elapsed,
+    }
+
+
+def build_part_labels(part_ids: List[int], session: Session = None) -> List[Dict]:
+    """Label data for parts (one query, ordered by SKU)"""
+    session, should_close = _get_session(session)
+    try:
+        rows = (
+            session.query(Part.id, Part.sku, Part.name, Part.category)
+            .filter(Part.id.in_(part_ids))
+            .order_by(Part.sku)
+            .all()
+        )
+        return [
+            {
+                "payload": part_qr_payload(row.id, row.sku),
+                "title": row.sku,
+                "lines": [row.name, row.category or ""],
+                "part_id": row.id,
+            }
+            for row in rows
+        ]
+    finally:
+        if should_close:
+            session.close()
+
+
+def build_storage_location_labels(location_ids: List[int], session: Session = None) -> List[Dict]:
+    """Label data for storage locations (paths resolved from one prefetch)"""
+    session, should_close = _get_session(session)
+    try:
+        locations = {
+            row.id: row
+            for row in session.query(
+                StorageLocation.id, StorageLocation.name, StorageLocation.code, StorageLocation.parent_id
+            ).all()
+        }
+
+        def path_of(location_id):
+            names = []
+            seen = set()
+            current = locations.get(location_id)
+            while current is not None and current.id not in seen:
+                seen.add(current.id)
+                names.insert(0, current.name)
+                current = locations.get(current.parent_id) if current.parent_id else None
+            return " → ".join(names)
+
+        labels = []
+        for location_id in location_ids:
+            location = locations.get(location_id)
+            if location is None:
+                continue
+            labels.append({
+                "payload": storage_location_qr_payload(location.id, location.code),
+                "title": location.code or location.name,
+                "lines": [location.name, path_of(location.id)],
+                "storage_location_id": location.id,
+            })
+        return labels
+    finally:
+        if should_close:
+            session.close()
+
+
+def generate_part_label_sheets(
+    part_ids: List[int],
+    output_path: Path,
+    output_format: str = "pdf",
+    record: bool = True,
+    session: Session = None,
+    **kwargs
+) -> Dict:
+    """
+    Generate label sheets for parts and record the QR codes in one commit
+
+    Args:
+        part_ids: Part IDs
+        output_path: Target file (see generate_label_sheets)
+        output_format: 'pdf' or 'png'
+        record: Store QRCodeData rows for the printed labels
+        session: Database session
+        **kwargs: Passed to generate_label_sheets
+
+    Returns:
+        generate_label_sheets result
+    """
+    session, should_close = _get_session(session)
+    try:
+        labels = build_part_labels(part_ids, session=session)
+        result = generate_label_sheets(labels, output_path, output_format, **kwargs)
+
+        if record and labels:
+            now = datetime.now()
+            session.bulk_save_objects([
+                QRCodeData(part_id=label["part_id"], qr_data=label["payload"], generated_at=now, is_printed=True)
+                for label in labels
+            ])
+            session.commit()
+        return result
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        if should_close:
+            session.close()
+
+
+def generate_storage_location_label_sheets(
+    location_ids: List[int],
+    output_path: Path,
+    output_format: str = "pdf",
+    session: Session = None,
+    **kwargs
+) -> Dict:
+    """Generate label sheets for storage locations (bin relabeling runs)"""
+    labels = build_storage_location_labels(location_ids, session=session)
+    return generate_label_sheets(labels, output_path, output_format, **kwargs)
+
+
+def _get_session(session: Session = None) -> tuple:
+    if session is None:
+        return SessionLocal(), True
+    return session, False
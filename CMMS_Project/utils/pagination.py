@@ -1,7 +1,8 @@
 """
 Pagination utilities
 """
-from typing import Tuple, List, TypeVar, Generic
+from typing import Any, Optional, Tuple, List, TypeVar, Generic
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query
 
 T = TypeVar('T')
@@ -73,3 +74,30 @@ def paginate_query(
         page=page,
         per_page=per_page
     )
+
+
+def keyset_after_desc(sort_column, id_column, position: Optional[Tuple[Any, int]]):
+    """
+    Keyset predicate: rows after `position` in ORDER BY sort_column DESC, id_column DESC
+
+    Unlike OFFSET, every page is an index range scan no matter how deep it is.
+    NULL sort values come last (SQLite / MySQL order them last in DESC).
+
+    Args:
+        sort_column: Column the list is ordered by (e.g. created_at)
+        id_column: Primary key, the tie-breaker
+        position: (sort value, id) of the last row of the previous page; None = first page
+
+    Returns:
+        WHERE clause, or None for the first page
+    """
+    if position is None:
+        return None
+    value, row_id = position
+    if value is None:
+        return and_(sort_column.is_(None), id_column < row_id)
+    return or_(
+        sort_column < value,
+        and_(sort_column == value, id_column < row_id),
+        sort_column.is_(None),
+    )
@@ -4,15 +4,18 @@ Generates QR codes for parts and creates printable labels
 """
 
 import qrcode
-from qrcode.image.pil import PilImage
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 from typing import List, Optional
 from io import BytesIO
 import base64
+import hashlib
+import os
 
 from database.models import Part, QRCodeData
 from database.session_manager import SessionLocal
+from config.app_config import RUNTIME_DATA_ROOT
+from utils.cache import LRUCache
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -21,7 +24,142 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def generate_qr_code(part_id: int, sku: str, size: int = 200) -> Optional[PilImage]:
+# Error correction levels accepted by the QR cache
+ERROR_LEVELS = {
+    "L": qrcode.constants.ERROR_CORRECT_L,
+    "M": qrcode.constants.ERROR_CORRECT_M,
+    "Q": qrcode.constants.ERROR_CORRECT_Q,
+    "H": qrcode.constants.ERROR_CORRECT_H,
+}
+
+# Rendered QR PNGs: in-memory LRU in front of an on-disk cache
+QR_CACHE_DIR = RUNTIME_DATA_ROOT / "data" / "cache" / "qr"
+_qr_memory_cache = LRUCache(max_size=1024, default_ttl=3600)
+
+
+def part_qr_payload(part_id: int, sku: str) -> str:
+    """QR data for a part: part_id:sku format for easy scanning"""
+    return f"{part_id}:{sku}"
+
+
+def _qr_cache_key(payload: str, size: int, error_level: str) -> str:
+    return hashlib.sha1(f"{payload}|{size}|{error_level}".encode("utf-8")).hexdigest()
+
+
+def _render_qr_png(payload: str, size: int = 200, error_level: str = "L") -> bytes:
+    """Render a QR code to PNG bytes (no caching)"""
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=ERROR_LEVELS[error_level],
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(payload)
+    qr.make(fit=True)
+    
+    img = qr.make_image(fill_color="black", back_color="white")
+    if size != 200:
+        img = img.resize((size, size), Image.Resampling.LANCZOS)
+    
+    buffer = BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _store_qr_png(key: str, png: bytes) -> None:
+    _qr_memory_cache.set(key, png)
+    try:
+        QR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so parallel workers never read a partial file
+        temp_path = QR_CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+        temp_path.write_bytes(png)
+        os.replace(temp_path, QR_CACHE_DIR / f"{key}.png")
+    except OSError as e:
+        logger.debug(f"Could not write QR cache file {key}: {e}")
+
+
+def _load_cached_qr_png(key: str) -> Optional[bytes]:
+    png = _qr_memory_cache.get(key)
+    if png is not None:
+        return png
+    cache_path = QR_CACHE_DIR / f"{key}.png"
+    try:
+        png = cache_path.read_bytes()
+    except OSError:
+        return None
+    _qr_memory_cache.set(key, png)
+    return png
+
+
+def get_qr_png(payload: str, size: int = 200, error_level: str = "L") -> bytes:
+    """
+    Get QR code PNG bytes, rendering it only once per (payload, size, error level)
+    
+    Args:
+        payload: QR data content
+        size: Image size in pixels
+        error_level: Error correction level (L, M, Q, H)
+    
+    Returns:
+        PNG image bytes
+    """
+    if error_level not in ERROR_LEVELS:
+        raise ValueError(f"Invalid QR error correction level: {error_level}")
+    key = _qr_cache_key(payload, size, error_level)
+    png = _load_cached_qr_png(key)
+    if png is None:
+        png = _render_qr_png(payload, size, error_level)
+        _store_qr_png(key, png)
+    return png
+
+
+def prerender_qr_codes(
+    payloads: List[str],
+    size: int = 200,
+    error_level: str = "L",
+    max_workers: Optional[int] = None
+) -> int:
+    """
+    Fill the QR cache for many payloads, rendering cache misses across CPU cores
+    
+    Args:
+        payloads: QR data contents
+        size: Image size in pixels
+        error_level: Error correction level (L, M, Q, H)
+        max_workers: Process pool size (defaults to CPU count)
+    
+    Returns:
+        Number of newly rendered QR codes
+    """
+    missing = [
+        payload for payload in dict.fromkeys(payloads)
+        if _load_cached_qr_png(_qr_cache_key(payload, size, error_level)) is None
+    ]
+    if not missing:
+        return 0
+    
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    
+    if max_workers <= 1 or len(missing) < 50:
+        for payload in missing:
+            _store_qr_png(_qr_cache_key(payload, size, error_level), _render_qr_png(payload, size, error_level))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunksize = max(1, len(missing) // (max_workers * 4))
+            pngs = executor.map(
+                _render_qr_png, missing, [size] * len(missing), [error_level] * len(missing),
+                chunksize=chunksize,
+            )
+            for payload, png in zip(missing, pngs):
+                _store_qr_png(_qr_cache_key(payload, size, error_level), png)
+    
+    logger.info(f"Pre-rendered {len(missing)} QR codes")
+    return len(missing)
+
+
+def generate_qr_code(part_id: int, sku: str, size: int = 200) -> Optional[Image.Image]:
     """
     Generate QR code image for a part
     
@@ -34,27 +172,11 @@ def generate_qr_code(part_id: int, sku: str, size: int = 200) -> Optional[PilIma
         PIL Image object with QR code, or None on error
     """
     try:
-        # Create QR code instance
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        
-        # QR data: part_id:sku format for easy scanning
-        qr_data = f"{part_id}:{sku}"
-        qr.add_data(qr_data)
-        qr.make(fit=True)
+        png = get_qr_png(part_qr_payload(part_id, sku), size)
+        img = Image.open(BytesIO(png))
+        img.load()
         
-        # Create image
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Resize if needed
-        if size != 200:
-            img = img.resize((size, size), Image.Resampling.LANCZOS)
-        
-        logger.info(f"QR code generated for part {part_id} (SKU: {sku})")
+        logger.debug(f"QR code generated for part {part_id} (SKU: {sku})")
         return img
         
     except Exception as e:
@@ -107,14 +229,8 @@ def generate_qr_code_base64(part_id: int, sku: str, size: int = 200) -> Optional
         Base64 encoded image string, or None on error
     """
     try:
-        img = generate_qr_code(part_id, sku, size)
-        if img is None:
-            return None
-        
-        # Convert to base64
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        img_str = base64.b64encode(buffer.getvalue()).decode()
+        png = get_qr_png(part_qr_payload(part_id, sku), size)
+        img_str = base64.b64encode(png).decode()
         
         return f"data:image/png;base64,{img_str}"
         
@@ -210,18 +326,14 @@ def generate_qr_labels(part_ids: List[int], output_format: str = 'docx',
         # Calculate labels per row (A4 width: ~21cm, margins: 2cm, label width: ~10cm)
         labels_per_row = 2
         
+        # Render all missing QR codes up front (parallel, cached)
+        prerender_qr_codes([part_qr_payload(part.id, part.sku) for part in parts], size=100)
+        
         # Generate QR codes and create labels
         row_labels = []
         
         for i, part in enumerate(parts):
-            # Generate QR code image
-            qr_img = generate_qr_code(part.id, part.sku, size=100)
-            if qr_img is None:
-                continue
-            
-            # Save QR code temporarily (use output_path's parent directory)
-            temp_qr_path = output_path.parent / f"temp_qr_{part.id}.png"
-            qr_img.save(temp_qr_path)
+            qr_png = get_qr_png(part_qr_payload(part.id, part.sku), size=100)
             
             # Get machine information for this part
             compatible_machines = part.compatible_machines if hasattr(part, 'compatible_machines') else []
@@ -255,7 +367,7 @@ def generate_qr_labels(part_ids: List[int], output_format: str = 'docx',
                 'child_info': child_info,
                 'user_info': user_info,
                 'creation_date': creation_date,
-                'qr_path': temp_qr_path
+                'qr_png': qr_png
             }
             
             row_labels.append(label_data)
@@ -311,7 +423,7 @@ def generate_qr_labels(part_ids: List[int], output_format: str = 'docx',
                     p_right.alignment = WD_ALIGN_PARAGRAPH.CENTER
                     
                     # Add QR code image
-                    p_right.add_run().add_picture(str(label_data['qr_path']), width=Cm(2.5))
+                    p_right.add_run().add_picture(BytesIO(label_data['qr_png']), width=Cm(2.5))
                 
                 row_labels = []
                 # Add spacing between rows
@@ -320,10 +432,6 @@ def generate_qr_labels(part_ids: List[int], output_format: str = 'docx',
         # Save document
         doc.save(str(output_path))
         
-        # Clean up temp files
-        for temp_file in output_path.parent.glob("temp_qr_*.png"):
-            temp_file.unlink()
-        
         logger.info(f"QR labels DOCX generated: {output_path}")
         return output_path
             